@@ -59,8 +59,11 @@ async def record_and_analyze(duration: float, backend: str) -> None:
     keyframes = extractor.extract(session)
 
     if not keyframes:
-        # 키보드 이벤트로 폴백
-        extractor = KeyframeExtractor(trigger_events={InputEventType.KEY_PRESS})
+        # 키보드 이벤트로 폴백 (키 입력 병합이 켜져 있으면 일반 타이핑은 TEXT_ENTRY,
+        # 단축키는 modifiers를 포함한 KEY_PRESS로 수집됨)
+        extractor = KeyframeExtractor(
+            trigger_events={InputEventType.TEXT_ENTRY, InputEventType.KEY_PRESS}
+        )
         keyframes = extractor.extract(session)
         if keyframes:
             print(f"(마우스 클릭 없음 - 키 입력 {len(keyframes)}개로 대체)")
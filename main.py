@@ -10,8 +10,10 @@
 """
 
 import asyncio
+import logging
 import threading
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException
@@ -20,12 +22,17 @@ from pydantic import BaseModel, Field
 from shadow.analysis.models import LabeledAction
 from shadow.analysis.claude import ClaudeAnalyzer
 from shadow.api.errors import ShadowAPIError, general_exception_handler, shadow_api_error_handler
+from shadow.api.repositories.users import load_excluded_apps
 from shadow.api.routers import agent_router, hitl_router, slack_router, specs_router
 from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.capture.storage import SessionStorage
 from shadow.config import settings
 from shadow.patterns import create_pattern_analyzer
+from shadow.preprocessing.budget import BudgetSelector
+from shadow.preprocessing.dedup import KeyframeDeduplicator, expand_labels
 from shadow.preprocessing.keyframe import KeyframeExtractor
 
+logger = logging.getLogger(__name__)
 
 # === 상태 관리 ===
 
@@ -40,6 +47,7 @@ class AppState:
         self.labels: list[LabeledAction] = []
         self.patterns: list[dict[str, Any]] = []
         self.is_analyzing: bool = False
+        self.deferred_dir: Path | None = None  # 분석 예산 초과로 미룬 쌍을 저장한 세션 디렉토리
 
 
 state = AppState()
@@ -91,6 +99,16 @@ class RecordingStatus(BaseModel):
     frame_count: int = 0
     event_count: int = 0
     duration: float = 0.0
+    # 캡처 성능 카운터
+    captured_frames: int = 0
+    dropped_frames: int = 0
+    unchanged_frames: int = 0
+    queue_dropped: int = 0
+    current_fps: float = 0.0
+    avg_grab_ms: float = 0.0
+    max_grab_ms: float = 0.0
+    avg_convert_ms: float = 0.0
+    max_convert_ms: float = 0.0
 
 
 class StatusResponse(BaseModel):
@@ -133,8 +151,13 @@ async def start_recording(request: RecordingStartRequest):
     state.session = None
     state.labels = []
     state.patterns = []
+    state.deferred_dir = None
 
-    state.recorder = Recorder(monitor=request.monitor, fps=request.fps)
+    # 사용자가 API로 제외한 앱은 캡처 단계에서 가리거나 버림 (DB 조회는 이벤트 루프 밖에서)
+    excluded_apps = await asyncio.to_thread(load_excluded_apps)
+    state.recorder = Recorder(
+        monitor=request.monitor, fps=request.fps, excluded_apps=excluded_apps
+    )
 
     def record_task():
         state.session = state.recorder.record(request.duration)
@@ -167,13 +190,23 @@ async def stop_recording():
 
 @app.get("/recording/status", response_model=RecordingStatus)
 async def get_recording_status():
-    """녹화 상태 상세 조회"""
+    """녹화 상태 상세 조회 (녹화 중에는 실시간 캡처 카운터 포함)"""
+    stats = state.recorder.capture_stats if state.recorder else None
     return RecordingStatus(
         is_recording=state.recorder.is_recording if state.recorder else False,
         has_session=state.session is not None,
         frame_count=len(state.session.frames) if state.session else 0,
         event_count=len(state.session.events) if state.session else 0,
         duration=state.session.duration if state.session else 0.0,
+        captured_frames=stats.captured_frames if stats else 0,
+        dropped_frames=stats.dropped_frames if stats else 0,
+        unchanged_frames=stats.unchanged_frames if stats else 0,
+        queue_dropped=stats.queue_dropped if stats else 0,
+        current_fps=stats.current_fps if stats else 0.0,
+        avg_grab_ms=stats.avg_grab_ms if stats else 0.0,
+        max_grab_ms=stats.grab_ms_max if stats else 0.0,
+        avg_convert_ms=stats.avg_convert_ms if stats else 0.0,
+        max_convert_ms=stats.convert_ms_max if stats else 0.0,
     )
 
 
@@ -203,12 +236,39 @@ async def analyze_session(request: AnalyzeRequest, background_tasks: BackgroundT
             # 키프레임 추출
             extractor = KeyframeExtractor()
             keyframes = extractor.extract(state.session)
+            if settings.keyframe_dedup:
+                keyframes, dropped = KeyframeDeduplicator().split(keyframes)
+                # 합쳐진 쌍의 링 버퍼 슬롯은 바로 해제
+                extractor.release_pairs(state.session, dropped)
 
             if not keyframes:
                 return
 
-            # 분석
-            state.labels = await analyzer.analyze_batch(keyframes)
+            # 분석 예산 상한이 있으면 정보량이 큰 쌍만 분석하고 나머지는 나중 분석용으로 저장
+            # (PNG 인코딩은 저장 스레드 풀에서 분석 API 호출과 함께 진행)
+            deferred_save = None
+            selector = BudgetSelector()
+            if selector.limited:
+                selection = selector.select(keyframes, analyzer.estimate_pair_cost)
+                keyframes = selection.selected
+                if selection.deferred and settings.analysis_defer_over_budget:
+                    deferred_save = SessionStorage().save_deferred_background(
+                        selection.deferred, SessionStorage.session_name(state.session)
+                    )
+                    state.deferred_dir = deferred_save.path
+                    logger.info(
+                        f"예산 초과 키프레임 쌍 {len(selection.deferred)}개 보류: "
+                        f"{deferred_save.path} (shadow analyze {deferred_save.path} --deferred)"
+                    )
+
+            try:
+                if not keyframes:
+                    return
+                # 분석 (중복 제거로 합친 쌍은 라벨을 반복해 순서/횟수 유지)
+                state.labels = expand_labels(keyframes, await analyzer.analyze_batch(keyframes))
+            finally:
+                if deferred_save is not None:
+                    await deferred_save
 
             # 패턴 감지 (LLM 기반)
             if state.labels:
@@ -246,6 +306,7 @@ async def get_labels():
     return {
         "count": len(state.labels),
         "labels": [label.model_dump() for label in state.labels],
+        "deferred_dir": str(state.deferred_dir) if state.deferred_dir else None,
     }
 
 
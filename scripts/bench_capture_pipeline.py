@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""직렬 캡처 루프 vs 단계별 캡처 파이프라인 처리량 벤치마크
+
+- serial: 기존 Recorder 루프 (grab -> 변환 -> 저장을 한 스레드에서 순서대로)
+- pipeline: CapturePipeline (grab / 변환 / sink 스레드 분리)
+
+화면 없이 실행할 수 있도록 grab은 합성 BGRA 버퍼 + 지연(--grab-ms)으로 대체하고,
+변화 감지와 링 버퍼 기록은 실제 코드를 사용합니다.
+
+실행 방법:
+    uv run python scripts/bench_capture_pipeline.py
+    uv run python scripts/bench_capture_pipeline.py --width 3840 --height 2160 --grab-ms 40
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.scheduler import CaptureStats
+from shadow.capture.screen import ScreenCapture
+from shadow.capture.stages import CapturePipeline
+
+
+class SyntheticScreenCapture(ScreenCapture):
+    """mss 대신 합성 버퍼를 반환하는 ScreenCapture"""
+
+    def __init__(self, fps: int, width: int, height: int, grab_ms: float):
+        super().__init__(monitor=1, fps=fps, detect_changes=True)
+        self._grab_seconds = grab_ms / 1000
+        # 매 프레임 화면이 바뀌도록 서로 다른 버퍼 두 개를 번갈아 반환
+        self._screens = [
+            np.random.randint(0, 256, (height, width, 4), dtype=np.uint8) for _ in range(2)
+        ]
+        self._count = 0
+
+    @contextmanager
+    def session(self):
+        self._reset_change_detection()
+        self._stats = CaptureStats()
+        yield self
+
+    def _grab(self):
+        time.sleep(self._grab_seconds)  # grab은 대부분 GIL을 놓는 시스템 호출
+        self._count += 1
+        return self._screens[self._count % 2]
+
+
+def run_serial(capture: ScreenCapture, buffer: FrameRingBuffer, seconds: float) -> int:
+    """기존 방식: 한 스레드에서 grab/변환/저장"""
+    frames = 0
+    with capture.session():
+        end = time.time() + seconds
+        capture.reset_schedule()
+        while time.time() < end:
+            capture.wait_next()
+            if capture.capture_into(buffer) is not None:
+                frames += 1
+    return frames
+
+
+def run_pipeline(capture: ScreenCapture, buffer: FrameRingBuffer, seconds: float) -> int:
+    """CapturePipeline 사용"""
+    frames = []
+    pipeline = CapturePipeline(capture, sink=frames.append, buffer=buffer)
+    pipeline.start()
+    time.sleep(seconds)
+    pipeline.stop()
+    return len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캡처 파이프라인 처리량 벤치마크")
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--fps", type=int, default=15, help="목표 FPS")
+    parser.add_argument("--grab-ms", type=float, default=40.0, help="grab 1회 지연 (ms)")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    results = {}
+    for name, run in (("serial", run_serial), ("pipeline", run_pipeline)):
+        capture = SyntheticScreenCapture(args.fps, args.width, args.height, args.grab_ms)
+        buffer = FrameRingBuffer(args.fps * 2)
+        frames = run(capture, buffer, args.seconds)
+        results[name] = (frames / args.seconds, capture.stats)
+
+    print("=" * 60)
+    print(
+        f" 캡처 처리량 ({args.width}x{args.height}, 목표 {args.fps} FPS, "
+        f"grab {args.grab_ms:.0f} ms)"
+    )
+    print("=" * 60)
+    for name, (fps, stats) in results.items():
+        print(
+            f"  {name:<9} {fps:6.1f} FPS  "
+            f"(변환 평균 {stats.avg_convert_ms:6.2f} ms, "
+            f"누락 {stats.dropped_frames}, 큐 버림 {stats.queue_dropped})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""키프레임 쌍 변화 영역 계산 비용 벤치마크
+
+mss 캡처와 같은 BGRA 프레임(기본 1920x1080, RGB 미변환)으로 Before/After 쌍을 합성하여
+compute_diff 시간을 측정합니다. 목표는 1080p에서 쌍당 10 ms 미만입니다.
+- same: 내용은 같고 버퍼만 다른 쌍
+- button: 버튼 하나 크기의 작은 변화
+- dialog: 화면 가운데 대화상자와 여러 작은 변화
+- scattered: 화면 곳곳의 작은 변화 200개 (연결 요소가 많은 최악 조건)
+- full: 화면 전체 전환
+
+실행 방법:
+    uv run python scripts/bench_diff.py
+    uv run python scripts/bench_diff.py --width 2560 --height 1600 --repeat 100
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from shadow.capture.models import Frame
+from shadow.config import settings
+from shadow.preprocessing.diff import compute_diff
+
+
+def make_pairs(width: int, height: int, seed: int) -> dict[str, tuple[Frame, Frame]]:
+    """시나리오별 Before/After 쌍"""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+
+    def changed(*regions: tuple[int, int, int, int]) -> np.ndarray:
+        after = base.copy()
+        for left, top, right, bottom in regions:
+            after[top:bottom, left:right, :3] = 255 - after[top:bottom, left:right, :3]
+        return after
+
+    scattered = []
+    for _ in range(200):
+        x, y = int(rng.integers(0, width - 24)), int(rng.integers(0, height - 24))
+        scattered.append((x, y, x + 24, y + 24))
+
+    afters = {
+        "same": base.copy(),
+        "button": changed((width // 3, height // 3, width // 3 + 120, height // 3 + 40)),
+        "dialog": changed(
+            (width // 4, height // 4, width * 3 // 4, height * 3 // 4),
+            (20, 20, 140, 44),
+            (width - 200, height - 60, width - 40, height - 20),
+        ),
+        "scattered": changed(*scattered),
+        "full": rng.integers(0, 256, (height, width, 4), dtype=np.uint8),
+    }
+    return {
+        name: (Frame(timestamp=0.0, bgra=base), Frame(timestamp=0.3, bgra=after))
+        for name, after in afters.items()
+    }
+
+
+def measure(before: Frame, after: Frame, repeat: int) -> list[float]:
+    """compute_diff 호출별 시간 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compute_diff(
+            before, after, cell=settings.keyframe_diff_cell, stride=settings.keyframe_diff_stride
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키프레임 쌍 변화 영역 계산 비용 벤치마크")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=10.0, help="쌍당 목표 시간 (ms)")
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.width, args.height, args.seed)
+
+    print("=" * 60)
+    print(
+        f" 변화 영역 계산 ({args.width}x{args.height}, cell={settings.keyframe_diff_cell}, "
+        f"stride={settings.keyframe_diff_stride})"
+    )
+    print("=" * 60)
+    worst = 0.0
+    for name, (before, after) in pairs.items():
+        times = measure(before, after, args.repeat)
+        p95 = statistics.quantiles(times, n=20)[-1]
+        worst = max(worst, p95)
+        boxes = len(compute_diff(before, after).boxes)
+        print(
+            f"  {name:10s} 평균 {statistics.mean(times):6.2f} ms  p95 {p95:6.2f} ms  "
+            f"영역 {boxes}개"
+        )
+    print(f"  목표 {args.budget:.0f} ms 미만: {worst < args.budget}")
+
+
+if __name__ == "__main__":
+    main()
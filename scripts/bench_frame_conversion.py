@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""프레임 BGRA -> RGB 변환 비용 벤치마크
+
+ScreenCapture.capture_frame의 프레임당 비용을 비교합니다.
+- eager: 기존 방식 (np.array(screenshot) + 슬라이스 .copy(), 전체 프레임 2회 복사)
+- lazy: BGRA 버퍼 view만 보관, image 첫 접근 시 변환
+
+화면 없이 실행할 수 있도록 mss ScreenShot을 합성 버퍼로 생성합니다.
+
+실행 방법:
+    uv run python scripts/bench_frame_conversion.py
+    uv run python scripts/bench_frame_conversion.py --width 3840 --height 2160 --frames 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+from mss.screenshot import ScreenShot
+
+from shadow.capture.models import Frame
+
+
+def make_screenshot(width: int, height: int) -> ScreenShot:
+    """mss.grab()과 같은 형태의 합성 스크린샷 (grab마다 새 bytearray)"""
+    raw = bytearray(np.random.randint(0, 256, width * height * 4, dtype=np.uint8).tobytes())
+    return ScreenShot(raw, {"left": 0, "top": 0, "width": width, "height": height})
+
+
+def eager_capture(screenshot: ScreenShot) -> Frame:
+    """기존 capture_frame 변환 경로"""
+    img = np.array(screenshot)
+    rgb = img[:, :, :3][:, :, ::-1].copy()
+    return Frame(timestamp=time.time(), image=rgb)
+
+
+def lazy_capture(screenshot: ScreenShot) -> Frame:
+    """현재 capture_frame 변환 경로"""
+    bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+        screenshot.height, screenshot.width, 4
+    )
+    return Frame(timestamp=time.time(), bgra=bgra)
+
+
+def measure(func, screenshots: list[ScreenShot]) -> float:
+    """프레임당 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for screenshot in screenshots:
+        func(screenshot)
+    return (time.perf_counter() - start) / len(screenshots) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프레임 변환 비용 벤치마크")
+    parser.add_argument("--width", type=int, default=2560)
+    parser.add_argument("--height", type=int, default=1600)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument(
+        "--analyzed-ratio", type=float, default=0.05, help="image에 접근하는 프레임 비율"
+    )
+    args = parser.parse_args()
+
+    screenshots = [make_screenshot(args.width, args.height) for _ in range(args.frames)]
+
+    eager_ms = measure(eager_capture, screenshots)
+    lazy_ms = measure(lazy_capture, screenshots)
+    convert_ms = measure(lambda s: lazy_capture(s).image, screenshots) - lazy_ms
+
+    # 일부 프레임만 분석되는 실제 녹화 기준 프레임당 평균 비용
+    effective_ms = lazy_ms + convert_ms * args.analyzed_ratio
+
+    print("=" * 60)
+    print(f" 프레임 변환 비용 ({args.width}x{args.height}, {args.frames} frames)")
+    print("=" * 60)
+    print(f"  eager (기존, 2회 복사):        {eager_ms:8.3f} ms/frame")
+    print(f"  lazy (캡처 시점):              {lazy_ms:8.3f} ms/frame")
+    print(f"  lazy (image 접근 시 변환):     {convert_ms:8.3f} ms/frame")
+    print(
+        f"  lazy 실효 비용 ({args.analyzed_ratio:.0%} 분석):     {effective_ms:8.3f} ms/frame"
+    )
+    print(f"  절감률:                        {(1 - effective_ms / eager_ms) * 100:7.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""키프레임 추출 비용 벤치마크 (합성 장시간 세션)
+
+10 FPS로 녹화한 긴 세션(기본 1시간, 36k 프레임)과 클릭 2k개를 합성하여
+KeyframeExtractor.extract_pairs 시간을 비교합니다.
+- linear: 기존 방식 (클릭마다 전체 프레임 목록을 훑고 임시 목록 생성, O(clicks x frames))
+- bisect: 현재 방식 (타임스탬프 이진 탐색, O((clicks + frames) log frames))
+두 방식이 같은 Before/After 프레임을 고르는지도 확인합니다.
+
+프레임 이미지는 모두 같은 작은 배열을 공유하므로 메모리를 거의 쓰지 않습니다.
+
+실행 방법:
+    uv run python scripts/bench_keyframe.py
+    uv run python scripts/bench_keyframe.py --minutes 10 --clicks 500 --skip-linear
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.recorder import RecordingSession
+from shadow.preprocessing.keyframe import KeyframeExtractor
+
+
+class LinearKeyframeExtractor(KeyframeExtractor):
+    """기존 선형 탐색 방식 (비교용)"""
+
+    def extract_pairs(self, session: RecordingSession) -> list[KeyframePair]:
+        pairs = []
+        frames = session.frames
+        for event in self._filter_trigger_events(session.events):
+            before = self._linear_closest(event, frames)
+            if before is None:
+                continue
+            after = self._linear_at(event.timestamp + self._after_delay, frames) or before
+            pairs.append(KeyframePair(before_frame=before, after_frame=after, trigger_event=event))
+        return pairs
+
+    def _linear_closest(self, event: InputEvent, frames: list[Frame]) -> Frame | None:
+        best_frame, best_diff = None, float("inf")
+        for frame in frames:
+            time_diff = event.timestamp - frame.timestamp
+            if -self._time_tolerance <= time_diff <= self._time_tolerance:
+                if abs(time_diff) < best_diff:
+                    best_diff, best_frame = abs(time_diff), frame
+        if best_frame is None:
+            before_frames = [f for f in frames if f.timestamp <= event.timestamp]
+            if before_frames:
+                best_frame = before_frames[-1]
+        return best_frame
+
+    @staticmethod
+    def _linear_at(timestamp: float, frames: list[Frame]) -> Frame | None:
+        after_frames = [f for f in frames if f.timestamp >= timestamp]
+        if after_frames:
+            return min(after_frames, key=lambda f: abs(f.timestamp - timestamp))
+        before_frames = [f for f in frames if f.timestamp < timestamp]
+        if before_frames:
+            return max(before_frames, key=lambda f: f.timestamp)
+        return None
+
+
+def make_session(minutes: float, fps: float, clicks: int, seed: int) -> RecordingSession:
+    """합성 세션 (프레임 간격에 약간의 지터, 클릭은 임의 시각)"""
+    rng = random.Random(seed)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    duration = minutes * 60
+    count = int(duration * fps)
+    frames = [
+        Frame(timestamp=i / fps + rng.uniform(0, 0.2 / fps), image=image) for i in range(count)
+    ]
+    events = sorted(
+        (
+            InputEvent(
+                timestamp=rng.uniform(0, duration), event_type=InputEventType.MOUSE_CLICK, x=1, y=1
+            )
+            for _ in range(clicks)
+        ),
+        key=lambda e: e.timestamp,
+    )
+    return RecordingSession(frames=frames, events=events, end_time=duration)
+
+
+def measure(extractor: KeyframeExtractor, session: RecordingSession) -> tuple[float, list]:
+    """extract_pairs 시간 (초)과 결과"""
+    start = time.perf_counter()
+    pairs = extractor.extract_pairs(session)
+    return time.perf_counter() - start, pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키프레임 추출 비용 벤치마크")
+    parser.add_argument("--minutes", type=float, default=60.0, help="세션 길이 (분)")
+    parser.add_argument("--fps", type=float, default=10.0)
+    parser.add_argument("--clicks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-linear", action="store_true", help="기존 방식 측정 생략")
+    args = parser.parse_args()
+
+    session = make_session(args.minutes, args.fps, args.clicks, args.seed)
+
+    print("=" * 60)
+    print(f" 키프레임 추출 ({len(session.frames)} frames, {len(session.events)} clicks)")
+    print("=" * 60)
+
+    bisect_s, pairs = measure(KeyframeExtractor(roi_size=0), session)
+    print(f"  bisect  {bisect_s * 1000:10.1f} ms")
+
+    if not args.skip_linear:
+        linear_s, expected = measure(LinearKeyframeExtractor(roi_size=0), session)
+        same = [(p.before_frame, p.after_frame) for p in pairs] == [
+            (p.before_frame, p.after_frame) for p in expected
+        ]
+        print(f"  linear  {linear_s * 1000:10.1f} ms  ({linear_s / bisect_s:.0f}x)")
+        print(f"  결과 일치: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""마우스 이동 경로 수집 오버헤드 벤치마크
+
+1000Hz 마우스(pynput on_move 최대 빈도)로 곡선 드래그를 합성하여
+PointerTracker.move() 1회 비용과 경로 점 수(솎아내기 비율)를 측정합니다.
+- drag: 버튼을 누른 채 이동 (모든 이동을 경로에 반영)
+- idle move: hover 기록을 끈 상태에서 버튼 없이 이동 (기본 설정의 평소 비용)
+
+실행 방법:
+    uv run python scripts/bench_pointer.py
+    uv run python scripts/bench_pointer.py --seconds 30 --min-distance 2 --tolerance 1
+"""
+
+import argparse
+import math
+import time
+
+from shadow.capture.models import InputEvent, WindowInfo
+from shadow.capture.pointer import PointerTracker
+
+
+def make_path(seconds: float, rate: int) -> list[tuple[int, int]]:
+    """rate Hz로 샘플링한 곡선 경로 (원 위를 돌며 반경이 변함)"""
+    count = int(seconds * rate)
+    return [
+        (
+            int(960 + (300 + 200 * math.sin(i / 700)) * math.cos(i / 300)),
+            int(540 + (300 + 200 * math.sin(i / 700)) * math.sin(i / 300)),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(tracker: PointerTracker, path: list[tuple[int, int]], rate: int) -> float:
+    """move() 1회 평균 시간 (us)"""
+    start = time.perf_counter()
+    for i, (x, y) in enumerate(path):
+        tracker.move(x, y, i / rate)
+    return (time.perf_counter() - start) / len(path) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마우스 이동 경로 수집 벤치마크")
+    parser.add_argument("--seconds", type=float, default=10.0, help="드래그 시간 (초)")
+    parser.add_argument("--rate", type=int, default=1000, help="이동 이벤트 빈도 (Hz)")
+    parser.add_argument("--min-distance", type=float, default=3.0)
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    parser.add_argument("--max-points", type=int, default=128)
+    args = parser.parse_args()
+
+    path = make_path(args.seconds, args.rate)
+    emitted: list[InputEvent] = []
+
+    def make_tracker() -> PointerTracker:
+        return PointerTracker(
+            emit=emitted.append,
+            window_lookup=lambda x, y: WindowInfo(app_name="Bench"),
+            min_distance=args.min_distance,
+            tolerance=args.tolerance,
+            max_points=args.max_points,
+        )
+
+    tracker = make_tracker()
+    tracker.press(*path[0], "left", 0.0)
+    drag_us = measure(tracker, path, args.rate)
+    tracker.release(*path[-1], "left", args.seconds)
+    drag = emitted[-1]
+
+    idle_us = measure(make_tracker(), path, args.rate)
+
+    print("=" * 60)
+    print(f" 마우스 이동 수집 ({len(path)} moves, {args.rate} Hz, {args.seconds:.0f}초)")
+    print("=" * 60)
+    print(f"  drag move() 평균        {drag_us:8.2f} us  (CPU {drag_us * args.rate / 1e4:.2f}%)")
+    print(f"  idle move() 평균        {idle_us:8.2f} us")
+    print(f"  원본 점 수              {len(path):8d}")
+    print(f"  DRAG 경로 점 수         {len(drag.path):8d}  (최대 {args.max_points})")
+    print(f"  감소율                  {1 - len(drag.path) / len(path):8.2%}")
+
+
+if __name__ == "__main__":
+    main()
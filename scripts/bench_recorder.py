@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Recorder 처리량 벤치마크 (디스플레이 없이 실행)
+
+- synthetic: SyntheticBackend로 합성 화면 + 일정 간격 클릭을 녹화
+- replay: 저장된 세션 디렉토리(--session)를 ReplayBackend로 재생하며 녹화
+
+같은 seed/세션이면 입력이 동일하므로 변경 전후의 처리량을 재현 가능하게 비교할 수 있습니다.
+
+실행 방법:
+    uv run python scripts/bench_recorder.py
+    uv run python scripts/bench_recorder.py --width 3840 --height 2160 --fps 30 --grab-ms 20
+    uv run python scripts/bench_recorder.py --session outputs/session_20260101_120000 --speed 4
+"""
+
+import argparse
+
+from shadow.capture.backends import CaptureBackend, ReplayBackend, SyntheticBackend
+from shadow.capture.recorder import Recorder
+from shadow.preprocessing.keyframe import KeyframeExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recorder 처리량 벤치마크")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--fps", type=int, default=10, help="목표 FPS")
+    parser.add_argument("--grab-ms", type=float, default=0.0, help="grab 1회 지연 (ms)")
+    parser.add_argument("--click-interval", type=float, default=0.5, help="클릭 간격 (초)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="녹화 시간 (초)")
+    parser.add_argument("--session", help="재생할 세션 디렉토리 (지정하면 replay)")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay 재생 속도 배율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    backend: CaptureBackend
+    if args.session:
+        backend = ReplayBackend(args.session, speed=args.speed)
+        seconds = min(args.seconds, backend.duration)
+        label = f"replay {args.session} x{args.speed:g}"
+    else:
+        backend = SyntheticBackend(
+            width=args.width,
+            height=args.height,
+            click_interval=args.click_interval,
+            duration=args.seconds,
+            grab_latency=args.grab_ms / 1000,
+            seed=args.seed,
+        )
+        seconds = args.seconds
+        label = f"synthetic {args.width}x{args.height}"
+
+    recorder = Recorder(fps=args.fps, buffer_seconds=0, backend=backend)
+    session = recorder.record(seconds)
+    pairs = KeyframeExtractor().extract_pairs(session)
+    stats = session.capture_stats
+
+    print("=" * 60)
+    print(f" Recorder 처리량 ({label}, 목표 {args.fps} FPS, {seconds:.1f}초)")
+    print("=" * 60)
+    fps = len(session.frames) / session.duration
+    print(f"  프레임      {len(session.frames):6d}  ({fps:5.1f} FPS)")
+    print(f"  무변화      {stats.unchanged_frames:6d}")
+    print(f"  누락/버림   {stats.dropped_frames:6d} / {stats.queue_dropped}")
+    print(f"  이벤트      {len(session.events):6d}")
+    print(f"  키프레임 쌍 {len(pairs):6d}")
+    print(f"  grab 평균   {stats.avg_grab_ms:6.2f} ms")
+    print(f"  변환 평균   {stats.avg_convert_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
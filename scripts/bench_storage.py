@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""세션 저장 (키프레임 PNG 인코딩) 벤치마크
+
+키프레임 쌍 100/500/2000개를 저장하는 전체 시간을 비교합니다.
+- serial: 호출 스레드에서 한 장씩 PIL로 인코딩 (이전 save_session 방식)
+- pool: SessionStorage의 스레드 풀 병렬 인코딩 (handle.result()까지의 시간)
+- return: save_session_background()가 호출자에게 반환되기까지의 시간
+
+화면과 비슷하게 압축되도록 단색 영역과 글자 같은 잡음 띠로 만든 큰 캔버스에서
+한 줄씩 어긋난 영역을 프레임으로 잘라 씁니다 (프레임마다 버퍼는 다르지만 메모리는 공유).
+
+실행 방법:
+    uv run python scripts/bench_storage.py
+    uv run python scripts/bench_storage.py --pairs 100 500 --workers 4 --width 1280 --height 720
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.recorder import RecordingSession
+from shadow.capture.storage import SessionStorage
+
+
+def make_canvas(width: int, height: int, seed: int) -> np.ndarray:
+    """화면 같은 합성 캔버스 (단색 창 + 글자 같은 잡음 띠)"""
+    rng = np.random.default_rng(seed)
+    canvas = np.full((height, width, 3), 240, dtype=np.uint8)
+    for _ in range(height // 40):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(0, height - 120))
+        w, h = int(rng.integers(80, 400)), int(rng.integers(20, 120))
+        canvas[y : y + h, x : x + w] = rng.integers(0, 256, 3, dtype=np.uint8)
+    for y in range(0, height - 12, 24):
+        x = int(rng.integers(0, width // 2))
+        text = rng.random((10, width // 3)) < 0.3
+        canvas[y : y + 10, x : x + width // 3][text] = 20
+    return canvas
+
+
+def make_pairs(count: int, width: int, height: int, seed: int) -> list[KeyframePair]:
+    """서로 다른 버퍼를 가진 키프레임 쌍 count개"""
+    canvas = make_canvas(width, height + 2 * count, seed)
+    pairs = []
+    for i in range(count):
+        before = Frame(timestamp=i * 1.0, image=canvas[2 * i : 2 * i + height])
+        after = Frame(timestamp=i * 1.0 + 0.3, image=canvas[2 * i + 1 : 2 * i + 1 + height])
+        event = InputEvent(
+            timestamp=i * 1.0, event_type=InputEventType.MOUSE_CLICK, x=100, y=100
+        )
+        pairs.append(KeyframePair(before_frame=before, after_frame=after, trigger_event=event))
+    return pairs
+
+
+def run_serial(pairs: list[KeyframePair], directory: Path) -> float:
+    """호출 스레드 순차 인코딩 시간 (초)"""
+    start = time.perf_counter()
+    for i, pair in enumerate(pairs):
+        Image.fromarray(pair.before_frame.image).save(directory / f"{i + 1:03d}_before.png")
+        Image.fromarray(pair.after_frame.image).save(directory / f"{i + 1:03d}_after.png")
+    return time.perf_counter() - start
+
+
+def run_pool(
+    pairs: list[KeyframePair], directory: Path, workers: int | None
+) -> tuple[float, float]:
+    """스레드 풀 저장의 (반환까지, 완료까지) 시간 (초)"""
+    storage = SessionStorage(directory, workers=workers)
+    start = time.perf_counter()
+    handle = storage.save_session_background(RecordingSession(), pairs, name="bench")
+    returned = time.perf_counter() - start
+    handle.result()
+    return returned, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 저장 (키프레임 PNG 인코딩) 벤치마크")
+    parser.add_argument("--pairs", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--workers", type=int, default=None, help="인코딩 스레드 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(
+        f" 키프레임 PNG 저장 ({args.width}x{args.height}, CPU {os.cpu_count()}개, "
+        f"workers={args.workers or '기본'})"
+    )
+    print("=" * 72)
+    for count in args.pairs:
+        pairs = make_pairs(count, args.width, args.height, args.seed)
+        with tempfile.TemporaryDirectory() as temp:
+            serial_dir = Path(temp) / "serial"
+            serial_dir.mkdir()
+            serial = run_serial(pairs, serial_dir)
+            shutil.rmtree(serial_dir)
+            returned, pooled = run_pool(pairs, Path(temp), args.workers)
+        print(
+            f"  {count:5d}쌍  serial {serial:7.2f} s  pool {pooled:7.2f} s  "
+            f"({serial / pooled:4.1f}x)  return {returned * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
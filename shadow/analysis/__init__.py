@@ -8,6 +8,7 @@
 from shadow.analysis.base import AnalyzerBackend, BaseVisionAnalyzer
 from shadow.analysis.claude import ClaudeAnalyzer
 from shadow.analysis.nemotron import NemotronAnalyzer
+from shadow.analysis.prefilter import NoChangeFilter
 from shadow.analysis.models import (
     ActionType,
     LabeledAction,
@@ -57,4 +58,6 @@ __all__ = [
     "ClaudeAnalyzer",
     "NemotronAnalyzer",
     "create_analyzer",
+    # 분석 전처리
+    "NoChangeFilter",
 ]
@@ -5,12 +5,14 @@ LLM 모델을 쉽게 교체할 수 있도록 인터페이스를 정의합니다.
 
 import io
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
 
 from PIL import Image
 
 from shadow.analysis.models import LabeledAction
-from shadow.capture.models import Frame, KeyframePair
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.config import settings
 
 
 class AnalyzerBackend(Enum):
@@ -20,6 +22,22 @@ class AnalyzerBackend(Enum):
     NEMOTRON = "nemotron"
 
 
+@dataclass
+class PreparedImage:
+    """API로 보낼 키프레임 이미지"""
+
+    role: str  # "before" 또는 "after"
+    zoomed: bool  # True면 클릭 주변 원본 해상도 영역
+    data: bytes
+    media_type: str
+
+    @property
+    def label(self) -> str:
+        """프롬프트 라벨 ("Before", "After 확대" 등)"""
+        name = self.role.capitalize()
+        return f"{name} 확대" if self.zoomed else name
+
+
 class BaseVisionAnalyzer(ABC):
     """Vision 분석기 추상 베이스 클래스
 
@@ -64,18 +82,26 @@ class BaseVisionAnalyzer(ABC):
         frame: Frame,
         max_size: int = 1024,
         click_pos: tuple[int, int] | None = None,
+        roi: tuple[int, int, int, int] | None = None,
     ) -> tuple[bytes, str]:
         """프레임 이미지를 API용으로 준비
 
         Args:
             frame: 분석할 프레임
             max_size: 이미지 최대 크기 (토큰 절약)
-            click_pos: 클릭 위치 (x, y) - 표시할 경우
+            click_pos: 클릭 위치 (x, y, 프레임 픽셀) - 표시할 경우
+            roi: 지정하면 전체 화면 대신 이 영역 (left, top, right, bottom)을
+                축소 없이 잘라서 사용 (클릭 위치 표시 없음)
 
         Returns:
             (이미지 bytes, mime_type) 튜플
         """
-        img = Image.fromarray(frame.image)
+        if roi is not None:
+            left, top, right, bottom = roi
+            img = Image.fromarray(frame.image[top:bottom, left:right])
+            click_pos = None
+        else:
+            img = Image.fromarray(frame.image)
         original_size = img.size
 
         # 이미지 리사이즈 (토큰 절약)
@@ -111,6 +137,79 @@ class BaseVisionAnalyzer(ABC):
         img.save(buffer, format="PNG", optimize=True)
         return buffer.getvalue(), "image/png"
 
+    def _prepare_pair_images(self, pair: KeyframePair, max_size: int) -> list[PreparedImage]:
+        """키프레임 쌍을 API용 이미지 목록으로 준비
+
+        클릭 주변 영역(pair.roi)이 있으면 Before/After마다
+        analysis_overview_size로 축소한 전체 화면과 원본 해상도 영역을 함께 보내므로,
+        큰 화면에서도 클릭한 UI의 작은 글자가 읽히면서 이미지 크기는 줄어듭니다.
+        없으면 max_size로 축소한 전체 화면만 보냅니다.
+
+        Args:
+            pair: 키프레임 쌍
+            max_size: 전체 화면 최대 크기 (ROI가 없을 때)
+
+        Returns:
+            Before, (Before 확대), After, (After 확대) 순서의 이미지 목록
+        """
+        event = pair.trigger_event
+        click_pos = pair.click_pos
+        if click_pos is None and event.x is not None and event.y is not None:
+            click_pos = (event.x, event.y)
+        overview_size = max_size
+        if pair.roi is not None:
+            overview_size = min(max_size, settings.analysis_overview_size)
+
+        images = []
+        for role, frame, marker in (
+            ("before", pair.before_frame, click_pos),
+            ("after", pair.after_frame, None),
+        ):
+            data, media_type = self._prepare_frame_image(frame, overview_size, click_pos=marker)
+            images.append(PreparedImage(role, False, data, media_type))
+            if pair.roi is not None:
+                data, media_type = self._prepare_frame_image(frame, max_size, roi=pair.roi)
+                images.append(PreparedImage(role, True, data, media_type))
+        return images
+
+    @staticmethod
+    def _describe_trigger(event: InputEvent) -> str:
+        """트리거 이벤트 컨텍스트 문구 (클릭 위치, 스크롤 양, 입력 텍스트, 단축키)"""
+        x, y = event.x or 0, event.y or 0
+        if event.event_type == InputEventType.MOUSE_SCROLL:
+            return f"스크롤: ({x}, {y})에서 dx={event.dx or 0}, dy={event.dy or 0}"
+        if event.event_type == InputEventType.TEXT_ENTRY:
+            return f'입력 텍스트: "{event.text or ""}"'
+        if event.event_type == InputEventType.KEY_PRESS:
+            keys = "+".join([*event.modifiers, event.key or "unknown"])
+            return f"단축키: {keys}" if event.modifiers else f"키 입력: {keys}"
+        return f"클릭 위치: ({x}, {y})"
+
+    @staticmethod
+    def _describe_changes(pair: KeyframePair, limit: int = 3) -> str | None:
+        """Before/After 변화 영역(pair.diff) 컨텍스트 문구
+
+        이미지가 축소되어 전송되므로 좌표는 화면 크기 대비 백분율로 표시합니다.
+
+        Args:
+            pair: 키프레임 쌍
+            limit: 표시할 최대 영역 수 (넓은 순)
+
+        Returns:
+            컨텍스트 문구 (변화 영역을 계산하지 않았으면 None)
+        """
+        if pair.diff is None:
+            return None
+        if not pair.diff.changed:
+            return "화면 변화: 없음"
+        width, height = pair.after_frame.width, pair.after_frame.height
+        regions = [
+            f"({100 * left // width}%, {100 * top // height}%)-"
+            f"({100 * right // width}%, {100 * bottom // height}%)"
+            for left, top, right, bottom in pair.diff.boxes[:limit]
+        ]
+        return f"변화 영역: {', '.join(regions)}"
+
     def _estimate_image_tokens(self, width: int, height: int) -> int:
         """이미지 토큰 수 추정 (Claude 기준)
 
@@ -128,4 +227,5 @@ __all__ = [
     "LabeledAction",
     "AnalyzerBackend",
     "BaseVisionAnalyzer",
+    "PreparedImage",
 ]
@@ -4,6 +4,7 @@
 - Prompt Caching: 시스템 프롬프트 캐싱으로 90% 비용 절감
 - 이미지 리사이즈: 작은 이미지로 토큰 절약
 - 배치 분석: 여러 이미지를 한 번에 분석
+- 변화 없음 로컬 판정: 화면 변화가 없는 쌍은 API 호출 생략 (NoChangeFilter)
 """
 
 import base64
@@ -15,7 +16,8 @@ import anthropic
 logger = logging.getLogger(__name__)
 
 from shadow.analysis.base import LabeledAction, AnalyzerBackend, BaseVisionAnalyzer
-from shadow.capture.models import KeyframePair
+from shadow.analysis.prefilter import NoChangeFilter
+from shadow.capture.models import InputEventType, KeyframePair
 from shadow.config import settings
 
 # 기본 배치 크기 (테스트 결과 5~10이 최적)
@@ -34,10 +36,11 @@ SYSTEM_PROMPT = """<role>
 </context>
 
 <instructions>
-1. 첫 번째 이미지(Before): 클릭 직전 화면 상태
-2. 두 번째 이미지(After): 클릭 직후 화면 상태
+1. [Before] 이미지: 클릭 직전 화면 상태
+2. [After] 이미지: 클릭 직후 화면 상태
 3. 빨간 원: 클릭 위치 (Before 이미지에 표시)
-4. 두 이미지를 비교하여 화면 변화를 구체적으로 분석
+4. [Before 확대], [After 확대] 이미지가 있으면 클릭 주변을 원본 해상도로 자른 영역 (작은 글자 확인용)
+5. 두 이미지를 비교하여 화면 변화를 구체적으로 분석
 </instructions>
 
 <output_format>
@@ -87,8 +90,9 @@ BATCH_SYSTEM_PROMPT = """<role>
 1. 각 쌍은 [Before N], [After N] 형식으로 표시됩니다
 2. Before: 클릭 직전 화면, After: 클릭 직후 화면
 3. 빨간 원: 클릭 위치 (Before 이미지에 표시)
-4. 각 쌍별로 화면 변화를 분석하세요
-5. 변화가 없으면 정직하게 "no_change"라고 작성하세요
+4. [Before N 확대], [After N 확대]가 있으면 클릭 주변을 원본 해상도로 자른 영역 (작은 글자 확인용)
+5. 각 쌍별로 화면 변화를 분석하세요
+6. 변화가 없으면 정직하게 "no_change"라고 작성하세요
 </instructions>
 
 <output_format>
@@ -121,6 +125,7 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
         model: str | None = None,
         max_image_size: int | None = None,
         use_cache: bool | None = None,
+        no_change_filter: NoChangeFilter | None = None,
     ):
         """
         Args:
@@ -128,6 +133,8 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
             model: 사용할 모델 (None이면 설정에서 가져옴)
             max_image_size: 이미지 최대 크기 (None이면 설정에서 가져옴)
             use_cache: 프롬프트 캐싱 사용 여부 (None이면 설정에서 가져옴)
+            no_change_filter: analyze_batch 전 변화 없음 판정기
+                (None이면 analysis_skip_no_change 설정에 따라 생성)
         """
         self._api_key = api_key or settings.anthropic_api_key
         if not self._api_key:
@@ -136,6 +143,9 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
         self._model = model or settings.claude_model
         self._max_image_size = max_image_size or settings.claude_max_image_size
         self._use_cache = use_cache if use_cache is not None else settings.claude_use_cache
+        if no_change_filter is None and settings.analysis_skip_no_change:
+            no_change_filter = NoChangeFilter()
+        self._no_change_filter = no_change_filter
 
         self._client = anthropic.Anthropic(
             api_key=self._api_key,
@@ -150,6 +160,11 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
     def model_name(self) -> str:
         return self._model
 
+    @property
+    def no_change_filter(self) -> NoChangeFilter | None:
+        """변화 없음 판정기 (skipped_pairs, skipped_calls로 생략한 쌍/호출 수 확인)"""
+        return self._no_change_filter
+
     async def analyze_keyframe_pair(self, pair: KeyframePair) -> LabeledAction:
         """F-04: Before/After 키프레임 쌍 분석
 
@@ -161,25 +176,21 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
         Returns:
             상태 변화가 포함된 동작 라벨
         """
-        # Before 이미지 (클릭 위치 표시)
-        click_pos = None
-        if pair.trigger_event.x is not None and pair.trigger_event.y is not None:
-            click_pos = (pair.trigger_event.x, pair.trigger_event.y)
-
-        before_bytes, media_type = self._prepare_frame_image(
-            pair.before_frame,
-            max_size=self._max_image_size,
-            click_pos=click_pos,
-        )
-        before_b64 = base64.standard_b64encode(before_bytes).decode("utf-8")
-
-        # After 이미지 (클릭 위치 표시 없음)
-        after_bytes, _ = self._prepare_frame_image(
-            pair.after_frame,
-            max_size=self._max_image_size,
-            click_pos=None,
-        )
-        after_b64 = base64.standard_b64encode(after_bytes).decode("utf-8")
+        # Before/After 이미지 (Before에 클릭 위치 표시, ROI가 있으면 확대 이미지 추가)
+        images = self._prepare_pair_images(pair, self._max_image_size)
+        image_content = []
+        for image in images:
+            image_content.extend([
+                {"type": "text", "text": f"[{image.label} 이미지]"},
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": image.media_type,
+                        "data": base64.standard_b64encode(image.data).decode("utf-8"),
+                    },
+                },
+            ])
 
         # 컨텍스트 정보 구성
         context_info = []
@@ -187,17 +198,20 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
             context_info.append(f"앱: {pair.trigger_event.app_name}")
         if pair.trigger_event.window_title:
             context_info.append(f"윈도우: {pair.trigger_event.window_title}")
-        x = pair.trigger_event.x or 0
-        y = pair.trigger_event.y or 0
-        context_info.append(f"클릭 위치: ({x}, {y})")
+        context_info.append(self._describe_trigger(pair.trigger_event))
+        changes = self._describe_changes(pair)
+        if changes:
+            context_info.append(changes)
 
         user_message = f"""다음 두 스크린샷을 비교 분석해주세요.
 
 [컨텍스트]
 {chr(10).join(context_info)}
 
-[Before] 첫 번째 이미지 - 클릭 직전 (빨간 원이 클릭 위치)
-[After] 두 번째 이미지 - 클릭 직후"""
+[Before] 클릭 직전 (빨간 원이 클릭 위치)
+[After] 클릭 직후"""
+        if pair.roi is not None:
+            user_message += "\n[Before 확대], [After 확대] 클릭 주변 원본 해상도 영역"
 
         # 시스템 프롬프트 캐싱 설정
         system_content = [{"type": "text", "text": SYSTEM_PROMPT}]
@@ -213,24 +227,7 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
                 {
                     "role": "user",
                     "content": [
-                        {"type": "text", "text": "[Before 이미지]"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": before_b64,
-                            },
-                        },
-                        {"type": "text", "text": "[After 이미지]"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": after_b64,
-                            },
-                        },
+                        *image_content,
                         {"type": "text", "text": user_message},
                     ],
                 },
@@ -253,6 +250,7 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
 
         여러 쌍을 묶어서 한 번의 API 호출로 분석합니다.
         테스트 결과 batch_size=5~10이 비용/정확도 최적입니다.
+        변화 없음 판정기가 있으면 화면 변화가 없는 쌍은 API 없이 no_change 라벨을 붙입니다.
 
         Args:
             pairs: 분석할 키프레임 쌍 목록
@@ -264,6 +262,16 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
         if not pairs:
             return []
 
+        if self._no_change_filter is not None:
+            return await self._no_change_filter.run(
+                pairs, lambda changed: self._analyze_pairs(changed, batch_size), batch_size
+            )
+        return await self._analyze_pairs(pairs, batch_size)
+
+    async def _analyze_pairs(
+        self, pairs: list[KeyframePair], batch_size: int
+    ) -> list[LabeledAction]:
+        """API로 키프레임 쌍 분석 (1쌍은 개별 분석, 나머지는 batch_size씩 배치 분석)"""
         # 단일 쌍인 경우 개별 분석
         if len(pairs) == 1:
             result = await self.analyze_keyframe_pair(pairs[0])
@@ -299,53 +307,33 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
         for i, pair in enumerate(batch):
             pair_num = start_index + i + 1
 
-            # 클릭 위치
-            click_pos = None
-            if pair.trigger_event.x is not None and pair.trigger_event.y is not None:
-                click_pos = (pair.trigger_event.x, pair.trigger_event.y)
-
-            # Before 이미지
-            before_bytes, media_type = self._prepare_frame_image(
-                pair.before_frame,
-                max_size=self._max_image_size,
-                click_pos=click_pos,
-            )
-            before_b64 = base64.standard_b64encode(before_bytes).decode("utf-8")
-
-            # After 이미지
-            after_bytes, _ = self._prepare_frame_image(
-                pair.after_frame,
-                max_size=self._max_image_size,
-                click_pos=None,
-            )
-            after_b64 = base64.standard_b64encode(after_bytes).decode("utf-8")
-
             # 컨텍스트 정보
             context_parts = []
             if pair.trigger_event.app_name:
                 context_parts.append(f"앱: {pair.trigger_event.app_name}")
+            if pair.trigger_event.event_type != InputEventType.MOUSE_CLICK:
+                context_parts.append(self._describe_trigger(pair.trigger_event))
+            changes = self._describe_changes(pair)
+            if changes:
+                context_parts.append(changes)
             context_str = ", ".join(context_parts) if context_parts else ""
 
-            content.extend([
-                {"type": "text", "text": f"[Before {pair_num}] {context_str}"},
-                {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": before_b64,
-                    },
-                },
-                {"type": "text", "text": f"[After {pair_num}]"},
-                {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": after_b64,
+            images = self._prepare_pair_images(pair, self._max_image_size)
+            for image in images:
+                label = f"[{image.label} {pair_num}]"
+                if image.role == "before" and not image.zoomed and context_str:
+                    label = f"{label} {context_str}"
+                content.extend([
+                    {"type": "text", "text": label},
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": image.media_type,
+                            "data": base64.standard_b64encode(image.data).decode("utf-8"),
+                        },
                     },
-                },
-            ])
+                ])
 
         content.append({
             "type": "text",
@@ -480,6 +468,35 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
                 description=response_text[:200],
             )
 
+    def estimate_pair_cost(self, pair: KeyframePair) -> tuple[int, float]:
+        """키프레임 쌍 하나의 예상 입력 토큰과 비용 (분석 예산 선택용)
+
+        배치 시스템 프롬프트는 DEFAULT_BATCH_SIZE 쌍이 나눠 쓰는 것으로 보고 쌍마다 나눠 더합니다.
+
+        Returns:
+            (입력 토큰, USD) (변화 없음으로 API 없이 처리할 쌍은 (0, 0.0))
+        """
+        if self._no_change_filter is not None and self._no_change_filter.is_unchanged(pair):
+            return 0, 0.0
+        input_tokens = self._pair_image_tokens(pair) + 50 + 800 // DEFAULT_BATCH_SIZE
+        return input_tokens, input_tokens * 3 / 1_000_000 + 100 * 15 / 1_000_000
+
+    def _pair_image_tokens(self, pair: KeyframePair) -> int:
+        """쌍의 이미지 토큰 (Before + After = 2장, ROI가 있으면 확대 이미지 2장 추가)"""
+        tokens = 0
+        max_size = self._max_image_size
+        if pair.roi is not None:
+            max_size = min(max_size, settings.analysis_overview_size)
+            left, top, right, bottom = pair.roi
+            tokens += 2 * self._estimate_image_tokens(right - left, bottom - top)
+        for frame in [pair.before_frame, pair.after_frame]:
+            w, h = frame.width, frame.height
+            if max(w, h) > max_size:
+                ratio = max_size / max(w, h)
+                w, h = int(w * ratio), int(h * ratio)
+            tokens += self._estimate_image_tokens(w, h)
+        return tokens
+
     def estimate_cost(
         self,
         pairs: list[KeyframePair],
@@ -492,17 +509,15 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
             batch_size: 배치 크기 (기본값: 5)
 
         Returns:
-            예상 비용 정보 딕셔너리
+            예상 비용 정보 딕셔너리 (변화 없음으로 API 없이 처리할 쌍은 제외)
         """
-        # 이미지 토큰 계산 (Before + After = 2장/쌍)
-        total_image_tokens = 0
-        for pair in pairs:
-            for frame in [pair.before_frame, pair.after_frame]:
-                w, h = frame.width, frame.height
-                if max(w, h) > self._max_image_size:
-                    ratio = self._max_image_size / max(w, h)
-                    w, h = int(w * ratio), int(h * ratio)
-                total_image_tokens += self._estimate_image_tokens(w, h)
+        skipped_pairs = 0
+        if self._no_change_filter is not None:
+            analyzed = [pair for pair in pairs if not self._no_change_filter.is_unchanged(pair)]
+            skipped_pairs = len(pairs) - len(analyzed)
+            pairs = analyzed
+
+        total_image_tokens = sum(self._pair_image_tokens(pair) for pair in pairs)
 
         # API 호출 횟수 계산
         num_api_calls = (len(pairs) + batch_size - 1) // batch_size
@@ -535,6 +550,7 @@ class ClaudeAnalyzer(BaseVisionAnalyzer):
             "prompt_tokens": prompt_tokens,
             "output_tokens": output_tokens,
             "api_calls": num_api_calls,
+            "skipped_pairs": skipped_pairs,
             "batch_size": batch_size,
             "input_cost_usd": input_cost,
             "output_cost_usd": output_cost,
@@ -30,10 +30,11 @@ SYSTEM_PROMPT = """<role>
 </context>
 
 <instructions>
-1. 첫 번째 이미지(Before): 클릭 직전 화면 상태
-2. 두 번째 이미지(After): 클릭 직후 화면 상태
+1. [Before] 이미지: 클릭 직전 화면 상태
+2. [After] 이미지: 클릭 직후 화면 상태
 3. 빨간 원: 클릭 위치 (Before 이미지에 표시)
-4. 두 이미지를 비교하여 화면 변화를 구체적으로 분석
+4. [Before 확대], [After 확대] 이미지가 있으면 클릭 주변을 원본 해상도로 자른 영역 (작은 글자 확인용)
+5. 두 이미지를 비교하여 화면 변화를 구체적으로 분석
 </instructions>
 
 <output_format>
@@ -120,25 +121,17 @@ class NemotronAnalyzer(BaseVisionAnalyzer):
         Returns:
             상태 변화가 포함된 동작 라벨
         """
-        # Before 이미지 (클릭 위치 표시)
-        click_pos = None
-        if pair.trigger_event.x is not None and pair.trigger_event.y is not None:
-            click_pos = (pair.trigger_event.x, pair.trigger_event.y)
-
-        before_bytes, _ = self._prepare_frame_image(
-            pair.before_frame,
-            max_size=self._max_image_size,
-            click_pos=click_pos,
-        )
-        before_b64 = base64.standard_b64encode(before_bytes).decode("utf-8")
-
-        # After 이미지 (클릭 위치 표시 없음)
-        after_bytes, _ = self._prepare_frame_image(
-            pair.after_frame,
-            max_size=self._max_image_size,
-            click_pos=None,
-        )
-        after_b64 = base64.standard_b64encode(after_bytes).decode("utf-8")
+        # Before/After 이미지 (Before에 클릭 위치 표시, ROI가 있으면 확대 이미지 추가)
+        image_content = []
+        for image in self._prepare_pair_images(pair, self._max_image_size):
+            image_b64 = base64.standard_b64encode(image.data).decode("utf-8")
+            image_content.extend([
+                {"type": "text", "text": f"[{image.label} 이미지]"},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:{image.media_type};base64,{image_b64}"},
+                },
+            ])
 
         # 컨텍스트 정보 구성
         context_info = []
@@ -146,17 +139,20 @@ class NemotronAnalyzer(BaseVisionAnalyzer):
             context_info.append(f"앱: {pair.trigger_event.app_name}")
         if pair.trigger_event.window_title:
             context_info.append(f"윈도우: {pair.trigger_event.window_title}")
-        x = pair.trigger_event.x or 0
-        y = pair.trigger_event.y or 0
-        context_info.append(f"클릭 위치: ({x}, {y})")
+        context_info.append(self._describe_trigger(pair.trigger_event))
+        changes = self._describe_changes(pair)
+        if changes:
+            context_info.append(changes)
 
         user_message = f"""다음 두 스크린샷을 비교 분석해주세요.
 
 [컨텍스트]
 {chr(10).join(context_info)}
 
-[Before] 첫 번째 이미지 - 클릭 직전 (빨간 원이 클릭 위치)
-[After] 두 번째 이미지 - 클릭 직후"""
+[Before] 클릭 직전 (빨간 원이 클릭 위치)
+[After] 클릭 직후"""
+        if pair.roi is not None:
+            user_message += "\n[Before 확대], [After 확대] 클릭 주변 원본 해상도 영역"
 
         # OpenAI 호환 API 호출 (동기 -> 비동기 래핑)
         loop = asyncio.get_event_loop()
@@ -169,16 +165,7 @@ class NemotronAnalyzer(BaseVisionAnalyzer):
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": "[Before 이미지]"},
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{before_b64}"},
-                            },
-                            {"type": "text", "text": "[After 이미지]"},
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{after_b64}"},
-                            },
+                            *image_content,
                             {"type": "text", "text": user_message},
                         ],
                     },
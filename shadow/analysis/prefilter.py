@@ -0,0 +1,94 @@
+"""VLM 분석 전 변화 없음 판정 모듈
+
+BATCH_SYSTEM_PROMPT는 변화가 없는 쌍에 "no_change"로 답하도록 하지만,
+그 답을 받기까지 이미지 토큰과 지연 시간을 그대로 씁니다.
+Before/After 사이에 변화 영역(FrameDiff.boxes)이 하나도 없는 쌍만 API를 호출하지 않고
+로컬에서 no_change 라벨을 만들어 결과 순서에 끼워 넣습니다.
+체크박스나 한 글자 입력처럼 작은 변화도 변화 영역이 생기므로 분석에 보냅니다.
+"""
+
+import logging
+import math
+from collections.abc import Awaitable, Callable
+
+from shadow.analysis.models import LabeledAction
+from shadow.capture.models import KeyframePair
+from shadow.config import settings
+from shadow.preprocessing.diff import compute_diff
+
+logger = logging.getLogger(__name__)
+
+
+class NoChangeFilter:
+    """화면 변화 없는 키프레임 쌍 로컬 판정
+
+    KeyframePair.diff가 있으면 재사용하고, 없으면 그 자리에서 계산합니다.
+    """
+
+    def __init__(self):
+        self.skipped_pairs = 0  # 로컬 판정한 누적 쌍 수
+        self.skipped_calls = 0  # 그로 인해 줄어든 누적 API 호출 수
+
+    def is_unchanged(self, pair: KeyframePair) -> bool:
+        """Before/After 사이에 변화 영역이 없는지 확인"""
+        diff = pair.diff
+        if diff is None:
+            diff = compute_diff(
+                pair.before_frame,
+                pair.after_frame,
+                cell=settings.keyframe_diff_cell,
+                stride=settings.keyframe_diff_stride,
+            )
+        return not diff.changed
+
+    @staticmethod
+    def no_change_label(pair: KeyframePair) -> LabeledAction:
+        """API 응답 형식과 같은 no_change 라벨"""
+        return LabeledAction(
+            action="no_change",
+            target="none",
+            context=pair.trigger_event.app_name or "unknown",
+            description="화면 변화 없음 (로컬 판정)",
+            state_change="변화 없음",
+        )
+
+    async def run(
+        self,
+        pairs: list[KeyframePair],
+        analyze: Callable[[list[KeyframePair]], Awaitable[list[LabeledAction]]],
+        batch_size: int,
+    ) -> list[LabeledAction]:
+        """변화 있는 쌍만 analyze로 분석하고 원래 순서대로 라벨 합치기
+
+        Args:
+            pairs: 분석할 키프레임 쌍 목록
+            analyze: 변화 있는 쌍 목록을 분석하는 함수 (pairs 순서대로 라벨 반환)
+            batch_size: analyze의 배치 크기 (줄어든 API 호출 수 계산용)
+
+        Returns:
+            pairs 순서대로의 라벨 목록
+        """
+        unchanged = [self.is_unchanged(pair) for pair in pairs]
+        changed = [pair for pair, skip in zip(pairs, unchanged) if not skip]
+        analyzed = iter(await analyze(changed) if changed else [])
+
+        skipped_calls = self._api_calls(len(pairs), batch_size) - self._api_calls(
+            len(changed), batch_size
+        )
+        self.skipped_pairs += len(pairs) - len(changed)
+        self.skipped_calls += skipped_calls
+        if len(changed) < len(pairs):
+            logger.info(
+                f"변화 없는 쌍 {len(pairs) - len(changed)}/{len(pairs)}개 로컬 판정 "
+                f"(API 호출 {skipped_calls}회 생략)"
+            )
+
+        return [
+            self.no_change_label(pair) if skip else next(analyzed)
+            for pair, skip in zip(pairs, unchanged)
+        ]
+
+    @staticmethod
+    def _api_calls(count: int, batch_size: int) -> int:
+        """analyze_batch의 API 호출 수 (1쌍은 개별 분석 1회)"""
+        return math.ceil(count / batch_size) if count > 1 else count
@@ -3,13 +3,18 @@
 users 및 configs 테이블과 상호작용
 """
 
+import logging
 from datetime import datetime
 from typing import Any
 
 from supabase import Client
 
 from shadow.api.errors import ErrorCode, ShadowAPIError
-from shadow.core.database import get_db
+from shadow.capture.redaction import parse_excluded_apps
+from shadow.config import settings
+from shadow.core.database import Database, get_db
+
+logger = logging.getLogger(__name__)
 
 
 class UserRepository:
@@ -396,3 +401,34 @@ class ConfigRepository:
                 message="제외 앱 제거 중 오류 발생",
                 details=str(e),
             )
+
+
+def load_excluded_apps(
+    user_id: str | None = None, repository: ConfigRepository | None = None
+) -> list[str] | None:
+    """Recorder에 전달할 녹화 제외 앱 목록
+
+    capture_excluded_apps 설정과 사용자 설정(configs.excluded_apps)을 합칩니다.
+    Supabase가 설정되지 않았거나 사용자 설정을 읽을 수 없으면 None을 반환하므로
+    Recorder는 capture_excluded_apps 설정만 사용합니다.
+
+    Args:
+        user_id: 사용자 ID (None이면 user_id 설정 사용)
+        repository: 설정 Repository (None이면 기본 DB 클라이언트로 생성)
+
+    Returns:
+        제외 앱 이름 또는 bundle ID 목록 (사용자 설정이 없으면 None)
+    """
+    if repository is None:
+        if not Database.is_configured():
+            return None
+        repository = ConfigRepository()
+    user_id = user_id or settings.user_id
+    try:
+        config = repository.get_config(user_id)
+    except ShadowAPIError as e:
+        logger.warning("사용자 제외 앱 설정을 읽지 못했습니다 (%s): %s", user_id, e.message)
+        return None
+
+    apps = parse_excluded_apps(settings.capture_excluded_apps)
+    return apps + [app for app in config.get("excluded_apps") or [] if app not in apps]
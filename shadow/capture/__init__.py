@@ -1,12 +1,25 @@
 """데이터 수집 모듈"""
 
+from shadow.capture.backends import (
+    CaptureBackend,
+    MssBackend,
+    ReplayBackend,
+    SyntheticBackend,
+    list_monitors,
+)
+from shadow.capture.event_log import EventCursor, EventLog
+from shadow.capture.event_store import EventStore
+from shadow.capture.frame_buffer import FrameRingBuffer
 from shadow.capture.input_events import InputEventCollector
 from shadow.capture.models import (
     # Dataclass 모델 (내부 처리용)
+    CaptureMode,
     Frame,
+    FrameDiff,
     InputEvent,
     InputEventType,
     KeyframePair,
+    MonitorGeometry,
     # Pydantic 모델 (저장/API용)
     ActiveWindow,
     ClickType,
@@ -19,16 +32,25 @@ from shadow.capture.models import (
     ScreenshotType,
     WindowInfo
 )
+from shadow.capture.rate import AdaptiveRateController
 from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.capture.redaction import ExclusionFilter
+from shadow.capture.scheduler import CaptureScheduler, CaptureStats
 from shadow.capture.screen import ScreenCapture
+from shadow.capture.stages import BackpressurePolicy, CapturePipeline, StageQueue
+from shadow.capture.triggered import TriggeredFrameSelector
 from shadow.capture.window import WindowInfoCollector, get_active_window
+from shadow.capture.writer import BackgroundWriter, SaveHandle
 
 __all__ = [
     # Dataclass 모델
+    "CaptureMode",
     "Frame",
+    "FrameDiff",
     "InputEvent",
     "InputEventType",
     "KeyframePair",
+    "MonitorGeometry",
     # Pydantic 모델
     "Screenshot",
     "ScreenshotType",
@@ -41,10 +63,31 @@ __all__ = [
     "ClickType",
     "WindowInfo",
     # 수집기
+    "FrameRingBuffer",
     "ScreenCapture",
+    "TriggeredFrameSelector",
     "InputEventCollector",
+    "EventLog",
+    "EventCursor",
+    "EventStore",
     "WindowInfoCollector",
     "get_active_window",
     "Recorder",
     "RecordingSession",
+    "ExclusionFilter",
+    "CaptureScheduler",
+    "CaptureStats",
+    "CapturePipeline",
+    "StageQueue",
+    "BackpressurePolicy",
+    "AdaptiveRateController",
+    # 캡처 백엔드
+    "CaptureBackend",
+    "MssBackend",
+    "SyntheticBackend",
+    "ReplayBackend",
+    "list_monitors",
+    # 저장
+    "BackgroundWriter",
+    "SaveHandle",
 ]
@@ -0,0 +1,402 @@
+"""캡처 백엔드 모듈
+
+ScreenCapture가 화면을 가져오는 소스를 교체할 수 있도록 백엔드 인터페이스를 정의합니다.
+
+- MssBackend: 실제 모니터 화면 (기본값)
+- SyntheticBackend: 합성 화면 + 스크립트 입력 이벤트 (디스플레이 없는 환경의 벤치마크/부하 테스트용)
+- ReplayBackend: 저장된 세션 디렉토리를 실제 또는 가속 속도로 재생
+
+입력 이벤트를 제공하는 백엔드(provides_events=True)는 InputEventCollector에
+pynput 리스너 대신 이벤트 소스로 연결됩니다.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+from pathlib import Path
+
+import mss
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from shadow.capture.models import InputEvent, InputEventType, MonitorGeometry, WindowInfo
+from shadow.capture.window import get_current_process_info
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureBackend(ABC):
+    """화면(및 선택적으로 입력 이벤트) 소스
+
+    grab()은 (H, W, 4) BGRA 배열을 반환하며, 호출마다 새 버퍼이거나
+    이후 수정되지 않는 버퍼여야 합니다 (캡처 파이프라인이 다른 스레드에서 나중에 변환).
+    """
+
+    provides_events = False  # True면 start_events()로 입력 이벤트 제공
+
+    def open(self) -> None:
+        """캡처 세션 시작 (ScreenCapture.session() 진입 시, grab 스레드에서 호출)"""
+
+    def close(self) -> None:
+        """캡처 세션 종료"""
+
+    @abstractmethod
+    def grab(self) -> NDArray[np.uint8]:
+        """화면을 BGRA 배열로 가져오기"""
+
+    @property
+    @abstractmethod
+    def monitor_info(self) -> dict:
+        """모니터 정보 (left, top, width, height)"""
+
+    def start_events(self, emit: Callable[[InputEvent], None]) -> None:
+        """입력 이벤트 발생 시작 (provides_events=True인 백엔드만 구현)
+
+        Args:
+            emit: 이벤트를 전달할 콜백
+        """
+        raise NotImplementedError(f"{type(self).__name__}는 입력 이벤트를 제공하지 않습니다")
+
+    def stop_events(self) -> None:
+        """입력 이벤트 발생 중지"""
+
+
+class MssBackend(CaptureBackend):
+    """MSS를 사용한 실제 모니터 캡처
+
+    mss 핸들은 open()을 호출한 스레드에서만 사용하므로,
+    모니터마다 MssBackend를 따로 만들어 각자의 grab 스레드에서 캡처합니다.
+    """
+
+    def __init__(self, monitor: int):
+        """
+        Args:
+            monitor: 캡처할 모니터 번호 (1-based)
+        """
+        self._monitor = monitor
+        self._sct: mss.mss | None = None
+
+    def open(self) -> None:
+        self._sct = mss.mss()
+
+    def close(self) -> None:
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
+    def grab(self) -> NDArray[np.uint8]:
+        """모니터 화면을 BGRA 배열로 가져오기 (mss 버퍼 view, 복사 없음)"""
+        if self._monitor >= len(self._sct.monitors):
+            info = get_current_process_info()
+            logger.warning(
+                "Screen Recording 권한 필요. 현재 실행 앱=%s bundle_id=%s pid=%s exe=%s",
+                info.get("app_name"),
+                info.get("bundle_id"),
+                info.get("pid"),
+                info.get("executable"),
+            )
+            raise RuntimeError(
+                f"모니터 인덱스 범위 오류: monitor={self._monitor}, "
+                f"available={len(self._sct.monitors)}. "
+                "Screen Recording 권한을 확인하세요."
+            )
+
+        monitor = self._sct.monitors[self._monitor]
+        screenshot = self._sct.grab(monitor)
+        return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4
+        )
+
+    @property
+    def monitor_info(self) -> dict:
+        if self._sct is None:
+            with mss.mss() as sct:
+                return dict(sct.monitors[self._monitor])
+        return dict(self._sct.monitors[self._monitor])
+
+
+def list_monitors() -> list[MonitorGeometry]:
+    """연결된 모니터 목록 (mss 모니터 번호 순, 가상 데스크톱 전체(0번) 제외)"""
+    with mss.mss() as sct:
+        return [
+            MonitorGeometry(
+                index=index,
+                left=monitor["left"],
+                top=monitor["top"],
+                width=monitor["width"],
+                height=monitor["height"],
+            )
+            for index, monitor in enumerate(sct.monitors)
+            if index > 0
+        ]
+
+
+class _EventPlayer:
+    """(시작 후 경과 초, 이벤트) 목록을 시각에 맞춰 발생시키는 스레드
+
+    발생 시 timestamp(와 end_timestamp)는 현재 시각 기준으로 옮겨지며,
+    지속 시간(end_timestamp - timestamp)은 speed배 빠르게 줄어듭니다.
+    """
+
+    def __init__(self, script: Sequence[tuple[float, InputEvent]], speed: float = 1.0):
+        self._script = sorted(script, key=lambda item: item[0])
+        self._speed = speed
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, emit: Callable[[InputEvent], None], started: float) -> None:
+        """started(time.time() 기준)부터 스크립트 재생"""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(emit, started), name="capture-event-player", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, emit: Callable[[InputEvent], None], started: float) -> None:
+        for offset, event in self._script:
+            if self._stop.wait(max(0.0, started + offset - time.time())):
+                return
+            timestamp = started + offset
+            end_timestamp = None
+            if event.end_timestamp is not None:
+                end_timestamp = timestamp + (event.end_timestamp - event.timestamp) / self._speed
+            emit(replace(event, timestamp=timestamp, end_timestamp=end_timestamp))
+
+
+class _ScriptedBackend(CaptureBackend):
+    """스크립트 이벤트를 발생시키는 백엔드 공통 부분
+
+    화면 grab과 이벤트 발생이 같은 시간축(세션 시작 시각)을 공유합니다.
+    """
+
+    provides_events = True
+
+    def __init__(self, script: Sequence[tuple[float, InputEvent]], speed: float = 1.0):
+        self._player = _EventPlayer(script, speed)
+        self._started: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """세션 시작 후 경과 시간 (초)"""
+        return 0.0 if self._started is None else time.time() - self._started
+
+    def open(self) -> None:
+        # 화면 세션과 이벤트 중 먼저 시작한 쪽의 시각을 공유
+        if self._started is None:
+            self._started = time.time()
+
+    def start_events(self, emit: Callable[[InputEvent], None]) -> None:
+        self.open()
+        self._player.start(emit, self._started)
+
+    def stop_events(self) -> None:
+        self._player.stop()
+        self._started = None
+
+
+class SyntheticBackend(_ScriptedBackend):
+    """합성 화면 + 스크립트 입력 이벤트
+
+    - 화면: 고정 노이즈 배경 위에서 change_interval초마다 사각 영역 하나가 바뀜
+      (클릭 후 response_delay초 뒤에는 클릭 위치 주변 영역이 바뀜)
+    - 이벤트: events를 지정하면 그대로, 아니면 click_interval초마다 임의 위치 클릭
+    - grab_latency로 실제 grab 시간을 흉내낼 수 있음
+
+    같은 seed면 화면과 이벤트가 동일하므로 Recorder 처리량을 재현 가능하게 측정할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        events: Sequence[InputEvent] | None = None,
+        click_interval: float | None = 1.0,
+        duration: float = 60.0,
+        change_interval: float = 0.5,
+        region_size: tuple[int, int] = (200, 120),
+        response_delay: float = 0.1,
+        grab_latency: float = 0.0,
+        seed: int = 0,
+        origin: tuple[int, int] = (0, 0),
+    ):
+        """
+        Args:
+            width: 화면 너비 (px)
+            height: 화면 높이 (px)
+            events: 발생시킬 이벤트 (timestamp는 세션 시작 후 경과 초, 좌표는 가상 데스크톱 기준)
+            click_interval: events가 없을 때 자동 클릭 간격 (초, None이면 이벤트 없음)
+            duration: 자동 클릭을 생성할 시간 범위 (초)
+            change_interval: 화면 일부가 바뀌는 간격 (초, 0이면 클릭 반응만)
+            region_size: 바뀌는 영역 크기 (너비, 높이)
+            response_delay: 클릭 후 클릭 위치 주변 화면이 바뀌기까지의 시간 (초)
+            grab_latency: grab 1회 소요 시간 (초)
+            seed: 난수 시드
+            origin: 가상 데스크톱에서 화면 좌상단 좌표 (다중 모니터 흉내)
+        """
+        self._width = width
+        self._origin_xy = origin
+        self._height = height
+        self._change_interval = change_interval
+        self._region_size = region_size
+        self._response_delay = response_delay
+        self._grab_latency = grab_latency
+        self._rng_seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._background = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        self._background[:, :, 3] = 255
+
+        if events is None:
+            events = self._scripted_clicks(rng, click_interval, duration)
+        super().__init__([(event.timestamp, event) for event in events])
+        # 클릭 반응 시각과 위치 (화면 합성용)
+        left, top = origin
+        self._responses = sorted(
+            (event.timestamp + response_delay, event.x - left, event.y - top)
+            for event in events
+            if event.event_type == InputEventType.MOUSE_CLICK and event.x is not None
+        )
+
+    def _scripted_clicks(
+        self, rng: np.random.Generator, interval: float | None, duration: float
+    ) -> list[InputEvent]:
+        """interval초 간격의 임의 위치 클릭 생성"""
+        if not interval:
+            return []
+        window = WindowInfo(app_name="Synthetic", window_title="Synthetic Screen")
+        return [
+            InputEvent(
+                timestamp=offset,
+                event_type=InputEventType.MOUSE_CLICK,
+                x=self._origin_xy[0] + int(rng.integers(0, self._width)),
+                y=self._origin_xy[1] + int(rng.integers(0, self._height)),
+                button="left",
+                app_name=window.app_name,
+                window_title=window.window_title,
+                window_info=window,
+            )
+            for offset in np.arange(interval, duration, interval).tolist()
+        ]
+
+    def _region(self, step: int) -> tuple[int, int]:
+        """step번째 주기 변화 영역의 좌상단 좌표"""
+        rng = np.random.default_rng((self._rng_seed, step))
+        w, h = self._region_size
+        return int(rng.integers(0, max(1, self._width - w))), int(
+            rng.integers(0, max(1, self._height - h))
+        )
+
+    def grab(self) -> NDArray[np.uint8]:
+        if self._grab_latency > 0:
+            time.sleep(self._grab_latency)
+
+        elapsed = self.elapsed
+        frame = self._background.copy()
+        w, h = self._region_size
+
+        if self._change_interval > 0:
+            step = int(elapsed / self._change_interval)
+            left, top = self._region(step)
+            frame[top : top + h, left : left + w, :3] = step % 256
+
+        # 이미 반응 시각이 지난 클릭 중 가장 최근 클릭 위치 주변
+        responded = bisect.bisect_right(self._responses, (elapsed, float("inf"), float("inf")))
+        if responded:
+            _, x, y = self._responses[responded - 1]
+            left, top = max(0, x - w // 2), max(0, y - h // 2)
+            frame[top : top + h, left : left + w, :3] = (responded * 37) % 256
+
+        return frame
+
+    @property
+    def monitor_info(self) -> dict:
+        left, top = self._origin_xy
+        return {"left": left, "top": top, "width": self._width, "height": self._height}
+
+
+class ReplayBackend(_ScriptedBackend):
+    """저장된 세션 디렉토리 재생
+
+    SessionStorage.save_session()이 저장한 키프레임 이미지와 events.json을
+    원래 시간 간격(speed배 가속)으로 다시 발생시킵니다.
+    grab()은 재생 시점 직전에 저장된 키프레임 이미지를 반환합니다.
+    """
+
+    def __init__(self, session_dir: str | Path, speed: float = 1.0):
+        """
+        Args:
+            session_dir: SessionStorage로 저장한 세션 디렉토리
+            speed: 재생 속도 배율 (2.0이면 2배속)
+
+        Raises:
+            ValueError: speed가 0 이하이거나 재생할 키프레임이 없는 경우
+        """
+        if speed <= 0:
+            raise ValueError(f"speed는 0보다 커야 합니다: {speed}")
+
+        # storage -> recorder -> screen -> backends 순환 import 방지
+        from shadow.capture.storage import SessionStorage
+
+        storage = SessionStorage()
+        images: dict[float, Path] = {}
+        for before_path, after_path, event_data in storage.load_keyframe_pairs(session_dir):
+            images.setdefault(event_data["before_timestamp"], before_path)
+            images.setdefault(event_data["after_timestamp"], after_path)
+        if not images:
+            raise ValueError(f"재생할 키프레임이 없습니다: {session_dir}")
+
+        events = [
+            storage.event_from_dict(data) for data in storage.load_session_events(session_dir)
+        ]
+        self._frame_times = sorted(images)
+        self._frame_paths = [images[ts] for ts in self._frame_times]
+        self._frames: dict[int, NDArray[np.uint8]] = {}
+        self._origin = min([self._frame_times[0], *(e.timestamp for e in events)])
+        self._span = max([self._frame_times[-1], *(e.timestamp for e in events)]) - self._origin
+        self._speed = speed
+        self._lock = threading.Lock()
+        super().__init__([((e.timestamp - self._origin) / speed, e) for e in events], speed)
+
+    @property
+    def duration(self) -> float:
+        """재생 시간 (초, speed 반영)"""
+        return self._span / self._speed
+
+    @property
+    def finished(self) -> bool:
+        """재생이 끝났는지 여부"""
+        return self._started is not None and self.elapsed >= self.duration
+
+    def _load(self, index: int) -> NDArray[np.uint8]:
+        """index번째 키프레임을 BGRA로 로드 (캐시, 반환 배열은 수정하지 않음)"""
+        with self._lock:
+            frame = self._frames.get(index)
+            if frame is None:
+                rgb = np.asarray(Image.open(self._frame_paths[index]).convert("RGB"))
+                frame = np.empty((*rgb.shape[:2], 4), dtype=np.uint8)
+                frame[:, :, 2::-1] = rgb
+                frame[:, :, 3] = 255
+                frame.flags.writeable = False
+                self._frames[index] = frame
+            return frame
+
+    def grab(self) -> NDArray[np.uint8]:
+        original = self._origin + self.elapsed * self._speed
+        index = max(0, bisect.bisect_right(self._frame_times, original) - 1)
+        return self._load(index)
+
+    @property
+    def monitor_info(self) -> dict:
+        height, width = self._load(0).shape[:2]
+        return {"left": 0, "top": 0, "width": width, "height": height}
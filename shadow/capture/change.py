@@ -0,0 +1,69 @@
+"""캡처 단계 프레임 변화 감지 모듈
+
+mss가 반환한 BGRA 버퍼를 다운샘플링한 체크섬으로 화면 변화를 판단합니다.
+변화가 없는 프레임은 RGB 변환/복사 없이 이전 프레임을 참조하도록 합니다.
+변화가 있으면 바뀐 샘플 픽셀 비율(changed_ratio)로 변화 크기를 알려 줍니다
+(적응형 FPS가 커서 깜박임 같은 작은 변화를 활동으로 보지 않도록).
+"""
+
+import zlib
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FrameChangeDetector:
+    """다운샘플 체크섬 기반 변화 감지기
+
+    stride 간격으로 샘플링한 픽셀의 CRC32를 비교합니다.
+    stride보다 작은 변화(예: 샘플 사이에 낀 1px 커서)는 놓칠 수 있으므로
+    텍스트 입력처럼 작은 변화가 중요하면 stride를 줄이세요.
+    """
+
+    def __init__(self, stride: int = 4):
+        """
+        Args:
+            stride: 샘플링 간격 (px, 1이면 전체 픽셀)
+        """
+        if stride < 1:
+            raise ValueError(f"stride는 1 이상이어야 합니다: {stride}")
+        self._stride = stride
+        self._last_signature: int | None = None
+        self._sample: NDArray[np.uint8] | None = None  # 마지막 signature()의 샘플
+        self._last_sample: NDArray[np.uint8] | None = None  # 기록된 프레임의 샘플
+
+    def signature(self, bgra: NDArray[np.uint8]) -> int:
+        """BGRA 버퍼의 다운샘플 체크섬 계산
+
+        Args:
+            bgra: (H, W, 4) BGRA 배열
+
+        Returns:
+            CRC32 체크섬
+        """
+        sample = np.ascontiguousarray(bgra[:: self._stride, :: self._stride, :3])
+        self._sample = sample
+        return zlib.crc32(sample)
+
+    def is_unchanged(self, signature: int) -> bool:
+        """마지막으로 기록된 프레임과 동일한지 확인"""
+        return signature == self._last_signature
+
+    def changed_ratio(self) -> float:
+        """마지막 signature()의 샘플 중 기록된 프레임과 다른 픽셀 비율 (기록이 없으면 1.0)"""
+        if self._sample is None or self._last_sample is None:
+            return 1.0
+        if self._sample.shape != self._last_sample.shape:
+            return 1.0
+        return float(np.any(self._sample != self._last_sample, axis=2).mean())
+
+    def commit(self, signature: int) -> None:
+        """저장된 프레임의 체크섬 (및 샘플) 기록"""
+        self._last_signature = signature
+        self._last_sample = self._sample
+
+    def reset(self) -> None:
+        """기록 초기화 (새 캡처 세션 시작 시)"""
+        self._last_signature = None
+        self._sample = None
+        self._last_sample = None
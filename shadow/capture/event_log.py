@@ -0,0 +1,181 @@
+"""입력 이벤트 로그 모듈
+
+이벤트를 순번(sequence number)과 함께 chunk 단위 리스트에 덧붙여 저장합니다.
+소비자는 큐처럼 꺼내 가지 않고 각자의 커서 위치부터 읽으므로
+Recorder, 스트리밍 추출기, 업로더 등 여러 소비자가 같은 이벤트를 동시에 읽을 수 있습니다.
+"""
+
+import threading
+from collections import deque
+
+from shadow.capture.models import InputEvent
+
+
+class EventLog:
+    """append-only 입력 이벤트 로그
+
+    - append()는 0부터 증가하는 순번을 반환
+    - max_events를 지정하면 가장 오래된 이벤트부터 보관 범위에서 제외 (dropped 증가)
+    - 메모리는 chunk 단위로 해제
+    """
+
+    def __init__(self, chunk_size: int = 256, max_events: int | None = None):
+        """
+        Args:
+            chunk_size: chunk당 이벤트 수
+            max_events: 최대 보관 이벤트 수 (None이면 제한 없음)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+        if max_events is not None and max_events < 1:
+            raise ValueError(f"max_events는 1 이상이어야 합니다: {max_events}")
+
+        self._chunk_size = chunk_size
+        self._max_events = max_events
+        self._chunks: deque[list[InputEvent]] = deque()
+        self._base_seq = 0  # _chunks[0][0]의 순번
+        self._first_seq = 0  # 보관 중인 가장 오래된 이벤트 순번
+        self._next_seq = 0  # 다음 append()의 순번
+        self._cond = threading.Condition()
+
+    @property
+    def first_seq(self) -> int:
+        """보관 중인 가장 오래된 이벤트 순번"""
+        return self._first_seq
+
+    @property
+    def next_seq(self) -> int:
+        """다음에 추가될 이벤트 순번 (= 지금까지 추가된 이벤트 수)"""
+        return self._next_seq
+
+    @property
+    def dropped(self) -> int:
+        """보관 범위를 넘어 제외된 이벤트 수"""
+        return self._first_seq
+
+    def __len__(self) -> int:
+        return self._next_seq - self._first_seq
+
+    def append(self, event: InputEvent) -> int:
+        """이벤트 추가
+
+        Args:
+            event: 추가할 이벤트
+
+        Returns:
+            이벤트 순번
+        """
+        with self._cond:
+            if not self._chunks or len(self._chunks[-1]) >= self._chunk_size:
+                self._chunks.append([])
+            self._chunks[-1].append(event)
+            seq = self._next_seq
+            self._next_seq += 1
+
+            if self._max_events is not None and len(self) > self._max_events:
+                self._first_seq = self._next_seq - self._max_events
+                # 보관 범위 밖으로 완전히 밀려난 chunk 해제
+                while self._base_seq + len(self._chunks[0]) <= self._first_seq:
+                    self._base_seq += len(self._chunks.popleft())
+
+            self._cond.notify_all()
+            return seq
+
+    def read(self, start: int, limit: int | None = None) -> tuple[list[InputEvent], int]:
+        """start 순번부터 이벤트 읽기 (로그는 변경하지 않음)
+
+        Args:
+            start: 읽기 시작 순번 (보관 범위 이전이면 가장 오래된 이벤트부터)
+            limit: 최대 이벤트 수 (None이면 전부)
+
+        Returns:
+            (이벤트 목록, 실제 시작 순번) 튜플
+        """
+        with self._cond:
+            start = max(start, self._first_seq)
+            stop = self._next_seq if limit is None else min(self._next_seq, start + limit)
+            events: list[InputEvent] = []
+            seq = start
+            while seq < stop:
+                index, offset = divmod(seq - self._base_seq, self._chunk_size)
+                chunk = self._chunks[index]
+                taken = chunk[offset : offset + (stop - seq)]
+                events.extend(taken)
+                seq += len(taken)
+            return events, start
+
+    def wait(self, seq: int, timeout: float | None = None) -> bool:
+        """seq 순번의 이벤트가 추가될 때까지 대기
+
+        Args:
+            seq: 기다릴 순번
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            이벤트가 추가되었으면 True
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._next_seq > seq, timeout=timeout)
+
+    def cursor(self, from_start: bool = True) -> "EventCursor":
+        """새 소비자 커서 생성
+
+        Args:
+            from_start: True면 보관 중인 가장 오래된 이벤트부터, False면 이후 이벤트만
+
+        Returns:
+            EventCursor
+        """
+        return EventCursor(self, self._first_seq if from_start else self._next_seq)
+
+
+class EventCursor:
+    """EventLog 소비자별 읽기 위치
+
+    한 커서는 한 소비자 스레드에서만 사용합니다.
+    """
+
+    def __init__(self, log: EventLog, position: int = 0):
+        """
+        Args:
+            log: 읽을 이벤트 로그
+            position: 시작 순번
+        """
+        self._log = log
+        self._position = position
+        self.missed = 0  # 읽기 전에 보관 범위를 벗어나 놓친 이벤트 수
+
+    @property
+    def position(self) -> int:
+        """다음에 읽을 순번"""
+        return self._position
+
+    @property
+    def pending(self) -> int:
+        """아직 읽지 않은 이벤트 수"""
+        return max(0, self._log.next_seq - max(self._position, self._log.first_seq))
+
+    def read(self, limit: int | None = None) -> list[InputEvent]:
+        """마지막으로 읽은 이후의 이벤트 읽기
+
+        Args:
+            limit: 최대 이벤트 수 (None이면 전부)
+
+        Returns:
+            새 이벤트 목록 (순번 순)
+        """
+        events, start = self._log.read(self._position, limit)
+        self.missed += start - self._position
+        self._position = start + len(events)
+        return events
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """읽지 않은 이벤트가 생길 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            읽을 이벤트가 있으면 True
+        """
+        return self._log.wait(self._position, timeout)
@@ -0,0 +1,320 @@
+"""열 기반 입력 이벤트 저장소
+
+InputEvent를 객체 목록 대신 NumPy 열(struct-of-arrays)로 보관합니다.
+숫자 필드는 타입별 배열에, 문자열 필드(앱 이름, 윈도우 타이틀, 키 등)는
+중복 제거된 문자열 테이블의 번호로 저장하므로 긴 세션에서도 이벤트당 메모리가 작습니다.
+마우스 좌표는 macOS에서 소수(Retina 등)로 들어오므로 float64 열에 NaN을 없는 값으로 저장합니다.
+길이가 가변인 이동 경로(DRAG 등)는 경로가 있는 이벤트만 별도 dict에 보관합니다.
+접근 시에는 InputEvent를 그때그때 만들어 반환합니다.
+"""
+
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+
+_NO_STRING = -1  # 문자열 없음 (None)
+_NO_INT = np.iinfo(np.int32).min  # 정수 없음 (None)
+_NO_FLOAT = np.nan  # 좌표 없음 (None)
+
+_EVENT_TYPES = list(InputEventType)
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(_EVENT_TYPES)}
+
+
+def _coordinate(value: float) -> int | float | None:
+    """저장된 좌표 복원 (NaN이면 None, 정수 값이면 int로 되돌림)"""
+    if np.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+
+class StringTable:
+    """중복 제거 문자열 테이블"""
+
+    def __init__(self):
+        self._codes: dict[str, int] = {}
+        self._strings: list[str] = []
+
+    def intern(self, value: str | None) -> int:
+        """문자열 번호 (처음 보는 문자열이면 추가, None이면 -1)"""
+        if value is None:
+            return _NO_STRING
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._codes[value] = code
+            self._strings.append(value)
+        return code
+
+    def lookup(self, code: int) -> str | None:
+        """번호에 해당하는 문자열 (-1이면 None)"""
+        return None if code == _NO_STRING else self._strings[code]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class EventStore:
+    """열 기반 InputEvent 저장소
+
+    list[InputEvent]처럼 append/extend/len/iter/index/slice를 지원하고,
+    type_mask()/select()로 이벤트 객체를 만들지 않고 필터링할 수 있습니다.
+    """
+
+    _FLOAT_FIELDS = ("x", "y")
+    _INT_FIELDS = ("dx", "dy", "process_id")
+    _STR_FIELDS = (
+        "button",
+        "key",
+        "text",
+        "modifiers",  # ","로 이어 붙여 저장
+        "app_name",
+        "window_title",
+        "window_app_name",  # window_info.app_name
+        "window_window_title",  # window_info.window_title
+        "bundle_id",
+    )
+
+    def __init__(self, events: Iterable[InputEvent] = (), capacity: int = 1024):
+        """
+        Args:
+            events: 초기 이벤트
+            capacity: 초기 할당 크기 (부족하면 2배씩 증가)
+        """
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._timestamp = np.empty(self._capacity, dtype=np.float64)
+        self._end_timestamp = np.empty(self._capacity, dtype=np.float64)
+        self._type = np.empty(self._capacity, dtype=np.uint8)
+        self._has_window = np.empty(self._capacity, dtype=np.bool_)
+        self._floats = {
+            name: np.empty(self._capacity, dtype=np.float64) for name in self._FLOAT_FIELDS
+        }
+        self._ints = {name: np.empty(self._capacity, dtype=np.int32) for name in self._INT_FIELDS}
+        self._strs = {name: np.empty(self._capacity, dtype=np.int32) for name in self._STR_FIELDS}
+        self._strings = StringTable()
+        self._paths: dict[int, list[tuple[int, int]]] = {}  # 경로가 있는 이벤트만
+        self._lock = threading.Lock()
+        self.extend(events)
+
+    @property
+    def timestamps(self) -> NDArray[np.float64]:
+        """이벤트 타임스탬프 열 (읽기 전용 view)"""
+        view = self._timestamp[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def type_codes(self) -> NDArray[np.uint8]:
+        """이벤트 타입 코드 열 (읽기 전용 view, type_code()로 비교)"""
+        view = self._type[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """열 배열이 차지하는 메모리 (bytes, 문자열 테이블 제외)"""
+        arrays = [self._timestamp, self._end_timestamp, self._type, self._has_window]
+        arrays += [*self._floats.values(), *self._ints.values(), *self._strs.values()]
+        return sum(array.nbytes for array in arrays)
+
+    @staticmethod
+    def type_code(event_type: InputEventType) -> int:
+        """이벤트 타입의 코드 값"""
+        return _TYPE_CODES[event_type]
+
+    def type_mask(self, event_types: Iterable[InputEventType]) -> NDArray[np.bool_]:
+        """지정한 타입인 이벤트의 불리언 마스크
+
+        Args:
+            event_types: 찾을 이벤트 타입들
+
+        Returns:
+            이벤트 수 길이의 bool 배열
+        """
+        codes = [_TYPE_CODES[event_type] for event_type in event_types]
+        return np.isin(self._type[: self._size], codes)
+
+    def select(self, selector: NDArray[np.bool_] | NDArray[np.integer]) -> list[InputEvent]:
+        """마스크 또는 인덱스 배열로 이벤트 선택
+
+        Args:
+            selector: bool 마스크 또는 정수 인덱스 배열
+
+        Returns:
+            선택된 InputEvent 목록 (순서 유지)
+        """
+        selector = np.asarray(selector)
+        indices = np.flatnonzero(selector) if selector.dtype == np.bool_ else selector
+        return [self._event_at(int(i)) for i in indices]
+
+    def append(self, event: InputEvent) -> None:
+        """이벤트 추가"""
+        with self._lock:
+            self._reserve(self._size + 1)
+            self._write(self._size, event)
+            self._size += 1
+
+    def extend(self, events: Iterable[InputEvent]) -> None:
+        """이벤트 여러 개 추가"""
+        events = list(events)
+        if not events:
+            return
+        with self._lock:
+            self._reserve(self._size + len(events))
+            for offset, event in enumerate(events):
+                self._write(self._size + offset, event)
+            self._size += len(events)
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """InputEvent 필드별 값 목록 (event_type은 문자열 값, 없는 값은 None)
+
+        이벤트 객체를 만들지 않고 저장/직렬화할 때 사용합니다.
+        """
+        n = self._size
+        end = self._end_timestamp[:n]
+        columns: dict[str, list[Any]] = {
+            "timestamp": self._timestamp[:n].tolist(),
+            "event_type": [_EVENT_TYPES[code].value for code in self._type[:n].tolist()],
+            "end_timestamp": [None if np.isnan(v) else v for v in end.tolist()],
+        }
+        for name in self._FLOAT_FIELDS:
+            columns[name] = [_coordinate(v) for v in self._floats[name][:n].tolist()]
+        for name in self._INT_FIELDS:
+            columns[name] = [None if v == _NO_INT else v for v in self._ints[name][:n].tolist()]
+        lookup = self._strings.lookup
+        for name in self._STR_FIELDS:
+            columns[name] = [lookup(code) for code in self._strs[name][:n].tolist()]
+        columns["modifiers"] = [m.split(",") if m else [] for m in columns["modifiers"]]
+        columns["path"] = [list(self._paths.get(i, ())) for i in range(n)]
+        return columns
+
+    def _reserve(self, size: int) -> None:
+        """size개를 담을 수 있도록 열 확장 (lock 보유 상태에서 호출)"""
+        if size <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+
+        def grow(array: NDArray) -> NDArray:
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            return grown
+
+        self._timestamp = grow(self._timestamp)
+        self._end_timestamp = grow(self._end_timestamp)
+        self._type = grow(self._type)
+        self._has_window = grow(self._has_window)
+        self._floats = {name: grow(array) for name, array in self._floats.items()}
+        self._ints = {name: grow(array) for name, array in self._ints.items()}
+        self._strs = {name: grow(array) for name, array in self._strs.items()}
+        self._capacity = capacity
+
+    def _write(self, index: int, event: InputEvent) -> None:
+        """index 위치에 이벤트 기록 (lock 보유 상태에서 호출)"""
+        window = event.window_info
+        self._timestamp[index] = event.timestamp
+        self._end_timestamp[index] = np.nan if event.end_timestamp is None else event.end_timestamp
+        self._type[index] = _TYPE_CODES[event.event_type]
+        self._has_window[index] = window is not None
+
+        self._floats["x"][index] = _NO_FLOAT if event.x is None else event.x
+        self._floats["y"][index] = _NO_FLOAT if event.y is None else event.y
+
+        ints = {
+            "dx": event.dx,
+            "dy": event.dy,
+            "process_id": window.process_id if window else None,
+        }
+        for name, value in ints.items():
+            self._ints[name][index] = _NO_INT if value is None else value
+
+        strs = {
+            "button": event.button,
+            "key": event.key,
+            "text": event.text,
+            "modifiers": ",".join(event.modifiers) if event.modifiers else None,
+            "app_name": event.app_name,
+            "window_title": event.window_title,
+            "window_app_name": window.app_name if window else None,
+            "window_window_title": window.window_title if window else None,
+            "bundle_id": window.bundle_id if window else None,
+        }
+        for name, value in strs.items():
+            self._strs[name][index] = self._strings.intern(value)
+
+        if event.path:
+            self._paths[index] = [tuple(point) for point in event.path]
+
+    def _event_at(self, index: int) -> InputEvent:
+        """index 위치의 InputEvent 생성"""
+
+        def integer(name: str) -> int | None:
+            value = int(self._ints[name][index])
+            return None if value == _NO_INT else value
+
+        def string(name: str) -> str | None:
+            return self._strings.lookup(int(self._strs[name][index]))
+
+        window_info = None
+        if self._has_window[index]:
+            window_info = WindowInfo(
+                app_name=string("window_app_name"),
+                window_title=string("window_window_title"),
+                bundle_id=string("bundle_id"),
+                process_id=integer("process_id"),
+            )
+
+        end = float(self._end_timestamp[index])
+        modifiers = string("modifiers")
+        return InputEvent(
+            timestamp=float(self._timestamp[index]),
+            event_type=_EVENT_TYPES[self._type[index]],
+            x=_coordinate(float(self._floats["x"][index])),
+            y=_coordinate(float(self._floats["y"][index])),
+            button=string("button"),
+            key=string("key"),
+            dx=integer("dx"),
+            dy=integer("dy"),
+            text=string("text"),
+            modifiers=modifiers.split(",") if modifiers else [],
+            end_timestamp=None if np.isnan(end) else end,
+            path=list(self._paths.get(index, ())),
+            app_name=string("app_name"),
+            window_title=string("window_title"),
+            window_info=window_info,
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, index: int | slice) -> InputEvent | list[InputEvent]:
+        if isinstance(index, slice):
+            return [self._event_at(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("EventStore index out of range")
+        return self._event_at(index)
+
+    def __iter__(self) -> Iterator[InputEvent]:
+        for index in range(self._size):
+            yield self._event_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventStore, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # list처럼 변경 가능하므로 해시 불가
+
+    def __repr__(self) -> str:
+        return f"EventStore(events={self._size}, strings={len(self._strings)})"
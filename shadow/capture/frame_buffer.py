@@ -0,0 +1,248 @@
+"""프레임 링 버퍼 모듈
+
+녹화 프레임을 미리 할당된 NumPy 배열(N x H x W x 3)에 순환 저장합니다.
+보존 구간을 넘긴 프레임 슬롯은 재사용되므로 세션 길이와 무관하게
+메모리 사용량이 일정하게 유지됩니다.
+"""
+
+import math
+import threading
+from collections import deque
+from collections.abc import Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from shadow.capture.models import Frame
+
+
+class FrameRingBuffer:
+    """미리 할당된 프레임 링 버퍼
+
+    - 엔트리(timestamp, slot)는 시간순으로 최대 capacity개 보관되고,
+      슬롯이 부족하면 가장 오래된 것부터 제거
+    - 변화 없는 프레임은 직전 슬롯을 참조하는 엔트리로만 추가 (append_reference)
+    - 슬롯은 참조(엔트리 + pin)가 모두 해제되어야 재사용
+    - pin된 슬롯은 덮어쓰지 않으므로 KeyframePair가 안전하게 참조 가능
+    - 모든 슬롯이 pin되어 있으면 새 프레임은 버려지고 dropped가 증가
+
+    반환되는 Frame.image는 버퍼 슬롯의 view입니다.
+    pin하지 않은 프레임은 이후 캡처로 덮어써질 수 있습니다.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: 슬롯 수 (최소 2)
+        """
+        if capacity < 2:
+            raise ValueError(f"capacity는 2 이상이어야 합니다: {capacity}")
+
+        self._capacity = capacity
+        self._images: NDArray[np.uint8] | None = None
+        self._refs = np.zeros(capacity, dtype=np.int32)
+        self._pin_counts = np.zeros(capacity, dtype=np.int32)
+        self._entries: deque[tuple[float, int]] = deque()
+        self._free: deque[int] = deque(range(capacity))
+        self._lock = threading.Lock()
+        self.dropped = 0  # 슬롯 부족으로 버려진 프레임 수
+
+    @classmethod
+    def for_retention(cls, seconds: float, fps: float) -> "FrameRingBuffer":
+        """보존 시간과 FPS로 버퍼 생성
+
+        Args:
+            seconds: 보존할 시간 (초)
+            fps: 초당 프레임 수
+
+        Returns:
+            seconds 동안의 프레임을 담을 수 있는 버퍼
+        """
+        return cls(max(2, math.ceil(seconds * fps)))
+
+    @property
+    def capacity(self) -> int:
+        """슬롯 수"""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 이미지 메모리 (bytes, 첫 프레임 전에는 0)"""
+        return 0 if self._images is None else self._images.nbytes
+
+    @property
+    def pinned_count(self) -> int:
+        """pin된 슬롯 수"""
+        return int(np.count_nonzero(self._pin_counts))
+
+    def acquire(self, height: int, width: int) -> tuple[int, NDArray[np.uint8]] | None:
+        """쓰기용 슬롯 확보
+
+        ScreenCapture가 변환 결과를 슬롯에 직접 기록할 때 사용합니다.
+        기록 후 반드시 commit()을 호출해야 합니다.
+
+        Args:
+            height: 프레임 높이
+            width: 프레임 너비
+
+        Returns:
+            (slot, 슬롯 view) 튜플, 사용 가능한 슬롯이 없으면 None
+
+        Raises:
+            ValueError: 버퍼 해상도와 다른 프레임인 경우
+        """
+        with self._lock:
+            if self._images is None:
+                # 첫 프레임 해상도로 한 번만 할당
+                self._images = np.empty(
+                    (self._capacity, height, width, 3), dtype=np.uint8
+                )
+            elif self._images.shape[1:3] != (height, width):
+                raise ValueError(
+                    f"프레임 해상도 불일치: buffer={self._images.shape[1:3]}, "
+                    f"frame={(height, width)}"
+                )
+
+            slot = self._take_free_slot()
+            if slot is None:
+                self.dropped += 1
+                return None
+
+            # commit 전까지 재사용되지 않도록 참조 유지 (commit 시 엔트리 참조로 전환)
+            self._refs[slot] += 1
+            return slot, self._images[slot]
+
+    def commit(self, slot: int, timestamp: float) -> Frame:
+        """acquire()로 확보한 슬롯을 엔트리로 등록
+
+        Args:
+            slot: acquire()가 반환한 슬롯
+            timestamp: 프레임 타임스탬프
+
+        Returns:
+            슬롯 view를 가진 Frame
+        """
+        with self._lock:
+            self._entries.append((timestamp, slot))
+            self._trim_entries()
+        return Frame(timestamp=timestamp, image=self._images[slot])
+
+    def append_reference(self, timestamp: float) -> Frame | None:
+        """직전 프레임과 같은 화면을 새 엔트리로 등록 (복사 없음)
+
+        Args:
+            timestamp: 프레임 타임스탬프
+
+        Returns:
+            직전 슬롯 view를 가진 Frame (버퍼가 비어 있으면 None)
+        """
+        with self._lock:
+            if not self._entries:
+                return None
+            slot = self._entries[-1][1]
+            self._refs[slot] += 1
+            self._entries.append((timestamp, slot))
+            self._trim_entries()
+        return Frame(timestamp=timestamp, image=self._images[slot])
+
+    def append(self, frame: Frame) -> Frame | None:
+        """기존 Frame을 버퍼에 복사
+
+        Args:
+            frame: 복사할 프레임
+
+        Returns:
+            버퍼에 저장된 Frame (슬롯이 없으면 None)
+        """
+        acquired = self.acquire(frame.height, frame.width)
+        if acquired is None:
+            return None
+        slot, dst = acquired
+        # 미변환 프레임은 BGRA -> RGB 변환과 복사를 한 번에 수행
+        np.copyto(dst, frame.rgb_view())
+        return self.commit(slot, frame.timestamp)
+
+    def pin(self, frame: Frame) -> Frame:
+        """프레임 슬롯을 고정하여 덮어쓰기 방지
+
+        Args:
+            frame: 이 버퍼가 반환한 Frame
+
+        Returns:
+            전달된 Frame (버퍼 밖의 프레임이면 그대로 반환)
+        """
+        slot = self._slot_of(frame)
+        if slot is None:
+            return frame
+        with self._lock:
+            self._refs[slot] += 1
+            self._pin_counts[slot] += 1
+        return frame
+
+    def unpin(self, frame: Frame) -> None:
+        """pin() 해제
+
+        Args:
+            frame: pin()에 전달했던 Frame
+        """
+        slot = self._slot_of(frame)
+        if slot is None:
+            return
+        with self._lock:
+            if self._pin_counts[slot] == 0:
+                return
+            self._pin_counts[slot] -= 1
+            self._release_slot(slot)
+
+    def timestamps(self) -> NDArray[np.float64]:
+        """보관 중인 프레임 타임스탬프 배열 (시간순)"""
+        with self._lock:
+            return np.fromiter(
+                (ts for ts, _ in self._entries), dtype=np.float64, count=len(self._entries)
+            )
+
+    def _slot_of(self, frame: Frame) -> int | None:
+        """Frame.image가 가리키는 슬롯 번호 (버퍼 밖이면 None)"""
+        image = frame.rgb_view()  # 버퍼 밖의 미변환 프레임을 변환하지 않도록 view 사용
+        if self._images is None or image.base is not self._images:
+            return None
+        offset = (
+            image.__array_interface__["data"][0]
+            - self._images.__array_interface__["data"][0]
+        )
+        return offset // self._images[0].nbytes
+
+    def _take_free_slot(self) -> int | None:
+        """빈 슬롯 확보 (필요하면 오래된 엔트리 제거, lock 보유 상태에서 호출)"""
+        while not self._free:
+            if not self._entries:
+                return None
+            _, slot = self._entries.popleft()
+            self._release_slot(slot)
+        return self._free.popleft()
+
+    def _trim_entries(self) -> None:
+        """엔트리 수를 capacity 이하로 유지 (lock 보유 상태에서 호출)"""
+        while len(self._entries) > self._capacity:
+            _, slot = self._entries.popleft()
+            self._release_slot(slot)
+
+    def _release_slot(self, slot: int) -> None:
+        """슬롯 참조 해제 (lock 보유 상태에서 호출)"""
+        self._refs[slot] -= 1
+        if self._refs[slot] == 0:
+            self._free.append(slot)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> Frame:
+        with self._lock:
+            timestamp, slot = self._entries[index]
+        return Frame(timestamp=timestamp, image=self._images[slot])
+
+    def __iter__(self) -> Iterator[Frame]:
+        with self._lock:
+            entries = list(self._entries)
+        for timestamp, slot in entries:
+            yield Frame(timestamp=timestamp, image=self._images[slot])
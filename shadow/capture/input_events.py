@@ -4,17 +4,28 @@ import logging
 import threading
 import time
 from collections.abc import Callable
-from queue import Empty, Queue
 
-from pynput import keyboard, mouse
-
-from shadow.capture.models import InputEvent, InputEventType
+from shadow.capture.backends import CaptureBackend
+from shadow.capture.event_log import EventCursor, EventLog
+from shadow.capture.keystrokes import KeystrokeCoalescer
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+from shadow.capture.pointer import PointerTracker
+from shadow.capture.redaction import ExclusionFilter
 from shadow.capture.window import (
     WindowInfoCollector,
     get_active_window,
     get_current_process_info,
     get_window_at_point,
 )
+from shadow.config import settings
+
+# pynput은 디스플레이 없는 환경(Linux CI 등)에서 import 시 실패
+try:
+    from pynput import keyboard, mouse
+
+    HAS_PYNPUT = True
+except ImportError:
+    HAS_PYNPUT = False
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +33,35 @@ logger = logging.getLogger(__name__)
 class InputEventCollector:
     """마우스 및 키보드 입력 이벤트 수집"""
 
-    def __init__(self, buffer_size: int = 1000):
+    def __init__(
+        self,
+        buffer_size: int | None = None,
+        coalesce_keys: bool | None = None,
+        event_source: CaptureBackend | None = None,
+        exclusion: ExclusionFilter | None = None,
+        track_moves: bool | None = None,
+    ):
         """
         Args:
-            buffer_size: 이벤트 버퍼 크기
+            buffer_size: 이벤트 로그 최대 보관 수 (None이면 설정 사용)
+            coalesce_keys: 연속 키 입력을 TEXT_ENTRY 이벤트로 병합 (None이면 설정 사용)
+            event_source: pynput 리스너 대신 이벤트를 발생시킬 백엔드
+                (SyntheticBackend, ReplayBackend 등 provides_events=True인 백엔드)
+            exclusion: 지정하면 제외 앱에서 발생한 이벤트를 기록/콜백 전에 버림
+            track_moves: 마우스 이동을 DRAG(/hover MOUSE_MOVE) 이벤트로 기록
+                (None이면 input_track_drags 설정 사용)
         """
-        self._buffer_size = buffer_size
-        self._events: Queue[InputEvent] = Queue(maxsize=buffer_size)
-        self._mouse_listener: mouse.Listener | None = None
-        self._keyboard_listener: keyboard.Listener | None = None
+        self._buffer_size = buffer_size or settings.input_event_log_size
+        self._log = EventLog(max_events=self._buffer_size)
+        # get_events()용 기본 소비자 커서
+        self._cursor = self._log.cursor()
+        self._event_source = event_source
+        self._exclusion = exclusion if exclusion else None
+        self._mouse_listener: "mouse.Listener | None" = None
+        self._keyboard_listener: "keyboard.Listener | None" = None
         self._running = False
         self._callbacks: list[Callable[[InputEvent], None]] = []
+        self._mouse_controller: "mouse.Controller | None" = None
         self._window_collector: WindowInfoCollector | None = None
         if WindowInfoCollector.is_available():
             try:
@@ -40,11 +69,70 @@ class InputEventCollector:
             except Exception:
                 self._window_collector = None
 
+        if coalesce_keys is None:
+            coalesce_keys = settings.input_coalesce_keys
+        self._keystrokes: KeystrokeCoalescer | None = (
+            KeystrokeCoalescer(
+                emit=self._emit_event,
+                window_lookup=self._get_keyboard_window_info,
+                gap=settings.input_text_gap,
+            )
+            if coalesce_keys
+            else None
+        )
+
+        if track_moves is None:
+            track_moves = settings.input_track_drags
+        self._pointer: PointerTracker | None = (
+            PointerTracker(
+                emit=self._emit_event,
+                window_lookup=self._get_window_info_for_point,
+                drag_threshold=settings.input_drag_threshold,
+                min_distance=settings.input_move_min_distance,
+                tolerance=settings.input_move_tolerance,
+                hover=settings.input_track_hover,
+            )
+            if track_moves
+            else None
+        )
+
     def _get_window_info_for_point(self, x: int, y: int):
         if self._window_collector:
             return self._window_collector.get_window_at_point(x, y)
         return get_window_at_point(x, y)
 
+    def _cursor_position(self) -> tuple[int, int]:
+        """현재 마우스 커서 위치 (키 입력마다 Controller를 새로 만들지 않도록 재사용)"""
+        if self._mouse_controller is None:
+            self._mouse_controller = mouse.Controller()
+        return self._mouse_controller.position
+
+    def _get_keyboard_window_info(self) -> WindowInfo:
+        """키보드 입력 대상 윈도우 (마우스 커서 위치 기반)"""
+        # frontmostApplication()이 터미널을 반환하는 문제 회피
+        cursor_pos = self._cursor_position()
+        return self._get_window_info_for_point(cursor_pos[0], cursor_pos[1])
+
+    def _flush_keystrokes(self, idle_only: bool = False) -> None:
+        """진행 중인 키 입력 묶음을 이벤트로 발생"""
+        if self._keystrokes is not None:
+            self._keystrokes.flush(idle_only=idle_only)
+
+    def _flush_pointer(self, idle_only: bool = False) -> None:
+        """진행 중인 hover 이동 구간을 이벤트로 발생"""
+        if self._pointer is not None:
+            self._pointer.flush(idle_only=idle_only)
+
+    @property
+    def typing_since(self) -> float | None:
+        """아직 TEXT_ENTRY로 발생하지 않은 입력 묶음의 시작 시각 (없으면 None)"""
+        return self._keystrokes.pending_start if self._keystrokes is not None else None
+
+    @property
+    def pointer(self) -> PointerTracker | None:
+        """마우스 이동 경로 수집기 (moves/points 카운터로 오버헤드 확인)"""
+        return self._pointer
+
     def _get_active_window_info(self):
         if self._window_collector:
             return self._window_collector.get_active_window()
@@ -58,16 +146,38 @@ class InputEventCollector:
         """콜백 제거"""
         self._callbacks.remove(callback)
 
+    @property
+    def event_log(self) -> EventLog:
+        """수집된 이벤트 로그 (여러 소비자가 커서로 읽기)"""
+        return self._log
+
+    @property
+    def dropped_events(self) -> int:
+        """get_events()가 읽기 전에 보관 범위를 벗어나 놓친 이벤트 수"""
+        return self._cursor.missed + max(0, self._log.first_seq - self._cursor.position)
+
+    def cursor(self, from_start: bool = False) -> EventCursor:
+        """추가 소비자용 커서 생성
+
+        Args:
+            from_start: True면 보관 중인 가장 오래된 이벤트부터 읽음
+
+        Returns:
+            다른 소비자와 독립적으로 읽는 EventCursor
+        """
+        return self._log.cursor(from_start=from_start)
+
+    @property
+    def excluded_events(self) -> int:
+        """제외 앱에서 발생해 버린 이벤트 수"""
+        return self._exclusion.dropped_events if self._exclusion is not None else 0
+
     def _emit_event(self, event: InputEvent) -> None:
-        """이벤트 발생 및 콜백 호출"""
-        # 버퍼가 가득 차면 오래된 이벤트 제거
-        if self._events.full():
-            try:
-                self._events.get_nowait()
-            except Empty:
-                pass
+        """이벤트 발생 및 콜백 호출 (제외 앱 이벤트는 버림)"""
+        if self._exclusion is not None and self._exclusion.drops(event):
+            return
 
-        self._events.put(event)
+        self._log.append(event)
 
         # 등록된 콜백 호출
         for callback in self._callbacks:
@@ -77,17 +187,26 @@ class InputEventCollector:
                 pass  # 콜백 에러 무시
 
     def _on_mouse_click(
-        self, x: int, y: int, button: mouse.Button, pressed: bool
+        self, x: int, y: int, button: "mouse.Button", pressed: bool
     ) -> None:
-        """마우스 클릭 이벤트 핸들러"""
-        if not pressed:  # 릴리즈는 무시
+        """마우스 클릭 이벤트 핸들러 (누름은 MOUSE_CLICK, 놓음은 드래그 판정에만 사용)"""
+        timestamp = time.time()
+        if not pressed:
+            if self._pointer is not None:
+                self._pointer.release(x, y, button.name, timestamp)
             return
 
+        # 클릭 전 입력은 클릭 이벤트보다 먼저 기록 (포커스 이동 후 입력과 분리)
+        self._flush_keystrokes()
+
         # F-03: 활성 윈도우 정보 수집
         window_info = self._get_window_info_for_point(x, y)
+        if self._pointer is not None:
+            # hover 구간을 먼저 끝내고, 드래그 후보는 클릭과 같은 timestamp로 시작
+            self._pointer.press(x, y, button.name, timestamp, window_info)
 
         event = InputEvent(
-            timestamp=time.time(),
+            timestamp=timestamp,
             event_type=InputEventType.MOUSE_CLICK,
             x=x,
             y=y,
@@ -106,11 +225,15 @@ class InputEventCollector:
         self._emit_event(event)
 
     def _on_mouse_move(self, x: int, y: int) -> None:
-        """마우스 이동 이벤트 핸들러 (비활성화 - 너무 많은 이벤트 발생)"""
-        pass
+        """마우스 이동 이벤트 핸들러 (경로 수집기가 솎아내어 DRAG/MOUSE_MOVE로 병합)"""
+        if self._pointer is not None:
+            self._pointer.move(x, y, time.time())
 
     def _on_mouse_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
         """마우스 스크롤 이벤트 핸들러"""
+        self._flush_keystrokes()
+        self._flush_pointer()
+
         # F-03: 활성 윈도우 정보 수집
         window_info = self._get_window_info_for_point(x, y)
 
@@ -127,14 +250,14 @@ class InputEventCollector:
         )
         self._emit_event(event)
 
-    def _on_key_press(self, key: keyboard.Key | keyboard.KeyCode | None) -> None:
+    def _on_key_press(self, key: "keyboard.Key | keyboard.KeyCode | None") -> None:
         """키 누름 이벤트 핸들러"""
-        # F-03: 활성 윈도우 정보 수집
-        # 키보드 이벤트는 마우스 커서 위치 기반으로 윈도우 감지
-        # (frontmostApplication()이 터미널을 반환하는 문제 회피)
-        mouse_controller = mouse.Controller()
-        cursor_pos = mouse_controller.position
-        window_info = self._get_window_info_for_point(cursor_pos[0], cursor_pos[1])
+        if self._keystrokes is not None:
+            self._keystrokes.press(self._key_to_string(key), time.time())
+            return
+
+        # F-03: 활성 윈도우 정보 수집 (마우스 커서 위치 기반)
+        window_info = self._get_keyboard_window_info()
 
         key_str = self._key_to_string(key)
         event = InputEvent(
@@ -147,13 +270,14 @@ class InputEventCollector:
         )
         self._emit_event(event)
 
-    def _on_key_release(self, key: keyboard.Key | keyboard.KeyCode | None) -> None:
+    def _on_key_release(self, key: "keyboard.Key | keyboard.KeyCode | None") -> None:
         """키 릴리즈 이벤트 핸들러"""
-        # F-03: 활성 윈도우 정보 수집
-        # 키보드 이벤트는 마우스 커서 위치 기반으로 윈도우 감지
-        mouse_controller = mouse.Controller()
-        cursor_pos = mouse_controller.position
-        window_info = self._get_window_info_for_point(cursor_pos[0], cursor_pos[1])
+        if self._keystrokes is not None:
+            self._keystrokes.release(self._key_to_string(key), time.time())
+            return
+
+        # F-03: 활성 윈도우 정보 수집 (마우스 커서 위치 기반)
+        window_info = self._get_keyboard_window_info()
 
         key_str = self._key_to_string(key)
         event = InputEvent(
@@ -167,7 +291,7 @@ class InputEventCollector:
         self._emit_event(event)
 
     @staticmethod
-    def _key_to_string(key: keyboard.Key | keyboard.KeyCode | None) -> str:
+    def _key_to_string(key: "keyboard.Key | keyboard.KeyCode | None") -> str:
         """키 객체를 문자열로 변환"""
         if key is None:
             return "unknown"
@@ -178,14 +302,31 @@ class InputEventCollector:
         return str(key)
 
     def start(self) -> None:
-        """이벤트 수집 시작"""
+        """이벤트 수집 시작
+
+        Raises:
+            RuntimeError: 이벤트 소스가 없고 pynput을 사용할 수 없는 경우
+        """
         if self._running:
             return
 
+        # 백엔드 이벤트 소스: 리스너 없이 백엔드가 이벤트 발생
+        if self._event_source is not None:
+            self._running = True
+            self._event_source.start_events(self._emit_event)
+            return
+
+        if not HAS_PYNPUT:
+            raise RuntimeError(
+                "pynput을 사용할 수 없습니다 (디스플레이 없음). "
+                "SyntheticBackend/ReplayBackend를 event_source로 지정하세요."
+            )
+
         self._running = True
 
         # 마우스 리스너 시작
         self._mouse_listener = mouse.Listener(
+            on_move=self._on_mouse_move if self._pointer is not None else None,
             on_click=self._on_mouse_click,
             on_scroll=self._on_mouse_scroll,
         )
@@ -205,6 +346,9 @@ class InputEventCollector:
 
         self._running = False
 
+        if self._event_source is not None:
+            self._event_source.stop_events()
+
         if self._mouse_listener:
             self._mouse_listener.stop()
             self._mouse_listener = None
@@ -213,8 +357,16 @@ class InputEventCollector:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
 
+        # 남은 키 입력 묶음/hover 구간 기록 (놓지 않은 드래그는 버림)
+        self._flush_keystrokes()
+        self._flush_pointer()
+        if self._pointer is not None:
+            self._pointer.reset()
+
     def get_events(self, timeout: float | None = None) -> list[InputEvent]:
-        """수집된 이벤트 가져오기 (버퍼 비우기)
+        """마지막 호출 이후 수집된 이벤트 가져오기
+
+        기본 커서로 읽으므로 event_log와 다른 소비자의 커서에는 영향을 주지 않습니다.
 
         Args:
             timeout: 첫 이벤트 대기 시간 (None이면 즉시 반환)
@@ -222,24 +374,15 @@ class InputEventCollector:
         Returns:
             수집된 이벤트 목록
         """
-        events = []
+        # 입력이 멈춘 키 입력 묶음은 TEXT_ENTRY로, 멈춘 hover 구간은 MOUSE_MOVE로 발생
+        self._flush_keystrokes(idle_only=True)
+        self._flush_pointer(idle_only=True)
 
         # 첫 이벤트 대기
-        if timeout is not None:
-            try:
-                event = self._events.get(timeout=timeout)
-                events.append(event)
-            except Empty:
-                return events
-
-        # 나머지 이벤트 즉시 가져오기
-        while not self._events.empty():
-            try:
-                events.append(self._events.get_nowait())
-            except Empty:
-                break
+        if timeout is not None and not self._cursor.wait(timeout):
+            return []
 
-        return events
+        return self._cursor.read()
 
     def __enter__(self) -> "InputEventCollector":
         self.start()
@@ -0,0 +1,184 @@
+"""키 입력 병합 모듈
+
+연속된 글자 입력을 하나의 TEXT_ENTRY 이벤트로 합칩니다.
+문장 하나를 입력해도 키마다 KEY_PRESS/KEY_RELEASE 이벤트와
+윈도우 조회가 생기지 않도록, 입력 묶음(run)마다 이벤트 1개와 윈도우 조회 1회만 수행합니다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+
+# pynput 키 이름 -> 표준 modifier 이름
+MODIFIER_KEYS = {
+    "shift": "shift",
+    "shift_l": "shift",
+    "shift_r": "shift",
+    "ctrl": "ctrl",
+    "ctrl_l": "ctrl",
+    "ctrl_r": "ctrl",
+    "alt": "alt",
+    "alt_l": "alt",
+    "alt_r": "alt",
+    "alt_gr": "alt",
+    "cmd": "cmd",
+    "cmd_l": "cmd",
+    "cmd_r": "cmd",
+}
+
+# 글자로 취급하는 특수 키
+TEXT_KEYS = {"space": " "}
+
+
+@dataclass
+class _TextRun:
+    """진행 중인 입력 묶음"""
+
+    start: float  # 첫 키 입력 시각
+    last: float  # 마지막 키 입력 시각
+    window_info: WindowInfo  # 입력 시작 시점의 윈도우
+    chars: list[str] = field(default_factory=list)
+
+
+class KeystrokeCoalescer:
+    """키 입력을 TEXT_ENTRY / 단축키 이벤트로 병합
+
+    - modifier 없이(shift 제외) 입력한 글자와 space는 하나의 입력 묶음으로 누적
+    - backspace는 묶음의 마지막 글자를 지움
+    - 단축키(cmd/ctrl/alt + 키)와 특수 키(enter, tab, 방향키 등)는 묶음을 끝내고
+      modifiers를 포함한 KEY_PRESS 이벤트로 발생
+    - 입력 간격이 gap초를 넘거나 flush()가 호출되면 묶음을 끝냄
+      (마우스 클릭/스크롤 전에 flush하면 포커스 이동 후 입력이 섞이지 않음)
+    - modifier 키 자체와 키 릴리즈는 이벤트를 만들지 않음
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[InputEvent], None],
+        window_lookup: Callable[[], WindowInfo],
+        gap: float = 1.0,
+    ):
+        """
+        Args:
+            emit: 완성된 이벤트를 전달할 콜백
+            window_lookup: 현재 입력 대상 윈도우 조회 함수 (묶음 시작 시 1회 호출)
+            gap: 입력 묶음을 끝내는 입력 간격 (초)
+        """
+        self._emit = emit
+        self._window_lookup = window_lookup
+        self._gap = gap
+        self._modifiers: set[str] = set()
+        self._run: _TextRun | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def has_pending(self) -> bool:
+        """진행 중인 입력 묶음 존재 여부"""
+        return self._run is not None
+
+    @property
+    def pending_start(self) -> float | None:
+        """진행 중인 입력 묶음의 첫 키 입력 시각 (없으면 None)
+
+        TEXT_ENTRY는 묶음이 끝난 뒤 시작 시각으로 발생하므로,
+        녹화 중 추출기는 이 시각 이후의 프레임을 보관해야 Before 프레임을 찾을 수 있습니다.
+        """
+        run = self._run
+        return run.start if run is not None else None
+
+    def press(self, key: str, timestamp: float) -> None:
+        """키 누름 처리
+
+        Args:
+            key: 키 문자열 (글자 또는 pynput 키 이름)
+            timestamp: 입력 시각 (Unix timestamp)
+        """
+        events: list[InputEvent] = []
+        with self._lock:
+            modifier = MODIFIER_KEYS.get(key)
+            if modifier is not None:
+                self._modifiers.add(modifier)
+                return
+
+            if self._run is not None and timestamp - self._run.last > self._gap:
+                events.extend(self._finish_run())
+
+            char = TEXT_KEYS.get(key, key if len(key) == 1 else None)
+            shortcut = bool(self._modifiers - {"shift"})
+
+            if char is not None and not shortcut:
+                if self._run is None:
+                    self._run = _TextRun(
+                        start=timestamp, last=timestamp, window_info=self._window_lookup()
+                    )
+                self._run.chars.append(char)
+                self._run.last = timestamp
+            elif key == "backspace" and not shortcut and self._run and self._run.chars:
+                self._run.chars.pop()
+                self._run.last = timestamp
+            else:
+                # 단축키/특수 키: 진행 중인 입력을 끝내고 개별 이벤트로 발생
+                events.extend(self._finish_run())
+                window_info = self._window_lookup()
+                events.append(
+                    InputEvent(
+                        timestamp=timestamp,
+                        event_type=InputEventType.KEY_PRESS,
+                        key=key,
+                        modifiers=sorted(self._modifiers),
+                        app_name=window_info.app_name,
+                        window_title=window_info.window_title,
+                        window_info=window_info,
+                    )
+                )
+
+        for event in events:
+            self._emit(event)
+
+    def release(self, key: str, timestamp: float) -> None:
+        """키 릴리즈 처리 (modifier 상태만 갱신)
+
+        Args:
+            key: 키 문자열
+            timestamp: 입력 시각 (Unix timestamp)
+        """
+        modifier = MODIFIER_KEYS.get(key)
+        if modifier is not None:
+            with self._lock:
+                self._modifiers.discard(modifier)
+
+    def flush(self, idle_only: bool = False) -> None:
+        """진행 중인 입력 묶음을 TEXT_ENTRY 이벤트로 발생
+
+        Args:
+            idle_only: True면 마지막 입력 후 gap초가 지난 묶음만 발생
+        """
+        with self._lock:
+            if self._run is None:
+                return
+            if idle_only and time.time() - self._run.last <= self._gap:
+                return
+            events = self._finish_run()
+
+        for event in events:
+            self._emit(event)
+
+    def _finish_run(self) -> list[InputEvent]:
+        """입력 묶음 종료 (lock 보유 상태에서 호출)"""
+        run, self._run = self._run, None
+        if run is None or not run.chars:
+            return []
+        return [
+            InputEvent(
+                timestamp=run.start,
+                event_type=InputEventType.TEXT_ENTRY,
+                text="".join(run.chars),
+                end_timestamp=run.last,
+                app_name=run.window_info.app_name,
+                window_title=run.window_info.window_title,
+                window_info=run.window_info,
+            )
+        ]
@@ -1,11 +1,11 @@
 """데이터 모델 정의
 
 Raw Data Layer 모델들을 정의합니다.
-- 내부 처리용: dataclass 기반 (Frame, InputEvent, KeyframePair)
+- 내부 처리용: dataclass 기반 (InputEvent, KeyframePair), Frame은 지연 변환 클래스
 - 저장/API용: Pydantic 기반 (Screenshot, InputEventRecord, RawObservation)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Literal
@@ -29,6 +29,15 @@ class InputEventType(Enum):
     MOUSE_SCROLL = "mouse_scroll"
     KEY_PRESS = "key_press"
     KEY_RELEASE = "key_release"
+    TEXT_ENTRY = "text_entry"  # 연속 키 입력을 병합한 텍스트 입력
+    DRAG = "drag"  # 버튼을 누른 채 이동 (누름 ~ 놓음)
+
+
+class CaptureMode(str, Enum):
+    """프레임 캡처 모드"""
+
+    CONTINUOUS = "continuous"  # 모든 프레임 보존
+    TRIGGERED = "triggered"  # 트리거 이벤트 주변 프레임만 보존
 
 
 @dataclass
@@ -41,6 +50,38 @@ class WindowInfo:
     process_id: int | None = None  # 프로세스 ID
 
 
+@dataclass(frozen=True)
+class MonitorGeometry:
+    """모니터 위치와 크기 (가상 데스크톱 좌표, mss monitors 항목과 동일)"""
+
+    index: int  # 모니터 번호 (1-based)
+    left: int
+    top: int
+    width: int
+    height: int
+
+    def contains(self, x: float, y: float) -> bool:
+        """좌표가 이 모니터 안에 있는지 여부"""
+        return (
+            self.left <= x < self.left + self.width and self.top <= y < self.top + self.height
+        )
+
+    def to_local(
+        self, x: float, y: float, frame_width: int | None = None, frame_height: int | None = None
+    ) -> tuple[int, int]:
+        """가상 데스크톱 좌표를 이 모니터 프레임의 픽셀 좌표로 변환
+
+        Retina 등에서 프레임 픽셀 크기가 모니터 좌표 크기와 다르면 비율을 적용합니다.
+
+        Args:
+            x, y: 가상 데스크톱 좌표
+            frame_width, frame_height: 프레임 픽셀 크기 (None이면 배율 1)
+        """
+        scale_x = (frame_width or self.width) / self.width
+        scale_y = (frame_height or self.height) / self.height
+        return int((x - self.left) * scale_x), int((y - self.top) * scale_y)
+
+
 class MouseButton(str, Enum):
     """마우스 버튼"""
 
@@ -63,20 +104,98 @@ class ScreenshotType(str, Enum):
     AFTER = "after"
 
 
-@dataclass
 class Frame:
-    """화면 캡처 프레임"""
+    """화면 캡처 프레임
 
-    timestamp: float  # Unix timestamp
-    image: NDArray[np.uint8]  # RGB 이미지 (H, W, 3)
+    RGB 이미지를 직접 받거나, mss의 BGRA 원본을 받아 `image`에
+    처음 접근할 때 RGB로 변환합니다. 대부분의 프레임은 분석되지 않으므로
+    KeyframeExtractor가 선택한 프레임만 변환 비용을 치릅니다.
+    오래 보관할 프레임은 convert()로 미리 변환하면 BGRA(4채널)보다 메모리를 1/4 덜 씁니다.
+    """
+
+    __slots__ = ("timestamp", "_image", "_bgra", "_source")
+
+    def __init__(
+        self,
+        timestamp: float,
+        image: NDArray[np.uint8] | None = None,
+        bgra: NDArray[np.uint8] | None = None,
+    ):
+        """
+        Args:
+            timestamp: Unix timestamp
+            image: RGB 이미지 (H, W, 3)
+            bgra: BGRA 원본 (H, W, 4) - image 대신 지정하면 지연 변환
+        """
+        if image is None and bgra is None:
+            raise ValueError("image 또는 bgra 중 하나는 지정해야 합니다")
+        self.timestamp = timestamp
+        self._image = image
+        self._bgra = bgra
+        self._source: Frame | None = None
+
+    @property
+    def image(self) -> NDArray[np.uint8]:
+        """RGB 이미지 (H, W, 3) - 첫 접근 시 BGRA에서 변환"""
+        if self._source is not None:
+            return self._source.image
+        self.convert()
+        return self._image
+
+    @image.setter
+    def image(self, value: NDArray[np.uint8]) -> None:
+        self._image = value
+        self._bgra = None
+        self._source = None
+
+    @property
+    def is_converted(self) -> bool:
+        """RGB 변환 완료 여부"""
+        if self._source is not None:
+            return self._source.is_converted
+        return self._image is not None
+
+    def convert(self) -> None:
+        """BGRA 원본을 RGB로 변환하고 원본 해제 (이미 변환되었으면 아무 일도 하지 않음)"""
+        if self._source is not None:
+            self._source.convert()
+        elif self._image is None:
+            self._image = self._bgra[:, :, 2::-1].copy()
+            self._bgra = None
+
+    def rgb_view(self) -> NDArray[np.uint8]:
+        """복사 없이 읽을 수 있는 RGB view (미변환이면 BGRA의 strided view)"""
+        if self._source is not None:
+            return self._source.rgb_view()
+        if self._image is not None:
+            return self._image
+        return self._bgra[:, :, 2::-1]
+
+    def reference(self, timestamp: float) -> "Frame":
+        """같은 화면을 공유하는 새 타임스탬프의 프레임
+
+        변환은 원본 프레임에서 한 번만 수행되고 결과 배열을 공유합니다.
+        """
+        frame = Frame.__new__(Frame)
+        frame.timestamp = timestamp
+        frame._image = None
+        frame._bgra = None
+        frame._source = self._source or self
+        return frame
 
     @property
     def height(self) -> int:
-        return self.image.shape[0]
+        return self.rgb_view().shape[0]
 
     @property
     def width(self) -> int:
-        return self.image.shape[1]
+        return self.rgb_view().shape[1]
+
+    def __repr__(self) -> str:
+        return (
+            f"Frame(timestamp={self.timestamp!r}, size={self.width}x{self.height}, "
+            f"converted={self.is_converted})"
+        )
 
 
 @dataclass
@@ -91,12 +210,43 @@ class InputEvent:
     key: str | None = None  # 키보드 키
     dx: int | None = None  # 스크롤 X 변화량
     dy: int | None = None  # 스크롤 Y 변화량
+    text: str | None = None  # TEXT_ENTRY: 입력된 문자열
+    modifiers: list[str] = field(default_factory=list)  # 함께 누른 modifier 키 (cmd, ctrl, ...)
+    end_timestamp: float | None = None  # 지속 이벤트 종료 시각 (TEXT_ENTRY: 마지막 키, DRAG: 놓은 시각)
+    path: list[tuple[int, int]] = field(default_factory=list)  # DRAG/MOUSE_MOVE: 솎아낸 이동 경로
     # F-03: 활성 윈도우 정보
     app_name: str | None = None  # 애플리케이션 이름
     window_title: str | None = None  # 윈도우 타이틀
     window_info: WindowInfo | None = None  # 활성 윈도우 정보
 
 
+@dataclass
+class FrameDiff:
+    """Before/After 프레임 변화 영역
+
+    축소 샘플링한 프레임을 cell px 격자로 나눠 달라진 칸을 표시하고,
+    이어진 칸 묶음마다 원본 해상도 기준 경계 상자를 구합니다.
+    """
+
+    mask: NDArray[np.bool_]  # 달라진 칸 (rows, cols)
+    cell: int  # 칸 한 변의 원본 해상도 크기 (px)
+    boxes: list[tuple[int, int, int, int]] = field(default_factory=list)  # 변화 영역 (넓은 순)
+    changed_ratio: float = 0.0  # 달라진 샘플 픽셀 비율 (0~1)
+
+    @property
+    def changed(self) -> bool:
+        """변화 영역 존재 여부"""
+        return bool(self.boxes)
+
+    @property
+    def bbox(self) -> tuple[int, int, int, int] | None:
+        """모든 변화 영역을 감싸는 상자 (left, top, right, bottom, 변화가 없으면 None)"""
+        if not self.boxes:
+            return None
+        lefts, tops, rights, bottoms = zip(*self.boxes)
+        return min(lefts), min(tops), max(rights), max(bottoms)
+
+
 @dataclass
 class KeyframePair:
     """F-01: Before/After 프레임 쌍
@@ -106,8 +256,14 @@ class KeyframePair:
     """
 
     before_frame: Frame  # 클릭 직전 프레임
-    after_frame: Frame  # 클릭 직후 프레임 (0.3초 후)
+    after_frame: Frame  # 클릭 직후 프레임 (기본 0.3초 후, settle 모드는 화면이 안정된 시점)
     trigger_event: InputEvent  # 트리거 이벤트 (클릭 등)
+    monitor: int | None = None  # 프레임을 가져온 모니터 번호 (다중 모니터 녹화 시)
+    click_pos: tuple[int, int] | None = None  # 프레임 픽셀 기준 클릭 좌표 (모니터 위치/배율 반영)
+    roi: tuple[int, int, int, int] | None = None  # 클릭 주변 원본 해상도 영역 (left, top, right, bottom)
+    after_latency: float | None = None  # 트리거(종료) 시각부터 After 프레임까지 걸린 시간 (초)
+    multiplicity: int = 1  # 중복 제거로 합쳐진 같은 동작의 쌍 수 (자신 포함)
+    diff: FrameDiff | None = None  # Before/After 변화 영역 (분석, 중복 제거, 크롭에서 재사용)
 
 
 # =============================================================================
@@ -163,12 +319,16 @@ class InputEventRecord(BaseModel):
 
     id: UUID = Field(default_factory=uuid4)
     timestamp: datetime
-    type: Literal["mouse_click", "mouse_move", "key_press", "key_release", "scroll"]
+    type: Literal[
+        "mouse_click", "mouse_move", "key_press", "key_release", "scroll", "text_entry", "drag"
+    ]
     position: Position | None = None
+    path: list[Position] = Field(default_factory=list)  # drag/mouse_move 이동 경로
     button: MouseButton | None = None
     click_type: ClickType | None = None
     key: str | None = None
     modifiers: list[str] = Field(default_factory=list)
+    text: str | None = None
     active_window: ActiveWindow
     session_id: UUID
 
@@ -193,6 +353,8 @@ class InputEventRecord(BaseModel):
             InputEventType.MOUSE_SCROLL: "scroll",
             InputEventType.KEY_PRESS: "key_press",
             InputEventType.KEY_RELEASE: "key_release",
+            InputEventType.TEXT_ENTRY: "text_entry",
+            InputEventType.DRAG: "drag",
         }
 
         return cls(
@@ -200,8 +362,11 @@ class InputEventRecord(BaseModel):
             timestamp=datetime.fromtimestamp(event.timestamp),
             type=event_type_map[event.event_type],
             position=position,
+            path=[Position(x=x, y=y) for x, y in event.path],
             button=MouseButton(event.button) if event.button else None,
             key=event.key,
+            modifiers=list(event.modifiers),
+            text=event.text,
             active_window=ActiveWindow(
                 title=event.window_title or "",
                 app_name=event.app_name or "",
@@ -0,0 +1,273 @@
+"""마우스 이동 경로 수집 모듈
+
+마우스 이동 이벤트는 초당 수백 개가 발생하므로 그대로 기록하지 않고,
+버튼을 누른 채 움직인 구간(드래그)과 선택적으로 버튼 없이 움직인 구간(hover)을
+경로 하나로 묶어 이벤트 1개로 발생합니다.
+
+경로는 수집 중에 바로 솎아냅니다 (online decimation).
+- 직전에 남긴 점에서 min_distance 미만으로 움직인 점은 버림
+- 남긴 점이 max_points에 도달하면 Ramer-Douglas-Peucker로 줄임
+  (줄지 않으면 허용 오차를 두 배로 늘림)
+따라서 이동 이벤트 1개의 처리 비용과 경로 하나의 메모리는 일정 범위 안에 있습니다.
+"""
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+
+Point = tuple[int, int]
+
+
+def simplify_path(points: list[Point], tolerance: float) -> list[Point]:
+    """Ramer-Douglas-Peucker 경로 단순화
+
+    양 끝점은 항상 남기고, 선분에서 tolerance 이내인 중간 점을 제거합니다.
+
+    Args:
+        points: 경로 점 목록
+        tolerance: 허용 오차 (px)
+
+    Returns:
+        단순화된 점 목록
+    """
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    # 재귀 대신 구간 스택 사용 (긴 경로에서 재귀 한도 회피)
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        (x0, y0), (x1, y1) = points[start], points[end]
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy)
+
+        farthest, max_distance = -1, tolerance
+        for i in range(start + 1, end):
+            x, y = points[i]
+            if length == 0:
+                distance = math.hypot(x - x0, y - y0)
+            else:
+                distance = abs(dy * (x - x0) - dx * (y - y0)) / length
+            if distance > max_distance:
+                farthest, max_distance = i, distance
+
+        if farthest >= 0:
+            keep[farthest] = True
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+@dataclass
+class _Stroke:
+    """진행 중인 이동 구간"""
+
+    start: float  # 시작 시각
+    last: float  # 마지막 이동 시각
+    points: list[Point] = field(default_factory=list)
+    button: str | None = None  # 드래그 버튼 (hover면 None)
+    window_info: WindowInfo | None = None  # 시작 위치의 윈도우 (드래그)
+    tolerance: float = 0.0  # 현재 RDP 허용 오차 (경로가 길면 증가)
+
+
+class PointerTracker:
+    """마우스 이동을 DRAG / MOUSE_MOVE 이벤트로 병합
+
+    - press() ~ release() 사이 이동 거리가 drag_threshold 이상이면 DRAG 이벤트
+      (timestamp는 누른 시각으로 같은 누름의 MOUSE_CLICK과 같고, end_timestamp는 놓은 시각)
+    - hover=True면 버튼 없이 움직인 구간을 MOUSE_MOVE 이벤트로 발생
+      (hover_gap초 동안 멈추거나 버튼을 누르면 구간 종료)
+    - 이벤트의 x/y는 시작 위치, path는 솎아낸 경로 (시작점과 끝점 포함)
+    - 윈도우 조회는 구간마다 1회만 수행
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[InputEvent], None],
+        window_lookup: Callable[[int, int], WindowInfo],
+        drag_threshold: float = 5.0,
+        min_distance: float = 3.0,
+        tolerance: float = 2.0,
+        max_points: int = 128,
+        hover: bool = False,
+        hover_gap: float = 0.5,
+    ):
+        """
+        Args:
+            emit: 완성된 이벤트를 전달할 콜백
+            window_lookup: 좌표의 윈도우 조회 함수 (hover 구간 종료 시 1회 호출)
+            drag_threshold: 드래그로 판단하는 최소 이동 거리 (px)
+            min_distance: 경로에 점을 남기는 최소 이동 거리 (px)
+            tolerance: RDP 허용 오차 (px)
+            max_points: 경로 하나에 보관하는 최대 점 수 (최소 3)
+            hover: 버튼 없이 움직인 구간도 MOUSE_MOVE 이벤트로 기록
+            hover_gap: hover 구간을 끝내는 정지 시간 (초)
+        """
+        self._emit = emit
+        self._window_lookup = window_lookup
+        self._drag_threshold = drag_threshold
+        self._min_distance = min_distance
+        self._tolerance = tolerance
+        self._max_points = max(3, max_points)
+        self._hover = hover
+        self._hover_gap = hover_gap
+        self._stroke: _Stroke | None = None
+        self._lock = threading.Lock()
+        self.moves = 0  # 처리한 이동 이벤트 수
+        self.points = 0  # 발생한 이벤트 경로의 점 수 합계
+
+    @property
+    def has_pending(self) -> bool:
+        """진행 중인 이동 구간 존재 여부"""
+        return self._stroke is not None
+
+    @property
+    def button_down(self) -> bool:
+        """버튼을 누르고 있는지 여부 (놓기 전까지 DRAG 이벤트가 발생할 수 있음)"""
+        stroke = self._stroke
+        return stroke is not None and stroke.button is not None
+
+    def press(
+        self, x: int, y: int, button: str, timestamp: float, window_info: WindowInfo | None = None
+    ) -> None:
+        """버튼 누름 처리 (진행 중인 hover 구간을 끝내고 드래그 후보 시작)
+
+        Args:
+            x, y: 누른 위치
+            button: 버튼 이름
+            timestamp: 누른 시각 (같은 누름의 MOUSE_CLICK 이벤트와 같은 값)
+            window_info: 누른 위치의 윈도우 (MOUSE_CLICK에서 조회한 값 재사용)
+        """
+        with self._lock:
+            events = self._finish_hover()
+            self._stroke = _Stroke(
+                start=timestamp,
+                last=timestamp,
+                points=[(x, y)],
+                button=button,
+                window_info=window_info,
+                tolerance=self._tolerance,
+            )
+        for event in events:
+            self._emit(event)
+
+    def move(self, x: int, y: int, timestamp: float) -> None:
+        """이동 처리
+
+        Args:
+            x, y: 현재 위치
+            timestamp: 이동 시각
+        """
+        events: list[InputEvent] = []
+        with self._lock:
+            self.moves += 1
+            stroke = self._stroke
+            if stroke is not None and stroke.button is None:
+                if timestamp - stroke.last > self._hover_gap:
+                    events = self._finish_hover()
+                    stroke = None
+            if stroke is None:
+                if not self._hover:
+                    return
+                stroke = self._stroke = _Stroke(
+                    start=timestamp, last=timestamp, tolerance=self._tolerance
+                )
+            self._add_point(stroke, (x, y))
+            stroke.last = timestamp
+        for event in events:
+            self._emit(event)
+
+    def release(self, x: int, y: int, button: str, timestamp: float) -> None:
+        """버튼 놓음 처리 (충분히 움직였으면 DRAG 이벤트 발생)
+
+        Args:
+            x, y: 놓은 위치
+            button: 버튼 이름
+            timestamp: 놓은 시각
+        """
+        with self._lock:
+            stroke = self._stroke
+            if stroke is None or stroke.button != button:
+                return
+            self._stroke = None
+            self._add_point(stroke, (x, y), endpoint=True)
+            start = stroke.points[0]
+            if max(math.dist(start, point) for point in stroke.points) < self._drag_threshold:
+                return
+            event = self._to_event(stroke, InputEventType.DRAG, timestamp)
+        self._emit(event)
+
+    def flush(self, idle_only: bool = False) -> None:
+        """진행 중인 hover 구간을 MOUSE_MOVE 이벤트로 발생 (드래그는 release까지 유지)
+
+        Args:
+            idle_only: True면 마지막 이동 후 hover_gap초가 지난 구간만 발생
+        """
+        with self._lock:
+            stroke = self._stroke
+            if stroke is None or stroke.button is not None:
+                return
+            if idle_only and time.time() - stroke.last <= self._hover_gap:
+                return
+            events = self._finish_hover()
+        for event in events:
+            self._emit(event)
+
+    def reset(self) -> None:
+        """진행 중인 구간 버림"""
+        with self._lock:
+            self._stroke = None
+
+    def _add_point(self, stroke: _Stroke, point: Point, endpoint: bool = False) -> None:
+        """경로에 점 추가 (min_distance 미만 이동은 버리고, 가득 차면 RDP로 줄임)
+
+        endpoint=True면 가까운 점을 버리는 대신 마지막 점을 이 점으로 바꿉니다 (놓은 위치 보존).
+        """
+        points = stroke.points
+        if points and math.dist(points[-1], point) < self._min_distance:
+            if endpoint and len(points) > 1:
+                points[-1] = point
+            return
+        points.append(point)
+        while len(points) >= self._max_points:
+            stroke.points = points = simplify_path(points, stroke.tolerance)
+            if len(points) >= self._max_points:
+                stroke.tolerance = max(1.0, stroke.tolerance * 2)
+
+    def _finish_hover(self) -> list[InputEvent]:
+        """hover 구간 종료 (lock 보유 상태에서 호출)"""
+        stroke = self._stroke
+        if stroke is None or stroke.button is not None:
+            return []
+        self._stroke = None
+        if len(stroke.points) < 2:
+            return []
+        x, y = stroke.points[-1]
+        stroke.window_info = self._window_lookup(x, y)
+        return [self._to_event(stroke, InputEventType.MOUSE_MOVE, stroke.last)]
+
+    def _to_event(self, stroke: _Stroke, event_type: InputEventType, end: float) -> InputEvent:
+        """이동 구간을 이벤트로 변환 (lock 보유 상태에서 호출)"""
+        path = simplify_path(stroke.points, stroke.tolerance)
+        self.points += len(path)
+        window_info = stroke.window_info
+        x, y = path[0]
+        return InputEvent(
+            timestamp=stroke.start,
+            event_type=event_type,
+            x=x,
+            y=y,
+            button=stroke.button,
+            end_timestamp=end,
+            path=path,
+            app_name=window_info.app_name if window_info else None,
+            window_title=window_info.window_title if window_info else None,
+            window_info=window_info,
+        )
@@ -0,0 +1,152 @@
+"""활동량 기반 캡처 FPS 조절 모듈
+
+입력 이벤트 빈도와 화면 변화율을 보고 캡처 FPS를 하한~상한 사이에서 조절합니다.
+커서 깜박임처럼 작은 변화(CaptureStats.minor_changes)는 변화로 세지 않습니다.
+사용자가 활동하면 즉시 상한으로 올리고, 한가해지면 천천히 하한으로 내립니다.
+"""
+
+import threading
+import time
+from collections import deque
+
+from shadow.capture.models import InputEvent
+from shadow.capture.scheduler import CaptureStats
+
+
+class AdaptiveRateController:
+    """활동량에 따라 캡처 FPS를 조절하는 컨트롤러
+
+    - 활동량 = max(최근 window초 이벤트 수 / burst_events, 최근 window초 프레임 변화율), 0~1
+      (detect_changes=False면 무변화 프레임이 집계되지 않으므로 이벤트 빈도만 사용)
+    - 변화율은 바뀐 영역이 capture_min_change_area 이상인 프레임만 셈: 낮은 FPS에서는
+      1Hz 커서 깜박임만으로도 거의 모든 프레임이 바뀌어 유휴 화면이 상한 FPS로 올라가기 때문
+    - 목표 FPS = min_fps + (max_fps - min_fps) * 활동량
+    - 목표가 현재보다 높으면 즉시 반영 (클릭 직후 프레임을 놓치지 않도록)
+    - 목표가 낮으면 release_half_life초마다 절반씩 감소 (짧은 멈춤에 흔들리지 않도록)
+
+    낮은 FPS로 대기 중에 이벤트가 들어오면 wakeup을 set()하여
+    캡처 스케줄러가 다음 슬롯까지 기다리지 않고 바로 깨어나도록 합니다.
+    """
+
+    def __init__(
+        self,
+        min_fps: float,
+        max_fps: float,
+        window: float = 2.0,
+        burst_events: int = 4,
+        release_half_life: float = 1.0,
+        detect_changes: bool = True,
+    ):
+        """
+        Args:
+            min_fps: FPS 하한 (유휴 상태)
+            max_fps: FPS 상한 (활동 중)
+            window: 이벤트 빈도 측정 구간 (초)
+            burst_events: window 안에 이 수 이상의 이벤트가 있으면 상한 FPS
+            release_half_life: 활동이 줄었을 때 FPS가 절반으로 줄어드는 시간 (초)
+            detect_changes: 캡처가 변화 감지를 하는지 (False면 화면 변화율은 활동량에서 제외)
+        """
+        if not 0 < min_fps <= max_fps:
+            raise ValueError(f"0 < min_fps <= max_fps 이어야 합니다: {min_fps}, {max_fps}")
+
+        self._min_fps = min_fps
+        self._max_fps = max_fps
+        self._window = window
+        self._burst_events = burst_events
+        self._release_half_life = release_half_life
+        self._detect_changes = detect_changes
+        self._event_times: deque[float] = deque()
+        self._frame_samples: deque[tuple[float, int, int]] = deque()  # (시각, 캡처 수, 무변화+작은 변화 수)
+        self._lock = threading.Lock()
+        self.wakeup = threading.Event()  # 이벤트 발생 시 캡처 대기를 깨우는 신호
+        self.reset()
+
+    @property
+    def fps(self) -> float:
+        """현재 FPS"""
+        return self._fps
+
+    @property
+    def min_fps(self) -> float:
+        """FPS 하한"""
+        return self._min_fps
+
+    @property
+    def max_fps(self) -> float:
+        """FPS 상한"""
+        return self._max_fps
+
+    def reset(self) -> None:
+        """상태 초기화 (상한 FPS에서 시작)"""
+        with self._lock:
+            self._event_times.clear()
+        self.wakeup.clear()
+        self._frame_samples.clear()
+        self._fps = float(self._max_fps)
+        # 변화 감지가 꺼져 있으면 unchanged_frames가 항상 0이라 변화율이 1로 고정되므로 무시
+        self._change_ratio = 1.0 if self._detect_changes else 0.0
+        self._last_update: float | None = None
+        self._last_captured = 0
+        self._last_unchanged = 0
+
+    def on_event(self, event: InputEvent) -> None:
+        """입력 이벤트 기록 (InputEventCollector 콜백)
+
+        Args:
+            event: 수집된 입력 이벤트
+        """
+        with self._lock:
+            self._event_times.append(event.timestamp)
+        if self._fps < self._max_fps:
+            self.wakeup.set()
+
+    def update(self, stats: CaptureStats, now: float | None = None) -> float:
+        """최근 활동량으로 FPS 갱신
+
+        Args:
+            stats: 캡처 카운터 (직전 update 이후 변화율 계산에 사용)
+            now: 현재 시각 (Unix timestamp, None이면 time.time())
+
+        Returns:
+            갱신된 FPS
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            cutoff = now - self._window
+            while self._event_times and self._event_times[0] < cutoff:
+                self._event_times.popleft()
+            event_count = len(self._event_times)
+        event_activity = min(1.0, event_count / self._burst_events)
+
+        # 최근 window초 동안 캡처된 프레임 중 화면이 크게 바뀐 비율 (새 프레임이 없으면 유지)
+        idle_frames = stats.unchanged_frames + stats.minor_changes
+        self._frame_samples.append(
+            (
+                now,
+                stats.captured_frames - self._last_captured,
+                idle_frames - self._last_unchanged,
+            )
+        )
+        self._last_captured = stats.captured_frames
+        self._last_unchanged = idle_frames
+        while self._frame_samples[0][0] < cutoff:
+            self._frame_samples.popleft()
+        captured = sum(sample[1] for sample in self._frame_samples)
+        if captured > 0 and self._detect_changes:
+            unchanged = sum(sample[2] for sample in self._frame_samples)
+            self._change_ratio = (captured - unchanged) / captured
+
+        activity = max(event_activity, self._change_ratio)
+        target = self._min_fps + (self._max_fps - self._min_fps) * activity
+
+        if target >= self._fps:
+            self._fps = target
+        else:
+            last = now if self._last_update is None else self._last_update
+            elapsed = max(0.0, now - last)
+            decayed = self._fps * 0.5 ** (elapsed / self._release_half_life)
+            self._fps = max(target, decayed)
+
+        self._last_update = now
+        return self._fps
@@ -1,43 +1,270 @@
 """캡처 + 입력 이벤트 동기화 오케스트레이터"""
 
+import logging
 import threading
 import time
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
 
+from shadow.capture.backends import CaptureBackend, list_monitors
+from shadow.capture.event_store import EventStore
+from shadow.capture.frame_buffer import FrameRingBuffer
 from shadow.capture.input_events import InputEventCollector
-from shadow.capture.models import Frame, InputEvent
+from shadow.capture.models import CaptureMode, Frame, InputEvent, KeyframePair, MonitorGeometry
+from shadow.capture.rate import AdaptiveRateController
+from shadow.capture.redaction import ExclusionFilter, parse_excluded_apps
+from shadow.capture.scheduler import CaptureStats
 from shadow.capture.screen import ScreenCapture
+from shadow.capture.stages import CapturePipeline
+from shadow.capture.triggered import TriggeredFrameSelector
+from shadow.config import settings
+
+if TYPE_CHECKING:
+    from shadow.preprocessing.keyframe import StreamingKeyframeExtractor
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class RecordingSession:
-    """녹화 세션 결과"""
+    """녹화 세션 결과
+
+    frames는 기본적으로 list이며, 보존 구간을 지정하면 FrameRingBuffer입니다.
+    events는 기본적으로 list이며, Recorder는 열 기반 EventStore를 사용합니다.
+
+    다중 모니터 녹화에서는 monitor_frames에 모니터별 프레임이 들어가고,
+    frames는 주 모니터(첫 번째 모니터)의 프레임입니다.
 
-    frames: list[Frame] = field(default_factory=list)
-    events: list[InputEvent] = field(default_factory=list)
+    링 버퍼 세션은 보존 구간보다 오래된 프레임 슬롯이 재사용되므로,
+    Recorder가 녹화 중에 키프레임 쌍을 추출해 keyframe_pairs에 담습니다.
+    """
+
+    frames: list[Frame] | FrameRingBuffer = field(default_factory=list)
+    events: list[InputEvent] | EventStore = field(default_factory=list)
     start_time: float = 0.0
     end_time: float = 0.0
+    capture_stats: CaptureStats = field(default_factory=CaptureStats)
+    monitors: dict[int, MonitorGeometry] = field(default_factory=dict)  # 모니터 번호 -> 위치/크기
+    monitor_frames: dict[int, list[Frame] | FrameRingBuffer] = field(default_factory=dict)
+    # 녹화 중 추출한 키프레임 쌍 (프레임은 링 버퍼 밖 복사본, None이면 녹화 후 추출)
+    keyframe_pairs: list[KeyframePair] | None = None
 
     @property
     def duration(self) -> float:
         """녹화 시간 (초)"""
         return self.end_time - self.start_time
 
+    def monitor_at(self, x: float | None, y: float | None) -> int | None:
+        """좌표가 속한 모니터 번호 (단일 모니터 녹화이거나 해당 모니터가 없으면 None)"""
+        if x is None or y is None:
+            return None
+        for index, geometry in self.monitors.items():
+            if index in self.monitor_frames and geometry.contains(x, y):
+                return index
+        return None
+
+    def geometry_for(self, monitor: int | None) -> MonitorGeometry | None:
+        """모니터 위치/크기 (None이면 주 모니터, 기록되지 않았으면 None)"""
+        if monitor is None:
+            return next(iter(self.monitors.values()), None)
+        return self.monitors.get(monitor)
+
+    def frames_for(self, monitor: int | None) -> list[Frame] | FrameRingBuffer:
+        """모니터의 프레임 (None이거나 없는 모니터면 주 모니터 프레임)"""
+        if monitor is None:
+            return self.frames
+        return self.monitor_frames.get(monitor, self.frames)
+
+
+@dataclass
+class _MonitorLane:
+    """모니터 하나의 캡처 경로 (캡처 + 프레임 선별 + FPS 조절 + 파이프라인)"""
+
+    monitor: int
+    capture: ScreenCapture
+    selector: TriggeredFrameSelector | None = None
+    rate_controller: AdaptiveRateController | None = None
+    pipeline: CapturePipeline | None = None
+
+
+def _buffer_address(frame: Frame) -> int:
+    """프레임 이미지 버퍼 주소 (같은 슬롯을 공유하는 프레임 판별)"""
+    return frame.rgb_view().__array_interface__["data"][0]
 
-class Recorder:
-    """화면 캡처와 입력 이벤트를 동시에 수집하는 녹화기"""
 
-    def __init__(self, monitor: int | None = None, fps: int | None = None):
+def _parse_monitors(spec: str) -> list[int] | None:
+    """capture_monitors 설정 해석 ("all" -> 전체, "1,2" -> [1, 2], "" -> None)"""
+    spec = spec.strip().lower()
+    if not spec:
+        return None
+    if spec == "all":
+        return [monitor.index for monitor in list_monitors()]
+    return [int(part) for part in spec.split(",") if part.strip()]
+
+
+class Recorder:
+    """화면 캡처와 입력 이벤트를 동시에 수집하는 녹화기
+
+    monitors에 여러 모니터를 지정하면 모니터마다 캡처 파이프라인(grab 스레드와
+    mss 핸들)을 따로 두어 동시에 캡처합니다. 가상 데스크톱 전체 비트맵은 만들지 않습니다.
+    """
+
+    def __init__(
+        self,
+        monitor: int | None = None,
+        fps: int | None = None,
+        buffer_seconds: float | None = None,
+        mode: CaptureMode | str | None = None,
+        adaptive_fps: bool | None = None,
+        backend: CaptureBackend | dict[int, CaptureBackend] | None = None,
+        monitors: list[int] | None = None,
+        excluded_apps: list[str] | None = None,
+        retain_frames: bool = True,
+    ):
         """
         Args:
             monitor: 캡처할 모니터 번호 (1-based)
             fps: 초당 프레임 수
+            buffer_seconds: 프레임 보존 시간 (초, None이면 설정 사용, 0이면 전체 보관)
+            mode: 캡처 모드 (None이면 설정 사용)
+            adaptive_fps: 활동량에 따라 capture_min_fps~fps 사이로 FPS 조절 (None이면 설정 사용)
+            backend: 캡처 백엔드 (None이면 MSS, 이벤트를 제공하는 백엔드는 입력 이벤트 소스로도 사용)
+                다중 모니터에서는 모니터 번호 -> 백엔드 dict
+            monitors: 동시에 캡처할 모니터 번호 목록 (None이면 capture_monitors 설정,
+                설정도 비어 있으면 monitor 하나만 캡처)
+            excluded_apps: 녹화하지 않을 앱 이름 또는 bundle ID
+                (None이면 capture_excluded_apps 설정, 사용자 설정은 load_excluded_apps()로 전달)
+            retain_frames: 세션에 프레임 보관 (False면 프레임 콜백에만 전달하고 바로 놓음,
+                StreamingKeyframeExtractor로 녹화 중에 키프레임을 추출할 때 사용)
+
+        Raises:
+            ValueError: 다중 모니터 녹화에 단일 백엔드를 지정한 경우
         """
-        self._screen_capture = ScreenCapture(monitor=monitor, fps=fps)
-        self._input_collector = InputEventCollector()
+        if isinstance(backend, dict):
+            backends = backend
+            monitors = monitors or list(backend)
+        else:
+            if monitors is None and backend is None:
+                monitors = _parse_monitors(settings.capture_monitors)
+            if monitors is not None and len(monitors) > 1 and backend is not None:
+                raise ValueError("다중 모니터 녹화에는 모니터별 백엔드 dict를 지정하세요")
+            monitors = monitors or [monitor or settings.capture_monitor]
+            backends = {monitors[0]: backend} if backend is not None else {}
+
+        self._buffer_seconds = (
+            buffer_seconds if buffer_seconds is not None else settings.capture_buffer_seconds
+        )
+        self._mode = CaptureMode(mode or settings.capture_mode)
+        if adaptive_fps is None:
+            adaptive_fps = settings.capture_adaptive_fps
+
+        # 주 모니터 백엔드가 이벤트를 제공하면 pynput 대신 사용
+        primary_backend = backends.get(monitors[0])
+        event_source = (
+            primary_backend
+            if primary_backend is not None and primary_backend.provides_events
+            else None
+        )
+        # 제외 앱: 화면은 변환 전에 가리고 이벤트는 기록 전에 버림
+        if excluded_apps is None:
+            excluded_apps = parse_excluded_apps(settings.capture_excluded_apps)
+        self._exclusion = ExclusionFilter(excluded_apps) if excluded_apps else None
+        self._input_collector = InputEventCollector(
+            event_source=event_source, exclusion=self._exclusion
+        )
+
+        self._retain_frames = retain_frames
+        self._frame_callbacks: list[Callable[[RecordingSession, int, Frame], None]] = []
+
+        self._lanes = [
+            self._create_lane(index, fps, backends.get(index), adaptive_fps) for index in monitors
+        ]
         self._recording = False
         self._stop_event = threading.Event()
         self._session: RecordingSession | None = None
+        self._keyframes: StreamingKeyframeExtractor | None = None
+
+    def _create_lane(
+        self,
+        monitor: int,
+        fps: int | None,
+        backend: CaptureBackend | None,
+        adaptive_fps: bool,
+    ) -> _MonitorLane:
+        """모니터 캡처 경로 생성 및 입력 이벤트 콜백 등록"""
+        lane = _MonitorLane(
+            monitor=monitor,
+            capture=ScreenCapture(
+                monitor=monitor, fps=fps, backend=backend, exclusion=self._exclusion
+            ),
+        )
+
+        # triggered 모드: 트리거 주변 프레임만 보존
+        if self._mode == CaptureMode.TRIGGERED:
+            post_roll = settings.capture_post_roll
+            if settings.keyframe_after_mode == "settle":
+                # settle 모드는 트리거 후 최대 keyframe_max_wait초까지 After 프레임을 찾음
+                post_roll = max(post_roll, settings.keyframe_max_wait)
+            lane.selector = TriggeredFrameSelector(
+                pre_roll=settings.capture_pre_roll,
+                post_roll=post_roll,
+                fps=lane.capture.fps,
+                typing_since=lambda: self._input_collector.typing_since,
+            )
+            self._input_collector.add_callback(lane.selector.on_event)
+
+        # 적응형 FPS: 유휴 시 capture_min_fps까지 낮추고 활동 시 fps로 복귀
+        if adaptive_fps:
+            max_fps = lane.capture.fps
+            lane.rate_controller = AdaptiveRateController(
+                min_fps=min(settings.capture_min_fps, max_fps),
+                max_fps=max_fps,
+                detect_changes=lane.capture.detect_changes,
+            )
+            self._input_collector.add_callback(lane.rate_controller.on_event)
+        return lane
+
+    def add_frame_callback(
+        self, callback: Callable[[RecordingSession, int, Frame], None]
+    ) -> None:
+        """보존된 프레임마다 호출될 콜백 추가
+
+        콜백은 (세션, 모니터 번호, 프레임)을 받으며 모니터별 sink 스레드에서 호출됩니다.
+        세션이 링 버퍼를 사용하면 프레임은 버퍼 슬롯의 view이므로,
+        콜백 이후에도 참조하려면 FrameRingBuffer.pin()으로 고정해야 합니다.
+        """
+        self._frame_callbacks.append(callback)
+
+    def remove_frame_callback(
+        self, callback: Callable[[RecordingSession, int, Frame], None]
+    ) -> None:
+        """프레임 콜백 제거"""
+        self._frame_callbacks.remove(callback)
+
+    def add_event_callback(self, callback: Callable[[InputEvent], None]) -> None:
+        """입력 이벤트 발생 시 호출될 콜백 추가 (입력 리스너 스레드에서 호출)"""
+        self._input_collector.add_callback(callback)
+
+    def remove_event_callback(self, callback: Callable[[InputEvent], None]) -> None:
+        """입력 이벤트 콜백 제거"""
+        self._input_collector.remove_callback(callback)
+
+    @property
+    def button_down(self) -> bool:
+        """마우스 버튼을 누르고 있는지 여부 (드래그 추적을 끄면 항상 False)"""
+        pointer = self._input_collector.pointer
+        return pointer is not None and pointer.button_down
+
+    @property
+    def typing_since(self) -> float | None:
+        """진행 중인 타이핑 묶음의 시작 시각 (키 입력 병합을 끄거나 입력 중이 아니면 None)"""
+        return self._input_collector.typing_since
+
+    @property
+    def monitors(self) -> list[int]:
+        """캡처하는 모니터 번호 목록 (첫 번째가 주 모니터)"""
+        return [lane.monitor for lane in self._lanes]
 
     def record(self, duration: float) -> RecordingSession:
         """지정된 시간 동안 녹화
@@ -48,63 +275,185 @@ class Recorder:
         Returns:
             녹화된 프레임과 이벤트를 포함한 세션
         """
+        self.start()
+        self._stop_event.wait(timeout=duration)
+        return self.stop()
+
+    def _new_frames(self, lane: _MonitorLane) -> list[Frame] | FrameRingBuffer:
+        """모니터 하나의 프레임 저장소 생성"""
+        if self._buffer_seconds > 0 and self._retain_frames:
+            return FrameRingBuffer.for_retention(self._buffer_seconds, lane.capture.fps)
+        return []
+
+    def _new_session(self) -> RecordingSession:
+        """프레임/이벤트 저장소가 설정된 새 세션 생성"""
         session = RecordingSession()
-        session.start_time = time.time()
-
-        self._stop_event.clear()
-        self._recording = True
-
-        # 입력 이벤트 수집 시작
-        with self._input_collector:
-            # 화면 캡처 시작
-            with self._screen_capture.session():
-                end_time = session.start_time + duration
-
-                for frame in self._screen_capture.capture_continuous():
-                    session.frames.append(frame)
-
-                    # 이벤트 수집
-                    events = self._input_collector.get_events()
-                    session.events.extend(events)
-
-                    # 종료 조건 확인
-                    if time.time() >= end_time or self._stop_event.is_set():
-                        break
+        for lane in self._lanes:
+            if lane.selector is not None:
+                lane.selector.reset()
+            session.monitor_frames[lane.monitor] = self._new_frames(lane)
+        session.frames = session.monitor_frames[self._lanes[0].monitor]
+        if len(self._lanes) == 1:
+            # 단일 모니터: 좌표 라우팅 없이 frames만 사용
+            session.monitor_frames.clear()
+        if settings.capture_compact_events:
+            session.events = EventStore()
+        return session
 
-        session.end_time = time.time()
-        self._recording = False
+    def _capture_buffer(
+        self, lane: _MonitorLane, frames: list[Frame] | FrameRingBuffer
+    ) -> FrameRingBuffer | None:
+        """변환 단계에서 직접 기록할 링 버퍼 (continuous 모드 + 링 버퍼일 때만)"""
+        if isinstance(frames, FrameRingBuffer) and lane.selector is None:
+            return frames
+        return None
+
+    @staticmethod
+    def _select_frames(lane: _MonitorLane, frame: Frame) -> list[Frame]:
+        """캡처 모드에 따라 보존할 프레임 선별"""
+        if lane.selector is None:
+            return [frame]
+        return lane.selector.select(frame)
+
+    def _store_frame(
+        self, lane: _MonitorLane, frames: list[Frame] | FrameRingBuffer, frame: Frame
+    ) -> Frame | None:
+        """프레임 저장 (continuous 모드의 링 버퍼는 캡처 시 이미 기록됨)
 
-        return session
+        Returns:
+            세션에 저장된 프레임 (링 버퍼 슬롯이 없어 버려지면 None)
+        """
+        if not isinstance(frames, FrameRingBuffer):
+            if self._retain_frames:
+                # list 모드는 프레임을 녹화 끝까지 보관하므로 BGRA 대신 RGB로 보관 (메모리 3/4)
+                frame.convert()
+                frames.append(frame)
+            return frame
+        if lane.selector is not None:
+            # triggered 모드: 선별된 프레임만 링 버퍼에 복사
+            return frames.append(frame)
+        return frame
+
+    def _consume_frame(
+        self,
+        session: RecordingSession,
+        lane: _MonitorLane,
+        frames: list[Frame] | FrameRingBuffer,
+        frame: Frame,
+    ) -> None:
+        """파이프라인 sink: 프레임 저장 및 입력 이벤트 수집 (모니터별 sink 스레드)"""
+        for kept in self._select_frames(lane, frame):
+            stored = self._store_frame(lane, frames, kept)
+            if stored is None:
+                continue
+            for callback in self._frame_callbacks:
+                try:
+                    callback(session, lane.monitor, stored)
+                except Exception:
+                    logger.exception("프레임 콜백 실패")
+        # 이벤트는 주 모니터 sink만 수집 (get_events 커서는 한 스레드에서만 사용)
+        if lane is self._lanes[0]:
+            session.events.extend(self._input_collector.get_events())
+
+    def _start_lane(self, session: RecordingSession, lane: _MonitorLane) -> None:
+        """모니터 캡처 파이프라인 시작 (grab -> 변환 -> sink 스레드)"""
+        frames = session.monitor_frames.get(lane.monitor, session.frames)
+        if lane.rate_controller is not None:
+            lane.rate_controller.reset()
+        lane.pipeline = CapturePipeline(
+            lane.capture,
+            sink=lambda frame: self._consume_frame(session, lane, frames, frame),
+            buffer=self._capture_buffer(lane, frames),
+            queue_size=settings.capture_queue_size,
+            grab_policy=settings.capture_backpressure,
+            rate_controller=lane.rate_controller,
+        )
+        lane.pipeline.start()
+        # 클릭 좌표 변환/라우팅용 모니터 위치 (grab 스레드가 세션 시작 시 조회)
+        if lane.capture.geometry is not None:
+            session.monitors[lane.monitor] = lane.capture.geometry
+
+    def _stop_lanes(self) -> None:
+        """모든 캡처 파이프라인 중지 (grab 중지 후 큐에 남은 프레임까지 처리)"""
+        for lane in self._lanes:
+            if lane.pipeline is not None:
+                lane.pipeline.stop()
+                lane.pipeline = None
 
     def start(self) -> None:
-        """녹화 시작 (백그라운드 스레드에서 실행)
+        """녹화 시작 (백그라운드 캡처 파이프라인에서 실행)
 
         stop()을 호출하면 녹화가 중지되고 세션을 반환받을 수 있습니다.
         """
         self._stop_event.clear()
-        self._recording = True
-        self._session = RecordingSession()
-        self._session.start_time = time.time()
+        session = self._new_session()
+        session.start_time = time.time()
+
+        # 링 버퍼 세션: 녹화 중 키프레임 추출 (콜백은 캡처/입력 시작 전에 등록)
+        self._start_keyframes(session)
 
         # 입력 이벤트 수집 시작
         self._input_collector.start()
-        self._screen_capture_context = self._screen_capture.session()
-        self._screen_capture_context.__enter__()
 
-        # 백그라운드 캡처 스레드 시작
-        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
-        self._capture_thread.start()
+        # 모니터별 파이프라인 시작 (캡처 세션은 각 grab 스레드가 소유)
+        try:
+            for lane in self._lanes:
+                self._start_lane(session, lane)
+        except Exception:
+            self._stop_lanes()
+            self._input_collector.stop()
+            self._stop_keyframes(session)
+            raise
+
+        session.capture_stats = self._lanes[0].capture.stats
+        self._session = session
+        self._recording = True
 
-    def _capture_loop(self) -> None:
-        """백그라운드 캡처 루프"""
-        for frame in self._screen_capture.capture_continuous():
-            if self._session:
-                self._session.frames.append(frame)
-                events = self._input_collector.get_events()
-                self._session.events.extend(events)
+    def _start_keyframes(self, session: RecordingSession) -> None:
+        """링 버퍼 세션의 녹화 중 키프레임 추출 시작 (캡처 시작 전에 호출)
 
-            if self._stop_event.is_set():
-                break
+        녹화 후 extract_pairs()로는 보존 구간보다 오래된 트리거의 프레임을 찾을 수 없으므로,
+        트리거 주변 슬롯만 pin했다가 쌍이 정해지면 링 버퍼 밖으로 복사하고 슬롯을 돌려줍니다.
+        """
+        if not any(isinstance(frames, FrameRingBuffer) for frames in self._all_frames(session)):
+            return
+        # preprocessing이 recorder를 import하므로 순환 import를 피해 여기서 import
+        from shadow.preprocessing.keyframe import StreamingKeyframeExtractor
+
+        session.keyframe_pairs = []
+        extractor = StreamingKeyframeExtractor(
+            on_pair=lambda pair: session.keyframe_pairs.append(self._detach_pair(session, pair))
+        )
+        extractor.attach(self)
+        self._keyframes = extractor
+
+    def _stop_keyframes(self, session: RecordingSession) -> None:
+        """대기 중인 트리거를 마지막 프레임으로 완성하고 녹화 중 추출 종료"""
+        extractor, self._keyframes = self._keyframes, None
+        if extractor is None:
+            return
+        extractor.flush()
+        extractor.detach(self)
+        session.keyframe_pairs.sort(key=lambda pair: pair.trigger_event.timestamp)
+
+    def _detach_pair(self, session: RecordingSession, pair: KeyframePair) -> KeyframePair:
+        """쌍의 프레임을 링 버퍼 밖으로 복사하고 pin한 슬롯 해제"""
+        before = Frame(timestamp=pair.before_frame.timestamp, image=pair.before_frame.image.copy())
+        if _buffer_address(pair.after_frame) == _buffer_address(pair.before_frame):
+            # 변화 없는 쌍은 복사본 하나를 공유
+            after = before.reference(pair.after_frame.timestamp)
+        else:
+            after = Frame(timestamp=pair.after_frame.timestamp, image=pair.after_frame.image.copy())
+        frames = session.frames_for(pair.monitor)
+        if isinstance(frames, FrameRingBuffer):
+            frames.unpin(pair.before_frame)
+            frames.unpin(pair.after_frame)
+        return replace(pair, before_frame=before, after_frame=after)
+
+    @staticmethod
+    def _all_frames(session: RecordingSession) -> list[list[Frame] | FrameRingBuffer]:
+        """세션의 모든 모니터 프레임 저장소"""
+        return list(session.monitor_frames.values()) or [session.frames]
 
     def stop(self) -> RecordingSession:
         """녹화 중지 및 세션 반환
@@ -113,14 +462,7 @@ class Recorder:
             녹화된 세션 (start()가 호출되지 않았으면 빈 세션)
         """
         self._stop_event.set()
-
-        # 캡처 스레드 종료 대기
-        if hasattr(self, '_capture_thread') and self._capture_thread.is_alive():
-            self._capture_thread.join(timeout=2.0)
-
-        # 컨텍스트 정리
-        if hasattr(self, '_screen_capture_context'):
-            self._screen_capture_context.__exit__(None, None, None)
+        self._stop_lanes()
 
         # 입력 수집기 정리
         self._input_collector.stop()
@@ -128,6 +470,9 @@ class Recorder:
         self._recording = False
 
         if self._session:
+            # 마지막 프레임 이후 이벤트 수집
+            self._session.events.extend(self._input_collector.get_events())
+            self._stop_keyframes(self._session)
             self._session.end_time = time.time()
             session = self._session
             self._session = None
@@ -139,3 +484,18 @@ class Recorder:
     def is_recording(self) -> bool:
         """녹화 중 여부"""
         return self._recording
+
+    @property
+    def capture_stats(self) -> CaptureStats:
+        """현재(또는 마지막) 녹화의 주 모니터 캡처 성능 카운터"""
+        return self._lanes[0].capture.stats
+
+    @property
+    def exclusion(self) -> ExclusionFilter | None:
+        """녹화 제외 앱 필터 (제외 앱이 없으면 None)"""
+        return self._exclusion
+
+    @property
+    def monitor_stats(self) -> dict[int, CaptureStats]:
+        """모니터별 캡처 성능 카운터"""
+        return {lane.monitor: lane.capture.stats for lane in self._lanes}
@@ -0,0 +1,165 @@
+"""녹화 제외 앱 필터 모듈
+
+사용자가 녹화를 원하지 않는 앱(설정의 excluded_apps)을 캡처 단계에서 걸러냅니다.
+제외 앱 윈도우 영역은 RGB 변환/변화 감지 전에 BGRA 버퍼에서 검게 지우고,
+화면 전체가 제외 앱이면 프레임을 버립니다. 제외 앱에서 발생한 입력 이벤트는
+이벤트 로그에 들어가기 전에 버립니다. 따라서 제외 앱 화면은 변환, 저장, API 전송
+어느 단계에도 도달하지 않습니다.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from shadow.capture.models import InputEvent, MonitorGeometry, WindowInfo
+from shadow.capture.window import WindowInfoCollector
+
+logger = logging.getLogger(__name__)
+
+# (left, top, right, bottom) 가상 데스크톱 좌표
+Rect = tuple[int, int, int, int]
+
+
+def parse_excluded_apps(spec: str) -> list[str]:
+    """capture_excluded_apps 설정 해석 ("Slack, com.apple.keychainaccess" -> 목록)"""
+    return [part.strip() for part in spec.split(",") if part.strip()]
+
+
+class ExclusionFilter:
+    """제외 앱 윈도우 마스킹 및 입력 이벤트 필터
+
+    앱은 이름(WindowInfo.app_name) 또는 bundle ID로 지정하며 대소문자를 구분하지 않습니다.
+    윈도우 영역 조회는 비용이 크므로 refresh_interval 동안 재사용합니다.
+    다른 윈도우에 일부 가려진 제외 앱 윈도우도 bounds 전체를 지웁니다.
+    """
+
+    def __init__(
+        self,
+        apps: Iterable[str],
+        window_bounds: Callable[[Callable[[WindowInfo], bool]], list[Rect]] | None = None,
+        refresh_interval: float = 0.5,
+    ):
+        """
+        Args:
+            apps: 제외할 앱 이름 또는 bundle ID 목록
+            window_bounds: 조건에 맞는 윈도우 영역 조회 함수
+                (None이면 WindowInfoCollector 사용, 사용할 수 없으면 이벤트만 필터)
+            refresh_interval: 윈도우 영역 재조회 간격 (초)
+        """
+        self._apps = frozenset(app.strip().lower() for app in apps if app.strip())
+        if window_bounds is None and WindowInfoCollector.is_available():
+            try:
+                window_bounds = WindowInfoCollector().get_window_bounds
+            except Exception:
+                logger.warning("윈도우 영역을 조회할 수 없어 제외 앱 화면을 가리지 못합니다")
+        self._window_bounds = window_bounds
+        self._refresh_interval = refresh_interval
+        self._regions: list[Rect] = []
+        self._regions_at: float | None = None
+        self._lock = threading.Lock()
+        self.dropped_events = 0  # 버려진 입력 이벤트 수
+
+    @property
+    def apps(self) -> frozenset[str]:
+        """제외 앱 (소문자)"""
+        return self._apps
+
+    def __bool__(self) -> bool:
+        return bool(self._apps)
+
+    def matches(self, app_name: str | None, bundle_id: str | None = None) -> bool:
+        """제외 앱인지 확인
+
+        Args:
+            app_name: 앱 이름
+            bundle_id: bundle ID
+
+        Returns:
+            이름 또는 bundle ID가 제외 목록에 있으면 True
+        """
+        return any(name and name.lower() in self._apps for name in (app_name, bundle_id))
+
+    def matches_window(self, window: WindowInfo) -> bool:
+        """윈도우가 제외 앱 소유인지 확인"""
+        return self.matches(window.app_name, window.bundle_id)
+
+    def drops(self, event: InputEvent) -> bool:
+        """제외 앱에서 발생한 입력 이벤트인지 확인 (버릴 이벤트면 dropped_events 증가)
+
+        Args:
+            event: 입력 이벤트
+
+        Returns:
+            버려야 하면 True
+        """
+        if event.window_info is not None:
+            excluded = self.matches_window(event.window_info)
+        else:
+            excluded = self.matches(event.app_name)
+        if excluded:
+            self.dropped_events += 1
+        return excluded
+
+    def regions(self) -> list[Rect]:
+        """제외 앱 윈도우 영역 (가상 데스크톱 좌표, refresh_interval 동안 캐시)"""
+        if self._window_bounds is None or not self._apps:
+            return []
+
+        now = time.monotonic()
+        with self._lock:
+            if self._regions_at is None or now - self._regions_at >= self._refresh_interval:
+                try:
+                    self._regions = list(self._window_bounds(self.matches_window))
+                except Exception:
+                    logger.exception("제외 앱 윈도우 영역 조회 실패, 이전 영역 사용")
+                self._regions_at = now
+            return self._regions
+
+    def redact(
+        self, bgra: NDArray[np.uint8], geometry: MonitorGeometry | None
+    ) -> NDArray[np.uint8] | None:
+        """제외 앱 윈도우 영역을 검게 지운 BGRA 배열
+
+        읽기 전용 버퍼(replay 등)는 가릴 영역이 있을 때만 복사합니다.
+
+        Args:
+            bgra: grab()이 반환한 BGRA 배열
+            geometry: 캡처한 모니터의 위치/크기 (None이면 좌표 변환 없음)
+
+        Returns:
+            가린 BGRA 배열 (화면 전체가 제외 앱이면 None)
+        """
+        height, width = bgra.shape[:2]
+        boxes = []
+        for rect in self.regions():
+            box = self._to_pixels(rect, geometry, width, height)
+            if box is None:
+                continue
+            if box == (0, 0, width, height):
+                return None
+            boxes.append(box)
+
+        if boxes and not bgra.flags.writeable:
+            bgra = bgra.copy()
+        for left, top, right, bottom in boxes:
+            bgra[top:bottom, left:right, :3] = 0
+        return bgra
+
+    @staticmethod
+    def _to_pixels(
+        rect: Rect, geometry: MonitorGeometry | None, width: int, height: int
+    ) -> Rect | None:
+        """가상 데스크톱 영역을 프레임 픽셀 영역으로 변환 (프레임과 겹치지 않으면 None)"""
+        left, top, right, bottom = rect
+        if geometry is not None:
+            left, top = geometry.to_local(left, top, width, height)
+            right, bottom = geometry.to_local(right, bottom, width, height)
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(width, right), min(height, bottom)
+        if left >= right or top >= bottom:
+            return None
+        return left, top, right, bottom
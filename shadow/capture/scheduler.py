@@ -0,0 +1,115 @@
+"""캡처 스케줄링 모듈
+
+monotonic 시계 기반으로 프레임 캡처 시점을 정하고, 캡처 지연/누락을 집계합니다.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class CaptureStats:
+    """캡처 성능 카운터"""
+
+    captured_frames: int = 0  # 캡처된 프레임 수
+    dropped_frames: int = 0  # 캡처가 늦어져 건너뛴 프레임 슬롯 수
+    unchanged_frames: int = 0  # 변화 없어 이전 프레임을 참조한 프레임 수
+    minor_changes: int = 0  # 바뀐 영역이 capture_min_change_area 미만인 프레임 수 (저장은 함)
+    queue_dropped: int = 0  # 파이프라인 큐 포화로 버려진 프레임 수
+    excluded_frames: int = 0  # 화면 전체가 제외 앱이라 버린 프레임 수
+    current_fps: float = 0.0  # 현재 캡처 FPS (적응형 FPS 사용 시 변동)
+    grab_ms_total: float = 0.0  # mss.grab 누적 시간 (ms)
+    grab_ms_max: float = 0.0  # mss.grab 최대 시간 (ms)
+    convert_ms_total: float = 0.0  # 변환/저장 누적 시간 (ms)
+    convert_ms_max: float = 0.0  # 변환/저장 최대 시간 (ms)
+
+    def record_grab(self, seconds: float) -> None:
+        """grab 소요 시간 기록"""
+        ms = seconds * 1000
+        self.grab_ms_total += ms
+        self.grab_ms_max = max(self.grab_ms_max, ms)
+
+    def record_convert(self, seconds: float) -> None:
+        """변환 소요 시간 기록 (프레임 1장 완료)"""
+        ms = seconds * 1000
+        self.convert_ms_total += ms
+        self.convert_ms_max = max(self.convert_ms_max, ms)
+        self.captured_frames += 1
+
+    @property
+    def avg_grab_ms(self) -> float:
+        """프레임당 평균 grab 시간 (ms)"""
+        return self.grab_ms_total / self.captured_frames if self.captured_frames else 0.0
+
+    @property
+    def avg_convert_ms(self) -> float:
+        """프레임당 평균 변환 시간 (ms)"""
+        return self.convert_ms_total / self.captured_frames if self.captured_frames else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """딕셔너리로 변환 (평균값 포함)"""
+        data = asdict(self)
+        data["avg_grab_ms"] = self.avg_grab_ms
+        data["avg_convert_ms"] = self.avg_convert_ms
+        return data
+
+
+class CaptureScheduler:
+    """monotonic 시계 기반 고정 간격 스케줄러
+
+    캡처가 간격보다 오래 걸려 예정 시각을 지나치면, 밀린 슬롯을 몰아서
+    캡처하지 않고 건너뛴 뒤 다음 예정 시각에 다시 맞춥니다.
+    """
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 캡처 간격 (초)
+        """
+        self._interval = interval
+        self._next: float | None = None
+
+    @property
+    def interval(self) -> float:
+        """캡처 간격 (초)"""
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: float) -> None:
+        """캡처 간격 변경 (다음 슬롯은 직전 슬롯 + 새 간격)"""
+        if self._next is not None:
+            self._next += interval - self._interval
+        self._interval = interval
+
+    def reset(self) -> None:
+        """스케줄 초기화 (다음 wait()는 즉시 반환)"""
+        self._next = None
+
+    def wait(self, wake: threading.Event | None = None) -> int:
+        """다음 캡처 시각까지 대기
+
+        Args:
+            wake: 지정하면 대기 중 set() 시 즉시 깨어나 바로 캡처 (깨운 뒤 clear)
+
+        Returns:
+            지연으로 건너뛴 슬롯 수
+        """
+        now = time.monotonic()
+        if self._next is None:
+            self._next = now
+
+        missed = 0
+        if now < self._next:
+            if wake is None:
+                time.sleep(self._next - now)
+            elif wake.wait(self._next - now):
+                # 깨우기 요청: 남은 대기를 건너뛰고 지금부터 다시 간격 계산
+                wake.clear()
+                self._next = time.monotonic()
+        else:
+            # 이미 지난 슬롯 중 가장 최근 슬롯에서 캡처하고 나머지는 누락 처리
+            missed = int((now - self._next) // self._interval)
+
+        self._next += (missed + 1) * self._interval
+        return missed
@@ -1,105 +1,326 @@
-"""MSS 기반 화면 캡처 모듈"""
+"""화면 캡처 모듈 (기본 백엔드: MSS)"""
 
+import threading
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
 
-import mss
 import numpy as np
 from numpy.typing import NDArray
 
-from shadow.capture.models import Frame
-from shadow.capture.window import get_current_process_info
+from shadow.capture.backends import CaptureBackend, MssBackend
+from shadow.capture.change import FrameChangeDetector
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.models import Frame, MonitorGeometry
+from shadow.capture.redaction import ExclusionFilter
+from shadow.capture.scheduler import CaptureScheduler, CaptureStats
 from shadow.config import settings
 
 
 class ScreenCapture:
-    """MSS를 사용한 화면 캡처"""
+    """화면 캡처 (화면 소스는 CaptureBackend, 기본은 MSS)"""
 
-    def __init__(self, monitor: int | None = None, fps: int | None = None):
+    def __init__(
+        self,
+        monitor: int | None = None,
+        fps: int | None = None,
+        detect_changes: bool | None = None,
+        backend: CaptureBackend | None = None,
+        exclusion: ExclusionFilter | None = None,
+    ):
         """
         Args:
             monitor: 캡처할 모니터 번호 (1-based, None이면 설정 사용)
             fps: 초당 프레임 수 (None이면 설정 사용)
+            detect_changes: 변화 없는 프레임을 이전 프레임 참조로 저장 (None이면 설정 사용)
+            backend: 화면 소스 (None이면 monitor를 캡처하는 MssBackend)
+            exclusion: 지정하면 제외 앱 윈도우를 변환 전에 가림 (화면 전체면 프레임 버림)
         """
         self._monitor = monitor or settings.capture_monitor
         self._fps = fps or settings.capture_fps
         self._frame_interval = 1.0 / self._fps
-        self._sct: mss.mss | None = None
+        self._backend = backend or MssBackend(self._monitor)
+        self._active = False
+        self._geometry: MonitorGeometry | None = None
+        self._exclusion = exclusion if exclusion else None
+
+        if detect_changes is None:
+            detect_changes = settings.capture_detect_changes
+        self._change_detector: FrameChangeDetector | None = (
+            FrameChangeDetector(stride=settings.capture_change_stride)
+            if detect_changes
+            else None
+        )
+        self._min_change_area = settings.capture_min_change_area
+        self._last_frame: Frame | None = None
+        self._scheduler = CaptureScheduler(self._frame_interval)
+        self._stats = CaptureStats()
 
     @contextmanager
     def session(self) -> Generator["ScreenCapture", None, None]:
         """캡처 세션 컨텍스트 매니저"""
-        self._sct = mss.mss()
+        self._backend.open()
+        self._active = True
+        info = self._backend.monitor_info
+        self._geometry = MonitorGeometry(
+            index=self._monitor,
+            left=info["left"],
+            top=info["top"],
+            width=info["width"],
+            height=info["height"],
+        )
+        self._reset_change_detection()
+        self._scheduler.reset()
+        self._stats = CaptureStats(current_fps=self.current_fps)
         try:
             yield self
         finally:
-            self._sct.close()
-            self._sct = None
+            self._active = False
+            self._backend.close()
+
+    @property
+    def backend(self) -> CaptureBackend:
+        """화면 소스 백엔드"""
+        return self._backend
+
+    @property
+    def geometry(self) -> MonitorGeometry | None:
+        """마지막 캡처 세션의 모니터 위치/크기 (세션 시작 전이면 None)"""
+        return self._geometry
+
+    @property
+    def fps(self) -> int:
+        """초당 프레임 수"""
+        return self._fps
+
+    @property
+    def current_fps(self) -> float:
+        """현재 캡처 FPS (set_rate()로 변경 가능)"""
+        return 1.0 / self._scheduler.interval
+
+    def set_rate(self, fps: float) -> None:
+        """캡처 FPS 변경 (다음 캡처 슬롯부터 적용)
+
+        Args:
+            fps: 새 FPS
+        """
+        self._scheduler.interval = 1.0 / fps
+        self._stats.current_fps = fps
+
+    @property
+    def detect_changes(self) -> bool:
+        """변화 없는 프레임을 감지하는지 (False면 unchanged_frames는 항상 0)"""
+        return self._change_detector is not None
+
+    @property
+    def unchanged_frames(self) -> int:
+        """이전 프레임 참조로 저장된(변화 없는) 프레임 수"""
+        return self._stats.unchanged_frames
+
+    @property
+    def stats(self) -> CaptureStats:
+        """현재 캡처 세션의 성능 카운터"""
+        return self._stats
+
+    def _reset_change_detection(self) -> None:
+        """변화 감지 상태 초기화"""
+        self._last_frame = None
+        if self._change_detector is not None:
+            self._change_detector.reset()
+
+    def _signature(self, bgra: NDArray[np.uint8]) -> int | None:
+        """변화 감지용 체크섬 (비활성화 시 None)"""
+        if self._change_detector is None:
+            return None
+        return self._change_detector.signature(bgra)
+
+    def _is_unchanged(self, signature: int | None) -> bool:
+        """직전에 저장한 프레임과 화면이 같은지 확인"""
+        return (
+            signature is not None
+            and self._last_frame is not None
+            and self._change_detector.is_unchanged(signature)
+        )
+
+    def _record_change(self) -> None:
+        """바뀐 프레임의 변화 크기 집계 (capture_min_change_area 미만이면 minor_changes 증가)"""
+        if self._change_detector is None or self._last_frame is None:
+            return
+        if self._change_detector.changed_ratio() < self._min_change_area:
+            self._stats.minor_changes += 1
+
+    def _remember(self, frame: Frame, signature: int | None) -> Frame:
+        """저장된 프레임과 체크섬 기록"""
+        self._last_frame = frame
+        if signature is not None:
+            self._change_detector.commit(signature)
+        return frame
+
+    def _redact(self, bgra: NDArray[np.uint8]) -> NDArray[np.uint8] | None:
+        """제외 앱 윈도우 가리기 (화면 전체가 제외 앱이면 None)"""
+        if self._exclusion is None:
+            return bgra
+        redacted = self._exclusion.redact(bgra, self._geometry)
+        if redacted is None:
+            self._stats.excluded_frames += 1
+        return redacted
+
+    def _grab(self) -> NDArray[np.uint8]:
+        """백엔드에서 화면을 BGRA 배열로 가져오기 (복사 없음)"""
+        if not self._active:
+            raise RuntimeError("캡처 세션이 시작되지 않음. session() 컨텍스트 내에서 사용하세요.")
+        return self._backend.grab()
 
-    def capture_frame(self) -> Frame:
+    def capture_frame(self) -> Frame | None:
         """단일 프레임 캡처
 
+        grab 버퍼를 BGRA 그대로 보관하고 RGB 변환은 Frame.image 첫 접근 시 수행합니다.
+        변화 감지가 켜져 있고 화면이 직전 프레임과 같으면
+        직전 프레임의 이미지를 공유하는 Frame을 반환합니다.
+
         Returns:
-            캡처된 Frame 객체
+            캡처된 Frame 객체 (화면 전체가 제외 앱이면 None)
         """
-        if self._sct is None:
-            raise RuntimeError("캡처 세션이 시작되지 않음. session() 컨텍스트 내에서 사용하세요.")
+        return self.process_frame(*self.grab())
+
+    def capture_into(self, buffer: FrameRingBuffer) -> Frame | None:
+        """링 버퍼 슬롯에 직접 캡처
+
+        BGRA -> RGB 변환 결과를 버퍼 슬롯에 바로 기록하므로
+        프레임마다 새 배열을 할당하지 않습니다.
+        화면 변화가 없으면 슬롯을 쓰지 않고 직전 슬롯을 참조합니다.
+
+        Args:
+            buffer: 기록할 링 버퍼
+
+        Returns:
+            버퍼에 저장된 Frame (모든 슬롯이 pin되어 있으면 None)
+        """
+        return self.process_into(buffer, *self.grab())
+
+    def grab(self) -> tuple[NDArray[np.uint8], float]:
+        """grab 소요 시간을 기록하며 캡처
+
+        백엔드는 grab마다 새 버퍼(또는 수정되지 않는 버퍼)를 반환하므로,
+        반환된 배열은 다른 스레드로 넘겨 나중에 처리해도 안전합니다.
+
+        Returns:
+            (BGRA 배열, Unix timestamp) 튜플
+        """
+        started = time.perf_counter()
+        bgra = self._grab()
+        self._stats.record_grab(time.perf_counter() - started)
+        return bgra, time.time()
+
+    def process_frame(self, bgra: NDArray[np.uint8], timestamp: float) -> Frame | None:
+        """grab() 결과를 Frame으로 변환 (제외 앱 가리기, 변화 감지 포함)
+
+        Args:
+            bgra: grab()이 반환한 BGRA 배열
+            timestamp: grab()이 반환한 타임스탬프
+
+        Returns:
+            변환된 Frame 객체 (화면 전체가 제외 앱이면 None)
+        """
+        started = time.perf_counter()
+        try:
+            bgra = self._redact(bgra)
+            if bgra is None:
+                return None
+
+            # 변화 없음: 변환/복사 없이 이전 프레임 이미지 참조
+            signature = self._signature(bgra)
+            if self._is_unchanged(signature):
+                self._stats.unchanged_frames += 1
+                return self._last_frame.reference(timestamp)
+            self._record_change()
+
+            # BGRA -> RGB 변환은 image 첫 접근 시 수행
+            return self._remember(Frame(timestamp=timestamp, bgra=bgra), signature)
+        finally:
+            self._stats.record_convert(time.perf_counter() - started)
+
+    def process_into(
+        self, buffer: FrameRingBuffer, bgra: NDArray[np.uint8], timestamp: float
+    ) -> Frame | None:
+        """grab() 결과를 링 버퍼 슬롯에 기록 (제외 앱 가리기, 변화 감지 포함)
+
+        Args:
+            buffer: 기록할 링 버퍼
+            bgra: grab()이 반환한 BGRA 배열
+            timestamp: grab()이 반환한 타임스탬프
+
+        Returns:
+            버퍼에 저장된 Frame (모든 슬롯이 pin되어 있거나 화면 전체가 제외 앱이면 None)
+        """
+        started = time.perf_counter()
+        try:
+            bgra = self._redact(bgra)
+            if bgra is None:
+                return None
+
+            # 변화 없음: 직전 슬롯을 참조하는 엔트리만 추가
+            signature = self._signature(bgra)
+            if self._is_unchanged(signature):
+                frame = buffer.append_reference(timestamp)
+                if frame is not None:
+                    self._stats.unchanged_frames += 1
+                    return frame
+            self._record_change()
+
+            acquired = buffer.acquire(bgra.shape[0], bgra.shape[1])
+            if acquired is None:
+                return None
+
+            slot, dst = acquired
+            np.copyto(dst, bgra[:, :, 2::-1])
+            return self._remember(buffer.commit(slot, timestamp), signature)
+        finally:
+            self._stats.record_convert(time.perf_counter() - started)
 
-        if self._monitor >= len(self._sct.monitors):
-            info = get_current_process_info()
-            logger = __import__("logging").getLogger(__name__)
-            logger.warning(
-                "Screen Recording 권한 필요. 현재 실행 앱=%s bundle_id=%s pid=%s exe=%s",
-                info.get("app_name"),
-                info.get("bundle_id"),
-                info.get("pid"),
-                info.get("executable"),
-            )
-            raise RuntimeError(
-                f"모니터 인덱스 범위 오류: monitor={self._monitor}, "
-                f"available={len(self._sct.monitors)}. "
-                "Screen Recording 권한을 확인하세요."
-            )
-
-        monitor = self._sct.monitors[self._monitor]
-        screenshot = self._sct.grab(monitor)
-
-        # BGRA -> RGB 변환
-        img = np.array(screenshot)
-        rgb = img[:, :, :3][:, :, ::-1].copy()
-
-        return Frame(timestamp=time.time(), image=rgb)
-
-    def capture_continuous(self) -> Generator[Frame, None, None]:
+    def wait_next(self, wake: threading.Event | None = None) -> None:
+        """다음 캡처 시각까지 대기 (지연 시 밀린 슬롯은 dropped_frames에 집계)
+
+        Args:
+            wake: 지정하면 대기 중 set() 시 즉시 깨어남
+        """
+        self._stats.dropped_frames += self._scheduler.wait(wake)
+
+    def reset_schedule(self) -> None:
+        """캡처 스케줄 초기화 (다음 wait_next()는 즉시 반환)"""
+        self._scheduler.reset()
+
+    def capture_continuous(
+        self, buffer: FrameRingBuffer | None = None
+    ) -> Generator[Frame, None, None]:
         """연속 프레임 캡처 제너레이터
 
         설정된 FPS에 맞춰 프레임을 생성합니다.
+        캡처가 간격보다 늦어지면 밀린 슬롯은 건너뛰고 dropped_frames에 집계합니다.
+
+        Args:
+            buffer: 지정하면 프레임을 링 버퍼 슬롯에 직접 기록
 
         Yields:
             캡처된 Frame 객체
         """
-        if self._sct is None:
+        if not self._active:
             raise RuntimeError("캡처 세션이 시작되지 않음. session() 컨텍스트 내에서 사용하세요.")
 
-        next_capture_time = time.time()
+        self.reset_schedule()
 
         while True:
-            current_time = time.time()
-
-            # 다음 캡처 시간까지 대기
-            if current_time < next_capture_time:
-                time.sleep(next_capture_time - current_time)
-
-            frame = self.capture_frame()
-            yield frame
+            # 다음 캡처 시간까지 대기 (지연 시 밀린 슬롯 건너뜀)
+            self.wait_next()
 
-            next_capture_time += self._frame_interval
+            if buffer is None:
+                frame = self.capture_frame()
+            else:
+                frame = self.capture_into(buffer)
+            if frame is not None:
+                yield frame
 
     @property
     def monitor_info(self) -> dict:
         """현재 모니터 정보"""
-        if self._sct is None:
-            with mss.mss() as sct:
-                return dict(sct.monitors[self._monitor])
-        return dict(self._sct.monitors[self._monitor])
+        return self._backend.monitor_info
@@ -0,0 +1,254 @@
+"""단계별 캡처 파이프라인 모듈
+
+화면 캡처를 grab -> 변환(변화 감지) -> 저장(sink) 스레드로 나누고
+크기가 제한된 큐로 연결합니다. 한 단계가 느려져도 grab 주기가 밀리지 않으며,
+큐가 가득 차면 설정된 backpressure 정책에 따라 처리합니다.
+"""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.models import Frame
+from shadow.capture.rate import AdaptiveRateController
+from shadow.capture.screen import ScreenCapture
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(str, Enum):
+    """큐가 가득 찼을 때의 처리 정책"""
+
+    BLOCK = "block"  # 빈 자리가 생길 때까지 생산자 대기
+    DROP_NEWEST = "drop_newest"  # 새 항목을 버림
+    DROP_OLDEST = "drop_oldest"  # 가장 오래된 항목을 버리고 새 항목 추가
+
+
+class StageQueue:
+    """크기가 제한된 단계 간 큐
+
+    close() 후에는 남은 항목을 모두 꺼낸 다음 get()이 None을 반환합니다.
+    None은 항목으로 넣을 수 없습니다.
+    """
+
+    def __init__(self, maxsize: int, policy: BackpressurePolicy | str = BackpressurePolicy.BLOCK):
+        """
+        Args:
+            maxsize: 최대 항목 수 (최소 1)
+            policy: 큐가 가득 찼을 때의 처리 정책
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+
+        self._maxsize = maxsize
+        self._policy = BackpressurePolicy(policy)
+        self._items: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.dropped = 0  # 정책에 따라 버려진 항목 수
+
+    @property
+    def policy(self) -> BackpressurePolicy:
+        """backpressure 정책"""
+        return self._policy
+
+    def put(self, item: Any) -> int:
+        """항목 추가
+
+        Args:
+            item: 추가할 항목
+
+        Returns:
+            이번 호출로 버려진 항목 수 (0 또는 1)
+        """
+        with self._cond:
+            if self._policy == BackpressurePolicy.BLOCK:
+                while len(self._items) >= self._maxsize and not self._closed:
+                    self._cond.wait()
+
+            dropped = 0
+            if self._closed:
+                dropped = 1
+            elif len(self._items) >= self._maxsize:
+                dropped = 1
+                if self._policy == BackpressurePolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self._items.append(item)
+            else:
+                self._items.append(item)
+
+            self.dropped += dropped
+            self._cond.notify_all()
+            return dropped
+
+    def get(self) -> Any | None:
+        """항목 꺼내기 (비어 있으면 대기)
+
+        Returns:
+            꺼낸 항목 (close() 후 비어 있으면 None)
+        """
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def close(self) -> None:
+        """더 이상 항목을 받지 않음 (대기 중인 스레드 깨움)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+
+class CapturePipeline:
+    """grab / 변환 / sink 스레드로 나눈 캡처 파이프라인
+
+    - grab 스레드: 캡처 세션(mss)을 소유하고 FPS 주기에 맞춰 BGRA 버퍼만 가져옴
+      (rate_controller가 있으면 매 주기 FPS를 활동량에 맞춰 조절)
+    - 변환 스레드: 변화 감지 체크섬 계산 후 Frame 생성 (링 버퍼면 슬롯에 직접 기록)
+    - sink 스레드: 완성된 Frame을 sink 콜백에 전달
+
+    stop()은 grab을 멈춘 뒤 큐에 남은 프레임을 모두 처리하고 반환합니다.
+    파이프라인은 한 번만 시작할 수 있으며, 녹화마다 새로 생성합니다.
+    """
+
+    def __init__(
+        self,
+        screen_capture: ScreenCapture,
+        sink: Callable[[Frame], None],
+        buffer: FrameRingBuffer | None = None,
+        queue_size: int = 4,
+        grab_policy: BackpressurePolicy | str = BackpressurePolicy.DROP_OLDEST,
+        sink_policy: BackpressurePolicy | str = BackpressurePolicy.BLOCK,
+        rate_controller: AdaptiveRateController | None = None,
+    ):
+        """
+        Args:
+            screen_capture: 캡처에 사용할 ScreenCapture (세션은 grab 스레드에서 시작)
+            sink: 완성된 프레임을 받을 콜백 (sink 스레드에서 호출)
+            buffer: 지정하면 변환 단계에서 링 버퍼 슬롯에 직접 기록
+            queue_size: 단계 간 큐 크기
+            grab_policy: grab -> 변환 큐가 가득 찼을 때의 정책
+            sink_policy: 변환 -> sink 큐가 가득 찼을 때의 정책
+            rate_controller: 지정하면 활동량에 따라 캡처 FPS 조절
+        """
+        self._screen_capture = screen_capture
+        self._sink = sink
+        self._buffer = buffer
+        self._grab_queue = StageQueue(queue_size, grab_policy)
+        self._sink_queue = StageQueue(queue_size, sink_policy)
+        self._rate_controller = rate_controller
+        self._stop_event = threading.Event()
+        # 캡처 대기를 깨우는 신호 (stop() 또는 적응형 FPS의 이벤트 발생 시)
+        self._wake = rate_controller.wakeup if rate_controller else threading.Event()
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def dropped(self) -> int:
+        """큐 포화로 버려진 프레임 수 (grab 큐 + sink 큐)"""
+        return self._grab_queue.dropped + self._sink_queue.dropped
+
+    @property
+    def is_running(self) -> bool:
+        """실행 중인 스레드가 있는지 여부"""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """파이프라인 시작 (캡처 세션이 열릴 때까지 대기)
+
+        Raises:
+            RuntimeError: 이미 시작된 파이프라인인 경우
+            Exception: grab 스레드에서 캡처 세션을 열지 못한 경우 해당 예외
+        """
+        if self._threads:
+            raise RuntimeError("캡처 파이프라인은 한 번만 시작할 수 있습니다.")
+
+        self._threads = [
+            threading.Thread(target=self._grab_loop, name="capture-grab", daemon=True),
+            threading.Thread(target=self._convert_loop, name="capture-convert", daemon=True),
+            threading.Thread(target=self._sink_loop, name="capture-sink", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        self._ready.wait()
+        if self._error is not None:
+            self.stop()
+            raise self._error
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """grab 중지 후 남은 프레임 처리 완료까지 대기
+
+        Args:
+            timeout: 스레드별 최대 대기 시간 (초)
+        """
+        self._stop_event.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._screen_capture.stats.queue_dropped = self.dropped
+
+    def _grab_loop(self) -> None:
+        """grab 스레드: 세션 소유, 주기적으로 BGRA 버퍼를 큐에 추가"""
+        capture = self._screen_capture
+        try:
+            with capture.session():
+                self._ready.set()
+                capture.reset_schedule()
+                while not self._stop_event.is_set():
+                    if self._rate_controller is not None:
+                        capture.set_rate(self._rate_controller.update(capture.stats))
+                    capture.wait_next(self._wake)
+                    if self._stop_event.is_set():
+                        break
+                    self._grab_queue.put(capture.grab())
+                    # 카운터는 grab 스레드에서만 갱신 (변환 스레드와 경합 방지)
+                    capture.stats.queue_dropped = self.dropped
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.exception("캡처 grab 실패, 파이프라인 중지")
+        finally:
+            self._ready.set()
+            self._grab_queue.close()
+
+    def _convert_loop(self) -> None:
+        """변환 스레드: 변화 감지 + Frame 생성"""
+        capture = self._screen_capture
+        try:
+            while (item := self._grab_queue.get()) is not None:
+                bgra, timestamp = item
+                try:
+                    if self._buffer is None:
+                        frame = capture.process_frame(bgra, timestamp)
+                    else:
+                        frame = capture.process_into(self._buffer, bgra, timestamp)
+                except Exception:
+                    logger.exception("프레임 변환 실패, 건너뜀")
+                    continue
+                if frame is not None:
+                    self._sink_queue.put(frame)
+        finally:
+            self._sink_queue.close()
+
+    def _sink_loop(self) -> None:
+        """sink 스레드: 완성된 Frame 전달"""
+        while (frame := self._sink_queue.get()) is not None:
+            try:
+                self._sink(frame)
+            except Exception:
+                logger.exception("프레임 저장 실패, 건너뜀")
@@ -1,18 +1,50 @@
 """세션 저장 모듈
 
 녹화 세션, 이벤트, 이미지를 파일로 저장합니다.
+키프레임 PNG는 BackgroundWriter 스레드 풀에서 병렬로 인코딩합니다.
 """
 
 import json
+import shutil
+import threading
+from concurrent.futures import Future
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from PIL import Image
 
-from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.event_store import EventStore
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair, WindowInfo
 from shadow.capture.recorder import RecordingSession
+from shadow.capture.writer import (
+    BackgroundWriter,
+    SaveHandle,
+    copy_written,
+    write_png,
+    write_text,
+)
+
+
+# events.json / *_event.json에 저장하는 InputEvent 필드
+EVENT_FIELDS = (
+    "timestamp",
+    "event_type",
+    "x",
+    "y",
+    "button",
+    "key",
+    "dx",
+    "dy",
+    "text",
+    "modifiers",
+    "end_timestamp",
+    "path",
+    "app_name",
+    "window_title",
+)
 
 
 class SessionStorage:
@@ -23,20 +55,30 @@ class SessionStorage:
     └── session_<timestamp>/
         ├── session.json       # 세션 메타데이터
         ├── events.json        # 모든 입력 이벤트
-        └── keyframes/
-            ├── 001_before.png
-            ├── 001_after.png
-            ├── 001_event.json
-            ├── 002_before.png
-            ...
+        ├── keyframes/
+        │   ├── 001_before.png
+        │   ├── 001_after.png
+        │   ├── 001_event.json
+        │   ├── 002_before.png
+        │   ...
+        └── deferred/          # 분석 예산 초과로 미룬 키프레임 쌍 (같은 형식)
     """
 
-    def __init__(self, base_dir: str | Path = "outputs"):
+    def __init__(
+        self,
+        base_dir: str | Path = "outputs",
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+    ):
         """
         Args:
             base_dir: 출력 기본 디렉토리
+            workers: PNG 인코딩 스레드 수 (None이면 설정 사용)
+            max_in_flight: 동시에 대기/인코딩 중인 최대 이미지 수 (None이면 설정 사용)
         """
         self._base_dir = Path(base_dir)
+        self._workers = workers
+        self._max_in_flight = max_in_flight
 
     def save_session(
         self,
@@ -44,7 +86,7 @@ class SessionStorage:
         pairs: list[KeyframePair],
         name: str | None = None,
     ) -> Path:
-        """세션과 키프레임 쌍 저장
+        """세션과 키프레임 쌍 저장 (모든 파일이 저장될 때까지 대기)
 
         Args:
             session: 녹화 세션
@@ -54,9 +96,30 @@ class SessionStorage:
         Returns:
             저장된 세션 디렉토리 경로
         """
+        return self.save_session_background(session, pairs, name).result()
+
+    def save_session_background(
+        self,
+        session: RecordingSession,
+        pairs: list[KeyframePair],
+        name: str | None = None,
+    ) -> SaveHandle:
+        """세션과 키프레임 쌍을 백그라운드에서 저장
+
+        session.json/events.json을 쓴 뒤 바로 반환하고, 키프레임 PNG는 스레드 풀에서 인코딩합니다.
+        완료 전에는 pairs의 프레임 이미지를 수정하면 안 됩니다.
+
+        Args:
+            session: 녹화 세션
+            pairs: 키프레임 쌍 목록
+            name: 세션 이름 (None이면 타임스탬프 사용)
+
+        Returns:
+            저장 완료 핸들 (handle.path는 세션 디렉토리)
+        """
         # 세션 디렉토리 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        session_name = name or f"session_{timestamp}"
+        session_name = name or self.session_name(session)
         session_dir = self._base_dir / session_name
         session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -73,56 +136,208 @@ class SessionStorage:
             "keyframe_pair_count": len(pairs),
             "duration_seconds": self._calculate_duration(session),
         }
-        (session_dir / "session.json").write_text(
-            json.dumps(session_meta, indent=2, ensure_ascii=False)
+        write_text(
+            json.dumps(session_meta, indent=2, ensure_ascii=False), session_dir / "session.json"
         )
 
         # 이벤트 저장
-        events_data = [self._event_to_dict(e) for e in session.events]
-        (session_dir / "events.json").write_text(
-            json.dumps(events_data, indent=2, ensure_ascii=False)
+        events_data = self._events_to_dicts(session.events)
+        write_text(
+            json.dumps(events_data, indent=2, ensure_ascii=False), session_dir / "events.json"
         )
 
-        # 키프레임 쌍 저장
-        for i, pair in enumerate(pairs):
-            prefix = f"{i + 1:03d}"
-            self._save_keyframe_pair(keyframes_dir, prefix, pair)
+        return self._save_keyframe_pairs(session_dir, keyframes_dir, pairs)
+
+    @staticmethod
+    def session_name(session: RecordingSession) -> str:
+        """녹화 시작 시각 기반 기본 세션 이름 (같은 녹화는 같은 디렉토리에 저장)"""
+        started = datetime.fromtimestamp(session.start_time) if session.start_time else None
+        return f"session_{(started or datetime.now()).strftime('%Y%m%d_%H%M%S')}"
+
+    def save_deferred(self, pairs: list[KeyframePair], name: str) -> Path:
+        """분석 예산 초과로 미룬 키프레임 쌍 저장 (모든 파일이 저장될 때까지 대기)
+
+        Args:
+            pairs: 미룬 키프레임 쌍 목록
+            name: 세션 이름 (녹화 세션과 같은 디렉토리에 저장)
+
+        Returns:
+            저장된 세션 디렉토리 경로 (load_deferred()에 전달)
+        """
+        return self.save_deferred_background(pairs, name).result()
 
-        return session_dir
+    def save_deferred_background(self, pairs: list[KeyframePair], name: str) -> SaveHandle:
+        """분석 예산 초과로 미룬 키프레임 쌍을 백그라운드에서 저장
+
+        Args:
+            pairs: 미룬 키프레임 쌍 목록
+            name: 세션 이름 (녹화 세션과 같은 디렉토리에 저장)
+
+        Returns:
+            저장 완료 핸들 (handle.path는 세션 디렉토리, load_deferred()에 전달)
+        """
+        session_dir = self._base_dir / name
+        deferred_dir = session_dir / "deferred"
+        if deferred_dir.exists():
+            # 이전에 미룬 쌍을 새 목록으로 교체
+            shutil.rmtree(deferred_dir)
+        deferred_dir.mkdir(parents=True)
+        return self._save_keyframe_pairs(session_dir, deferred_dir, pairs)
+
+    def load_deferred(self, session_dir: str | Path) -> list[KeyframePair]:
+        """save_deferred()로 저장한 키프레임 쌍 로드
+
+        Args:
+            session_dir: 세션 디렉토리 경로
+
+        Returns:
+            KeyframePair 목록 (이미지는 PNG에서 읽은 RGB 배열)
+        """
+        pairs = []
+        for before_path, after_path, event_data in self.load_keyframe_pairs(
+            session_dir, "deferred"
+        ):
+            roi = event_data.get("roi")
+            click_pos = event_data.get("click_pos")
+            pairs.append(
+                KeyframePair(
+                    before_frame=self._load_frame(before_path, event_data["before_timestamp"]),
+                    after_frame=self._load_frame(after_path, event_data["after_timestamp"]),
+                    trigger_event=self.event_from_dict(event_data),
+                    monitor=event_data.get("monitor"),
+                    click_pos=tuple(click_pos) if click_pos else None,
+                    roi=tuple(roi) if roi else None,
+                    after_latency=event_data.get("after_latency"),
+                    multiplicity=event_data.get("multiplicity", 1),
+                )
+            )
+        return pairs
+
+    def _save_keyframe_pairs(
+        self, session_dir: Path, directory: Path, pairs: list[KeyframePair]
+    ) -> SaveHandle:
+        """키프레임 쌍 목록을 백그라운드에서 저장 (같은 이미지 버퍼는 한 번만 인코딩)
+
+        in-flight 한도에서 블로킹되는 작업 제출도 별도 스레드에서 수행하여 호출자는 바로 반환합니다.
+        """
+        writer = BackgroundWriter(self._workers, self._max_in_flight)
+
+        def submit_all() -> None:
+            try:
+                encoded: dict[int, Future[Path]] = {}
+                for i, pair in enumerate(pairs):
+                    prefix = f"{i + 1:03d}"
+                    self._save_keyframe_pair(directory, prefix, pair, writer, encoded)
+            except BaseException as e:
+                writer.fail(e)
+            finally:
+                writer.close()
+
+        threading.Thread(target=submit_all, name="storage-submit").start()
+        return SaveHandle(session_dir, writer.completion)
+
+    @staticmethod
+    def _load_frame(path: Path, timestamp: float) -> Frame:
+        """PNG 이미지를 프레임으로 로드"""
+        with Image.open(path) as image:
+            return Frame(timestamp=timestamp, image=np.asarray(image.convert("RGB")))
 
     def _save_keyframe_pair(
-        self, directory: Path, prefix: str, pair: KeyframePair
+        self,
+        directory: Path,
+        prefix: str,
+        pair: KeyframePair,
+        writer: BackgroundWriter,
+        encoded: dict[int, Future[Path]],
     ) -> None:
-        """키프레임 쌍 저장"""
+        """키프레임 쌍 저장 (이미지는 writer에 제출)"""
         # Before 이미지
         before_path = directory / f"{prefix}_before.png"
-        Image.fromarray(pair.before_frame.image).save(before_path)
+        self._save_frame_image(pair.before_frame, before_path, writer, encoded)
 
         # After 이미지
         after_path = directory / f"{prefix}_after.png"
-        Image.fromarray(pair.after_frame.image).save(after_path)
+        self._save_frame_image(pair.after_frame, after_path, writer, encoded)
 
         # 이벤트 정보
         event_data = self._event_to_dict(pair.trigger_event)
         event_data["before_timestamp"] = pair.before_frame.timestamp
         event_data["after_timestamp"] = pair.after_frame.timestamp
+        if pair.monitor is not None:
+            event_data["monitor"] = pair.monitor
+        if pair.after_latency is not None:
+            event_data["after_latency"] = pair.after_latency
+        if pair.multiplicity > 1:
+            event_data["multiplicity"] = pair.multiplicity
+        if pair.diff is not None:
+            event_data["change_boxes"] = [list(box) for box in pair.diff.boxes]
+        if pair.roi is not None:
+            event_data["click_pos"] = list(pair.click_pos)
+            event_data["roi"] = list(pair.roi)
         event_path = directory / f"{prefix}_event.json"
-        event_path.write_text(json.dumps(event_data, indent=2, ensure_ascii=False))
+        write_text(json.dumps(event_data, indent=2, ensure_ascii=False), event_path)
+
+    @staticmethod
+    def _save_frame_image(
+        frame: Frame, path: Path, writer: BackgroundWriter, encoded: dict[int, Future[Path]]
+    ) -> None:
+        """프레임 이미지 PNG 저장 제출
+
+        변화 감지로 이미지 버퍼를 공유하는 프레임은 PNG를 다시 인코딩하지 않고
+        먼저 제출한 파일의 저장이 끝나면 복사합니다.
+        """
+        key = frame.image.__array_interface__["data"][0]
+        existing = encoded.get(key)
+        if existing is not None:
+            writer.submit(copy_written, existing, path)
+            return
+        encoded[key] = writer.submit(write_png, frame.image, path)
+
+    @staticmethod
+    def event_from_dict(data: dict[str, Any]) -> InputEvent:
+        """events.json / *_event.json 항목을 InputEvent로 변환"""
+        window_info = None
+        if data.get("app_name") is not None or data.get("window_title") is not None:
+            window_info = WindowInfo(
+                app_name=data.get("app_name") or "Unknown",
+                window_title=data.get("window_title") or "Unknown",
+            )
+        return InputEvent(
+            timestamp=data["timestamp"],
+            event_type=InputEventType(data["event_type"]),
+            x=data.get("x"),
+            y=data.get("y"),
+            button=data.get("button"),
+            key=data.get("key"),
+            dx=data.get("dx"),
+            dy=data.get("dy"),
+            text=data.get("text"),
+            modifiers=data.get("modifiers") or [],
+            end_timestamp=data.get("end_timestamp"),
+            path=[tuple(point) for point in data.get("path") or []],
+            app_name=data.get("app_name"),
+            window_title=data.get("window_title"),
+            window_info=window_info,
+        )
 
     def _event_to_dict(self, event: InputEvent) -> dict[str, Any]:
         """InputEvent를 딕셔너리로 변환"""
-        return {
-            "timestamp": event.timestamp,
-            "event_type": event.event_type.value,
-            "x": event.x,
-            "y": event.y,
-            "button": event.button,
-            "key": event.key,
-            "dx": event.dx,
-            "dy": event.dy,
-            "app_name": event.app_name,
-            "window_title": event.window_title,
-        }
+        data = {name: getattr(event, name) for name in EVENT_FIELDS}
+        data["event_type"] = event.event_type.value
+        return data
+
+    def _events_to_dicts(self, events: list[InputEvent] | EventStore) -> list[dict[str, Any]]:
+        """이벤트 목록을 딕셔너리 목록으로 변환
+
+        EventStore는 InputEvent 객체를 만들지 않고 열 단위로 변환합니다.
+        """
+        if isinstance(events, EventStore):
+            columns = events.to_columns()
+            return [
+                dict(zip(EVENT_FIELDS, values))
+                for values in zip(*(columns[name] for name in EVENT_FIELDS))
+            ]
+        return [self._event_to_dict(e) for e in events]
 
     def _calculate_duration(self, session: RecordingSession) -> float:
         """세션 지속 시간 계산"""
@@ -145,17 +360,18 @@ class SessionStorage:
         return json.loads(events_path.read_text())
 
     def load_keyframe_pairs(
-        self, session_dir: str | Path
+        self, session_dir: str | Path, subdir: str = "keyframes"
     ) -> list[tuple[Path, Path, dict[str, Any]]]:
         """키프레임 쌍 경로 및 이벤트 로드
 
         Args:
             session_dir: 세션 디렉토리 경로
+            subdir: 키프레임 디렉토리 이름 ("keyframes", 미룬 쌍은 "deferred")
 
         Returns:
             (before_path, after_path, event_data) 튜플 목록
         """
-        keyframes_dir = Path(session_dir) / "keyframes"
+        keyframes_dir = Path(session_dir) / subdir
         if not keyframes_dir.exists():
             return []
 
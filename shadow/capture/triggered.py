@@ -0,0 +1,129 @@
+"""이벤트 트리거 기반 프레임 선별 모듈
+
+KeyframeExtractor가 필요로 하는 것은 트리거 직전 프레임과 직후 프레임뿐이므로,
+작은 pre-roll 링만 유지하다가 트리거 이벤트 주변 프레임만 보존합니다.
+트리거 타입은 키프레임 추출과 같은 keyframe_triggers 설정을 따릅니다.
+"""
+
+import math
+from collections import deque
+from collections.abc import Callable
+
+from shadow.capture.models import Frame, InputEvent, InputEventType
+from shadow.config import settings
+
+
+def parse_trigger_events(spec: str) -> set[InputEventType]:
+    """keyframe_triggers 설정 해석 ("mouse_click, drag" -> 이벤트 타입 집합)
+
+    Raises:
+        ValueError: 알 수 없는 이벤트 타입 이름인 경우
+    """
+    return {InputEventType(part.strip().lower()) for part in spec.split(",") if part.strip()}
+
+
+class TriggeredFrameSelector:
+    """트리거 이벤트 주변 프레임 선별기
+
+    - pre-roll: 트리거 직전 pre_roll초 구간 프레임 (+ 그 이전 마지막 프레임 1장)
+    - post-roll: 트리거 후 post_roll초 동안의 모든 프레임
+    - TEXT_ENTRY는 입력이 멈춘 뒤 묶음 시작 시각으로 늦게 도착하므로,
+      타이핑 중(typing_since가 시각을 반환)에는 묶음 시작 - pre_roll 이후 프레임을 계속 보존
+
+    on_event()는 InputEventCollector 콜백(리스너 스레드)에서,
+    select()는 캡처 루프에서 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        trigger_events: set[InputEventType] | None = None,
+        pre_roll: float = 0.5,
+        post_roll: float = 1.0,
+        fps: float = 10,
+        typing_since: Callable[[], float | None] | None = None,
+    ):
+        """
+        Args:
+            trigger_events: 프레임 보존을 트리거하는 이벤트 타입 (None이면 keyframe_triggers 설정)
+            pre_roll: 트리거 이전 보존 시간 (초, TEXT_ENTRY가 트리거이면
+                input_text_gap + keyframe_typing_gap 이상)
+            post_roll: 트리거 이후 보존 시간 (초)
+            fps: 캡처 FPS (pre-roll 링 크기 계산용)
+            typing_since: 진행 중인 타이핑 묶음의 시작 시각 조회 함수
+        """
+        self._trigger_events = trigger_events or parse_trigger_events(settings.keyframe_triggers)
+        if InputEventType.TEXT_ENTRY in self._trigger_events:
+            # 늦게 도착하는 TEXT_ENTRY의 시작 시각까지 링에 남도록 확장
+            pre_roll = max(pre_roll, settings.input_text_gap + settings.keyframe_typing_gap)
+        self._typing_since = typing_since
+        self._pre_roll_seconds = pre_roll
+        self._post_roll_seconds = post_roll
+        self._pre_roll: deque[Frame] = deque(maxlen=math.ceil(pre_roll * fps) + 2)
+        # (시작, 종료) 시각, deque의 append/popleft는 스레드 안전
+        self._pending: deque[tuple[float, float]] = deque()
+        self._persist_until = -math.inf
+        self.kept = 0  # 보존된 프레임 수
+        self.discarded = 0  # 버려진 프레임 수
+
+    def reset(self) -> None:
+        """새 녹화를 위해 상태 초기화"""
+        self._pre_roll.clear()
+        self._pending.clear()
+        self._persist_until = -math.inf
+        self.kept = 0
+        self.discarded = 0
+
+    def on_event(self, event: InputEvent) -> None:
+        """입력 이벤트 콜백 (트리거 이벤트만 기록, 지속 이벤트는 종료 시각까지)"""
+        if event.event_type in self._trigger_events:
+            self._pending.append((event.timestamp, event.end_timestamp or event.timestamp))
+
+    def select(self, frame: Frame) -> list[Frame]:
+        """새 프레임에 대해 보존할 프레임 목록 반환
+
+        Args:
+            frame: 방금 캡처된 프레임
+
+        Returns:
+            보존할 프레임 목록 (시간순, 없으면 빈 리스트)
+        """
+        earliest = None
+        typing_start = self._typing_since() if self._typing_since else None
+        if typing_start is not None and InputEventType.TEXT_ENTRY in self._trigger_events:
+            # 타이핑 중: 아직 도착하지 않은 TEXT_ENTRY의 Before/After 후보 보존
+            earliest = typing_start
+            self._persist_until = max(self._persist_until, frame.timestamp)
+        while self._pending:
+            timestamp, end_timestamp = self._pending.popleft()
+            earliest = timestamp if earliest is None else min(earliest, timestamp)
+            self._persist_until = max(
+                self._persist_until, end_timestamp + self._post_roll_seconds
+            )
+
+        selected: list[Frame] = []
+        if earliest is not None:
+            selected = self._flush_pre_roll(earliest - self._pre_roll_seconds)
+
+        if frame.timestamp <= self._persist_until:
+            selected.append(frame)
+        else:
+            if len(self._pre_roll) == self._pre_roll.maxlen:
+                self.discarded += 1
+            self._pre_roll.append(frame)
+
+        self.kept += len(selected)
+        return selected
+
+    def _flush_pre_roll(self, cutoff: float) -> list[Frame]:
+        """pre-roll 링에서 cutoff 이후 프레임과 그 직전 프레임 1장 방출"""
+        frames = list(self._pre_roll)
+        self._pre_roll.clear()
+
+        recent = [f for f in frames if f.timestamp >= cutoff]
+        older = [f for f in frames if f.timestamp < cutoff]
+        self.discarded += max(0, len(older) - 1)
+
+        # 프레임 간격이 pre-roll보다 길어도 Before 프레임이 남도록 직전 1장 포함
+        if older:
+            recent.insert(0, older[-1])
+        return recent
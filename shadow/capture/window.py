@@ -6,8 +6,14 @@ F-03: 현재 활성화된 윈도우의 앱 이름과 윈도우 타이틀을 수
 import logging
 import os
 import sys
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
-from shadow.capture.models import WindowInfo
+from shadow.capture.models import MonitorGeometry, WindowInfo
+from shadow.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +27,7 @@ except ImportError:
 try:
     from Quartz import (
         CGDisplayBounds,
-        CGMainDisplayID,
+        CGGetActiveDisplayList,
         CGWindowListCopyWindowInfo,
         kCGNullWindowID,
         kCGWindowListExcludeDesktopElements,
@@ -32,13 +38,131 @@ try:
 except ImportError:
     HAS_QUARTZ = False
 
+MAX_DISPLAYS = 16  # CGGetActiveDisplayList로 조회할 최대 디스플레이 수
+
+
+def flip_quartz_y(x: float, y: float, displays: list[MonitorGeometry]) -> float | None:
+    """좌하단 기준(Cocoa) y를 Quartz 전역 좌표(좌상단 기준) y로 변환
+
+    Cocoa 전역 좌표의 원점은 주 디스플레이(Quartz 좌표 (0, 0)에 있는 디스플레이)의 좌하단이므로
+    주 디스플레이 높이를 기준으로 반전합니다. 반전한 점이 어느 디스플레이에도 없으면
+    (다른 모니터 위 클릭을 잘못 반전한 경우) None을 반환합니다.
+
+    Args:
+        x, y: 좌하단 기준 좌표
+        displays: 활성 디스플레이 영역 (Quartz 전역 좌표)
+
+    Returns:
+        Quartz 좌표 y (디스플레이 합집합 밖이면 None)
+    """
+    if not displays:
+        return None
+    primary = next(
+        (display for display in displays if display.left == 0 and display.top == 0),
+        displays[0],
+    )
+    cg_y = primary.top + primary.height - y
+    if not any(display.contains(x, cg_y) for display in displays):
+        return None
+    return cg_y
+
+
+class WindowSpatialIndex:
+    """윈도우 bounds 공간 인덱스 (x 구간 분할)
+
+    모든 윈도우의 좌/우 경계로 x축을 구간(slab)으로 나누고,
+    구간마다 그 구간 전체를 덮는 윈도우를 z-order(앞쪽 먼저) 순으로 보관합니다.
+    좌표 조회는 구간 이진 탐색 후 해당 구간의 윈도우만 y 범위를 확인합니다.
+    경계는 기존 선형 탐색과 같이 양 끝을 포함합니다.
+    """
+
+    def __init__(self, windows: list[tuple[dict, dict]]):
+        """
+        Args:
+            windows: (window dict, kCGWindowBounds dict) 목록 (앞쪽 윈도우 먼저)
+        """
+        self._windows = [window for window, _ in windows]
+        self._rects = [
+            (
+                int(bounds.get("X", 0)),
+                int(bounds.get("Y", 0)),
+                int(bounds.get("X", 0)) + int(bounds.get("Width", 0)),
+                int(bounds.get("Y", 0)) + int(bounds.get("Height", 0)),
+            )
+            for _, bounds in windows
+        ]
+
+        edges = sorted({x for x0, _, x1, _ in self._rects for x in (x0, x1)})
+        self._edges = edges
+        # slab i = [edges[i], edges[i + 1]) 을 덮는 윈도우 번호 (z-order 순)
+        self._slabs: list[list[int]] = [[] for _ in range(max(0, len(edges) - 1))]
+        for order, (x0, _, x1, _) in enumerate(self._rects):
+            start = bisect_right(edges, x0) - 1
+            end = bisect_right(edges, x1) - 1
+            for slab in range(start, end):
+                self._slabs[slab].append(order)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def find(self, x: int, y: int) -> dict | None:
+        """좌표를 포함하는 가장 앞쪽 윈도우
+
+        Args:
+            x: x 좌표
+            y: y 좌표
+
+        Returns:
+            window dict (없으면 None)
+        """
+        slab = bisect_right(self._edges, x) - 1
+        if slab < 0:
+            return None
+
+        # 오른쪽 경계 위의 점은 왼쪽 slab의 윈도우에도 포함됨
+        candidates = [slab]
+        if self._edges[slab] == x and slab > 0:
+            candidates.append(slab - 1)
+
+        best: int | None = None
+        for index in candidates:
+            if index >= len(self._slabs):
+                continue
+            for order in self._slabs[index]:
+                if best is not None and order >= best:
+                    break
+                x0, y0, x1, y1 = self._rects[order]
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    best = order
+                    break
+
+        return None if best is None else self._windows[best]
+
+
+@dataclass
+class WindowSnapshot:
+    """윈도우 목록 스냅샷 (TTL 캐시 단위)"""
+
+    created_at: float  # 생성 시각 (monotonic)
+    frontmost_pid: int | None  # 생성 시점의 활성 앱 PID
+    displays: list[MonitorGeometry]  # 활성 디스플레이 영역 (Quartz y 반전용)
+    windows: list[dict] = field(default_factory=list)  # 사용 가능한 윈도우 (z-order 순)
+    index: WindowSpatialIndex = field(default_factory=lambda: WindowSpatialIndex([]))
+
 
 class WindowInfoCollector:
-    """macOS 활성 윈도우 정보 수집기"""
+    """macOS 활성 윈도우 정보 수집기
+
+    클릭/키 입력마다 윈도우 목록을 복사하지 않도록 스냅샷을 캐시합니다.
+    스냅샷은 TTL이 지나거나 활성 앱이 바뀌면 다시 만듭니다.
+    """
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float | None = None):
         """초기화 - AppKit 사용 가능 여부 확인
 
+        Args:
+            cache_ttl: 윈도우 목록 스냅샷 유지 시간 (초, None이면 설정 사용, 0이면 캐시 안 함)
+
         Raises:
             RuntimeError: PyObjC가 설치되지 않은 경우
         """
@@ -49,6 +173,10 @@ class WindowInfoCollector:
             )
 
         self._workspace = NSWorkspace.sharedWorkspace()
+        self._cache_ttl = settings.window_cache_ttl if cache_ttl is None else cache_ttl
+        self._snapshot: WindowSnapshot | None = None
+        self._snapshot_lock = threading.Lock()
+        self._bundle_ids: dict[int, str | None] = {}
 
     def get_active_window(self) -> WindowInfo:
         """현재 활성 윈도우 정보 반환
@@ -89,7 +217,7 @@ class WindowInfoCollector:
         """지정 좌표에 위치한 윈도우 정보 반환
 
         마우스 클릭 좌표 기준으로 실제 대상 앱/타이틀을 찾기 위해 사용.
-        (PRD는 다중 모니터를 비목표로 두므로 메인 디스플레이 기준으로 변환)
+        좌표가 좌하단 기준일 가능성도 고려해 주 디스플레이 기준으로 반전한 위치도 찾습니다.
         """
         if not HAS_QUARTZ:
             return self.get_active_window()
@@ -99,41 +227,16 @@ class WindowInfoCollector:
             frontmost_pid = (
                 frontmost_app.processIdentifier() if frontmost_app else None
             )
-            window_list = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
-                kCGNullWindowID,
-            )
+            snapshot = self._get_snapshot(frontmost_pid)
 
-            if not window_list:
+            if snapshot is None or not snapshot.windows:
                 return self.get_active_window()
 
-            usable_windows = []
-            for window in window_list:
-                if not self._is_usable_window(window):
-                    continue
-                bounds = window.get("kCGWindowBounds", {})
-                if not bounds:
-                    continue
-                usable_windows.append((window, bounds))
-
-            # Quartz 좌표계는 좌하단 기준이므로 y를 반전 (단일 모니터 가정)
-            display_bounds = CGDisplayBounds(CGMainDisplayID())
-            display_height = int(display_bounds.size.height)
-            cg_y = display_height - y
-
-            def find_window_at_point(px: int, py: int) -> dict | None:
-                for window, bounds in usable_windows:
-                    wx = int(bounds.get("X", 0))
-                    wy = int(bounds.get("Y", 0))
-                    ww = int(bounds.get("Width", 0))
-                    wh = int(bounds.get("Height", 0))
-
-                    if wx <= px <= wx + ww and wy <= py <= wy + wh:
-                        return window
-                return None
+            # 좌하단 기준 좌표일 수 있으므로 y를 반전한 위치도 확인 (디스플레이 밖이면 제외)
+            cg_y = flip_quartz_y(x, y, snapshot.displays)
 
-            direct_match = find_window_at_point(x, y)
-            inverted_match = find_window_at_point(x, cg_y)
+            direct_match = snapshot.index.find(x, y)
+            inverted_match = None if cg_y is None else snapshot.index.find(x, int(cg_y))
 
             selected = None
             if direct_match and inverted_match and frontmost_pid is not None:
@@ -155,6 +258,115 @@ class WindowInfoCollector:
         except Exception:
             return self.get_active_window()
 
+    def get_window_bounds(
+        self, predicate: Callable[[WindowInfo], bool]
+    ) -> list[tuple[int, int, int, int]]:
+        """조건에 맞는 윈도우의 화면 영역 (녹화 제외 앱 마스킹용)
+
+        Args:
+            predicate: WindowInfo를 받아 포함 여부를 반환하는 함수
+
+        Returns:
+            (left, top, right, bottom) 목록 (가상 데스크톱 좌표, z-order 순)
+        """
+        if not HAS_QUARTZ:
+            return []
+
+        frontmost_app = self._workspace.frontmostApplication()
+        frontmost_pid = frontmost_app.processIdentifier() if frontmost_app else None
+        snapshot = self._get_snapshot(frontmost_pid)
+        if snapshot is None:
+            return []
+
+        rects = []
+        for window in snapshot.windows:
+            bounds = window.get("kCGWindowBounds")
+            if not bounds or not predicate(self._window_info_from_window_dict(window)):
+                continue
+            left, top = int(bounds.get("X", 0)), int(bounds.get("Y", 0))
+            rects.append(
+                (left, top, left + int(bounds.get("Width", 0)), top + int(bounds.get("Height", 0)))
+            )
+        return rects
+
+    def invalidate(self) -> None:
+        """윈도우 목록 스냅샷 캐시 무효화"""
+        self._snapshot = None
+
+    def _get_snapshot(self, frontmost_pid: int | None) -> WindowSnapshot | None:
+        """캐시된 윈도우 목록 스냅샷 (TTL 만료 또는 활성 앱 변경 시 갱신)
+
+        Args:
+            frontmost_pid: 현재 활성 앱 PID
+
+        Returns:
+            스냅샷 (윈도우 목록을 가져올 수 없으면 None)
+        """
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot, frontmost_pid, now):
+            return snapshot
+
+        with self._snapshot_lock:
+            # 다른 리스너 스레드가 방금 갱신했으면 재사용
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot, frontmost_pid, now):
+                return snapshot
+
+            window_list = CGWindowListCopyWindowInfo(
+                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+                kCGNullWindowID,
+            )
+            if not window_list:
+                return None
+
+            windows = [window for window in window_list if self._is_usable_window(window)]
+            bounded = [
+                (window, window.get("kCGWindowBounds"))
+                for window in windows
+                if window.get("kCGWindowBounds")
+            ]
+            snapshot = WindowSnapshot(
+                created_at=now,
+                frontmost_pid=frontmost_pid,
+                displays=self._get_displays(),
+                windows=windows,
+                index=WindowSpatialIndex(bounded),
+            )
+            if self._cache_ttl > 0:
+                self._snapshot = snapshot
+            return snapshot
+
+    @staticmethod
+    def _get_displays() -> list[MonitorGeometry]:
+        """활성 디스플레이 영역 목록 (Quartz 전역 좌표, 조회 실패 시 빈 목록)"""
+        error, display_ids, _ = CGGetActiveDisplayList(MAX_DISPLAYS, None, None)
+        if error:
+            return []
+        displays = []
+        for index, display_id in enumerate(display_ids, start=1):
+            bounds = CGDisplayBounds(display_id)
+            displays.append(
+                MonitorGeometry(
+                    index=index,
+                    left=int(bounds.origin.x),
+                    top=int(bounds.origin.y),
+                    width=int(bounds.size.width),
+                    height=int(bounds.size.height),
+                )
+            )
+        return displays
+
+    def _is_fresh(
+        self, snapshot: WindowSnapshot | None, frontmost_pid: int | None, now: float
+    ) -> bool:
+        """스냅샷을 재사용할 수 있는지 확인"""
+        return (
+            snapshot is not None
+            and snapshot.frontmost_pid == frontmost_pid
+            and now - snapshot.created_at < self._cache_ttl
+        )
+
     def _get_active_window_via_quartz(self) -> WindowInfo | None:
         """Quartz API로 활성 윈도우 정보 가져오기 (스레드 안전)
 
@@ -189,17 +401,13 @@ class WindowInfoCollector:
             return "Unknown"
 
         try:
-            window_list = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
-                kCGNullWindowID,
-            )
+            # 활성 앱의 타이틀 조회이므로 process_id를 활성 PID로 스냅샷 확인
+            snapshot = self._get_snapshot(process_id)
 
-            if window_list:
-                for window in window_list:
+            if snapshot:
+                for window in snapshot.windows:
                     if window.get("kCGWindowOwnerPID") != process_id:
                         continue
-                    if not self._is_usable_window(window):
-                        continue
                     title = window.get("kCGWindowName", "")
                     if title:
                         return title
@@ -216,14 +424,19 @@ class WindowInfoCollector:
         bundle_id = None
 
         if process_id is not None:
-            try:
-                running_app = NSRunningApplication.runningApplicationWithProcessIdentifier(
-                    process_id
-                )
-                if running_app:
-                    bundle_id = running_app.bundleIdentifier()
-            except Exception:
-                bundle_id = None
+            if process_id in self._bundle_ids:
+                bundle_id = self._bundle_ids[process_id]
+            else:
+                try:
+                    running_app = NSRunningApplication.runningApplicationWithProcessIdentifier(
+                        process_id
+                    )
+                    if running_app:
+                        bundle_id = running_app.bundleIdentifier()
+                except Exception:
+                    bundle_id = None
+                # PID별 bundle_id는 프로세스가 살아 있는 동안 바뀌지 않음
+                self._bundle_ids[process_id] = bundle_id
 
         return WindowInfo(
             app_name=app_name,
@@ -0,0 +1,185 @@
+"""백그라운드 파일 저장 모듈
+
+긴 녹화의 키프레임 PNG를 호출 스레드에서 하나씩 인코딩하면 저장이 수십 초 걸립니다.
+PIL의 PNG 인코딩(zlib)은 GIL을 놓으므로 스레드 풀에서 병렬로 인코딩합니다
+(프로세스 풀은 큰 이미지 배열을 매번 pickle로 넘겨야 하므로 쓰지 않음).
+
+- 동시에 대기/인코딩 중인 작업 수를 max_in_flight로 제한하여 메모리 사용량을 묶어 둡니다.
+- 모든 파일은 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace()로 바꿔,
+  중간에 중단되어도 반쯤 쓰인 PNG가 최종 경로에 남지 않습니다.
+- 완료는 SaveHandle로 기다립니다 (result() 또는 await).
+"""
+
+import asyncio
+import os
+import shutil
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from numpy.typing import NDArray
+from PIL import Image
+
+from shadow.config import settings
+
+
+def atomic_write(path: Path, write: Callable[[Path], None]) -> Path:
+    """임시 파일에 쓴 뒤 최종 경로로 원자적으로 교체
+
+    Args:
+        path: 최종 파일 경로
+        write: 전달받은 임시 경로에 내용을 쓰는 함수
+
+    Returns:
+        최종 파일 경로
+    """
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def write_png(image: NDArray, path: Path) -> Path:
+    """이미지 배열을 PNG로 원자적 저장"""
+    return atomic_write(path, lambda temp: Image.fromarray(image).save(temp, format="PNG"))
+
+
+def write_text(text: str, path: Path) -> Path:
+    """텍스트 파일 원자적 저장"""
+    return atomic_write(path, lambda temp: temp.write_text(text, encoding="utf-8"))
+
+
+def copy_written(source: "Future[Path]", path: Path) -> Path:
+    """source 파일 저장이 끝난 뒤 path로 원자적 복사"""
+    return atomic_write(path, lambda temp: shutil.copyfile(source.result(), temp))
+
+
+class SaveHandle:
+    """백그라운드 저장 완료 핸들
+
+    result()로 블로킹 대기하거나 asyncio 코드에서 await할 수 있습니다.
+    저장 중 발생한 첫 예외는 result()/await에서 다시 발생합니다.
+    """
+
+    def __init__(self, path: Path, future: "Future[None]"):
+        self._path = path
+        self._future = future
+
+    @property
+    def path(self) -> Path:
+        """저장 대상 디렉토리 (완료 전에도 접근 가능)"""
+        return self._path
+
+    def done(self) -> bool:
+        """모든 파일 저장이 끝났는지 (실패 포함)"""
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> Path:
+        """저장 완료까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            저장된 디렉토리 경로
+
+        Raises:
+            TimeoutError: timeout 안에 끝나지 않은 경우
+        """
+        self._future.result(timeout)
+        return self._path
+
+    def __await__(self) -> Generator[Any, None, Path]:
+        yield from asyncio.wrap_future(self._future).__await__()
+        return self._path
+
+
+class BackgroundWriter:
+    """스레드 풀 파일 저장기
+
+    submit()은 진행 중인 작업이 max_in_flight개이면 하나가 끝날 때까지 블로킹합니다.
+    close() 후 모든 작업이 끝나면 스레드 풀을 정리하고 completion Future를 채웁니다.
+    """
+
+    def __init__(self, workers: int | None = None, max_in_flight: int | None = None):
+        """
+        Args:
+            workers: 인코딩 스레드 수 (None이면 설정 사용, 0이면 CPU 코어 수)
+            max_in_flight: 동시에 대기/실행 중인 최대 작업 수
+            (None이면 설정 사용, 0이면 스레드 수의 2배)
+        """
+        workers = workers if workers is not None else settings.storage_workers
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = (
+            max_in_flight if max_in_flight is not None else settings.storage_max_in_flight
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="storage-writer"
+        )
+        self._slots = threading.BoundedSemaphore(max_in_flight or workers * 2)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._done: Future[None] = Future()
+
+    @property
+    def completion(self) -> "Future[None]":
+        """close() 후 모든 작업이 끝나면 완료되는 Future"""
+        return self._done
+
+    def submit(self, fn: Callable[..., Path], *args: Any) -> "Future[Path]":
+        """작업 제출 (in-flight 한도에 도달하면 블로킹)
+
+        copy_written처럼 다른 작업의 Future를 기다리는 작업은 그 작업보다 나중에 제출해야 합니다
+        (스레드 풀 큐는 FIFO이므로 먼저 제출한 작업이 먼저 실행됨).
+        """
+        self._slots.acquire()
+        with self._lock:
+            if self._closed:
+                self._slots.release()
+                raise RuntimeError("이미 닫힌 BackgroundWriter입니다")
+            self._pending += 1
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def fail(self, error: BaseException) -> None:
+        """작업 제출 중 발생한 예외 기록 (완료 Future에 전달)"""
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    def close(self) -> None:
+        """더 이상 작업을 받지 않음 (남은 작업이 끝나면 completion 완료)"""
+        with self._lock:
+            self._closed = True
+            finished = self._pending == 0
+        if finished:
+            self._finish()
+
+    def _on_done(self, future: "Future[Path]") -> None:
+        """작업 완료 콜백 (워커 스레드에서 실행)"""
+        self._slots.release()
+        error = future.exception()
+        with self._lock:
+            self._pending -= 1
+            if error is not None and self._error is None:
+                self._error = error
+            finished = self._closed and self._pending == 0
+        if finished:
+            self._finish()
+
+    def _finish(self) -> None:
+        """스레드 풀 정리 및 완료 Future 채우기"""
+        self._executor.shutdown(wait=False)
+        if self._error is not None:
+            self._done.set_exception(self._error)
+        else:
+            self._done.set_result(None)
@@ -4,6 +4,7 @@
     shadow start [--min MINUTES | --sec SECONDS | --duration SECONDS]   녹화 시작
     shadow stop                                                          녹화 중지
     shadow analyze [SESSION_DIR]                                         세션 분석
+    shadow analyze SESSION_DIR --deferred [--batch-size N]               예산 초과로 미룬 쌍 분석
     shadow test-slack                                                    Slack 연동 테스트
     shadow mock-e2e                                                      모킹 E2E 테스트
 """
@@ -18,8 +19,11 @@ from pathlib import Path
 
 def cmd_start(args):
     """녹화 시작"""
+    from shadow.api.repositories.users import load_excluded_apps
     from shadow.capture.recorder import Recorder
     from shadow.capture.storage import SessionStorage
+    from shadow.config import settings
+    from shadow.preprocessing.dedup import KeyframeDeduplicator
     from shadow.preprocessing.keyframe import KeyframeExtractor
 
     # 우선순위: --sec > --min > --duration
@@ -33,7 +37,7 @@ def cmd_start(args):
     print(f"녹화 시작 ({duration}초)...")
     print("녹화 중... Ctrl+C로 중지")
 
-    recorder = Recorder()
+    recorder = Recorder(excluded_apps=load_excluded_apps())
     try:
         recorder.start()
         time.sleep(duration)
@@ -49,10 +53,16 @@ def cmd_start(args):
     extractor = KeyframeExtractor()
     pairs = extractor.extract_pairs(session)
     print(f"키프레임 쌍: {len(pairs)}개")
+    if settings.keyframe_dedup:
+        pairs, dropped = KeyframeDeduplicator().split(pairs)
+        extractor.release_pairs(session, dropped)  # 합쳐진 쌍의 링 버퍼 슬롯 해제
+        print(f"중복 제거 후: {len(pairs)}개")
 
-    # 저장
+    # 저장 (키프레임 PNG는 스레드 풀에서 병렬 인코딩)
     storage = SessionStorage()
-    session_dir = storage.save_session(session, pairs)
+    handle = storage.save_session_background(session, pairs)
+    print(f"키프레임 이미지 저장 중: {handle.path}")
+    session_dir = handle.result()
     print(f"저장 완료: {session_dir}")
 
     return session_dir
@@ -70,11 +80,43 @@ def cmd_analyze(args):
         print("세션 디렉토리를 지정하세요.")
         return
 
+    if args.deferred:
+        cmd_analyze_deferred(session_dir, args.batch_size)
+        return
+
     print(f"분석 중: {session_dir}")
     # TODO: 실제 분석 구현
     print("분석 기능은 아직 구현 중입니다.")
 
 
+def cmd_analyze_deferred(session_dir: str, batch_size: int):
+    """분석 예산 초과로 미룬 키프레임 쌍 분석 (낮은 우선순위 실행, 큰 배치로 호출 수 절약)"""
+    import json
+
+    from shadow.analysis.claude import ClaudeAnalyzer
+    from shadow.capture.storage import SessionStorage
+    from shadow.config import settings
+    from shadow.preprocessing.dedup import expand_labels
+
+    if not settings.anthropic_api_key:
+        print("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        return
+
+    pairs = SessionStorage().load_deferred(session_dir)
+    if not pairs:
+        print(f"미룬 키프레임 쌍이 없습니다: {session_dir}")
+        return
+
+    print(f"미룬 키프레임 쌍 분석 중: {len(pairs)}개 (배치 크기 {batch_size})")
+    analyzer = ClaudeAnalyzer()
+    labels = expand_labels(pairs, asyncio.run(analyzer.analyze_batch(pairs, batch_size)))
+
+    output_path = Path(session_dir) / "deferred_labels.json"
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump([label.model_dump() for label in labels], f, ensure_ascii=False, indent=2)
+    print(f"저장 완료: {output_path}")
+
+
 def cmd_test_slack(args):
     """Slack 연동 테스트"""
     from shadow.hitl.models import Question, QuestionOption, QuestionType
@@ -191,6 +233,12 @@ def main():
     # analyze 명령
     analyze_parser = subparsers.add_parser("analyze", help="세션 분석")
     analyze_parser.add_argument("session_dir", nargs="?", help="분석할 세션 디렉토리")
+    analyze_parser.add_argument(
+        "--deferred", action="store_true", help="분석 예산 초과로 미룬 키프레임 쌍 분석"
+    )
+    analyze_parser.add_argument(
+        "--batch-size", type=int, default=10, help="미룬 쌍 분석 배치 크기 (기본값: 10)"
+    )
 
     # test-slack 명령
     slack_parser = subparsers.add_parser("test-slack", help="Slack 연동 테스트")
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     # Supabase (shadow-web과 동일한 DB)
     supabase_url: str = ""
     supabase_key: str = ""
+    user_id: str = "default_user"  # 설정(configs)을 조회할 사용자 ID (인증 도입 전 단일 사용자)
 
     # Slack API
     slack_bot_token: str = ""
@@ -22,6 +23,53 @@ class Settings(BaseSettings):
     # 화면 캡처 설정
     capture_fps: int = 10  # 초당 프레임 수
     capture_monitor: int = 1  # 캡처할 모니터 번호 (1-based)
+    capture_monitors: str = ""  # 동시에 캡처할 모니터 ("all" 또는 "1,2", 비우면 capture_monitor만)
+    capture_buffer_seconds: float = 0.0  # 프레임 링 버퍼 보존 시간 (초, 0이면 전체 보관)
+    capture_detect_changes: bool = True  # 변화 없는 프레임은 이전 프레임 참조로 저장
+    capture_change_stride: int = 4  # 변화 감지 샘플링 간격 (px)
+    capture_mode: str = "continuous"  # 캡처 모드 (continuous, triggered)
+    capture_pre_roll: float = 0.5  # triggered 모드: 트리거 이전 보존 시간 (초)
+    capture_post_roll: float = 1.0  # triggered 모드: 트리거 이후 보존 시간 (초)
+    capture_adaptive_fps: bool = False  # 활동량에 따라 FPS 조절 (상한은 capture_fps)
+    capture_min_fps: float = 1.0  # 적응형 FPS 하한 (유휴 상태)
+    capture_min_change_area: float = 0.002  # 적응형 FPS: 바뀐 화면 비율이 이 미만이면 활동 아님 (커서 깜박임 등)
+    capture_queue_size: int = 4  # 캡처 파이프라인 단계 간 큐 크기
+    capture_backpressure: str = "drop_oldest"  # grab 큐 포화 시 정책 (block, drop_newest, drop_oldest)
+    input_event_log_size: int = 100_000  # 입력 이벤트 로그 최대 보관 수
+    input_coalesce_keys: bool = True  # 연속 키 입력을 TEXT_ENTRY 이벤트로 병합
+    input_text_gap: float = 1.0  # 이 시간(초) 이상 입력이 없으면 TEXT_ENTRY 종료
+    input_track_drags: bool = True  # 버튼을 누른 채 이동하면 DRAG 이벤트 기록
+    input_track_hover: bool = False  # 버튼 없이 이동한 구간도 MOUSE_MOVE 이벤트로 기록
+    input_drag_threshold: float = 5.0  # 드래그로 판단하는 최소 이동 거리 (px)
+    input_move_min_distance: float = 3.0  # 이동 경로에 점을 남기는 최소 이동 거리 (px)
+    input_move_tolerance: float = 2.0  # 이동 경로 단순화(RDP) 허용 오차 (px)
+    capture_compact_events: bool = True  # 세션 이벤트를 열 기반 EventStore에 보관
+    capture_excluded_apps: str = ""  # 녹화 제외 앱 (쉼표 구분, 앱 이름 또는 bundle ID)
+    window_cache_ttl: float = 0.5  # 윈도우 목록 스냅샷 캐시 유지 시간 (초, 활성 앱 변경 시 즉시 갱신)
+
+    # 키프레임 설정
+    keyframe_triggers: str = "mouse_click"  # 트리거 이벤트 (쉼표 구분, drag/mouse_scroll 등 추가)
+    keyframe_group_bursts: bool = True  # 스크롤/타이핑/같은 단축키 반복을 트리거 하나로 병합
+    keyframe_scroll_gap: float = 0.5  # 같은 스크롤 제스처로 보는 틱 간격 (초)
+    keyframe_typing_gap: float = 1.0  # 같은 타이핑으로 보는 입력 간격 (초)
+    keyframe_key_repeat_gap: float = 0.5  # 같은 키/단축키 반복으로 보는 간격 (초)
+    keyframe_roi_size: int = 512  # 클릭 주변 원본 해상도 영역 크기 (px, 0이면 사용 안 함)
+    keyframe_after_mode: str = "fixed"  # After 프레임 선택 (fixed: 0.3초 후, settle: 화면 안정 시점)
+    keyframe_settle_time: float = 0.3  # settle: 이 시간 동안 변화가 없으면 안정으로 판단 (초)
+    keyframe_max_wait: float = 2.0  # settle: 트리거 후 안정을 기다리는 최대 시간 (초)
+    keyframe_settle_threshold: float = 0.002  # settle: 변화로 판단하는 샘플 픽셀 비율
+    keyframe_diff: bool = True  # 키프레임 쌍마다 Before/After 변화 영역 계산 (KeyframePair.diff)
+    keyframe_diff_cell: int = 16  # 변화 영역 격자 칸 크기 (px)
+    keyframe_diff_stride: int = 4  # 변화 비교 샘플링 간격 (px)
+    keyframe_dedup: bool = True  # 연속된 같은 동작의 키프레임 쌍을 하나로 합침
+    keyframe_dedup_hash_distance: int = 6  # 같은 화면으로 보는 dHash 거리 (64비트 중)
+    keyframe_dedup_click_radius: float = 24.0  # 같은 위치로 보는 클릭 거리 (px)
+    keyframe_dedup_double_click: float = 0.5  # Before 화면 비교 없이 합치는 클릭 간격 (초)
+    analysis_skip_no_change: bool = True  # 변화 영역이 없는 쌍은 API 없이 no_change로 처리
+    analysis_budget_usd: float = 0.0  # 세션당 분석 비용 상한 (USD, 0이면 제한 없음)
+    analysis_budget_tokens: int = 0  # 세션당 분석 입력 토큰 상한 (0이면 제한 없음)
+    analysis_defer_over_budget: bool = True  # 상한을 넘는 쌍은 버리지 않고 나중 분석용으로 저장
+    analysis_overview_size: int = 768  # ROI가 있을 때 전체 화면 축소 크기 (px)
 
     # Claude 분석 설정
     claude_model: str = "claude-opus-4-5-20251101"  # Claude Opus 4.5
@@ -34,6 +82,10 @@ class Settings(BaseSettings):
     nemotron_base_url: str = "https://integrate.api.nvidia.com/v1"
     nemotron_max_image_size: int = 1024
 
+    # 세션 저장 설정
+    storage_workers: int = 0  # 키프레임 PNG 인코딩 스레드 수 (0이면 CPU 코어 수)
+    storage_max_in_flight: int = 0  # 동시 인코딩/대기 최대 이미지 수 (0이면 스레드 수의 2배)
+
     # 패턴 분석 설정 (LLM 기반)
     pattern_analyzer_backend: str = "claude"  # 패턴 분석기 백엔드
     pattern_max_patterns: int = 5  # 최대 감지 패턴 수
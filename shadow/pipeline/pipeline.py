@@ -15,12 +15,16 @@ from typing import Any
 
 from shadow.analysis.claude import ClaudeAnalyzer
 from shadow.analysis.models import LabeledAction
+from shadow.api.repositories.users import load_excluded_apps
 from shadow.capture.models import KeyframePair
 from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.capture.storage import SessionStorage
 from shadow.config import settings
 from shadow.hitl.generator import QuestionGenerator
 from shadow.hitl.models import Question, Response
 from shadow.patterns import ClaudePatternAnalyzer, DetectedPattern
+from shadow.preprocessing.budget import BudgetSelector
+from shadow.preprocessing.dedup import KeyframeDeduplicator, expand_labels
 from shadow.preprocessing.keyframe import KeyframeExtractor
 from shadow.spec.builder import SpecBuilder
 from shadow.spec.models import Spec
@@ -33,6 +37,7 @@ class PipelineResult:
     # 각 단계별 결과
     session: RecordingSession | None = None
     keyframes: list[KeyframePair] = field(default_factory=list)
+    deferred: list[KeyframePair] = field(default_factory=list)  # 분석 예산 초과로 미룬 쌍
     actions: list[LabeledAction] = field(default_factory=list)
     patterns: list[DetectedPattern] = field(default_factory=list)
     questions: list[Question] = field(default_factory=list)
@@ -52,6 +57,7 @@ class PipelineResult:
             "frames": len(self.session.frames) if self.session else 0,
             "events": len(self.session.events) if self.session else 0,
             "keyframes": len(self.keyframes),
+            "deferred": len(self.deferred),
             "actions": len(self.actions),
             "patterns": len(self.patterns),
             "questions": len(self.questions),
@@ -106,7 +112,7 @@ class Pipeline:
         try:
             # 1. Record
             self._log("\n[1/6] 녹화 중...")
-            recorder = Recorder()
+            recorder = Recorder(excluded_apps=load_excluded_apps())
             result.session = recorder.record(duration)
             self._log(f"  - 프레임: {len(result.session.frames)}개")
             self._log(f"  - 이벤트: {len(result.session.events)}개")
@@ -116,6 +122,11 @@ class Pipeline:
             extractor = KeyframeExtractor()
             result.keyframes = extractor.extract_pairs(result.session)
             self._log(f"  - 키프레임 쌍: {len(result.keyframes)}개")
+            if settings.keyframe_dedup:
+                # 연속된 같은 동작은 한 번만 분석 (multiplicity로 반복 횟수 유지)
+                result.keyframes, dropped = KeyframeDeduplicator().split(result.keyframes)
+                extractor.release_pairs(result.session, dropped)  # 합쳐진 쌍의 링 버퍼 슬롯 해제
+                self._log(f"  - 중복 제거 후: {len(result.keyframes)}개")
 
             if not result.keyframes:
                 result.error = "키프레임이 없습니다 (마우스 클릭이 감지되지 않음)"
@@ -136,7 +147,35 @@ class Pipeline:
             cost_info = analyzer.estimate_cost(result.keyframes)
             self._log(f"  - 예상 비용: ${cost_info['total_cost_usd']:.4f}")
 
-            result.actions = await analyzer.analyze_batch(result.keyframes)
+            # 분석 예산 상한이 있으면 정보량이 큰 쌍만 분석
+            # (보류 쌍 PNG는 저장 스레드 풀에서 분석과 함께 인코딩하고 분석 후 완료를 기다림)
+            deferred_save = None
+            selector = BudgetSelector()
+            if selector.limited:
+                selection = selector.select(result.keyframes, analyzer.estimate_pair_cost)
+                result.keyframes, result.deferred = selection.selected, selection.deferred
+                self._log(
+                    f"  - 예산 내 선택: {len(selection.selected)}쌍 "
+                    f"(${selection.cost_usd:.4f}, 보류 {len(selection.deferred)}쌍)"
+                )
+                if result.deferred and settings.analysis_defer_over_budget:
+                    deferred_save = SessionStorage().save_deferred_background(
+                        result.deferred, result.session_id
+                    )
+                    self._log(f"  - 보류 쌍 저장: {deferred_save.path / 'deferred'}")
+
+            try:
+                labels = await analyzer.analyze_batch(result.keyframes)
+            finally:
+                if deferred_save is not None:
+                    await deferred_save
+            result.actions = expand_labels(result.keyframes, labels)
+            no_change_filter = analyzer.no_change_filter
+            if no_change_filter is not None and no_change_filter.skipped_pairs:
+                self._log(
+                    f"  - 변화 없음 로컬 처리: {no_change_filter.skipped_pairs}쌍 "
+                    f"(API 호출 {no_change_filter.skipped_calls}회 생략)"
+                )
             self._log(f"  - 분석된 액션: {len(result.actions)}개")
             for action in result.actions:
                 self._log(f"    - {action}")
@@ -1,5 +1,18 @@
 """전처리 모듈"""
 
-from shadow.preprocessing.keyframe import KeyframeExtractor
+from shadow.preprocessing.budget import BudgetSelection, BudgetSelector
+from shadow.preprocessing.dedup import KeyframeDeduplicator, expand_labels
+from shadow.preprocessing.diff import compute_diff
+from shadow.preprocessing.keyframe import KeyframeExtractor, StreamingKeyframeExtractor
+from shadow.preprocessing.triggers import TriggerGrouper
 
-__all__ = ["KeyframeExtractor"]
+__all__ = [
+    "BudgetSelection",
+    "BudgetSelector",
+    "KeyframeDeduplicator",
+    "KeyframeExtractor",
+    "StreamingKeyframeExtractor",
+    "TriggerGrouper",
+    "compute_diff",
+    "expand_labels",
+]
@@ -0,0 +1,159 @@
+"""분석 예산 내 키프레임 쌍 선택 모듈
+
+ClaudeAnalyzer.estimate_cost()로 비용을 미리 알 수 있지만, 긴 세션은 모든 쌍을 그대로 보냅니다.
+세션당 비용/토큰 상한이 설정되면 쌍마다 정보량 점수를 매겨 상한 안에서 점수가 높은 쌍부터 고르고,
+나머지는 SessionStorage.save_deferred()로 저장해 나중에 낮은 우선순위로 분석할 수 있게 합니다.
+
+정보량 점수 (가중합):
+- 변화량: Before/After 샘플 픽셀 변화 비율 (작은 변화도 구분되도록 포화 곡선 적용)
+- 전환: 직전 쌍과 앱/창이 다르면 1 (새 화면의 첫 동작)
+- 새로움: After 화면 dhash와 앞선 쌍들의 최소 해밍 거리 (처음 보는 화면일수록 큼)
+"""
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+from shadow.capture.models import KeyframePair
+from shadow.config import settings
+from shadow.preprocessing.dedup import dhash
+from shadow.preprocessing.diff import compute_diff
+
+# 변화량 점수가 약 0.63이 되는 샘플 픽셀 변화 비율
+DIFF_SCALE = 0.02
+
+
+@dataclass
+class BudgetSelection:
+    """예산 선택 결과 (두 목록 모두 원래 시간순)"""
+
+    selected: list[KeyframePair] = field(default_factory=list)
+    deferred: list[KeyframePair] = field(default_factory=list)
+    tokens: int = 0  # 선택한 쌍의 예상 입력 토큰
+    cost_usd: float = 0.0  # 선택한 쌍의 예상 비용
+
+
+class BudgetSelector:
+    """비용/토큰 상한 안에서 정보량이 큰 키프레임 쌍 선택
+
+    점수가 높은 쌍부터 담고, 상한을 넘는 쌍은 건너뛰어 더 싼 쌍으로 남은 예산을 채웁니다.
+    """
+
+    def __init__(
+        self,
+        max_cost_usd: float | None = None,
+        max_tokens: int | None = None,
+        diff_weight: float = 1.0,
+        transition_weight: float = 1.0,
+        novelty_weight: float = 1.0,
+    ):
+        """
+        Args:
+            max_cost_usd: 비용 상한 (USD, None이면 설정 사용, 0이면 제한 없음)
+            max_tokens: 입력 토큰 상한 (None이면 설정 사용, 0이면 제한 없음)
+            diff_weight: 변화량 점수 가중치
+            transition_weight: 앱/창 전환 점수 가중치
+            novelty_weight: 새로움 점수 가중치
+        """
+        self._max_cost = max_cost_usd if max_cost_usd is not None else settings.analysis_budget_usd
+        self._max_tokens = max_tokens if max_tokens is not None else settings.analysis_budget_tokens
+        self._weights = (diff_weight, transition_weight, novelty_weight)
+
+    @property
+    def limited(self) -> bool:
+        """비용 또는 토큰 상한이 설정되었는지"""
+        return self._max_cost > 0 or self._max_tokens > 0
+
+    def score(self, pairs: list[KeyframePair]) -> NDArray[np.float64]:
+        """쌍별 정보량 점수
+
+        Args:
+            pairs: 시간순 키프레임 쌍 목록
+
+        Returns:
+            pairs 순서대로의 점수 배열
+        """
+        if not pairs:
+            return np.zeros(0)
+        diff_weight, transition_weight, novelty_weight = self._weights
+        ratios = np.array([self._changed_ratio(pair) for pair in pairs])
+        return (
+            diff_weight * (1.0 - np.exp(-ratios / DIFF_SCALE))
+            + transition_weight * self._transitions(pairs)
+            + novelty_weight * self._novelty(pairs)
+        )
+
+    def select(
+        self,
+        pairs: list[KeyframePair],
+        pair_cost: Callable[[KeyframePair], tuple[int, float]],
+    ) -> BudgetSelection:
+        """상한 안에서 분석할 쌍 선택
+
+        Args:
+            pairs: 시간순 키프레임 쌍 목록
+            pair_cost: 쌍의 (입력 토큰, USD) 예상치 (ClaudeAnalyzer.estimate_pair_cost)
+
+        Returns:
+            선택/보류 쌍 목록과 선택한 쌍의 예상 비용
+        """
+        costs = [pair_cost(pair) for pair in pairs]
+        if not self.limited:
+            return BudgetSelection(
+                selected=list(pairs),
+                tokens=sum(tokens for tokens, _ in costs),
+                cost_usd=sum(usd for _, usd in costs),
+            )
+
+        max_tokens = self._max_tokens or math.inf
+        max_cost = self._max_cost or math.inf
+        tokens, cost = 0, 0.0
+        chosen = np.zeros(len(pairs), dtype=bool)
+        # 같은 점수는 앞선 쌍 우선 (stable 정렬)
+        for index in np.argsort(-self.score(pairs), kind="stable"):
+            pair_tokens, pair_usd = costs[index]
+            if tokens + pair_tokens <= max_tokens and cost + pair_usd <= max_cost:
+                chosen[index] = True
+                tokens += pair_tokens
+                cost += pair_usd
+
+        return BudgetSelection(
+            selected=[pair for pair, keep in zip(pairs, chosen) if keep],
+            deferred=[pair for pair, keep in zip(pairs, chosen) if not keep],
+            tokens=tokens,
+            cost_usd=cost,
+        )
+
+    @staticmethod
+    def _changed_ratio(pair: KeyframePair) -> float:
+        """Before/After 샘플 픽셀 변화 비율 (추출 시 계산한 diff 재사용)"""
+        diff = pair.diff
+        if diff is None:
+            diff = compute_diff(
+                pair.before_frame,
+                pair.after_frame,
+                cell=settings.keyframe_diff_cell,
+                stride=settings.keyframe_diff_stride,
+            )
+        return diff.changed_ratio
+
+    @staticmethod
+    def _transitions(pairs: list[KeyframePair]) -> NDArray[np.float64]:
+        """직전 쌍과 앱/창이 다르면 1 (첫 쌍은 1)"""
+        windows = [(p.trigger_event.app_name, p.trigger_event.window_title) for p in pairs]
+        return np.array(
+            [1.0] + [float(window != previous) for previous, window in zip(windows, windows[1:])]
+        )
+
+    @staticmethod
+    def _novelty(pairs: list[KeyframePair]) -> NDArray[np.float64]:
+        """After 화면 dhash와 앞선 쌍들의 최소 해밍 거리 / 64 (첫 쌍은 1)"""
+        hashes = np.array([dhash(pair.after_frame) for pair in pairs], dtype=np.uint64)
+        novelty = np.ones(len(pairs))
+        # n×n 거리 행렬 없이 한 행씩 계산 (긴 세션에서도 메모리 O(n))
+        for i in range(1, len(pairs)):
+            novelty[i] = np.bitwise_count(hashes[:i] ^ hashes[i]).min() / 64.0
+        return novelty
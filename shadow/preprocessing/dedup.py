@@ -0,0 +1,193 @@
+"""키프레임 쌍 중복 제거 모듈
+
+더블 클릭, 같은 버튼 반복 클릭, 아무 변화 없는 연속 클릭은 각각 KeyframePair가 되어
+PNG 인코딩과 VLM 호출을 반복합니다. 연속된 쌍 중 같은 위치에서 같은 화면 변화를 낸 쌍을
+앞선 쌍 하나로 합치고, 합친 횟수를 KeyframePair.multiplicity에 기록합니다.
+
+분석 후 expand_labels()로 라벨을 multiplicity만큼 펼치면
+패턴 감지에 쓰이는 동작 순서와 반복 횟수가 합치기 전과 같습니다.
+"""
+
+import math
+from collections.abc import Callable
+from dataclasses import replace
+from uuid import uuid4
+
+import numpy as np
+from PIL import Image
+
+from shadow.analysis.models import LabeledAction
+from shadow.capture.models import Frame, KeyframePair
+from shadow.config import settings
+
+
+def dhash(frame: Frame, hash_size: int = 8) -> int:
+    """difference hash (가로로 인접한 밝기 비교 hash_size x hash_size 비트)
+
+    Args:
+        frame: 프레임
+        hash_size: 한 변의 비트 수
+
+    Returns:
+        hash_size**2 비트 정수
+    """
+    image = frame.rgb_view()
+    # 축소 전에 샘플링하여 고해상도 프레임의 변환 비용을 줄임
+    step = max(1, min(image.shape[0], image.shape[1]) // (hash_size * 8))
+    sample = np.ascontiguousarray(image[::step, ::step])
+    gray = Image.fromarray(sample).convert("L").resize(
+        (hash_size + 1, hash_size), Image.Resampling.BOX
+    )
+    pixels = np.asarray(gray, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    """두 해시의 다른 비트 수"""
+    return (a ^ b).bit_count()
+
+
+class KeyframeDeduplicator:
+    """연속된 중복 키프레임 쌍 합치기
+
+    바로 앞에 남긴 쌍과 다음 조건을 모두 만족하면 앞선 쌍에 합칩니다.
+    - 같은 트리거 타입, 앱, 모니터
+    - 클릭 위치가 click_radius 이내
+    - After 화면의 해시 거리가 hash_distance 이내
+    - Before 화면의 해시 거리가 hash_distance 이내이거나,
+      직전 클릭과 double_click초 이내 (더블 클릭은 사이 화면이 달라질 수 있음)
+
+    연속된 쌍만 합치므로 동작 순서는 바뀌지 않습니다.
+    """
+
+    def __init__(
+        self,
+        hash_distance: int | None = None,
+        click_radius: float | None = None,
+        double_click: float | None = None,
+    ):
+        """
+        Args:
+            hash_distance: 같은 화면으로 보는 dHash 거리 (64비트 중, None이면 설정 사용)
+            click_radius: 같은 위치로 보는 클릭 거리 (px, None이면 설정 사용)
+            double_click: Before 화면 비교 없이 합치는 클릭 간격 (초, None이면 설정 사용)
+        """
+        self._hash_distance = (
+            hash_distance if hash_distance is not None else settings.keyframe_dedup_hash_distance
+        )
+        self._click_radius = (
+            click_radius if click_radius is not None else settings.keyframe_dedup_click_radius
+        )
+        self._double_click = (
+            double_click if double_click is not None else settings.keyframe_dedup_double_click
+        )
+
+    def dedup(self, pairs: list[KeyframePair]) -> list[KeyframePair]:
+        """중복 쌍을 합친 목록 반환
+
+        Args:
+            pairs: 시간순 키프레임 쌍 목록
+
+        Returns:
+            남은 쌍 목록 (multiplicity에 합친 쌍 수 반영)
+        """
+        return self.split(pairs)[0]
+
+    def split(
+        self, pairs: list[KeyframePair]
+    ) -> tuple[list[KeyframePair], list[KeyframePair]]:
+        """남은 쌍과 합쳐져 제거된 쌍으로 분리
+
+        제거된 쌍이 링 버퍼 슬롯을 pin하고 있으면 KeyframeExtractor.release_pairs()로 해제하세요.
+
+        Args:
+            pairs: 시간순 키프레임 쌍 목록
+
+        Returns:
+            (남은 쌍 목록, 제거된 쌍 목록)
+        """
+        hash_of = self._hasher()
+        kept: list[KeyframePair] = []
+        dropped: list[KeyframePair] = []
+        last_timestamp = 0.0  # 마지막으로 합친(또는 남긴) 쌍의 트리거 시각
+
+        for pair in pairs:
+            survivor = kept[-1] if kept else None
+            if survivor is not None and self._is_repeat(
+                survivor, pair, pair.trigger_event.timestamp - last_timestamp, hash_of
+            ):
+                kept[-1] = replace(
+                    survivor, multiplicity=survivor.multiplicity + pair.multiplicity
+                )
+                dropped.append(pair)
+            else:
+                kept.append(pair)
+            last_timestamp = pair.trigger_event.timestamp
+
+        return kept, dropped
+
+    def _is_repeat(
+        self,
+        survivor: KeyframePair,
+        pair: KeyframePair,
+        gap: float,
+        hash_of: Callable[[Frame], int],
+    ) -> bool:
+        """pair가 survivor와 같은 동작의 반복인지 확인"""
+        first, second = survivor.trigger_event, pair.trigger_event
+        if (
+            first.event_type != second.event_type
+            or first.app_name != second.app_name
+            or survivor.monitor != pair.monitor
+        ):
+            return False
+        if first.x is None or first.y is None or second.x is None or second.y is None:
+            return False
+        if math.hypot(first.x - second.x, first.y - second.y) > self._click_radius:
+            return False
+        if hamming(hash_of(survivor.after_frame), hash_of(pair.after_frame)) > self._hash_distance:
+            return False
+        if gap <= self._double_click:
+            return True
+        before_distance = hamming(hash_of(survivor.before_frame), hash_of(pair.before_frame))
+        return before_distance <= self._hash_distance
+
+    @staticmethod
+    def _hasher() -> Callable[[Frame], int]:
+        """이미지 버퍼별로 한 번만 계산하는 dhash (쌍끼리 프레임을 공유하는 경우가 많음)"""
+        cache: dict[int, int] = {}
+
+        def hash_of(frame: Frame) -> int:
+            key = frame.rgb_view().__array_interface__["data"][0]
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = dhash(frame)
+            return value
+
+        return hash_of
+
+
+def expand_labels(pairs: list[KeyframePair], labels: list[LabeledAction]) -> list[LabeledAction]:
+    """중복 제거된 쌍의 분석 라벨을 multiplicity만큼 반복
+
+    Args:
+        pairs: 분석한 키프레임 쌍 목록 (dedup 결과)
+        labels: pairs 순서대로 분석된 라벨 목록
+
+    Returns:
+        합치기 전 쌍 수만큼의 라벨 목록 (반복 라벨은 새 id를 가진 복사본)
+
+    Raises:
+        ValueError: 쌍과 라벨 수가 다른 경우
+    """
+    if len(pairs) != len(labels):
+        raise ValueError(f"쌍과 라벨 수가 다릅니다: pairs={len(pairs)}, labels={len(labels)}")
+
+    expanded: list[LabeledAction] = []
+    for pair, label in zip(pairs, labels):
+        expanded.append(label)
+        expanded.extend(
+            label.model_copy(update={"id": uuid4()}) for _ in range(pair.multiplicity - 1)
+        )
+    return expanded
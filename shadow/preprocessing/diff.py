@@ -0,0 +1,147 @@
+"""Before/After 변화 영역 계산 모듈
+
+키프레임 쌍마다 축소 샘플링한 두 프레임의 차이를 한 번 계산하여 KeyframePair.diff에 붙여 두면,
+분석/중복 제거/크롭 단계가 전체 이미지를 다시 비교하지 않고 변화 영역을 재사용할 수 있습니다.
+모든 단계는 numpy 벡터 연산이며 1080p 프레임 기준 쌍당 수 ms 안에 끝납니다
+(scripts/bench_diff.py).
+"""
+
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+from shadow.capture.models import Frame, FrameDiff
+
+
+def sample_change_mask(
+    a: NDArray[np.uint8], b: NDArray[np.uint8], stride: int = 4, tolerance: int = 8
+) -> NDArray[np.bool_]:
+    """stride 간격으로 샘플링한 픽셀 중 달라진 픽셀 표시
+
+    Args:
+        a: 이미지 (H, W, C)
+        b: 같은 크기의 비교할 이미지
+        stride: 샘플링 간격 (px)
+        tolerance: 같은 픽셀로 보는 채널 값 차이 (압축/안티앨리어싱 노이즈 무시)
+
+    Returns:
+        (ceil(H / stride), ceil(W / stride)) bool 배열
+    """
+    sample_a, sample_b = a[::stride, ::stride], b[::stride, ::stride]
+    # uint8 그대로 |a - b| 계산 (int16 변환 복사 없이)
+    difference = np.maximum(sample_a, sample_b)
+    difference -= np.minimum(sample_a, sample_b)
+    return (difference > tolerance).any(axis=-1)
+
+
+def compute_diff(
+    before: Frame, after: Frame, cell: int = 16, stride: int = 4, tolerance: int = 8
+) -> FrameDiff:
+    """두 프레임의 변화 영역 계산
+
+    샘플 마스크를 cell px 격자로 줄인 뒤 8방향으로 이어진 칸끼리 묶어
+    묶음마다 경계 상자를 구합니다. cell보다 가까운 변화는 한 영역으로 합쳐집니다.
+
+    Args:
+        before: Before 프레임
+        after: After 프레임
+        cell: 격자 칸 크기 (px, stride의 배수로 올림)
+        stride: 샘플링 간격 (px)
+        tolerance: 같은 픽셀로 보는 채널 값 차이
+
+    Returns:
+        변화 영역 (해상도가 다르면 After 화면 전체가 바뀐 것으로 봄)
+    """
+    image_a, image_b = before.rgb_view(), after.rgb_view()
+    height, width = image_b.shape[:2]
+    factor = max(1, math.ceil(cell / stride))
+    cell = factor * stride
+    rows, cols = math.ceil(height / cell), math.ceil(width / cell)
+
+    if image_a.__array_interface__["data"][0] == image_b.__array_interface__["data"][0]:
+        # 변화 감지로 같은 버퍼를 공유하는 프레임
+        return FrameDiff(mask=np.zeros((rows, cols), dtype=bool), cell=cell)
+    if image_a.shape != image_b.shape:
+        return FrameDiff(
+            mask=np.ones((rows, cols), dtype=bool),
+            cell=cell,
+            boxes=[(0, 0, width, height)],
+            changed_ratio=1.0,
+        )
+
+    sample = sample_change_mask(image_a, image_b, stride, tolerance)
+    changed_ratio = float(sample.mean())
+    if not changed_ratio:
+        return FrameDiff(mask=np.zeros((rows, cols), dtype=bool), cell=cell)
+
+    # 샘플 마스크를 factor x factor 블록 단위로 축소 (가장자리는 False로 채움)
+    padded = np.zeros((rows * factor, cols * factor), dtype=bool)
+    padded[: sample.shape[0], : sample.shape[1]] = sample
+    mask = padded.reshape(rows, factor, cols, factor).any(axis=(1, 3))
+
+    return FrameDiff(
+        mask=mask,
+        cell=cell,
+        boxes=_component_boxes(mask, cell, width, height),
+        changed_ratio=changed_ratio,
+    )
+
+
+def _label_cells(mask: NDArray[np.bool_]) -> NDArray[np.intp]:
+    """8방향으로 이어진 칸에 같은 라벨 부여
+
+    칸마다 자신의 평탄화 인덱스로 시작해 이웃 최솟값을 전파하고,
+    라벨이 가리키는 칸의 라벨로 건너뛰어(pointer jumping) 반복 횟수를 줄입니다.
+
+    Returns:
+        칸별 라벨 (변화 없는 칸은 mask.size)
+    """
+    rows, cols = mask.shape
+    background = mask.size
+    labels = np.where(mask, np.arange(background).reshape(rows, cols), background)
+    foreground = mask.ravel()
+
+    while True:
+        padded = np.pad(labels, 1, constant_values=background)
+        smallest = labels.copy()
+        for dy in range(3):
+            for dx in range(3):
+                np.minimum(smallest, padded[dy : dy + rows, dx : dx + cols], out=smallest)
+        smallest[~mask] = background
+        flat = smallest.ravel()
+        flat[foreground] = flat[flat[foreground]]
+        if np.array_equal(smallest, labels):
+            return labels
+        labels = smallest
+
+
+def _component_boxes(
+    mask: NDArray[np.bool_], cell: int, width: int, height: int
+) -> list[tuple[int, int, int, int]]:
+    """이어진 칸 묶음별 경계 상자 (원본 해상도, 넓은 순)"""
+    labels = _label_cells(mask)
+    ys, xs = np.nonzero(mask)
+    _, inverse = np.unique(labels[ys, xs], return_inverse=True)
+    count = int(inverse.max()) + 1
+
+    top = np.full(count, mask.shape[0])
+    left = np.full(count, mask.shape[1])
+    bottom = np.zeros(count, dtype=np.intp)
+    right = np.zeros(count, dtype=np.intp)
+    np.minimum.at(top, inverse, ys)
+    np.minimum.at(left, inverse, xs)
+    np.maximum.at(bottom, inverse, ys)
+    np.maximum.at(right, inverse, xs)
+
+    boxes = [
+        (
+            int(x0) * cell,
+            int(y0) * cell,
+            min((int(x1) + 1) * cell, width),
+            min((int(y1) + 1) * cell, height),
+        )
+        for x0, y0, x1, y1 in zip(left, top, right, bottom)
+    ]
+    boxes.sort(key=lambda box: (box[2] - box[0]) * (box[3] - box[1]), reverse=True)
+    return boxes
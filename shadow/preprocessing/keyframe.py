@@ -1,66 +1,181 @@
 """키프레임 추출 모듈
 
 Before/After 프레임 쌍(KeyframePair)을 추출합니다.
+녹화가 끝난 세션에서 추출하거나(KeyframeExtractor),
+녹화 중에 프레임/이벤트를 받아 바로 추출할 수 있습니다(StreamingKeyframeExtractor).
 """
 
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+
+from shadow.capture.event_store import EventStore
+from shadow.capture.frame_buffer import FrameRingBuffer
 from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
-from shadow.capture.recorder import RecordingSession
+from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.config import settings
+from shadow.preprocessing.diff import compute_diff
+from shadow.preprocessing.settle import SettleDetector
+from shadow.preprocessing.triggers import KEYBOARD_EVENTS, TriggerGrouper, parse_trigger_events
+
+
+AFTER_MODES = ("fixed", "settle")
+
+
+class _FrameIndex:
+    """프레임 타임스탬프 이진 탐색 인덱스
+
+    링 버퍼는 생성 시점의 프레임을 한 번만 복사해 두므로
+    추출 중에 캡처가 계속되어도 인덱스가 어긋나지 않습니다.
+    """
+
+    def __init__(self, frames: list[Frame] | FrameRingBuffer | None = None):
+        if frames is None:
+            frames = []
+        elif isinstance(frames, FrameRingBuffer):
+            frames = list(frames)
+        timestamps = [frame.timestamp for frame in frames]
+        if any(later < earlier for earlier, later in zip(timestamps, timestamps[1:])):
+            # 시간순이 아니면 정렬 (같은 타임스탬프는 원래 순서 유지)
+            frames = sorted(frames, key=lambda frame: frame.timestamp)
+            timestamps = [frame.timestamp for frame in frames]
+        self.frames = frames
+        self.timestamps = timestamps
+
+    def add(self, frame: Frame) -> None:
+        """프레임 추가 (시간순이 아니면 정렬 위치에 삽입)"""
+        timestamps = self.timestamps
+        if not timestamps or frame.timestamp >= timestamps[-1]:
+            timestamps.append(frame.timestamp)
+            self.frames.append(frame)
+            return
+        position = bisect_right(timestamps, frame.timestamp)
+        timestamps.insert(position, frame.timestamp)
+        self.frames.insert(position, frame)
+
+    def trim(self, cutoff: float) -> list[Frame]:
+        """cutoff 이전 프레임 제거 (이전 프레임 대체용으로 cutoff 직전 프레임은 남김)
+
+        Returns:
+            제거된 프레임 목록
+        """
+        timestamps = self.timestamps
+        keep = bisect_left(timestamps, cutoff) - 1
+        if keep <= 0:
+            return []
+        # 같은 타임스탬프 프레임은 함께 남김
+        count = bisect_left(timestamps, timestamps[keep])
+        removed = self.frames[:count]
+        del self.frames[:count]
+        del timestamps[:count]
+        return removed
 
 
 class KeyframeExtractor:
-    """클릭 이벤트 시점의 Before/After 프레임 쌍 추출"""
+    """클릭/드래그 이벤트 시점의 Before/After 프레임 쌍 추출
+
+    지속 이벤트(DRAG, TEXT_ENTRY 등)의 After 프레임은 종료 시각(end_timestamp) 기준입니다.
+    드래그는 누름 시점의 MOUSE_CLICK과 timestamp가 같으므로, DRAG가 트리거이면
+    같은 누름의 MOUSE_CLICK은 건너뜁니다.
+
+    After 프레임 선택 방식:
+    - fixed: 종료 시각 + after_delay 이후 첫 프레임
+    - settle: 종료 후 화면이 안정된 첫 프레임 (SettleDetector, 최대 max_wait초)
+    고른 지연 시간은 KeyframePair.after_latency에 기록합니다.
+
+    쌍마다 Before/After 변화 영역(compute_diff)을 계산하여 KeyframePair.diff에 붙입니다.
+
+    스크롤/타이핑/단축키를 트리거로 쓰면 틱이나 키마다 쌍을 만들지 않고
+    입력 묶음 하나를 트리거 하나로 병합합니다 (TriggerGrouper).
+    """
 
     def __init__(
         self,
         trigger_events: set[InputEventType] | None = None,
         time_tolerance: float = 0.1,
         after_delay: float = 0.3,
+        roi_size: int | None = None,
+        after_mode: str | None = None,
+        settle: SettleDetector | None = None,
+        diff: bool | None = None,
+        group_bursts: bool | None = None,
     ):
         """
         Args:
-            trigger_events: 키프레임을 트리거하는 이벤트 타입 (기본: 마우스 클릭)
+            trigger_events: 키프레임을 트리거하는 이벤트 타입 (None이면 keyframe_triggers 설정)
             time_tolerance: 이벤트와 프레임 간 허용 시간차 (초)
-            after_delay: After 프레임 지연 시간 (초, 기본 0.3초)
+            after_delay: After 프레임 지연 시간 (초, 기본 0.3초, fixed 모드)
+            roi_size: 클릭 주변 원본 해상도 영역 크기 (px, None이면 설정 사용, 0이면 사용 안 함)
+            after_mode: After 프레임 선택 방식 ("fixed", "settle", None이면 설정 사용)
+            settle: settle 모드의 안정 판단기 (None이면 설정으로 생성)
+            diff: 쌍마다 Before/After 변화 영역 계산 여부 (None이면 설정 사용)
+            group_bursts: 스크롤/타이핑/같은 단축키 반복을 트리거 하나로 병합 (None이면 설정 사용)
+
+        Raises:
+            ValueError: 알 수 없는 after_mode 또는 트리거 이벤트 이름인 경우
         """
-        self._trigger_events = trigger_events or {InputEventType.MOUSE_CLICK}
+        self._trigger_events = set(
+            trigger_events or parse_trigger_events(settings.keyframe_triggers)
+        )
         self._time_tolerance = time_tolerance
         self._after_delay = after_delay
+        self._roi_size = roi_size if roi_size is not None else settings.keyframe_roi_size
+        self._diff = diff if diff is not None else settings.keyframe_diff
+        if group_bursts is None:
+            group_bursts = settings.keyframe_group_bursts
+        self._grouper = TriggerGrouper() if group_bursts else None
 
-    def _find_closest_frame(
-        self, event: InputEvent, frames: list[Frame]
-    ) -> Frame | None:
+        after_mode = after_mode or settings.keyframe_after_mode
+        if after_mode not in AFTER_MODES:
+            raise ValueError(f"알 수 없는 after_mode: {after_mode} (가능: {', '.join(AFTER_MODES)})")
+        self._settle: SettleDetector | None = None
+        if after_mode == "settle":
+            self._settle = settle or SettleDetector(
+                settle_time=settings.keyframe_settle_time,
+                max_wait=settings.keyframe_max_wait,
+                threshold=settings.keyframe_settle_threshold,
+            )
+
+    def _find_closest_frame(self, event: InputEvent, index: _FrameIndex) -> Frame | None:
         """이벤트 시점에 가장 가까운 프레임 찾기
 
         이벤트 발생 직전의 프레임을 반환합니다 (사용자가 클릭한 화면).
+        허용 오차 안에서 가장 가까운 프레임을 고르며, 거리가 같으면 앞선 프레임을 고릅니다.
         """
-        if not frames:
+        timestamps = index.timestamps
+        if not timestamps:
             return None
 
-        # 이벤트 시점 직전 또는 가장 가까운 프레임 찾기
-        best_frame = None
+        # 이벤트 직전(<=) 프레임과 직후(>) 프레임만 후보
+        after = bisect_right(timestamps, event.timestamp)
+        best: int | None = None
         best_diff = float("inf")
-
-        for frame in frames:
-            # 프레임이 이벤트보다 이전이거나 허용 오차 내인 경우
-            time_diff = event.timestamp - frame.timestamp
-
-            if -self._time_tolerance <= time_diff <= self._time_tolerance:
-                if abs(time_diff) < best_diff:
-                    best_diff = abs(time_diff)
-                    best_frame = frame
+        if after > 0:
+            diff = event.timestamp - timestamps[after - 1]
+            if diff <= self._time_tolerance:
+                # 같은 타임스탬프가 여러 개면 첫 번째
+                best = bisect_left(timestamps, timestamps[after - 1])
+                best_diff = diff
+        if after < len(timestamps):
+            diff = timestamps[after] - event.timestamp
+            if diff <= self._time_tolerance and diff < best_diff:
+                best = after
 
         # 허용 오차 내 프레임이 없으면 가장 가까운 이전 프레임 사용
-        if best_frame is None:
-            before_frames = [f for f in frames if f.timestamp <= event.timestamp]
-            if before_frames:
-                best_frame = before_frames[-1]  # 가장 최근 프레임
+        if best is None and after > 0:
+            best = after - 1
 
-        return best_frame
+        return None if best is None else index.frames[best]
 
     def extract_pairs(self, session: RecordingSession) -> list[KeyframePair]:
         """F-01: Before/After 프레임 쌍 추출
 
         클릭 직전(Before)과 직후(After) 프레임을 함께 추출합니다.
+        세션 프레임이 FrameRingBuffer이면 선택된 슬롯만 pin합니다.
+        다중 모니터 세션에서는 클릭 좌표가 속한 모니터의 프레임에서 추출합니다.
+        클릭 좌표가 있으면 프레임 픽셀 좌표(click_pos)와 주변 원본 해상도 영역(roi)을 함께 기록합니다.
+        Recorder가 링 버퍼 세션에서 녹화 중에 추출한 쌍(session.keyframe_pairs)이 있으면
+        보존 구간 밖으로 밀려난 트리거도 포함된 그 쌍을 반환합니다.
 
         Args:
             session: 녹화 세션
@@ -68,59 +183,203 @@ class KeyframeExtractor:
         Returns:
             KeyframePair 목록
         """
+        if session.keyframe_pairs is not None:
+            return list(session.keyframe_pairs)
+
         pairs = []
 
         # 트리거 이벤트 필터링
-        trigger_events = [
-            e for e in session.events if e.event_type in self._trigger_events
-        ]
+        trigger_events = self._filter_trigger_events(session.events)
+
+        # 모니터별 타임스탬프 인덱스 (세션당 1회 생성, 이벤트마다 이진 탐색)
+        indexes: dict[int | None, _FrameIndex] = {}
 
         for event in trigger_events:
-            # Before: 이벤트 직전 프레임
-            before_frame = self._find_closest_frame(event, session.frames)
-            if before_frame is None:
-                continue
-
-            # After: 이벤트 후 _after_delay 초 후 프레임
-            after_timestamp = event.timestamp + self._after_delay
-            after_frame = self._find_frame_at_timestamp(after_timestamp, session.frames)
-
-            if after_frame is None:
-                # After 프레임이 없으면 마지막 프레임 사용
-                after_frames = [f for f in session.frames if f.timestamp > event.timestamp]
-                if after_frames:
-                    after_frame = after_frames[-1]
-                else:
-                    after_frame = before_frame  # fallback
-
-            pairs.append(
-                KeyframePair(
-                    before_frame=before_frame,
-                    after_frame=after_frame,
-                    trigger_event=event,
-                )
-            )
+            # 다중 모니터 세션: 클릭 좌표가 속한 모니터의 프레임 사용
+            monitor = session.monitor_at(event.x, event.y)
+            frames = session.frames_for(monitor)
+            index = indexes.get(monitor)
+            if index is None:
+                index = indexes[monitor] = _FrameIndex(frames)
+
+            pair = self._make_pair(session, monitor, index, event)
+            if pair is not None:
+                pairs.append(pair)
 
         return pairs
 
-    def _find_frame_at_timestamp(
-        self, timestamp: float, frames: list[Frame]
+    def _make_pair(
+        self,
+        session: RecordingSession,
+        monitor: int | None,
+        index: _FrameIndex,
+        event: InputEvent,
+        after_frame: Frame | None = None,
+    ) -> KeyframePair | None:
+        """트리거 이벤트 하나의 키프레임 쌍 생성 (Before 프레임이 없으면 None)
+
+        after_frame을 전달하지 않으면 모든 프레임이 도착한 것으로 보고 선택합니다.
+        """
+        # Before: 이벤트 직전 프레임
+        before_frame = self._find_closest_frame(event, index)
+        if before_frame is None:
+            return None
+
+        # After: 이벤트(지속 이벤트는 종료) 이후 프레임
+        if after_frame is None:
+            after_frame = self._select_after_frame(event, index)
+
+        frames = session.frames_for(monitor)
+        click_pos = self._click_position(session, monitor, event, before_frame)
+        end_timestamp = event.end_timestamp or event.timestamp
+        diff = None
+        if self._diff:
+            diff = compute_diff(
+                before_frame,
+                after_frame,
+                cell=settings.keyframe_diff_cell,
+                stride=settings.keyframe_diff_stride,
+            )
+        return KeyframePair(
+            before_frame=self._pin(frames, before_frame),
+            after_frame=self._pin(frames, after_frame),
+            trigger_event=event,
+            monitor=monitor,
+            click_pos=click_pos,
+            roi=self._click_roi(click_pos, before_frame),
+            after_latency=max(0.0, after_frame.timestamp - end_timestamp),
+            diff=diff,
+        )
+
+    def _select_after_frame(
+        self, event: InputEvent, index: _FrameIndex, final: bool = True
     ) -> Frame | None:
-        """특정 타임스탬프에 가장 가까운 프레임 찾기"""
-        if not frames:
+        """After 프레임 선택
+
+        Args:
+            event: 트리거 이벤트
+            index: 프레임 인덱스
+            final: 더 이상 프레임이 오지 않음 (False면 판단할 프레임이 부족할 때 None)
+
+        Returns:
+            선택된 프레임 (프레임이 없거나 아직 판단할 수 없으면 None)
+        """
+        end_timestamp = event.end_timestamp or event.timestamp
+        timestamps = index.timestamps
+        if self._settle is None:
+            # fixed: 종료 후 _after_delay 초 후 프레임
+            after_timestamp = end_timestamp + self._after_delay
+            if not final and (not timestamps or timestamps[-1] < after_timestamp):
+                return None
+            return self._find_frame_at_timestamp(after_timestamp, index)
+
+        # settle: 종료 시점 화면부터 max_wait 직후 프레임 1장까지 비교
+        first = bisect_right(timestamps, end_timestamp)
+        last = bisect_right(timestamps, end_timestamp + self._settle.max_wait) + 1
+        reference = index.frames[first - 1] if first > 0 else None
+        after_frame = self._settle.select(
+            reference, index.frames[first:last], end_timestamp, final=final
+        )
+        if after_frame is None and final:
+            # 종료 이후 프레임이 없으면 마지막 프레임
+            after_frame = self._find_frame_at_timestamp(end_timestamp, index)
+        return after_frame
+
+    @staticmethod
+    def _click_position(
+        session: RecordingSession, monitor: int | None, event: InputEvent, frame: Frame
+    ) -> tuple[int, int] | None:
+        """이벤트 좌표를 프레임 픽셀 좌표로 변환 (모니터 위치 정보가 없으면 그대로)"""
+        if event.x is None or event.y is None:
             return None
+        geometry = session.geometry_for(monitor)
+        if geometry is None:
+            return event.x, event.y
+        return geometry.to_local(event.x, event.y, frame.width, frame.height)
 
-        # 타임스탬프 이후 프레임 중 가장 가까운 것
-        after_frames = [f for f in frames if f.timestamp >= timestamp]
-        if after_frames:
-            return min(after_frames, key=lambda f: abs(f.timestamp - timestamp))
+    def _click_roi(
+        self, click_pos: tuple[int, int] | None, frame: Frame
+    ) -> tuple[int, int, int, int] | None:
+        """클릭 주변 roi_size 정사각형 영역 (프레임 경계 안으로 이동, 프레임보다 크면 None)"""
+        if click_pos is None or self._roi_size <= 0:
+            return None
+        width, height = frame.width, frame.height
+        if self._roi_size >= width and self._roi_size >= height:
+            return None
+
+        roi_w, roi_h = min(self._roi_size, width), min(self._roi_size, height)
+        left = min(max(0, click_pos[0] - roi_w // 2), width - roi_w)
+        top = min(max(0, click_pos[1] - roi_h // 2), height - roi_h)
+        return left, top, left + roi_w, top + roi_h
 
-        # 없으면 이전 프레임 중 가장 가까운 것
-        before_frames = [f for f in frames if f.timestamp < timestamp]
-        if before_frames:
-            return max(before_frames, key=lambda f: f.timestamp)
+    def _filter_trigger_events(
+        self, events: list[InputEvent] | EventStore
+    ) -> list[InputEvent]:
+        """트리거 타입 이벤트만 선택 (EventStore는 타입 열 마스크로 필터링)
 
-        return None
+        드래그로 이어진 누름의 MOUSE_CLICK은 DRAG 이벤트로 대신합니다.
+        입력 묶음 병합을 쓰면 키보드 트리거를 위해 개별 키 이벤트도 함께 읽어 병합한 뒤 고릅니다.
+        """
+        types = set(self._trigger_events)
+        if self._grouper is not None and types & KEYBOARD_EVENTS:
+            types |= KEYBOARD_EVENTS
+        if isinstance(events, EventStore):
+            triggers = events.select(events.type_mask(types))
+        else:
+            triggers = [e for e in events if e.event_type in types]
+        if self._grouper is not None:
+            triggers = [
+                e for e in self._grouper.group(triggers) if e.event_type in self._trigger_events
+            ]
+
+        drag_starts = {e.timestamp for e in triggers if e.event_type == InputEventType.DRAG}
+        if not drag_starts:
+            return triggers
+        return [
+            e
+            for e in triggers
+            if not (e.event_type == InputEventType.MOUSE_CLICK and e.timestamp in drag_starts)
+        ]
+
+    @staticmethod
+    def _pin(frames: list[Frame] | FrameRingBuffer, frame: Frame) -> Frame:
+        """링 버퍼 프레임이면 슬롯을 pin하여 덮어쓰기 방지"""
+        if isinstance(frames, FrameRingBuffer):
+            return frames.pin(frame)
+        return frame
+
+    def release_pairs(
+        self, session: RecordingSession, pairs: list[KeyframePair]
+    ) -> None:
+        """extract_pairs()가 pin한 링 버퍼 슬롯 해제
+
+        저장/분석이 끝난 쌍의 슬롯을 다시 캡처에 사용할 수 있게 합니다.
+
+        Args:
+            session: 쌍을 추출한 녹화 세션
+            pairs: 해제할 키프레임 쌍 목록
+        """
+        for pair in pairs:
+            frames = session.frames_for(pair.monitor)
+            if isinstance(frames, FrameRingBuffer):
+                frames.unpin(pair.before_frame)
+                frames.unpin(pair.after_frame)
+
+    @staticmethod
+    def _find_frame_at_timestamp(timestamp: float, index: _FrameIndex) -> Frame | None:
+        """특정 타임스탬프에 가장 가까운 프레임 찾기
+
+        타임스탬프 이후 첫 프레임, 없으면 마지막 프레임을 반환합니다.
+        """
+        timestamps = index.timestamps
+        if not timestamps:
+            return None
+
+        position = bisect_left(timestamps, timestamp)
+        if position == len(timestamps):
+            # 없으면 이전 프레임 중 가장 가까운 것 (같은 타임스탬프면 첫 번째)
+            position = bisect_left(timestamps, timestamps[-1])
+        return index.frames[position]
 
     def extract(self, session: RecordingSession) -> list[KeyframePair]:
         """extract_pairs의 별칭 (호환성 유지)
@@ -141,3 +400,271 @@ class KeyframeExtractor:
 
         session = RecordingSession(frames=frames, events=events)
         return self.extract_pairs(session)
+
+
+class StreamingKeyframeExtractor(KeyframeExtractor):
+    """녹화 중 키프레임 쌍 추출
+
+    Recorder의 프레임/이벤트 콜백을 구독하여 트리거 이벤트의 After 프레임이
+    정해지는 즉시 (fixed: 종료 시각 + after_delay 프레임 도착, settle: 화면 안정)
+    KeyframePair를 발생합니다.
+    고르는 프레임은 녹화 후 extract_pairs()와 같습니다.
+
+    - 최근 history초 프레임과 대기 중인 트리거의 Before 후보 프레임만 보관
+      (링 버퍼 세션은 보관하는 동안 pin하고 버릴 때 unpin)
+    - 발생한 쌍의 프레임은 pin된 상태이므로 처리 후 release_pairs()로 해제
+    - 버튼을 누르고 있는 동안은 MOUSE_CLICK 쌍을 보류하고,
+      같은 누름의 DRAG가 도착하면 DRAG로 대체
+    - TEXT_ENTRY는 입력이 input_text_gap초 멈춘 뒤 시작 시각으로 도착하므로,
+      진행 중인 타이핑 묶음의 시작 시각(typing_since) 이후 프레임을 보관
+      (attach() 없이 사용하면 history를 input_text_gap + keyframe_typing_gap 이상으로 늘림)
+    - 지속 시간이 history보다 긴 트리거(드래그, 타이핑 제외)는 Before 후보가 이미 버려졌을 수 있음
+    - 입력 묶음(스크롤/타이핑/단축키 반복)은 묶음 간격이 지나 더 이어질 수 없을 때 쌍을 발생
+      (개별 키 이벤트 변환은 하지 않으므로 수집기의 키 입력 병합 결과를 사용)
+
+    사용 예:
+        extractor = StreamingKeyframeExtractor(on_pair=queue.put)
+        extractor.attach(recorder)
+        recorder.start()
+        ...
+        session = recorder.stop()
+        extractor.flush()
+    """
+
+    def __init__(
+        self,
+        trigger_events: set[InputEventType] | None = None,
+        time_tolerance: float = 0.1,
+        after_delay: float = 0.3,
+        roi_size: int | None = None,
+        after_mode: str | None = None,
+        settle: SettleDetector | None = None,
+        on_pair: Callable[[KeyframePair], None] | None = None,
+        history: float = 1.0,
+        button_down: Callable[[], bool] | None = None,
+        diff: bool | None = None,
+        group_bursts: bool | None = None,
+        typing_since: Callable[[], float | None] | None = None,
+    ):
+        """
+        Args:
+            trigger_events: 키프레임을 트리거하는 이벤트 타입 (None이면 keyframe_triggers 설정)
+            time_tolerance: 이벤트와 프레임 간 허용 시간차 (초)
+            after_delay: After 프레임 지연 시간 (초, 기본 0.3초, fixed 모드)
+            roi_size: 클릭 주변 원본 해상도 영역 크기 (px, None이면 설정 사용, 0이면 사용 안 함)
+            after_mode: After 프레임 선택 방식 ("fixed", "settle", None이면 설정 사용)
+            settle: settle 모드의 안정 판단기 (None이면 설정으로 생성)
+            on_pair: 완성된 쌍을 받을 콜백 (프레임 콜백 스레드에서 호출,
+                None이면 모아 두었다가 pop_pairs()로 반환)
+            history: 이벤트 전달 지연에 대비해 보관하는 최근 프레임 구간 (초,
+                TEXT_ENTRY가 트리거이면 input_text_gap + keyframe_typing_gap 이상)
+            button_down: 마우스 버튼을 누르고 있는지 조회하는 함수 (None이면 attach()에서 설정)
+            diff: 쌍마다 Before/After 변화 영역 계산 여부 (None이면 설정 사용)
+            group_bursts: 스크롤/타이핑/같은 단축키 반복을 트리거 하나로 병합 (None이면 설정 사용)
+            typing_since: 진행 중인 타이핑 묶음의 시작 시각 조회 함수
+                (None이면 attach()에서 설정)
+        """
+        super().__init__(
+            trigger_events,
+            time_tolerance,
+            after_delay,
+            roi_size,
+            after_mode,
+            settle,
+            diff,
+            group_bursts,
+        )
+        self._on_pair = on_pair
+        if InputEventType.TEXT_ENTRY in self._trigger_events:
+            # TEXT_ENTRY는 마지막 입력 후 input_text_gap초가 지나야 시작 시각으로 도착
+            history = max(history, settings.input_text_gap + settings.keyframe_typing_gap)
+        self._history = max(history, time_tolerance)
+        self._button_down = button_down
+        self._typing_since = typing_since
+        # DRAG가 트리거이면 누름(MOUSE_CLICK)도 받아 드래그 시작 시점의 프레임을 보존
+        self._accepted = set(self._trigger_events)
+        if InputEventType.DRAG in self._trigger_events:
+            self._accepted.add(InputEventType.MOUSE_CLICK)
+        self._lock = threading.Lock()
+        self._session: RecordingSession | None = None
+        self._windows: dict[int | None, _FrameIndex] = {}
+        self._pending: list[InputEvent] = []
+        self._ready: list[KeyframePair] = []
+        self.emitted = 0  # 발생한 쌍 수
+
+    def attach(self, recorder: Recorder) -> None:
+        """Recorder의 프레임/이벤트 콜백 구독 (start() 전에 호출)
+
+        Args:
+            recorder: 녹화기
+        """
+        recorder.add_frame_callback(self.on_frame)
+        recorder.add_event_callback(self.on_event)
+        if self._button_down is None:
+            self._button_down = lambda: recorder.button_down
+        if self._typing_since is None:
+            self._typing_since = lambda: recorder.typing_since
+
+    def detach(self, recorder: Recorder) -> None:
+        """attach()로 등록한 콜백 해제"""
+        recorder.remove_frame_callback(self.on_frame)
+        recorder.remove_event_callback(self.on_event)
+
+    @property
+    def pending_count(self) -> int:
+        """After 프레임을 기다리는 이벤트 수"""
+        return len(self._pending)
+
+    @property
+    def buffered_frames(self) -> int:
+        """Before/After 후보로 보관 중인 프레임 수"""
+        return sum(len(window.frames) for window in self._windows.values())
+
+    def on_event(self, event: InputEvent) -> None:
+        """입력 이벤트 콜백 (트리거 이벤트를 대기열에 추가)"""
+        if event.event_type not in self._accepted:
+            return
+        with self._lock:
+            if event.event_type == InputEventType.DRAG:
+                # 같은 누름의 MOUSE_CLICK을 DRAG로 대체
+                self._pending = [
+                    e
+                    for e in self._pending
+                    if not (
+                        e.event_type == InputEventType.MOUSE_CLICK
+                        and e.timestamp == event.timestamp
+                    )
+                ]
+            if (
+                self._grouper is not None
+                and self._pending
+                and self._grouper.continues(self._pending[-1], event)
+            ):
+                # 같은 입력 묶음: 대기 중인 트리거의 종료 시각을 늘림
+                self._pending[-1] = self._grouper.merge(self._pending[-1], event)
+                return
+            self._pending.append(event)
+
+    def on_frame(self, session: RecordingSession, monitor: int, frame: Frame) -> None:
+        """프레임 콜백 (After 프레임이 도착한 트리거의 쌍 발생, 오래된 프레임 해제)
+
+        Args:
+            session: 녹화 중인 세션
+            monitor: 프레임의 모니터 번호
+            frame: 세션에 저장된 프레임
+        """
+        with self._lock:
+            if session is not self._session:
+                self._start_session(session)
+            key = monitor if monitor in session.monitor_frames else None
+            frames = session.frames_for(key)
+            window = self._windows.setdefault(key, _FrameIndex())
+            window.add(self._pin(frames, frame))
+
+            pairs = self._take_ready(session, key, window)
+
+            # 대기 중인 이벤트의 Before 후보와 최근 history초 프레임만 보관
+            cutoff = window.timestamps[-1] - self._history
+            for event in self._pending:
+                if session.monitor_at(event.x, event.y) == key:
+                    cutoff = min(cutoff, event.timestamp - self._time_tolerance)
+            if InputEventType.TEXT_ENTRY in self._trigger_events and self._typing_since:
+                # 아직 TEXT_ENTRY로 도착하지 않은 타이핑 묶음의 Before 후보 보존
+                typing_start = self._typing_since()
+                if typing_start is not None:
+                    cutoff = min(cutoff, typing_start - self._time_tolerance)
+            self._unpin(frames, window.trim(cutoff))
+
+        self._emit(pairs)
+
+    def flush(self) -> list[KeyframePair]:
+        """녹화 종료 처리 (대기 중인 트리거를 마지막 프레임으로 완성하고 보관 프레임 해제)
+
+        Returns:
+            이번에 발생한 쌍 목록 (on_pair에도 전달)
+        """
+        pairs: list[KeyframePair] = []
+        with self._lock:
+            session = self._session
+            if session is not None:
+                for event in self._pending:
+                    if event.event_type not in self._trigger_events:
+                        continue
+                    key = session.monitor_at(event.x, event.y)
+                    window = self._windows.get(key)
+                    if window is None:
+                        continue
+                    pair = self._make_pair(session, key, window, event)
+                    if pair is not None:
+                        pairs.append(pair)
+            self._start_session(None)
+        self._emit(pairs)
+        return pairs
+
+    def pop_pairs(self) -> list[KeyframePair]:
+        """on_pair 없이 모아 둔 쌍을 반환하고 비움"""
+        with self._lock:
+            pairs, self._ready = self._ready, []
+        return pairs
+
+    def _start_session(self, session: RecordingSession | None) -> None:
+        """이전 세션의 보관 프레임 해제 및 상태 초기화 (lock 보유 상태에서 호출)"""
+        if self._session is not None:
+            for key, window in self._windows.items():
+                self._unpin(self._session.frames_for(key), window.frames)
+        self._windows.clear()
+        if session is None:
+            self._pending.clear()
+        else:
+            # 첫 프레임보다 먼저 도착한 새 세션 이벤트만 유지
+            self._pending = [e for e in self._pending if e.timestamp >= session.start_time]
+        self._session = session
+
+    def _take_ready(
+        self, session: RecordingSession, key: int | None, window: _FrameIndex
+    ) -> list[KeyframePair]:
+        """After 프레임이 도착한 트리거의 쌍 생성 (lock 보유 상태에서 호출)"""
+        holding = self._button_down is not None and self._button_down()
+        pairs: list[KeyframePair] = []
+        waiting: list[InputEvent] = []
+        for event in self._pending:
+            if (
+                event.event_type == InputEventType.MOUSE_CLICK
+                and holding
+                and InputEventType.DRAG in self._trigger_events
+            ):
+                # DRAG로 이어질 수 있으므로 버튼을 놓을 때까지 보류
+                waiting.append(event)
+            elif event.event_type not in self._trigger_events:
+                continue  # 드래그로 이어지지 않은 누름 (트리거 아님)
+            elif session.monitor_at(event.x, event.y) != key:
+                waiting.append(event)
+            elif self._grouper is not None and not self._grouper.is_closed(
+                event, window.timestamps[-1]
+            ):
+                waiting.append(event)  # 입력 묶음이 더 이어질 수 있음
+            elif (after_frame := self._select_after_frame(event, window, final=False)) is None:
+                waiting.append(event)  # After 프레임이 아직 정해지지 않음
+            else:
+                pair = self._make_pair(session, key, window, event, after_frame)
+                if pair is not None:
+                    pairs.append(pair)
+        self._pending = waiting
+        return pairs
+
+    @staticmethod
+    def _unpin(frames: list[Frame] | FrameRingBuffer, removed: list[Frame]) -> None:
+        """보관하던 링 버퍼 프레임의 pin 해제"""
+        if isinstance(frames, FrameRingBuffer):
+            for frame in removed:
+                frames.unpin(frame)
+
+    def _emit(self, pairs: list[KeyframePair]) -> None:
+        """완성된 쌍 전달 (lock 밖에서 호출)"""
+        for pair in pairs:
+            self.emitted += 1
+            if self._on_pair is not None:
+                self._on_pair(pair)
+            else:
+                with self._lock:
+                    self._ready.append(pair)
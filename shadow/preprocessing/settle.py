@@ -0,0 +1,104 @@
+"""화면 안정 시점 기반 After 프레임 선택 모듈
+
+고정 지연(after_delay) 대신 트리거 이후 프레임 간 변화를 보고
+화면이 바뀐 뒤 settle_time 동안 더 변하지 않은 상태의 프레임을 After로 고릅니다.
+느린 앱은 렌더링이 끝날 때까지 기다리고, 빠른 앱은 불필요하게 기다리지 않습니다.
+"""
+
+from shadow.capture.models import Frame
+from shadow.preprocessing.diff import sample_change_mask
+
+
+def frame_difference(a: Frame, b: Frame, stride: int = 4, tolerance: int = 8) -> float:
+    """두 프레임에서 달라진 샘플 픽셀 비율
+
+    같은 이미지 버퍼를 공유하는 프레임(변화 감지로 참조 저장된 프레임)은 비교하지 않습니다.
+
+    Args:
+        a: 프레임
+        b: 비교할 프레임
+        stride: 샘플링 간격 (px)
+        tolerance: 같은 픽셀로 보는 채널 값 차이 (압축/안티앨리어싱 노이즈 무시)
+
+    Returns:
+        0~1 사이 비율 (해상도가 다르면 1)
+    """
+    image_a, image_b = a.rgb_view(), b.rgb_view()
+    if image_a.__array_interface__["data"][0] == image_b.__array_interface__["data"][0]:
+        return 0.0
+    if image_a.shape != image_b.shape:
+        return 1.0
+    return float(sample_change_mask(image_a, image_b, stride, tolerance).mean())
+
+
+class SettleDetector:
+    """화면이 안정된 첫 프레임 선택기
+
+    트리거 종료 시각 이후 프레임을 차례로 비교하여, 화면이 바뀐 뒤
+    settle_time 동안 변화가 없으면 마지막 변화가 나타난 프레임을 고릅니다.
+    - 첫 변화 전의 정지 구간은 느린 렌더링을 기다리는 것으로 보고 계속 기다림
+    - max_wait 동안 변화가 전혀 없으면 트리거 직후 첫 프레임 (변화 없음)
+    - max_wait까지 안정되지 않으면 그 안의 마지막 프레임
+    """
+
+    def __init__(
+        self,
+        settle_time: float = 0.3,
+        max_wait: float = 2.0,
+        threshold: float = 0.002,
+        stride: int = 4,
+    ):
+        """
+        Args:
+            settle_time: 안정으로 판단하는 무변화 시간 (초)
+            max_wait: 트리거 종료 후 최대 대기 시간 (초)
+            threshold: 변화로 판단하는 샘플 픽셀 비율
+            stride: 비교 샘플링 간격 (px)
+        """
+        self._settle_time = settle_time
+        self._max_wait = max(max_wait, settle_time)
+        self._threshold = threshold
+        self._stride = stride
+
+    @property
+    def max_wait(self) -> float:
+        """트리거 종료 후 최대 대기 시간 (초)"""
+        return self._max_wait
+
+    def select(
+        self, reference: Frame | None, frames: list[Frame], start: float, final: bool = True
+    ) -> Frame | None:
+        """After 프레임 선택
+
+        Args:
+            reference: 트리거 종료 시점의 화면 (start 이전 마지막 프레임, 없으면 None)
+            frames: start 이후 시간순 프레임 (start + max_wait 이후 프레임은 무시)
+            start: 트리거 종료 시각
+            final: 더 이상 프레임이 오지 않음 (False면 판단에 프레임이 더 필요할 때 None)
+
+        Returns:
+            선택된 프레임 (final=False에서 아직 판단할 수 없거나 프레임이 없으면 None)
+        """
+        deadline = start + self._max_wait
+        previous = reference
+        first: Frame | None = None  # 트리거 직후 첫 프레임
+        settled: Frame | None = None  # 마지막 변화가 나타난 프레임
+        last_change = start
+
+        for frame in frames:
+            if frame.timestamp > deadline:
+                # 최대 대기 시간 초과: 변화가 없었으면 첫 프레임, 아니면 마지막 프레임
+                return first if settled is None else previous
+            if first is None:
+                first = frame
+            if previous is None or (
+                frame_difference(previous, frame, self._stride) > self._threshold
+            ):
+                settled, last_change = frame, frame.timestamp
+            elif settled is not None and frame.timestamp - last_change >= self._settle_time:
+                return settled
+            previous = frame
+
+        if final:
+            return first if settled is None else settled
+        return None
@@ -0,0 +1,142 @@
+"""입력 묶음(burst) 기반 트리거 병합 모듈
+
+스크롤 틱이나 키 입력마다 키프레임 쌍을 만들면 쌍 수가 폭증합니다.
+한 번의 스크롤 제스처, 이어진 타이핑, 같은 단축키 반복을 논리 트리거 하나로 합쳐
+시작 시각(timestamp)의 Before 프레임과 종료 시각(end_timestamp) 이후의 After 프레임
+한 쌍만 만들도록 합니다.
+
+- MOUSE_SCROLL: scroll_gap초 이내로 이어진 같은 앱의 스크롤 (dx/dy 합산)
+- TEXT_ENTRY: typing_gap초 이내로 이어진 같은 앱의 입력 (text 이어 붙임)
+- KEY_PRESS: key_repeat_gap초 이내로 반복한 같은 키/단축키 (Cmd+Z 연타, 방향키 반복 등)
+
+수집기의 키 입력 병합(input_coalesce_keys)을 끄고 녹화한 세션의 개별 KEY_PRESS/KEY_RELEASE는
+KeystrokeCoalescer로 먼저 TEXT_ENTRY와 단축키 KEY_PRESS(modifiers 포함)로 바꿉니다
+(녹화 중 수집기와 같은 input_text_gap 사용).
+"""
+
+from collections.abc import Iterable
+from dataclasses import replace
+
+from shadow.capture.keystrokes import KeystrokeCoalescer
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+from shadow.capture.triggered import parse_trigger_events
+from shadow.config import settings
+
+# 키보드 트리거를 만들 때 함께 읽는 이벤트 타입
+KEYBOARD_EVENTS = frozenset(
+    {InputEventType.KEY_PRESS, InputEventType.KEY_RELEASE, InputEventType.TEXT_ENTRY}
+)
+
+
+class TriggerGrouper:
+    """연속 입력 묶음을 논리 트리거 하나로 병합
+
+    병합한 이벤트는 첫 이벤트의 timestamp/좌표를 유지하고 end_timestamp를 마지막 이벤트로 늘립니다.
+    클릭/드래그 등 다른 타입의 이벤트가 사이에 있으면 묶음이 끊깁니다.
+    """
+
+    def __init__(
+        self,
+        scroll_gap: float | None = None,
+        typing_gap: float | None = None,
+        key_repeat_gap: float | None = None,
+    ):
+        """
+        Args:
+            scroll_gap: 같은 스크롤 제스처로 보는 틱 간격 (초, None이면 설정 사용)
+            typing_gap: 같은 타이핑으로 보는 입력 간격 (초, None이면 설정 사용)
+            key_repeat_gap: 같은 키/단축키 반복으로 보는 간격 (초, None이면 설정 사용)
+        """
+        self._gaps = {
+            InputEventType.MOUSE_SCROLL: (
+                scroll_gap if scroll_gap is not None else settings.keyframe_scroll_gap
+            ),
+            InputEventType.TEXT_ENTRY: (
+                typing_gap if typing_gap is not None else settings.keyframe_typing_gap
+            ),
+            InputEventType.KEY_PRESS: (
+                key_repeat_gap if key_repeat_gap is not None else settings.keyframe_key_repeat_gap
+            ),
+        }
+
+    def gap_for(self, event: InputEvent) -> float | None:
+        """이벤트 타입의 묶음 간격 (병합하지 않는 타입이면 None)"""
+        return self._gaps.get(event.event_type)
+
+    def is_closed(self, event: InputEvent, now: float) -> bool:
+        """now 시점에 이벤트의 묶음이 더 이어질 수 없는지 확인 (녹화 중 추출용)"""
+        gap = self.gap_for(event)
+        return gap is None or now - (event.end_timestamp or event.timestamp) > gap
+
+    def continues(self, last: InputEvent, event: InputEvent) -> bool:
+        """event가 last 묶음에 이어지는지 확인"""
+        gap = self.gap_for(event)
+        if gap is None or event.event_type != last.event_type or event.app_name != last.app_name:
+            return False
+        if event.timestamp - (last.end_timestamp or last.timestamp) > gap:
+            return False
+        if event.event_type == InputEventType.KEY_PRESS:
+            return event.key == last.key and event.modifiers == last.modifiers
+        return True
+
+    @staticmethod
+    def merge(last: InputEvent, event: InputEvent) -> InputEvent:
+        """last 묶음에 event를 합친 새 이벤트"""
+        changes: dict = {"end_timestamp": event.end_timestamp or event.timestamp}
+        if event.event_type == InputEventType.MOUSE_SCROLL:
+            changes["dx"] = (last.dx or 0) + (event.dx or 0)
+            changes["dy"] = (last.dy or 0) + (event.dy or 0)
+        elif event.event_type == InputEventType.TEXT_ENTRY:
+            changes["text"] = (last.text or "") + (event.text or "")
+        return replace(last, **changes)
+
+    def group(self, events: Iterable[InputEvent]) -> list[InputEvent]:
+        """시간순 이벤트 목록의 입력 묶음 병합
+
+        Args:
+            events: 시간순 이벤트 (트리거 후보 타입만 골라 전달)
+
+        Returns:
+            병합된 이벤트 목록 (KEY_RELEASE와 modifier 키 입력은 사라짐)
+        """
+        grouped: list[InputEvent] = []
+        for event in self._coalesce_keys(events):
+            if grouped and self.continues(grouped[-1], event):
+                grouped[-1] = self.merge(grouped[-1], event)
+            else:
+                grouped.append(event)
+        return grouped
+
+    @staticmethod
+    def _coalesce_keys(events: Iterable[InputEvent]) -> list[InputEvent]:
+        """개별 KEY_PRESS/KEY_RELEASE를 TEXT_ENTRY와 단축키 KEY_PRESS로 변환
+
+        modifiers가 채워진 KEY_PRESS(수집기가 이미 병합한 단축키)와 다른 이벤트는 그대로 둡니다.
+        """
+        output: list[InputEvent] = []
+        window = WindowInfo(app_name="Unknown")
+
+        def window_lookup() -> WindowInfo:
+            return window
+
+        # 녹화 중 수집기와 같은 간격으로 끊어야 live/offline 세션의 TEXT_ENTRY가 같아짐
+        coalescer = KeystrokeCoalescer(output.append, window_lookup, gap=settings.input_text_gap)
+        for event in events:
+            raw_key = event.event_type in (
+                InputEventType.KEY_PRESS,
+                InputEventType.KEY_RELEASE,
+            ) and not event.modifiers
+            if not raw_key:
+                coalescer.flush()
+                output.append(event)
+                continue
+            window = event.window_info or WindowInfo(
+                app_name=event.app_name or "Unknown", window_title=event.window_title or "Unknown"
+            )
+            key = event.key or "unknown"
+            if event.event_type == InputEventType.KEY_PRESS:
+                coalescer.press(key, event.timestamp)
+            else:
+                coalescer.release(key, event.timestamp)
+        coalescer.flush()
+        return output
@@ -0,0 +1,11 @@
+-- Add text_entry input events (coalesced keystroke runs)
+
+ALTER TABLE input_events
+ADD COLUMN text TEXT;
+
+ALTER TABLE input_events
+DROP CONSTRAINT input_events_type_check;
+
+ALTER TABLE input_events
+ADD CONSTRAINT input_events_type_check
+CHECK (type IN ('mouse_click', 'mouse_move', 'key_press', 'key_release', 'scroll', 'text_entry'));
@@ -4,11 +4,16 @@
 - 통합 테스트: 실제 Claude API 호출 (pytest -m integration)
 """
 
+import io
+
 import numpy as np
 import pytest
+from PIL import Image
 
-from shadow.analysis import ClaudeAnalyzer, LabeledAction, create_analyzer
+from shadow.analysis import ClaudeAnalyzer, LabeledAction, NoChangeFilter, create_analyzer
 from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.config import settings
+from shadow.preprocessing.diff import compute_diff
 
 
 # =============================================================================
@@ -192,6 +197,164 @@ class TestClaudeAnalyzerParseResponse:
         assert result.description == response[:200]
 
 
+class TestPreparePairImages:
+    """BaseVisionAnalyzer._prepare_pair_images 테스트"""
+
+    @pytest.fixture
+    def analyzer(self, monkeypatch):
+        """Mock API 키로 analyzer 생성"""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        return ClaudeAnalyzer(api_key="test-key")
+
+    @staticmethod
+    def image_size(data: bytes) -> tuple[int, int]:
+        return Image.open(io.BytesIO(data)).size
+
+    def test_without_roi(self, analyzer, sample_keyframe_pair):
+        """ROI가 없으면 Before/After 전체 화면 2장"""
+        images = analyzer._prepare_pair_images(sample_keyframe_pair, max_size=1024)
+
+        assert [image.label for image in images] == ["Before", "After"]
+        assert self.image_size(images[0].data) == (100, 100)
+
+    def test_with_roi(self, analyzer, monkeypatch):
+        """ROI가 있으면 축소 전체 화면 + 원본 해상도 확대 영역 4장"""
+        monkeypatch.setattr(settings, "analysis_overview_size", 200)
+        image = np.zeros((600, 800, 3), dtype=np.uint8)
+        pair = KeyframePair(
+            before_frame=Frame(timestamp=1000.0, image=image),
+            after_frame=Frame(timestamp=1000.3, image=image),
+            trigger_event=InputEvent(
+                timestamp=1000.0, event_type=InputEventType.MOUSE_CLICK, x=400, y=300
+            ),
+            click_pos=(400, 300),
+            roi=(336, 236, 464, 364),
+        )
+
+        images = analyzer._prepare_pair_images(pair, max_size=1024)
+
+        assert [image.label for image in images] == ["Before", "Before 확대", "After", "After 확대"]
+        assert self.image_size(images[0].data) == (200, 150)
+        assert self.image_size(images[1].data) == (128, 128)
+
+
+class TestDescribeChanges:
+    """BaseVisionAnalyzer._describe_changes 테스트"""
+
+    def test_change_regions(self, sample_keyframe_pair):
+        """변화 영역은 화면 대비 백분율, 계산하지 않았으면 None"""
+        assert ClaudeAnalyzer._describe_changes(sample_keyframe_pair) is None
+
+        sample_keyframe_pair.diff = compute_diff(
+            sample_keyframe_pair.before_frame, sample_keyframe_pair.after_frame
+        )
+        assert ClaudeAnalyzer._describe_changes(sample_keyframe_pair) == (
+            "변화 영역: (0%, 0%)-(100%, 100%)"
+        )
+
+        sample_keyframe_pair.diff = compute_diff(
+            sample_keyframe_pair.before_frame, sample_keyframe_pair.before_frame
+        )
+        assert ClaudeAnalyzer._describe_changes(sample_keyframe_pair) == "화면 변화: 없음"
+
+
+class TestDescribeTrigger:
+    """BaseVisionAnalyzer._describe_trigger 테스트"""
+
+    def test_trigger_types(self):
+        """클릭 위치, 스크롤 양, 입력 텍스트, 단축키 문구"""
+        describe = ClaudeAnalyzer._describe_trigger
+        click = InputEvent(timestamp=1.0, event_type=InputEventType.MOUSE_CLICK, x=5, y=6)
+        scroll = InputEvent(timestamp=1.0, event_type=InputEventType.MOUSE_SCROLL, x=5, y=6, dy=-9)
+        typed = InputEvent(timestamp=1.0, event_type=InputEventType.TEXT_ENTRY, text="hi")
+        chord = InputEvent(
+            timestamp=1.0, event_type=InputEventType.KEY_PRESS, key="c", modifiers=["cmd"]
+        )
+        enter = InputEvent(timestamp=1.0, event_type=InputEventType.KEY_PRESS, key="enter")
+
+        assert describe(click) == "클릭 위치: (5, 6)"
+        assert describe(scroll) == "스크롤: (5, 6)에서 dx=0, dy=-9"
+        assert describe(typed) == '입력 텍스트: "hi"'
+        assert describe(chord) == "단축키: cmd+c"
+        assert describe(enter) == "키 입력: enter"
+
+
+class TestNoChangeFilter:
+    """NoChangeFilter 테스트"""
+
+    @staticmethod
+    def still_pair(timestamp: float) -> KeyframePair:
+        """Before/After가 같은 화면인 쌍"""
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        return KeyframePair(
+            before_frame=Frame(timestamp=timestamp, image=image),
+            after_frame=Frame(timestamp=timestamp + 0.3, image=image.copy()),
+            trigger_event=InputEvent(
+                timestamp=timestamp, event_type=InputEventType.MOUSE_CLICK, app_name="TestApp"
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pairs_skip_api(self, monkeypatch, sample_keyframe_pair):
+        """변화 없는 쌍은 API에 보내지 않고 원래 순서에 no_change 라벨"""
+        analyzer = ClaudeAnalyzer(api_key="test-key", no_change_filter=NoChangeFilter())
+        sent: list[list[KeyframePair]] = []
+
+        async def fake_chunk(batch, start_index):
+            sent.append(batch)
+            return [
+                LabeledAction(action="click", target="t", context="c", description="")
+                for _ in batch
+            ]
+
+        monkeypatch.setattr(analyzer, "_analyze_batch_chunk", fake_chunk)
+        pairs = [
+            self.still_pair(1.0),
+            sample_keyframe_pair,
+            self.still_pair(2.0),
+            sample_keyframe_pair,
+            self.still_pair(3.0),
+        ]
+
+        results = await analyzer.analyze_batch(pairs, batch_size=2)
+
+        assert [r.action for r in results] == [
+            "no_change", "click", "no_change", "click", "no_change"
+        ]
+        assert results[0].context == "TestApp"
+        assert sent == [[sample_keyframe_pair, sample_keyframe_pair]]
+        assert analyzer.no_change_filter.skipped_pairs == 3
+        assert analyzer.no_change_filter.skipped_calls == 2
+        assert analyzer.estimate_cost(pairs, batch_size=2)["api_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_unchanged(self):
+        """모두 변화가 없으면 분석 함수를 호출하지 않음"""
+        no_change_filter = NoChangeFilter()
+
+        async def analyze(pairs):
+            raise AssertionError("호출되면 안 됨")
+
+        results = await no_change_filter.run([self.still_pair(1.0)], analyze, batch_size=5)
+
+        assert [r.action for r in results] == ["no_change"]
+        assert no_change_filter.skipped_calls == 1
+
+    def test_checkbox_change_not_skipped(self):
+        """1080p 화면의 체크박스 크기 변화는 no_change로 판정하지 않음"""
+        before = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+        after = before.copy()
+        after[500:508, 900:908] = 0  # 8x8 px 체크 표시
+        pair = KeyframePair(
+            before_frame=Frame(timestamp=1.0, image=before),
+            after_frame=Frame(timestamp=1.3, image=after),
+            trigger_event=InputEvent(timestamp=1.0, event_type=InputEventType.MOUSE_CLICK),
+        )
+
+        assert not NoChangeFilter().is_unchanged(pair)
+        assert NoChangeFilter().is_unchanged(self.still_pair(1.0))
+
+
 class TestCreateAnalyzer:
     """create_analyzer 팩토리 함수 테스트"""
 
@@ -0,0 +1,180 @@
+"""캡처 백엔드 단위 테스트"""
+
+import time
+
+import numpy as np
+import pytest
+
+from shadow.capture.backends import ReplayBackend, SyntheticBackend
+from shadow.capture.input_events import InputEventCollector
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.capture.screen import ScreenCapture
+from shadow.capture.storage import SessionStorage
+
+
+def click(offset: float, x: int = 10, y: int = 10) -> InputEvent:
+    return InputEvent(timestamp=offset, event_type=InputEventType.MOUSE_CLICK, x=x, y=y)
+
+
+class TestSyntheticBackend:
+    """SyntheticBackend 테스트"""
+
+    def test_grab_returns_fresh_bgra_buffers(self):
+        """grab()은 설정한 해상도의 BGRA 배열을 매번 새로 반환"""
+        backend = SyntheticBackend(width=64, height=32, click_interval=None)
+        backend.open()
+
+        first, second = backend.grab(), backend.grab()
+
+        assert first.shape == (32, 64, 4)
+        assert first.dtype == np.uint8
+        assert first is not second
+        assert backend.monitor_info == {"left": 0, "top": 0, "width": 64, "height": 32}
+
+    def test_screen_changes_over_time(self):
+        """change_interval마다 화면 일부가 바뀜"""
+        backend = SyntheticBackend(
+            width=64, height=32, click_interval=None, change_interval=0.05, region_size=(8, 8)
+        )
+        backend.open()
+
+        before = backend.grab()
+        time.sleep(0.06)
+        after = backend.grab()
+
+        assert not np.array_equal(before, after)
+
+    def test_same_seed_same_screen(self):
+        """같은 seed면 같은 화면"""
+        a = SyntheticBackend(width=32, height=32, click_interval=None, seed=3)
+        b = SyntheticBackend(width=32, height=32, click_interval=None, seed=3)
+        a.open()
+        b.open()
+
+        assert np.array_equal(a.grab(), b.grab())
+
+    def test_scripted_events_are_emitted_on_time(self):
+        """스크립트 이벤트는 세션 시작 기준 시각으로 발생"""
+        backend = SyntheticBackend(width=16, height=16, events=[click(0.0), click(0.05, x=3)])
+        emitted: list[InputEvent] = []
+
+        backend.start_events(emitted.append)
+        started = time.time()
+        time.sleep(0.15)
+        backend.stop_events()
+
+        assert [e.x for e in emitted] == [10, 3]
+        assert emitted[1].timestamp - emitted[0].timestamp == pytest.approx(0.05, abs=1e-6)
+        assert emitted[0].timestamp == pytest.approx(started, abs=0.05)
+
+    def test_auto_clicks(self):
+        """events가 없으면 click_interval 간격 클릭 생성"""
+        backend = SyntheticBackend(width=100, height=50, click_interval=0.5, duration=2.0)
+        offsets = [offset for offset, _ in backend._player._script]
+
+        assert offsets == [0.5, 1.0, 1.5]
+        assert all(e.window_info is not None for _, e in backend._player._script)
+
+
+class TestSyntheticRecording:
+    """SyntheticBackend로 ScreenCapture/InputEventCollector/Recorder 실행"""
+
+    def test_screen_capture_uses_backend(self):
+        """ScreenCapture는 백엔드 화면을 RGB Frame으로 변환"""
+        capture = ScreenCapture(
+            fps=30, backend=SyntheticBackend(width=40, height=20, click_interval=None)
+        )
+
+        with capture.session():
+            frame = capture.capture_frame()
+
+        assert frame.image.shape == (20, 40, 3)
+        assert capture.monitor_info["width"] == 40
+
+    def test_collector_uses_event_source(self):
+        """event_source를 지정하면 pynput 없이 이벤트 수집"""
+        collector = InputEventCollector(
+            event_source=SyntheticBackend(width=16, height=16, events=[click(0.0)])
+        )
+
+        with collector:
+            events = collector.get_events(timeout=1.0)
+
+        assert [e.event_type for e in events] == [InputEventType.MOUSE_CLICK]
+
+    def test_recorder_with_synthetic_backend(self):
+        """Recorder가 합성 화면과 스크립트 클릭을 함께 녹화"""
+        backend = SyntheticBackend(
+            width=64, height=48, events=[click(0.1), click(0.2)], change_interval=0.05
+        )
+        recorder = Recorder(fps=20, buffer_seconds=0, backend=backend)
+
+        session = recorder.record(0.4)
+
+        assert len(session.frames) >= 3
+        assert len(session.events) == 2
+        assert session.frames[0].image.shape == (48, 64, 3)
+
+
+class TestReplayBackend:
+    """ReplayBackend 테스트"""
+
+    @pytest.fixture
+    def saved_session(self, tmp_path):
+        """키프레임 1쌍과 이벤트 2개가 저장된 세션"""
+        base = 1000.0
+        before = Frame(timestamp=base, image=np.full((12, 16, 3), 10, dtype=np.uint8))
+        after = Frame(timestamp=base + 0.2, image=np.full((12, 16, 3), 200, dtype=np.uint8))
+        events = [
+            click(base + 0.1),
+            InputEvent(
+                timestamp=base + 0.3,
+                event_type=InputEventType.TEXT_ENTRY,
+                text="hi",
+                end_timestamp=base + 0.35,
+                app_name="Editor",
+                window_title="notes.txt",
+            ),
+        ]
+        session = RecordingSession(frames=[before, after], events=events)
+        pair = KeyframePair(before_frame=before, after_frame=after, trigger_event=events[0])
+        return SessionStorage(tmp_path).save_session(session, [pair], name="replay")
+
+    def test_replays_frames_by_time(self, saved_session):
+        """재생 시점 직전 키프레임 반환 (RGB -> BGRA)"""
+        backend = ReplayBackend(saved_session, speed=2.0)
+        backend.open()
+
+        first = backend.grab()
+        time.sleep(0.15)  # 원본 기준 0.3초 경과
+        second = backend.grab()
+
+        assert first.shape == (12, 16, 4)
+        assert first[0, 0, 0] == 10
+        assert second[0, 0, 0] == 200
+        assert backend.duration == pytest.approx(0.15)
+
+    def test_replays_events(self, saved_session):
+        """events.json 이벤트를 원래 간격(speed배)으로 재발생"""
+        backend = ReplayBackend(saved_session, speed=4.0)
+        emitted: list[InputEvent] = []
+
+        backend.start_events(emitted.append)
+        time.sleep(0.2)
+        backend.stop_events()
+
+        assert [e.event_type for e in emitted] == [
+            InputEventType.MOUSE_CLICK,
+            InputEventType.TEXT_ENTRY,
+        ]
+        assert emitted[1].timestamp - emitted[0].timestamp == pytest.approx(0.05, abs=1e-6)
+        assert emitted[1].end_timestamp - emitted[1].timestamp == pytest.approx(0.0125, abs=1e-6)
+        assert emitted[1].window_info.app_name == "Editor"
+
+    def test_invalid_arguments(self, tmp_path, saved_session):
+        """speed <= 0 또는 키프레임 없는 디렉토리는 ValueError"""
+        with pytest.raises(ValueError):
+            ReplayBackend(saved_session, speed=0)
+        with pytest.raises(ValueError):
+            ReplayBackend(tmp_path)
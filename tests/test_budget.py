@@ -0,0 +1,162 @@
+"""분석 예산 내 키프레임 쌍 선택 테스트"""
+
+from datetime import datetime
+
+import numpy as np
+
+from shadow.analysis.claude import ClaudeAnalyzer
+from shadow.analysis.prefilter import NoChangeFilter
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.recorder import RecordingSession
+from shadow.capture.storage import SessionStorage
+from shadow.preprocessing.budget import BudgetSelector
+from shadow.preprocessing.dedup import dhash
+
+
+def make_pair(
+    timestamp: float,
+    pattern: int,
+    changed_rows: int = 0,
+    app: str = "Web",
+    title: str = "Home",
+) -> KeyframePair:
+    """pattern번 줄무늬 화면에서 위쪽 changed_rows줄이 바뀐 쌍"""
+    before = np.zeros((64, 64, 3), dtype=np.uint8)
+    before[:, pattern * 4 : pattern * 4 + 8] = 200
+    after = before.copy()
+    after[:changed_rows] = 255 - after[:changed_rows]
+    return KeyframePair(
+        before_frame=Frame(timestamp=timestamp, image=before),
+        after_frame=Frame(timestamp=timestamp + 0.3, image=after),
+        trigger_event=InputEvent(
+            timestamp=timestamp,
+            event_type=InputEventType.MOUSE_CLICK,
+            x=10,
+            y=10,
+            app_name=app,
+            window_title=title,
+        ),
+    )
+
+
+def flat_cost(pair: KeyframePair) -> tuple[int, float]:
+    return 100, 0.01
+
+
+class TestBudgetSelector:
+    """BudgetSelector 테스트"""
+
+    def test_score_components(self):
+        """변화량, 앱/창 전환, 처음 보는 화면일수록 점수가 높음"""
+        pairs = [
+            make_pair(1.0, 0, changed_rows=8),
+            make_pair(2.0, 0, changed_rows=8),  # 같은 화면 반복
+            make_pair(3.0, 0, changed_rows=8, title="Settings"),  # 창 전환
+            make_pair(4.0, 0, changed_rows=64, title="Settings"),  # 큰 변화
+            make_pair(5.0, 0, title="Settings"),  # 변화 없음
+        ]
+
+        scores = BudgetSelector(max_cost_usd=1.0).score(pairs)
+
+        assert scores[0] > scores[1]
+        assert scores[2] > scores[1]
+        assert scores[3] > scores[1]
+        assert scores[4] < scores[1]
+
+    def test_select_under_cost_cap(self):
+        """상한 안에서 점수가 높은 쌍부터 고르고 두 목록 모두 시간순 유지"""
+        pairs = [
+            make_pair(1.0, 0, changed_rows=8),
+            make_pair(2.0, 0, changed_rows=8),
+            make_pair(3.0, 0, changed_rows=8, app="Mail"),
+            make_pair(4.0, 0, app="Mail"),
+        ]
+
+        selection = BudgetSelector(max_cost_usd=0.025).select(pairs, flat_cost)
+
+        assert selection.selected == [pairs[0], pairs[2]]
+        assert selection.deferred == [pairs[1], pairs[3]]
+        assert selection.tokens == 200
+        assert abs(selection.cost_usd - 0.02) < 1e-9
+
+    def test_cheaper_pairs_fill_remaining_budget(self):
+        """상한을 넘는 쌍은 건너뛰고 남은 예산을 더 싼 쌍으로 채움"""
+        pairs = [make_pair(1.0, 0, changed_rows=64), make_pair(2.0, 4, changed_rows=2)]
+        costs = {id(pairs[0]): (900, 0.1), id(pairs[1]): (100, 0.01)}
+
+        selection = BudgetSelector(max_tokens=500).select(pairs, lambda p: costs[id(p)])
+
+        assert selection.selected == [pairs[1]]
+        assert selection.deferred == [pairs[0]]
+
+    def test_unlimited(self):
+        """상한이 없으면 모든 쌍 선택"""
+        pairs = [make_pair(1.0, 0), make_pair(2.0, 0)]
+        selector = BudgetSelector(max_cost_usd=0, max_tokens=0)
+
+        selection = selector.select(pairs, flat_cost)
+
+        assert not selector.limited
+        assert selection.selected == pairs
+        assert selection.deferred == []
+
+    def test_novelty_is_min_distance_to_earlier_pairs(self):
+        """처음 보는 화면 점수는 앞선 쌍들과의 최소 해밍 거리 (첫 쌍은 1)"""
+        pairs = [make_pair(float(i), pattern) for i, pattern in enumerate([0, 5, 0, 9, 5, 12])]
+        hashes = [int(dhash(pair.after_frame)) for pair in pairs]
+        expected = [1.0] + [
+            min(bin(hashes[i] ^ earlier).count("1") for earlier in hashes[:i]) / 64.0
+            for i in range(1, len(pairs))
+        ]
+
+        novelty = BudgetSelector._novelty(pairs)
+
+        assert novelty.tolist() == expected
+        assert novelty[2] == 0.0  # 첫 화면 반복
+
+    def test_unchanged_pair_costs_nothing(self):
+        """변화 없음으로 로컬 처리할 쌍은 예산을 쓰지 않음"""
+        analyzer = ClaudeAnalyzer(api_key="test-key", no_change_filter=NoChangeFilter())
+
+        assert analyzer.estimate_pair_cost(make_pair(1.0, 0)) == (0, 0.0)
+        tokens, usd = analyzer.estimate_pair_cost(make_pair(1.0, 0, changed_rows=8))
+        assert tokens > 0 and usd > 0
+
+
+class TestDeferredStorage:
+    """미룬 쌍 저장/로드 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        """save_deferred로 저장한 쌍을 같은 이미지와 트리거로 복원"""
+        pairs = [make_pair(1.0, 0, changed_rows=8), make_pair(2.0, 4, app="Mail")]
+        storage = SessionStorage(tmp_path)
+
+        session_dir = storage.save_deferred(pairs, name="session-1")
+        loaded = storage.load_deferred(session_dir)
+
+        assert session_dir == tmp_path / "session-1"
+        assert len(loaded) == 2
+        for original, restored in zip(pairs, loaded):
+            assert np.array_equal(restored.before_frame.image, original.before_frame.image)
+            assert np.array_equal(restored.after_frame.image, original.after_frame.image)
+            assert restored.after_frame.timestamp == original.after_frame.timestamp
+            assert restored.trigger_event.event_type == InputEventType.MOUSE_CLICK
+            assert restored.trigger_event.app_name == original.trigger_event.app_name
+
+        # 다시 저장하면 이전 목록을 교체
+        storage.save_deferred(pairs[:1], name="session-1")
+        assert len(storage.load_deferred(session_dir)) == 1
+
+    def test_saved_next_to_recorded_session(self, tmp_path):
+        """녹화 시작 시각 기반 이름으로 세션과 같은 디렉토리에 백그라운드 저장"""
+        session = RecordingSession(start_time=datetime(2026, 3, 1, 9, 30, 15).timestamp())
+        storage = SessionStorage(tmp_path)
+        session_dir = storage.save_session(session, [], name=None)
+
+        handle = storage.save_deferred_background(
+            [make_pair(1.0, 0, changed_rows=8)], SessionStorage.session_name(session)
+        )
+
+        assert session_dir == tmp_path / "session_20260301_093015"
+        assert handle.path == session_dir
+        assert len(storage.load_deferred(handle.result(timeout=10))) == 1
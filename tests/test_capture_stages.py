@@ -0,0 +1,202 @@
+"""StageQueue / CapturePipeline 단위 테스트"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.rate import AdaptiveRateController
+from shadow.capture.scheduler import CaptureStats
+from shadow.capture.screen import ScreenCapture
+from shadow.capture.stages import BackpressurePolicy, CapturePipeline, StageQueue
+
+
+class FakeScreenCapture(ScreenCapture):
+    """mss 없이 합성 BGRA 버퍼를 반환하는 ScreenCapture"""
+
+    def __init__(self, fps: int = 100, fail_session: bool = False):
+        super().__init__(monitor=1, fps=fps, detect_changes=True)
+        self.fail_session = fail_session
+        self.grab_threads: set[str] = set()
+        self._counter = 0
+
+    @contextmanager
+    def session(self):
+        if self.fail_session:
+            raise RuntimeError("세션 시작 실패")
+        self._reset_change_detection()
+        self._stats = CaptureStats()
+        yield self
+
+    def _grab(self):
+        self.grab_threads.add(threading.current_thread().name)
+        self._counter += 1
+        # 2프레임마다 화면 변경
+        return np.full((8, 8, 4), self._counter // 2 % 256, dtype=np.uint8)
+
+
+class TestStageQueue:
+    """StageQueue backpressure 정책 테스트"""
+
+    def test_drop_newest_keeps_existing_items(self):
+        """DROP_NEWEST: 가득 차면 새 항목을 버림"""
+        queue = StageQueue(2, BackpressurePolicy.DROP_NEWEST)
+
+        assert queue.put(1) == 0
+        assert queue.put(2) == 0
+        assert queue.put(3) == 1
+
+        queue.close()
+        assert [queue.get(), queue.get(), queue.get()] == [1, 2, None]
+        assert queue.dropped == 1
+
+    def test_drop_oldest_keeps_latest_items(self):
+        """DROP_OLDEST: 가득 차면 가장 오래된 항목을 버림"""
+        queue = StageQueue(2, BackpressurePolicy.DROP_OLDEST)
+        for i in range(5):
+            queue.put(i)
+
+        queue.close()
+        assert [queue.get(), queue.get(), queue.get()] == [3, 4, None]
+        assert queue.dropped == 3
+
+    def test_block_waits_for_consumer(self):
+        """BLOCK: 소비자가 꺼낼 때까지 생산자 대기"""
+        queue = StageQueue(1, BackpressurePolicy.BLOCK)
+        queue.put(1)
+        done = threading.Event()
+
+        def produce():
+            queue.put(2)
+            done.set()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        assert not done.wait(timeout=0.05)
+
+        assert queue.get() == 1
+        thread.join(timeout=1.0)
+        assert done.is_set()
+        assert queue.get() == 2
+        assert queue.dropped == 0
+
+    def test_put_after_close_is_dropped(self):
+        """close() 이후 추가는 버려짐"""
+        queue = StageQueue(2)
+        queue.close()
+
+        assert queue.put(1) == 1
+        assert queue.get() is None
+
+    def test_invalid_maxsize_raises(self):
+        """maxsize가 1 미만이면 에러"""
+        with pytest.raises(ValueError):
+            StageQueue(0)
+
+
+class TestCapturePipeline:
+    """CapturePipeline 스레드 구성 테스트"""
+
+    def test_frames_flow_to_sink_in_order(self):
+        """grab한 프레임이 순서대로 sink에 전달"""
+        capture = FakeScreenCapture()
+        frames = []
+        pipeline = CapturePipeline(capture, sink=frames.append)
+
+        pipeline.start()
+        time.sleep(0.1)
+        pipeline.stop()
+
+        assert len(frames) > 0
+        timestamps = [f.timestamp for f in frames]
+        assert timestamps == sorted(timestamps)
+        assert not pipeline.is_running
+        assert capture.stats.captured_frames == len(frames)
+
+    def test_grab_runs_on_dedicated_thread(self):
+        """grab은 파이프라인의 grab 스레드에서만 실행"""
+        capture = FakeScreenCapture()
+        pipeline = CapturePipeline(capture, sink=lambda frame: None)
+
+        pipeline.start()
+        time.sleep(0.05)
+        pipeline.stop()
+
+        assert capture.grab_threads == {"capture-grab"}
+
+    def test_slow_sink_drops_at_grab_queue(self):
+        """sink가 느리면 grab 큐에서 버려지고 grab 주기는 유지"""
+        capture = FakeScreenCapture(fps=200)
+        frames = []
+
+        def slow_sink(frame):
+            time.sleep(0.02)
+            frames.append(frame)
+
+        pipeline = CapturePipeline(capture, sink=slow_sink, queue_size=2)
+        pipeline.start()
+        time.sleep(0.2)
+        pipeline.stop()
+
+        assert capture.stats.queue_dropped > 0
+        # 변환된 프레임은 sink 큐(BLOCK)에서 버려지지 않음
+        assert len(frames) == capture.stats.captured_frames
+
+    def test_writes_into_ring_buffer(self):
+        """링 버퍼를 지정하면 변환 단계에서 슬롯에 직접 기록"""
+        capture = FakeScreenCapture()
+        buffer = FrameRingBuffer(4)
+        pipeline = CapturePipeline(capture, sink=lambda frame: None, buffer=buffer)
+
+        pipeline.start()
+        time.sleep(0.1)
+        pipeline.stop()
+
+        assert 0 < len(buffer) <= 4
+        assert buffer[-1].image.shape == (8, 8, 3)
+
+    def test_session_error_propagates_from_start(self):
+        """캡처 세션을 열지 못하면 start()에서 예외 발생"""
+        pipeline = CapturePipeline(FakeScreenCapture(fail_session=True), sink=lambda f: None)
+
+        with pytest.raises(RuntimeError, match="세션 시작 실패"):
+            pipeline.start()
+        assert not pipeline.is_running
+
+    def test_cannot_start_twice(self):
+        """파이프라인은 한 번만 시작 가능"""
+        pipeline = CapturePipeline(FakeScreenCapture(), sink=lambda frame: None)
+        pipeline.start()
+        pipeline.stop()
+
+        with pytest.raises(RuntimeError):
+            pipeline.start()
+
+    def test_rate_controller_adjusts_capture_fps(self):
+        """rate_controller가 있으면 grab 주기마다 FPS 조절"""
+        capture = FakeScreenCapture(fps=100)
+        controller = AdaptiveRateController(min_fps=20, max_fps=100, release_half_life=0.01)
+        pipeline = CapturePipeline(capture, sink=lambda frame: None, rate_controller=controller)
+
+        pipeline.start()
+        time.sleep(0.2)
+        pipeline.stop()
+
+        # 화면이 절반만 바뀌므로 상한보다 낮은 FPS로 수렴
+        assert 20 <= capture.stats.current_fps < 100
+        assert capture.current_fps == pytest.approx(capture.stats.current_fps)
+
+    def test_stop_wakes_sleeping_grab(self):
+        """낮은 FPS로 대기 중이어도 stop()은 바로 반환"""
+        capture = FakeScreenCapture(fps=1)
+        pipeline = CapturePipeline(capture, sink=lambda frame: None)
+        pipeline.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        pipeline.stop()
+
+        assert time.monotonic() - started < 0.5
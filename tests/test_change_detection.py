@@ -0,0 +1,101 @@
+"""FrameChangeDetector 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.capture.backends import SyntheticBackend
+from shadow.capture.change import FrameChangeDetector
+from shadow.capture.screen import ScreenCapture
+from shadow.config import settings
+
+
+def make_bgra(value: int = 0) -> np.ndarray:
+    return np.full((64, 64, 4), value, dtype=np.uint8)
+
+
+class TestFrameChangeDetector:
+    """다운샘플 체크섬 변화 감지 테스트"""
+
+    def test_identical_frames_are_unchanged(self):
+        """같은 화면은 변화 없음으로 판단"""
+        detector = FrameChangeDetector(stride=4)
+        detector.commit(detector.signature(make_bgra(10)))
+
+        assert detector.is_unchanged(detector.signature(make_bgra(10)))
+
+    def test_changed_region_is_detected(self):
+        """샘플링 격자에 걸리는 변화는 감지"""
+        detector = FrameChangeDetector(stride=4)
+        detector.commit(detector.signature(make_bgra()))
+
+        changed = make_bgra()
+        changed[8:16, 8:16, :3] = 255
+
+        assert not detector.is_unchanged(detector.signature(changed))
+
+    def test_alpha_channel_is_ignored(self):
+        """알파 채널만 다른 경우는 변화 없음"""
+        detector = FrameChangeDetector(stride=1)
+        detector.commit(detector.signature(make_bgra()))
+
+        changed = make_bgra()
+        changed[:, :, 3] = 255
+
+        assert detector.is_unchanged(detector.signature(changed))
+
+    def test_reset_forgets_last_signature(self):
+        """reset() 후 첫 프레임은 항상 변화로 판단"""
+        detector = FrameChangeDetector()
+        signature = detector.signature(make_bgra())
+        detector.commit(signature)
+        detector.reset()
+
+        assert not detector.is_unchanged(signature)
+
+    def test_invalid_stride_raises(self):
+        """stride가 1 미만이면 에러"""
+        with pytest.raises(ValueError):
+            FrameChangeDetector(stride=0)
+
+    def test_changed_ratio_measures_area(self):
+        """changed_ratio는 기록된 프레임 대비 바뀐 샘플 비율 (기록 전에는 1.0)"""
+        detector = FrameChangeDetector(stride=1)
+        detector.signature(make_bgra())
+        assert detector.changed_ratio() == 1.0
+        detector.commit(detector.signature(make_bgra()))
+
+        caret = make_bgra()
+        caret[10:18, 20:21, :3] = 255  # 1x8 커서
+        detector.signature(caret)
+        assert detector.changed_ratio() == pytest.approx(8 / (64 * 64))
+
+        window = make_bgra()
+        window[:32, :, :3] = 255
+        detector.signature(window)
+        assert detector.changed_ratio() == pytest.approx(0.5)
+
+
+class TestCaptureChangeArea:
+    """캡처 단계의 작은 변화 집계 테스트"""
+
+    def test_small_changes_counted_as_minor(self, monkeypatch):
+        """바뀐 영역이 capture_min_change_area 미만이면 저장은 하되 minor_changes로 집계"""
+        monkeypatch.setattr(settings, "capture_min_change_area", 0.05)
+        capture = ScreenCapture(
+            fps=10,
+            detect_changes=True,
+            backend=SyntheticBackend(width=64, height=64, click_interval=None),
+        )
+        caret = make_bgra()
+        caret[8:24, 0:4, :3] = 255  # 샘플 256개 중 4개 변화
+        window = make_bgra()
+        window[:32, :, :3] = 255
+
+        first = capture.process_frame(make_bgra(), 1.0)
+        small = capture.process_frame(caret, 1.1)
+        large = capture.process_frame(window, 1.2)
+
+        assert small is not None and small.rgb_view() is not first.rgb_view()
+        assert large is not None
+        assert capture.stats.minor_changes == 1
+        assert capture.stats.unchanged_frames == 0
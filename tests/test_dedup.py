@@ -0,0 +1,118 @@
+"""키프레임 쌍 중복 제거 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.analysis.models import LabeledAction
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.preprocessing.dedup import KeyframeDeduplicator, dhash, expand_labels, hamming
+
+
+def screen(seed: int, timestamp: float = 0.0) -> Frame:
+    """seed마다 다른 무늬의 화면"""
+    rng = np.random.default_rng(seed)
+    return Frame(timestamp=timestamp, image=rng.integers(0, 256, (72, 96, 3), dtype=np.uint8))
+
+
+def pair(
+    timestamp: float, before: Frame, after: Frame, x: int = 100, y: int = 100, app: str = "Web"
+) -> KeyframePair:
+    event = InputEvent(
+        timestamp=timestamp, event_type=InputEventType.MOUSE_CLICK, x=x, y=y, app_name=app
+    )
+    return KeyframePair(before_frame=before, after_frame=after, trigger_event=event)
+
+
+@pytest.fixture
+def dedup() -> KeyframeDeduplicator:
+    return KeyframeDeduplicator(hash_distance=6, click_radius=24, double_click=0.5)
+
+
+class TestDhash:
+    """dhash 테스트"""
+
+    def test_same_screen_same_hash(self):
+        """같은 화면은 같은 해시, 약간의 노이즈는 가까운 해시"""
+        a = screen(1)
+        noisy_image = np.clip(a.image.astype(int) + 2, 0, 255).astype(np.uint8)
+        noisy = Frame(timestamp=0.0, image=noisy_image)
+
+        assert dhash(a) == dhash(screen(1))
+        assert hamming(dhash(a), dhash(noisy)) <= 2
+
+    def test_different_screens_far_apart(self):
+        """다른 화면은 해시 거리가 큼"""
+        assert hamming(dhash(screen(1)), dhash(screen(2))) > 10
+
+
+class TestKeyframeDeduplicator:
+    """KeyframeDeduplicator 테스트"""
+
+    def test_repeated_clicks_collapse(self, dedup):
+        """같은 위치에서 같은 변화를 낸 연속 클릭은 하나로 합치고 횟수 기록"""
+        form, saved = screen(1), screen(2)
+        pairs = [
+            pair(1.0, form, saved),
+            pair(3.0, screen(1), screen(2), x=110, y=95),
+            pair(5.0, screen(1), screen(2), x=104, y=100),
+        ]
+
+        kept, dropped = dedup.split(pairs)
+
+        assert len(kept) == 1
+        assert kept[0].multiplicity == 3
+        assert kept[0].before_frame is form
+        assert dropped == pairs[1:]
+
+    def test_double_click_collapses_despite_before(self, dedup):
+        """더블 클릭은 사이 화면(Before)이 달라도 합침"""
+        pairs = [pair(1.0, screen(1), screen(3)), pair(1.2, screen(2), screen(3))]
+
+        assert [p.multiplicity for p in dedup.dedup(pairs)] == [2]
+
+    def test_distinct_actions_kept(self, dedup):
+        """위치, 결과, 앱이 다르면 합치지 않음"""
+        pairs = [
+            pair(1.0, screen(1), screen(2)),
+            pair(3.0, screen(1), screen(2), x=400),
+            pair(5.0, screen(1), screen(4), x=400),
+            pair(7.0, screen(1), screen(4), x=400, app="Mail"),
+        ]
+
+        assert [p.multiplicity for p in dedup.dedup(pairs)] == [1, 1, 1, 1]
+
+    def test_only_consecutive_pairs_collapse(self, dedup):
+        """사이에 다른 동작이 있으면 합치지 않아 순서 유지"""
+        pairs = [
+            pair(1.0, screen(1), screen(2)),
+            pair(3.0, screen(2), screen(5), x=300),
+            pair(5.0, screen(1), screen(2)),
+        ]
+
+        assert len(dedup.dedup(pairs)) == 3
+
+
+class TestExpandLabels:
+    """expand_labels 테스트"""
+
+    def test_labels_repeated_by_multiplicity(self, dedup):
+        """합친 쌍의 라벨을 반복하여 원래 동작 수 복원"""
+        pairs = dedup.dedup(
+            [pair(1.0, screen(1), screen(2)), pair(1.1, screen(1), screen(2))]
+            + [pair(4.0, screen(3), screen(4), x=500)]
+        )
+        labels = [
+            LabeledAction(action="click", target="저장", context="Web", description="저장"),
+            LabeledAction(action="click", target="닫기", context="Web", description="닫기"),
+        ]
+
+        expanded = expand_labels(pairs, labels)
+
+        assert [label.target for label in expanded] == ["저장", "저장", "닫기"]
+        assert expanded[0] is labels[0]
+        assert expanded[1].id != expanded[0].id
+
+    def test_mismatched_counts(self):
+        """쌍과 라벨 수가 다르면 ValueError"""
+        with pytest.raises(ValueError):
+            expand_labels([pair(1.0, screen(1), screen(2))], [])
@@ -0,0 +1,96 @@
+"""Before/After 변화 영역 계산 테스트"""
+
+import numpy as np
+
+from shadow.capture.models import Frame, InputEvent, InputEventType
+from shadow.capture.recorder import RecordingSession
+from shadow.preprocessing.diff import compute_diff
+from shadow.preprocessing.keyframe import KeyframeExtractor
+
+
+def blank(timestamp: float = 0.0, width: int = 160, height: int = 120) -> Frame:
+    """회색 화면"""
+    return Frame(timestamp=timestamp, image=np.full((height, width, 3), 128, dtype=np.uint8))
+
+
+def painted(
+    frame: Frame, *regions: tuple[int, int, int, int], timestamp: float = 0.3
+) -> Frame:
+    """frame의 복사본에서 regions (left, top, right, bottom)를 흰색으로 칠한 화면"""
+    image = frame.image.copy()
+    for left, top, right, bottom in regions:
+        image[top:bottom, left:right] = 255
+    return Frame(timestamp=timestamp, image=image)
+
+
+class TestComputeDiff:
+    """compute_diff 테스트"""
+
+    def test_no_change(self):
+        """내용이 같거나 버퍼를 공유하면 변화 영역 없음"""
+        before = blank()
+
+        for after in (blank(0.3), before.reference(0.3)):
+            diff = compute_diff(before, after)
+            assert not diff.changed
+            assert diff.bbox is None
+            assert diff.changed_ratio == 0.0
+            assert not diff.mask.any()
+
+    def test_separate_regions(self):
+        """떨어진 변화는 영역별 상자, 넓은 순으로 정렬"""
+        before = blank()
+        after = painted(before, (8, 8, 24, 20), (96, 64, 144, 112))
+
+        diff = compute_diff(before, after, cell=16, stride=4)
+
+        assert diff.boxes == [(96, 64, 144, 112), (0, 0, 32, 32)]
+        assert diff.bbox == (0, 0, 144, 112)
+        assert diff.mask.shape == (8, 10)
+        assert 0.0 < diff.changed_ratio < 0.2
+
+    def test_nearby_changes_merge(self):
+        """대각선으로 이웃한 칸의 변화는 한 영역"""
+        before = blank()
+        after = painted(before, (0, 0, 16, 16), (16, 16, 32, 32), (32, 32, 48, 48))
+
+        assert compute_diff(before, after, cell=16, stride=4).boxes == [(0, 0, 48, 48)]
+
+    def test_edge_cells_clipped(self):
+        """프레임 가장자리 칸의 상자는 프레임 크기로 자름"""
+        before = blank(width=100, height=50)
+        after = painted(before, (90, 40, 100, 50))
+
+        assert compute_diff(before, after, cell=16, stride=4).boxes == [(80, 32, 100, 50)]
+
+    def test_noise_ignored(self):
+        """tolerance 이하의 작은 값 차이는 변화로 보지 않음"""
+        before = blank()
+        after = Frame(timestamp=0.3, image=before.image + 3)
+
+        assert not compute_diff(before, after).changed
+
+    def test_resolution_change(self):
+        """해상도가 다르면 After 화면 전체가 변화 영역"""
+        diff = compute_diff(blank(), blank(0.3, width=80, height=60))
+
+        assert diff.boxes == [(0, 0, 80, 60)]
+        assert diff.changed_ratio == 1.0
+
+
+class TestKeyframeDiff:
+    """키프레임 추출 시 변화 영역 계산 테스트"""
+
+    def test_pairs_carry_diff(self):
+        """추출한 쌍에 Before/After 변화 영역이 붙음"""
+        first = blank(100.0)
+        frames = [first, first.reference(100.1), painted(first, (40, 40, 80, 60), timestamp=100.4)]
+        click = InputEvent(timestamp=100.05, event_type=InputEventType.MOUSE_CLICK, x=50, y=50)
+        session = RecordingSession(frames=frames, events=[click])
+
+        pairs = KeyframeExtractor(roi_size=0, diff=True).extract_pairs(session)
+        plain = KeyframeExtractor(roi_size=0, diff=False).extract_pairs(session)
+
+        assert pairs[0].diff is not None
+        assert pairs[0].diff.bbox == (32, 32, 80, 64)
+        assert plain[0].diff is None
@@ -0,0 +1,142 @@
+"""EventLog / EventCursor 단위 테스트"""
+
+import threading
+
+import pytest
+
+from shadow.capture.event_log import EventLog
+from shadow.capture.models import InputEvent, InputEventType
+
+
+def click(i: int) -> InputEvent:
+    """순번 확인용 클릭 이벤트 (x = i)"""
+    return InputEvent(timestamp=float(i), event_type=InputEventType.MOUSE_CLICK, x=i, y=0)
+
+
+class TestEventLog:
+    """EventLog 기본 기능 테스트"""
+
+    def test_append_returns_sequence_numbers(self):
+        """append()는 0부터 증가하는 순번 반환"""
+        log = EventLog(chunk_size=2)
+
+        assert [log.append(click(i)) for i in range(5)] == [0, 1, 2, 3, 4]
+        assert log.next_seq == 5
+        assert len(log) == 5
+
+    def test_read_across_chunks(self):
+        """chunk 경계를 넘어 읽기"""
+        log = EventLog(chunk_size=3)
+        for i in range(10):
+            log.append(click(i))
+
+        events, start = log.read(2, limit=6)
+
+        assert start == 2
+        assert [e.x for e in events] == [2, 3, 4, 5, 6, 7]
+
+    def test_read_is_not_destructive(self):
+        """읽어도 로그는 그대로"""
+        log = EventLog()
+        log.append(click(0))
+
+        log.read(0)
+        events, _ = log.read(0)
+
+        assert len(events) == 1
+
+    def test_retention_drops_oldest(self):
+        """max_events를 넘으면 가장 오래된 이벤트부터 제외"""
+        log = EventLog(chunk_size=2, max_events=3)
+        for i in range(7):
+            log.append(click(i))
+
+        events, start = log.read(0)
+
+        assert start == 4
+        assert [e.x for e in events] == [4, 5, 6]
+        assert log.dropped == 4
+        # 완전히 밀려난 chunk는 해제
+        assert len(log._chunks) <= 3
+
+    def test_invalid_arguments(self):
+        """잘못된 크기는 에러"""
+        with pytest.raises(ValueError):
+            EventLog(chunk_size=0)
+        with pytest.raises(ValueError):
+            EventLog(max_events=0)
+
+
+class TestEventCursor:
+    """EventCursor 테스트"""
+
+    def test_independent_cursors(self):
+        """커서마다 독립적으로 읽음"""
+        log = EventLog()
+        first = log.cursor()
+        for i in range(3):
+            log.append(click(i))
+        second = log.cursor()
+        log.append(click(3))
+
+        assert [e.x for e in first.read()] == [0, 1, 2, 3]
+        assert [e.x for e in second.read()] == [0, 1, 2, 3]
+        assert first.read() == []
+
+    def test_cursor_from_end_reads_only_new_events(self):
+        """from_start=False 커서는 이후 이벤트만"""
+        log = EventLog()
+        log.append(click(0))
+        cursor = log.cursor(from_start=False)
+        log.append(click(1))
+
+        assert [e.x for e in cursor.read()] == [1]
+
+    def test_lagging_cursor_counts_missed(self):
+        """보관 범위 밖으로 밀려난 이벤트는 missed로 집계"""
+        log = EventLog(max_events=2)
+        cursor = log.cursor()
+        for i in range(5):
+            log.append(click(i))
+
+        assert cursor.pending == 2
+        assert [e.x for e in cursor.read()] == [3, 4]
+        assert cursor.missed == 3
+
+    def test_read_limit(self):
+        """limit만큼씩 나눠 읽기"""
+        log = EventLog()
+        cursor = log.cursor()
+        for i in range(5):
+            log.append(click(i))
+
+        assert [e.x for e in cursor.read(limit=2)] == [0, 1]
+        assert [e.x for e in cursor.read(limit=2)] == [2, 3]
+        assert cursor.position == 4
+
+    def test_wait_wakes_on_append(self):
+        """wait()는 새 이벤트가 추가되면 반환"""
+        log = EventLog()
+        cursor = log.cursor()
+        threading.Timer(0.02, lambda: log.append(click(0))).start()
+
+        assert cursor.wait(timeout=1.0)
+        assert not log.cursor(from_start=False).wait(timeout=0.01)
+
+    def test_concurrent_appends_are_lossless(self):
+        """여러 스레드가 동시에 추가해도 순번이 빠지지 않음"""
+        log = EventLog(chunk_size=16)
+
+        def produce():
+            for i in range(1000):
+                log.append(click(i))
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        events, _ = log.read(0)
+        assert len(events) == 4000
+        assert log.next_seq == 4000
@@ -0,0 +1,162 @@
+"""EventStore 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.capture.event_store import EventStore, StringTable
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+
+
+def full_event() -> InputEvent:
+    """모든 필드가 채워진 이벤트"""
+    window = WindowInfo(
+        app_name="Safari", window_title="Docs", bundle_id="com.apple.Safari", process_id=42
+    )
+    return InputEvent(
+        timestamp=1.5,
+        event_type=InputEventType.TEXT_ENTRY,
+        text="hello",
+        modifiers=["cmd", "shift"],
+        end_timestamp=2.5,
+        app_name="Safari",
+        window_title="Docs",
+        window_info=window,
+    )
+
+
+def click(ts: float, x: int = 0) -> InputEvent:
+    return InputEvent(
+        timestamp=ts, event_type=InputEventType.MOUSE_CLICK, x=x, y=-5, button="left"
+    )
+
+
+class TestStringTable:
+    """StringTable 테스트"""
+
+    def test_intern_deduplicates(self):
+        """같은 문자열은 같은 번호"""
+        table = StringTable()
+
+        assert table.intern("a") == table.intern("a")
+        assert table.intern("b") != table.intern("a")
+        assert len(table) == 2
+
+    def test_none_roundtrip(self):
+        """None은 -1로 저장되고 None으로 복원"""
+        table = StringTable()
+
+        assert table.lookup(table.intern(None)) is None
+        assert table.lookup(table.intern("")) == ""
+
+
+class TestEventStore:
+    """EventStore 테스트"""
+
+    def test_roundtrip_preserves_fields(self):
+        """저장 후 꺼낸 이벤트는 원본과 동일"""
+        events = [
+            full_event(),
+            click(3.0, x=7),
+            InputEvent(timestamp=4.0, event_type=InputEventType.MOUSE_SCROLL, dx=0, dy=-3),
+        ]
+        store = EventStore(events)
+
+        assert list(store) == events
+        assert store == events
+        assert store[-1] == events[-1]
+        assert store[1:] == events[1:]
+
+    def test_grows_beyond_capacity(self):
+        """초기 용량을 넘어도 모든 이벤트 보관"""
+        store = EventStore(capacity=2)
+        for i in range(10):
+            store.append(click(float(i), x=i))
+
+        assert len(store) == 10
+        assert [e.x for e in store] == list(range(10))
+        assert store.timestamps.tolist() == [float(i) for i in range(10)]
+
+    def test_index_out_of_range(self):
+        """범위 밖 인덱스는 IndexError"""
+        store = EventStore([click(0.0)])
+
+        with pytest.raises(IndexError):
+            store[1]
+
+    def test_strings_are_interned(self):
+        """반복되는 앱 이름/버튼은 문자열 테이블에 한 번만 저장"""
+        store = EventStore([full_event() for _ in range(100)])
+
+        # Safari, Docs, hello, "cmd,shift", com.apple.Safari
+        assert len(store._strings) == 5
+
+    def test_type_mask_and_select(self):
+        """타입 마스크로 필터링"""
+        store = EventStore([click(0.0), full_event(), click(2.0, x=9)])
+
+        mask = store.type_mask({InputEventType.MOUSE_CLICK})
+        selected = store.select(mask)
+
+        assert mask.tolist() == [True, False, True]
+        assert [e.x for e in selected] == [0, 9]
+        assert store.select(np.array([1]))[0].text == "hello"
+
+    def test_column_views_are_read_only(self):
+        """timestamps/type_codes는 수정 불가"""
+        store = EventStore([click(0.0)])
+
+        with pytest.raises(ValueError):
+            store.timestamps[0] = 1.0
+        assert store.type_codes[0] == EventStore.type_code(InputEventType.MOUSE_CLICK)
+
+    def test_to_columns(self):
+        """열 단위 값은 이벤트 필드와 동일 (없는 값은 None)"""
+        store = EventStore([click(1.0, x=3), full_event()])
+
+        columns = store.to_columns()
+
+        assert columns["event_type"] == ["mouse_click", "text_entry"]
+        assert columns["x"] == [3, None]
+        assert columns["modifiers"] == [[], ["cmd", "shift"]]
+        assert columns["end_timestamp"] == [None, 2.5]
+
+    def test_drag_path_roundtrip(self):
+        """경로가 있는 이벤트만 경로를 보관하고 그대로 복원"""
+        drag = InputEvent(
+            timestamp=1.0,
+            event_type=InputEventType.DRAG,
+            x=0,
+            y=0,
+            end_timestamp=1.5,
+            path=[(0, 0), (40, 5), (80, 80)],
+        )
+        store = EventStore([click(0.5), drag])
+
+        assert store[1] == drag
+        assert store[0].path == []
+        assert store.to_columns()["path"] == [[], [(0, 0), (40, 5), (80, 80)]]
+
+    def test_fractional_coordinates_roundtrip(self):
+        """소수 좌표는 잘리지 않고, 정수 좌표는 int로 복원"""
+        retina = InputEvent(
+            timestamp=1.0, event_type=InputEventType.MOUSE_CLICK, x=100.5, y=-20.25
+        )
+        store = EventStore([retina, click(2.0, x=3)])
+
+        assert store[0] == retina
+        assert store[0].x == 100.5
+        assert isinstance(store[1].x, int)
+        assert store.to_columns()["y"] == [-20.25, -5]
+
+    def test_unhashable(self):
+        """list처럼 해시할 수 없음"""
+        with pytest.raises(TypeError):
+            hash(EventStore())
+
+    def test_empty_store_is_falsy(self):
+        """빈 저장소는 빈 리스트처럼 동작"""
+        store = EventStore()
+
+        assert not store
+        assert store == []
+        assert store.type_mask({InputEventType.MOUSE_CLICK}).size == 0
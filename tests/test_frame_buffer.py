@@ -0,0 +1,148 @@
+"""FrameRingBuffer 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.models import Frame
+
+
+def make_frame(timestamp: float, value: int, size: int = 8) -> Frame:
+    """단색 테스트 프레임 생성"""
+    return Frame(
+        timestamp=timestamp,
+        image=np.full((size, size, 3), value, dtype=np.uint8),
+    )
+
+
+class TestFrameRingBuffer:
+    """FrameRingBuffer 기본 기능 테스트"""
+
+    def test_capacity_must_be_at_least_two(self):
+        """capacity가 2 미만이면 에러"""
+        with pytest.raises(ValueError):
+            FrameRingBuffer(1)
+
+    def test_for_retention_computes_capacity(self):
+        """보존 시간 * FPS로 capacity 계산"""
+        buffer = FrameRingBuffer.for_retention(seconds=3.0, fps=10)
+
+        assert buffer.capacity == 30
+
+    def test_append_and_index(self):
+        """추가한 프레임을 순서대로 조회"""
+        buffer = FrameRingBuffer(4)
+        for i in range(3):
+            buffer.append(make_frame(float(i), i))
+
+        assert len(buffer) == 3
+        assert buffer[0].timestamp == 0.0
+        assert buffer[-1].timestamp == 2.0
+        assert int(buffer[1].image[0, 0, 0]) == 1
+
+    def test_memory_stays_flat(self):
+        """capacity를 넘어도 할당 메모리는 일정"""
+        buffer = FrameRingBuffer(4)
+        buffer.append(make_frame(0.0, 0))
+        allocated = buffer.nbytes
+
+        for i in range(1, 100):
+            buffer.append(make_frame(float(i), i % 256))
+
+        assert buffer.nbytes == allocated
+        assert len(buffer) == 4
+        assert [f.timestamp for f in buffer] == [96.0, 97.0, 98.0, 99.0]
+
+    def test_timestamps_array(self):
+        """타임스탬프 배열 반환"""
+        buffer = FrameRingBuffer(3)
+        for i in range(5):
+            buffer.append(make_frame(float(i), i))
+
+        np.testing.assert_array_equal(buffer.timestamps(), [2.0, 3.0, 4.0])
+
+    def test_append_reference_shares_previous_slot(self):
+        """변화 없는 프레임은 직전 슬롯을 참조하는 엔트리로 추가"""
+        buffer = FrameRingBuffer(3)
+        buffer.append(make_frame(0.0, 7))
+
+        frame = buffer.append_reference(0.1)
+
+        assert frame is not None
+        assert len(buffer) == 2
+        assert np.shares_memory(buffer[0].image, buffer[1].image)
+
+    def test_append_reference_on_empty_buffer_returns_none(self):
+        """비어 있는 버퍼에는 참조 엔트리를 추가할 수 없음"""
+        buffer = FrameRingBuffer(3)
+
+        assert buffer.append_reference(0.0) is None
+
+    def test_references_keep_entry_count_bounded(self):
+        """참조 엔트리도 capacity 개수로 제한"""
+        buffer = FrameRingBuffer(3)
+        buffer.append(make_frame(0.0, 0))
+        for i in range(1, 10):
+            buffer.append_reference(float(i))
+        buffer.append(make_frame(10.0, 1))
+
+        assert len(buffer) == 3
+        assert [f.timestamp for f in buffer] == [8.0, 9.0, 10.0]
+
+    def test_resolution_mismatch_raises(self):
+        """해상도가 다른 프레임은 거부"""
+        buffer = FrameRingBuffer(3)
+        buffer.append(make_frame(0.0, 0, size=8))
+
+        with pytest.raises(ValueError, match="해상도 불일치"):
+            buffer.append(make_frame(1.0, 1, size=4))
+
+
+class TestFrameRingBufferPinning:
+    """pin/unpin 테스트"""
+
+    def test_pinned_slot_is_not_overwritten(self):
+        """pin된 프레임은 이후 캡처로 덮어써지지 않음"""
+        buffer = FrameRingBuffer(3)
+        buffer.append(make_frame(0.0, 10))
+        pinned = buffer.pin(buffer[0])
+
+        for i in range(1, 20):
+            buffer.append(make_frame(float(i), 100 + i))
+
+        assert buffer.pinned_count == 1
+        assert int(pinned.image[0, 0, 0]) == 10
+        # 나머지 슬롯으로 계속 순환
+        assert len(buffer) == 2
+
+    def test_unpin_releases_slot(self):
+        """unpin 후 슬롯 재사용"""
+        buffer = FrameRingBuffer(2)
+        buffer.append(make_frame(0.0, 0))
+        pinned = buffer.pin(buffer[0])
+
+        buffer.unpin(pinned)
+        for i in range(1, 5):
+            buffer.append(make_frame(float(i), i))
+
+        assert buffer.pinned_count == 0
+        assert len(buffer) == 2
+
+    def test_all_slots_pinned_drops_frames(self):
+        """모든 슬롯이 pin되면 새 프레임은 버려짐"""
+        buffer = FrameRingBuffer(2)
+        for i in range(2):
+            buffer.append(make_frame(float(i), i))
+        for frame in list(buffer):
+            buffer.pin(frame)
+
+        assert buffer.append(make_frame(2.0, 2)) is None
+        assert buffer.dropped == 1
+
+    def test_pin_foreign_frame_is_noop(self):
+        """버퍼 밖의 프레임은 그대로 반환"""
+        buffer = FrameRingBuffer(2)
+        frame = make_frame(0.0, 0)
+
+        assert buffer.pin(frame) is frame
+        assert buffer.pinned_count == 0
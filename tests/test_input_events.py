@@ -6,7 +6,7 @@ from unittest.mock import Mock
 import pytest
 
 from shadow.capture.input_events import InputEventCollector
-from shadow.capture.models import InputEvent, InputEventType
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
 
 
 class TestInputEventCollectorBasic:
@@ -18,7 +18,7 @@ class TestInputEventCollectorBasic:
 
         assert collector is not None
         assert not collector._running
-        assert collector._events.empty()
+        assert len(collector.event_log) == 0
 
     def test_collector_start_stop(self):
         """리스너 시작/중지 테스트 (실제 리스너 사용)"""
@@ -304,3 +304,126 @@ class TestInputEventTypes:
 
         assert event.event_type == InputEventType.KEY_RELEASE
         assert event.key == "shift"
+
+
+class TestInputEventCollectorKeystrokes:
+    """키 입력 병합 통합 테스트"""
+
+    def test_key_presses_coalesce_into_text_entry(self):
+        """키 이벤트가 TEXT_ENTRY로 병합되고 클릭 전에 기록됨"""
+        from pynput import keyboard, mouse
+
+        collector = InputEventCollector(coalesce_keys=True)
+        collector._get_window_info_for_point = lambda x, y: WindowInfo(app_name="Editor")
+        collector._cursor_position = lambda: (0, 0)
+
+        for char in "hi":
+            key = keyboard.KeyCode.from_char(char)
+            collector._on_key_press(key)
+            collector._on_key_release(key)
+        collector._on_mouse_click(10, 10, mouse.Button.left, True)
+
+        events = collector.get_events()
+        assert [e.event_type for e in events] == [
+            InputEventType.TEXT_ENTRY,
+            InputEventType.MOUSE_CLICK,
+        ]
+        assert events[0].text == "hi"
+
+    def test_coalescing_disabled_keeps_raw_events(self):
+        """병합을 끄면 키마다 KEY_PRESS/KEY_RELEASE"""
+        from pynput import keyboard
+
+        collector = InputEventCollector(coalesce_keys=False)
+        collector._get_window_info_for_point = lambda x, y: WindowInfo(app_name="Editor")
+        collector._cursor_position = lambda: (0, 0)
+
+        key = keyboard.KeyCode.from_char("a")
+        collector._on_key_press(key)
+        collector._on_key_release(key)
+
+        assert [e.event_type for e in collector.get_events()] == [
+            InputEventType.KEY_PRESS,
+            InputEventType.KEY_RELEASE,
+        ]
+
+
+class TestInputEventCollectorCursors:
+    """이벤트 로그 커서 테스트"""
+
+    def test_multiple_consumers_read_same_events(self):
+        """get_events()와 별도 커서가 같은 이벤트를 각각 읽음"""
+        collector = InputEventCollector()
+        uploader = collector.cursor()
+
+        for i in range(3):
+            collector._emit_event(
+                InputEvent(timestamp=float(i), event_type=InputEventType.MOUSE_CLICK, x=i, y=i)
+            )
+
+        assert [e.x for e in collector.get_events()] == [0, 1, 2]
+        assert [e.x for e in uploader.read()] == [0, 1, 2]
+        assert collector.get_events() == []
+
+    def test_no_events_lost_under_burst(self):
+        """기본 보관 범위 안에서는 몰려도 이벤트를 잃지 않음"""
+        collector = InputEventCollector()
+
+        for i in range(5000):
+            collector._emit_event(
+                InputEvent(timestamp=float(i), event_type=InputEventType.MOUSE_CLICK, x=i, y=0)
+            )
+
+        assert len(collector.get_events()) == 5000
+        assert collector.dropped_events == 0
+
+    def test_dropped_events_counted(self):
+        """보관 범위를 넘으면 놓친 이벤트 수를 집계"""
+        collector = InputEventCollector(buffer_size=3)
+
+        for i in range(5):
+            collector._emit_event(
+                InputEvent(timestamp=float(i), event_type=InputEventType.MOUSE_CLICK, x=i, y=0)
+            )
+
+        assert collector.dropped_events == 2
+        collector.get_events()
+        assert collector.dropped_events == 2
+
+
+class TestInputEventCollectorDrag:
+    """마우스 드래그 수집 통합 테스트"""
+
+    def test_press_move_release_emits_click_and_drag(self):
+        """누름은 MOUSE_CLICK, 이동 후 놓으면 같은 timestamp의 DRAG"""
+        from pynput import mouse
+
+        collector = InputEventCollector(track_moves=True)
+        collector._get_window_info_for_point = lambda x, y: WindowInfo(app_name="Finder")
+
+        collector._on_mouse_click(10, 10, mouse.Button.left, True)
+        for x in range(11, 200, 2):
+            collector._on_mouse_move(x, 10)
+        collector._on_mouse_click(200, 10, mouse.Button.left, False)
+
+        click, drag = collector.get_events()
+        assert click.event_type == InputEventType.MOUSE_CLICK
+        assert drag.event_type == InputEventType.DRAG
+        assert drag.timestamp == click.timestamp
+        assert drag.path == [(10, 10), (200, 10)]
+        assert drag.app_name == "Finder"
+        assert collector.pointer.moves == 95
+
+    def test_track_moves_disabled(self):
+        """track_moves=False면 이동과 놓음은 이벤트를 만들지 않음"""
+        from pynput import mouse
+
+        collector = InputEventCollector(track_moves=False)
+        collector._get_window_info_for_point = lambda x, y: WindowInfo(app_name="Finder")
+
+        collector._on_mouse_click(10, 10, mouse.Button.left, True)
+        collector._on_mouse_move(100, 100)
+        collector._on_mouse_click(100, 100, mouse.Button.left, False)
+
+        assert [e.event_type for e in collector.get_events()] == [InputEventType.MOUSE_CLICK]
+        assert collector.pointer is None
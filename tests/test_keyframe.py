@@ -5,9 +5,13 @@ import time
 import numpy as np
 import pytest
 
-from shadow.capture.models import Frame, InputEvent, InputEventType
-from shadow.capture.recorder import RecordingSession
-from shadow.preprocessing.keyframe import KeyframeExtractor
+from shadow.capture.backends import SyntheticBackend
+from shadow.capture.event_store import EventStore
+from shadow.capture.frame_buffer import FrameRingBuffer
+from shadow.capture.models import Frame, InputEvent, InputEventType, MonitorGeometry
+from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.preprocessing.dedup import KeyframeDeduplicator
+from shadow.preprocessing.keyframe import KeyframeExtractor, StreamingKeyframeExtractor
 
 
 class TestKeyframeExtractor:
@@ -283,3 +287,386 @@ class TestKeyframeExtractorEdgeCases:
         pair = pairs[0]
         assert pair.before_frame.timestamp == frames[-1].timestamp
         assert pair.after_frame.timestamp == frames[-1].timestamp
+
+    def test_equidistant_frames_prefer_earlier(self):
+        """직전/직후 프레임이 같은 거리면 직전 프레임을 Before로 선택"""
+        frames = [
+            Frame(timestamp=ts, image=np.full((10, 10, 3), i, dtype=np.uint8))
+            for i, ts in enumerate([1.0, 1.25, 1.5, 2.0])
+        ]
+        events = [InputEvent(timestamp=1.375, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)]
+
+        pairs = KeyframeExtractor(after_delay=0.5).extract_pairs(
+            RecordingSession(frames=frames, events=events)
+        )
+
+        assert pairs[0].before_frame is frames[1]
+        assert pairs[0].after_frame is frames[3]
+
+    def test_unsorted_frames(self):
+        """프레임이 시간순이 아니어도 같은 결과"""
+        frames = [
+            Frame(timestamp=1.0 + i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(10)
+        ]
+        events = [InputEvent(timestamp=1.42, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)]
+        extractor = KeyframeExtractor(after_delay=0.3)
+
+        ordered = extractor.extract_pairs(RecordingSession(frames=frames, events=events))
+        shuffled = extractor.extract_pairs(
+            RecordingSession(frames=frames[5:] + frames[:5], events=events)
+        )
+
+        assert shuffled[0].before_frame is ordered[0].before_frame is frames[4]
+        assert shuffled[0].after_frame is ordered[0].after_frame is frames[8]
+
+
+class TestKeyframeExtractorRingBuffer:
+    """FrameRingBuffer 세션에서의 추출 테스트"""
+
+    def test_extract_pairs_pins_only_selected_slots(self):
+        """선택된 Before/After 슬롯만 pin되고 release_pairs로 해제"""
+        base_time = 1000.0
+        buffer = FrameRingBuffer(capacity=20)
+        for i in range(20):
+            buffer.append(
+                Frame(timestamp=base_time + i * 0.1, image=np.full((10, 10, 3), i, dtype=np.uint8))
+            )
+
+        events = [
+            InputEvent(
+                timestamp=base_time + 0.25,
+                event_type=InputEventType.MOUSE_CLICK,
+                x=5,
+                y=5,
+            )
+        ]
+        session = RecordingSession(frames=buffer, events=events)
+        extractor = KeyframeExtractor()
+
+        pairs = extractor.extract_pairs(session)
+
+        assert len(pairs) == 1
+        assert buffer.pinned_count == 2
+
+        # 이후 캡처로 버퍼가 순환해도 pin된 프레임은 유지
+        before_value = int(pairs[0].before_frame.image[0, 0, 0])
+        for i in range(50):
+            buffer.append(
+                Frame(timestamp=base_time + 2 + i * 0.1, image=np.full((10, 10, 3), 255, dtype=np.uint8))
+            )
+        assert int(pairs[0].before_frame.image[0, 0, 0]) == before_value
+
+        extractor.release_pairs(session, pairs)
+        assert buffer.pinned_count == 0
+    def test_dedup_dropped_pairs_released(self):
+        """중복 제거로 합쳐진 쌍의 슬롯은 release_pairs로 바로 해제되어 남은 쌍만 pin"""
+        rng = np.random.default_rng(0)
+        form, saved = (rng.integers(0, 256, (72, 96, 3), dtype=np.uint8) for _ in range(2))
+        buffer = FrameRingBuffer(capacity=40)
+        for i in range(40):
+            # 매초 앞 0.5초는 같은 폼 화면, 뒤 0.5초는 같은 저장 결과 화면
+            image = form if i % 10 < 5 else saved
+            buffer.append(Frame(timestamp=1000.0 + i * 0.1, image=image.copy()))
+        events = [
+            InputEvent(
+                timestamp=1000.25 + second, event_type=InputEventType.MOUSE_CLICK, x=50, y=40
+            )
+            for second in range(3)
+        ]
+        session = RecordingSession(frames=buffer, events=events)
+        extractor = KeyframeExtractor()
+        pairs = extractor.extract_pairs(session)
+        assert buffer.pinned_count == 2 * len(pairs) == 6
+
+        kept, dropped = KeyframeDeduplicator().split(pairs)
+        extractor.release_pairs(session, dropped)
+
+        assert len(kept) == 1 and len(dropped) == 2
+        assert buffer.pinned_count == 2
+        extractor.release_pairs(session, kept)
+        assert buffer.pinned_count == 0
+
+
+class TestKeyframeExtractorEventStore:
+    """EventStore 세션에서의 추출 테스트"""
+
+    def test_event_store_matches_list(self):
+        """EventStore와 list 이벤트의 추출 결과가 동일"""
+        base_time = 1000.0
+        frames = [
+            Frame(timestamp=base_time + i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(20)
+        ]
+        events = [
+            InputEvent(timestamp=base_time + 0.05 + i * 0.3, event_type=event_type, x=i, y=i)
+            for i, event_type in enumerate(
+                [InputEventType.MOUSE_CLICK, InputEventType.MOUSE_SCROLL, InputEventType.MOUSE_CLICK]
+            )
+        ]
+        extractor = KeyframeExtractor()
+
+        from_list = extractor.extract_pairs(RecordingSession(frames=frames, events=events))
+        from_store = extractor.extract_pairs(
+            RecordingSession(frames=frames, events=EventStore(events))
+        )
+
+        assert [p.trigger_event for p in from_store] == [p.trigger_event for p in from_list]
+        assert [p.before_frame.timestamp for p in from_store] == [
+            p.before_frame.timestamp for p in from_list
+        ]
+        assert [p.after_frame.timestamp for p in from_store] == [
+            p.after_frame.timestamp for p in from_list
+        ]
+
+
+class TestKeyframeExtractorRoi:
+    """클릭 주변 원본 해상도 영역(ROI) 테스트"""
+
+    @staticmethod
+    def session_with_click(x: int, y: int, width: int = 400, height: int = 300):
+        base_time = 1000.0
+        frames = [
+            Frame(timestamp=base_time + i * 0.1, image=np.zeros((height, width, 3), np.uint8))
+            for i in range(10)
+        ]
+        event = InputEvent(
+            timestamp=base_time + 0.15, event_type=InputEventType.MOUSE_CLICK, x=x, y=y
+        )
+        return RecordingSession(frames=frames, events=[event])
+
+    def test_roi_centred_on_click(self):
+        """ROI는 클릭 위치 중심의 roi_size 정사각형"""
+        pairs = KeyframeExtractor(roi_size=100).extract_pairs(self.session_with_click(200, 150))
+
+        assert pairs[0].click_pos == (200, 150)
+        assert pairs[0].roi == (150, 100, 250, 200)
+
+    def test_roi_clamped_to_frame(self):
+        """화면 가장자리 클릭은 ROI를 프레임 안쪽으로 이동"""
+        extractor = KeyframeExtractor(roi_size=100)
+
+        top_left = extractor.extract_pairs(self.session_with_click(5, 5))[0]
+        bottom_right = extractor.extract_pairs(self.session_with_click(399, 299))[0]
+
+        assert top_left.roi == (0, 0, 100, 100)
+        assert bottom_right.roi == (300, 200, 400, 300)
+
+    def test_roi_disabled(self):
+        """roi_size=0이거나 프레임이 ROI보다 작으면 None"""
+        session = self.session_with_click(200, 150)
+
+        assert KeyframeExtractor(roi_size=0).extract_pairs(session)[0].roi is None
+        assert KeyframeExtractor(roi_size=500).extract_pairs(session)[0].roi is None
+
+    def test_click_pos_uses_monitor_geometry(self):
+        """모니터 위치/스케일 정보가 있으면 프레임 픽셀 좌표로 변환"""
+        session = self.session_with_click(1400, 200)
+        # 800x600 좌표 모니터를 400x300 프레임으로 캡처 (배율 0.5)
+        session.monitors[2] = MonitorGeometry(index=2, left=1000, top=0, width=800, height=600)
+        session.monitor_frames[2] = session.frames
+
+        pair = KeyframeExtractor(roi_size=100).extract_pairs(session)[0]
+
+        assert pair.monitor == 2
+        assert pair.click_pos == (200, 100)
+        assert pair.roi == (150, 50, 250, 150)
+
+
+DRAG_TRIGGERS = {InputEventType.MOUSE_CLICK, InputEventType.DRAG}
+
+
+class TestKeyframeExtractorDrag:
+    """드래그 트리거 테스트 (keyframe_triggers에 drag를 추가한 경우)"""
+
+    def test_drag_after_frame_follows_release(self):
+        """DRAG의 After 프레임은 놓은 시각 기준이고, 같은 누름의 클릭은 건너뜀"""
+        base_time = 1000.0
+        frames = [
+            Frame(timestamp=base_time + i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(30)
+        ]
+        press = base_time + 0.25
+        events = [
+            InputEvent(timestamp=press, event_type=InputEventType.MOUSE_CLICK, x=1, y=1),
+            InputEvent(
+                timestamp=press,
+                event_type=InputEventType.DRAG,
+                x=1,
+                y=1,
+                end_timestamp=base_time + 1.25,
+                path=[(1, 1), (8, 8)],
+            ),
+        ]
+
+        extractor = KeyframeExtractor(trigger_events=DRAG_TRIGGERS)
+        for store in (events, EventStore(events)):
+            pairs = extractor.extract_pairs(RecordingSession(frames=frames, events=store))
+
+            assert len(pairs) == 1
+            assert pairs[0].trigger_event.event_type == InputEventType.DRAG
+            assert pairs[0].before_frame.timestamp == pytest.approx(base_time + 0.2)
+            assert pairs[0].after_frame.timestamp == pytest.approx(base_time + 1.6)
+
+    def test_clicks_only_trigger(self):
+        """트리거를 클릭으로 제한하면 드래그 누름도 클릭 쌍으로 추출"""
+        base_time = 1000.0
+        frames = [
+            Frame(timestamp=base_time + i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(10)
+        ]
+        events = [
+            InputEvent(timestamp=base_time + 0.25, event_type=InputEventType.MOUSE_CLICK),
+            InputEvent(
+                timestamp=base_time + 0.25,
+                event_type=InputEventType.DRAG,
+                end_timestamp=base_time + 0.5,
+            ),
+        ]
+
+        session = RecordingSession(frames=frames, events=events)
+        explicit = KeyframeExtractor(trigger_events={InputEventType.MOUSE_CLICK})
+        default = KeyframeExtractor()  # 기본 keyframe_triggers는 클릭만 (드래그는 opt-in)
+
+        for extractor in (explicit, default):
+            pairs = extractor.extract_pairs(session)
+            assert [p.trigger_event.event_type for p in pairs] == [InputEventType.MOUSE_CLICK]
+
+
+def click_at(offset: float) -> InputEvent:
+    return InputEvent(timestamp=offset, event_type=InputEventType.MOUSE_CLICK, x=5, y=5)
+
+
+def stream(extractor, session, frames, events, delivered_at=None):
+    """프레임과 이벤트를 시간순으로 전달 (이벤트는 delivered_at 시각에 도착)"""
+    delivered_at = delivered_at or {}
+    queue = sorted(
+        [(delivered_at.get(id(e), e.timestamp), 0, e) for e in events]
+        + [(f.timestamp, 1, f) for f in frames],
+        key=lambda item: (item[0], item[1]),
+    )
+    emitted_at = []
+    for _, kind, item in queue:
+        if kind == 0:
+            extractor.on_event(item)
+        else:
+            extractor.on_frame(session, 1, item)
+            emitted_at.append((item.timestamp, extractor.emitted))
+    return emitted_at
+
+
+class TestStreamingKeyframeExtractor:
+    """녹화 중 키프레임 추출 테스트"""
+
+    def test_matches_batch_extraction(self):
+        """After 프레임 도착 즉시 발생하고, 고른 프레임은 녹화 후 추출과 같음"""
+        frames = [
+            Frame(timestamp=1000.0 + i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(100)
+        ]
+        events = [
+            InputEvent(timestamp=1000.0 + t, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+            for t in (0.05, 1.23, 1.31, 4.0, 9.85)
+        ]
+        session = RecordingSession(frames=[], events=[])
+        extractor = StreamingKeyframeExtractor(roi_size=0)
+
+        emitted_at = stream(extractor, session, frames, events)
+        streamed = extractor.pop_pairs()
+        flushed = extractor.flush()
+        expected = KeyframeExtractor(roi_size=0).extract_pairs(
+            RecordingSession(frames=frames, events=events)
+        )
+
+        assert [(p.before_frame, p.after_frame) for p in streamed + flushed] == [
+            (p.before_frame, p.after_frame) for p in expected
+        ]
+        # 첫 클릭(0.05)은 0.35 이후 첫 프레임(0.4)에서 발생, 마지막 클릭은 flush에서 발생
+        assert dict(emitted_at)[1000.3] == 0
+        assert dict(emitted_at)[1000.4] == 1
+        assert len(flushed) == 1
+        # flush 후에는 보관 프레임 없음
+        assert extractor.buffered_frames == 0
+
+    def test_window_is_bounded(self):
+        """대기 이벤트가 없으면 최근 history초 프레임만 보관"""
+        extractor = StreamingKeyframeExtractor(history=0.5)
+        session = RecordingSession()
+
+        for i in range(200):
+            frame = Frame(timestamp=i * 0.1, image=np.zeros((4, 4, 3), dtype=np.uint8))
+            extractor.on_frame(session, 1, frame)
+
+        assert extractor.buffered_frames <= 7
+
+    def test_click_held_until_release_and_replaced_by_drag(self):
+        """버튼을 누르고 있는 동안 클릭 쌍을 보류하고, 드래그가 오면 DRAG로 대체"""
+        frames = [
+            Frame(timestamp=i * 0.1, image=np.zeros((10, 10, 3), dtype=np.uint8))
+            for i in range(60)
+        ]
+        press = InputEvent(timestamp=0.25, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+        drag = InputEvent(
+            timestamp=0.25, event_type=InputEventType.DRAG, x=1, y=1, end_timestamp=3.0
+        )
+        held = {"down": True}
+        extractor = StreamingKeyframeExtractor(
+            trigger_events=DRAG_TRIGGERS,
+            roi_size=0,
+            history=0.5,
+            button_down=lambda: held["down"],
+        )
+        session = RecordingSession()
+
+        stream(extractor, session, frames[:30], [press])
+        assert extractor.emitted == 0
+        held["down"] = False
+        extractor.on_event(drag)
+        stream(extractor, session, frames[30:], [])
+
+        pairs = extractor.pop_pairs()
+        assert [p.trigger_event.event_type for p in pairs] == [InputEventType.DRAG]
+        # 드래그 시작 시점의 프레임은 history보다 오래되어도 보존됨
+        assert pairs[0].before_frame is frames[2]
+        assert pairs[0].after_frame is frames[33]
+
+    def test_ring_buffer_frames_pinned_while_buffered(self):
+        """링 버퍼 세션: 후보 프레임만 pin하고 쌍 해제 후 pin이 남지 않음"""
+        buffer = FrameRingBuffer(capacity=16)
+        session = RecordingSession(frames=buffer)
+        extractor = StreamingKeyframeExtractor(roi_size=0, history=0.3)
+        extractor.on_event(
+            InputEvent(timestamp=1.05, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+        )
+
+        for i in range(40):
+            stored = buffer.append(
+                Frame(timestamp=i * 0.1, image=np.full((4, 4, 3), i, dtype=np.uint8))
+            )
+            extractor.on_frame(session, 1, stored)
+            assert buffer.pinned_count <= extractor.buffered_frames + 2
+
+        pairs = extractor.pop_pairs()
+        assert [int(p.before_frame.image[0, 0, 0]) for p in pairs] == [10]
+        assert [int(p.after_frame.image[0, 0, 0]) for p in pairs] == [14]
+        extractor.flush()
+        extractor.release_pairs(session, pairs)
+        assert buffer.pinned_count == 0
+
+    def test_recorder_streams_pairs(self):
+        """Recorder에 연결하면 녹화 중에 쌍을 받고 세션에는 프레임을 보관하지 않음"""
+        backend = SyntheticBackend(
+            width=32, height=24, events=[click_at(0.1), click_at(0.2)], change_interval=0.05
+        )
+        recorder = Recorder(fps=20, buffer_seconds=0, backend=backend, retain_frames=False)
+        received: list = []
+        extractor = StreamingKeyframeExtractor(on_pair=received.append, roi_size=0)
+        extractor.attach(recorder)
+
+        session = recorder.record(0.8)
+        extractor.flush()
+
+        assert len(session.frames) == 0
+        assert len(session.events) == 2
+        assert len(received) == 2
+        assert all(p.before_frame.image.shape == (24, 32, 3) for p in received)
@@ -0,0 +1,163 @@
+"""KeystrokeCoalescer 단위 테스트"""
+
+import time
+
+from shadow.capture.keystrokes import KeystrokeCoalescer
+from shadow.capture.models import InputEventRecord, InputEventType, WindowInfo
+
+
+class EventSink:
+    """emit/window_lookup 호출 기록용 헬퍼"""
+
+    def __init__(self):
+        self.events = []
+        self.lookups = 0
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def lookup(self):
+        self.lookups += 1
+        return WindowInfo(app_name="Editor", window_title=f"doc{self.lookups}")
+
+
+def make_coalescer(gap: float = 1.0) -> tuple[KeystrokeCoalescer, EventSink]:
+    recorder = EventSink()
+    return KeystrokeCoalescer(recorder.emit, recorder.lookup, gap=gap), recorder
+
+
+def type_text(coalescer: KeystrokeCoalescer, keys: list[str], start: float = 100.0) -> float:
+    """키 목록을 0.1초 간격으로 입력하고 마지막 시각 반환"""
+    t = start
+    for key in keys:
+        coalescer.press(key, t)
+        coalescer.release(key, t + 0.05)
+        t += 0.1
+    return t - 0.1
+
+
+class TestKeystrokeCoalescer:
+    """키 입력 병합 테스트"""
+
+    def test_characters_merge_into_text_entry(self):
+        """연속 글자 입력은 TEXT_ENTRY 하나로 병합"""
+        coalescer, rec = make_coalescer()
+        last = type_text(coalescer, ["h", "i", "space", "t", "h", "e", "r", "e"])
+        coalescer.flush()
+
+        assert len(rec.events) == 1
+        event = rec.events[0]
+        assert event.event_type == InputEventType.TEXT_ENTRY
+        assert event.text == "hi there"
+        assert event.timestamp == 100.0
+        assert event.end_timestamp == last
+        assert event.app_name == "Editor"
+        # 윈도우 조회는 입력 묶음당 1회
+        assert rec.lookups == 1
+
+    def test_shift_is_part_of_text(self):
+        """shift + 글자는 단축키가 아니라 텍스트"""
+        coalescer, rec = make_coalescer()
+        coalescer.press("shift", 100.0)
+        coalescer.press("H", 100.1)
+        coalescer.release("shift", 100.2)
+        coalescer.press("i", 100.3)
+        coalescer.flush()
+
+        assert [e.text for e in rec.events] == ["Hi"]
+
+    def test_backspace_edits_text(self):
+        """backspace는 묶음의 마지막 글자를 지움"""
+        coalescer, rec = make_coalescer()
+        type_text(coalescer, ["c", "a", "r", "backspace", "t"])
+        coalescer.flush()
+
+        assert rec.events[0].text == "cat"
+
+    def test_shortcut_splits_run(self):
+        """단축키는 입력 묶음을 끝내고 modifiers 포함 KEY_PRESS로 발생"""
+        coalescer, rec = make_coalescer()
+        type_text(coalescer, ["a", "b"])
+        coalescer.press("cmd", 100.5)
+        coalescer.press("c", 100.6)
+        coalescer.release("cmd", 100.7)
+        type_text(coalescer, ["x"], start=100.8)
+        coalescer.flush()
+
+        types = [e.event_type for e in rec.events]
+        assert types == [
+            InputEventType.TEXT_ENTRY,
+            InputEventType.KEY_PRESS,
+            InputEventType.TEXT_ENTRY,
+        ]
+        shortcut = rec.events[1]
+        assert shortcut.key == "c"
+        assert shortcut.modifiers == ["cmd"]
+        assert rec.events[2].text == "x"
+
+    def test_special_key_emits_key_press(self):
+        """enter 같은 특수 키는 개별 KEY_PRESS"""
+        coalescer, rec = make_coalescer()
+        type_text(coalescer, ["o", "k", "enter"])
+
+        assert [e.event_type for e in rec.events] == [
+            InputEventType.TEXT_ENTRY,
+            InputEventType.KEY_PRESS,
+        ]
+        assert rec.events[1].key == "enter"
+        assert rec.events[1].modifiers == []
+
+    def test_gap_starts_new_run(self):
+        """입력 간격이 gap을 넘으면 새 묶음"""
+        coalescer, rec = make_coalescer(gap=1.0)
+        type_text(coalescer, ["a", "b"], start=100.0)
+        type_text(coalescer, ["c"], start=105.0)
+        coalescer.flush()
+
+        assert [e.text for e in rec.events] == ["ab", "c"]
+        assert rec.lookups == 2
+
+    def test_modifier_keys_alone_emit_nothing(self):
+        """modifier 키만 누르고 떼면 이벤트 없음"""
+        coalescer, rec = make_coalescer()
+        coalescer.press("shift", 100.0)
+        coalescer.release("shift", 100.1)
+        coalescer.flush()
+
+        assert rec.events == []
+
+    def test_flush_idle_only_keeps_active_run(self):
+        """idle_only flush는 입력 중인 묶음을 유지"""
+        coalescer, rec = make_coalescer(gap=10.0)
+        coalescer.press("a", time.time())
+
+        coalescer.flush(idle_only=True)
+        assert rec.events == []
+        assert coalescer.has_pending
+
+        coalescer.flush()
+        assert [e.text for e in rec.events] == ["a"]
+
+    def test_pending_start(self):
+        """진행 중인 입력 묶음의 시작 시각 (TEXT_ENTRY 발생 후에는 None)"""
+        coalescer, _ = make_coalescer()
+        assert coalescer.pending_start is None
+
+        type_text(coalescer, ["a", "b"], start=50.0)
+        assert coalescer.pending_start == 50.0
+
+        coalescer.flush()
+        assert coalescer.pending_start is None
+
+    def test_text_entry_record_conversion(self):
+        """TEXT_ENTRY를 저장용 레코드로 변환"""
+        from uuid import uuid4
+
+        coalescer, rec = make_coalescer()
+        type_text(coalescer, ["o", "k"])
+        coalescer.flush()
+
+        record = InputEventRecord.from_dataclass(rec.events[0], session_id=uuid4())
+
+        assert record.type == "text_entry"
+        assert record.text == "ok"
@@ -0,0 +1,126 @@
+"""마우스 이동 경로 수집 단위 테스트"""
+
+import math
+
+from shadow.capture.models import InputEvent, InputEventType, WindowInfo
+from shadow.capture.pointer import PointerTracker, simplify_path
+
+
+def make_tracker(**kwargs) -> tuple[PointerTracker, list[InputEvent]]:
+    emitted: list[InputEvent] = []
+    tracker = PointerTracker(
+        emit=emitted.append,
+        window_lookup=lambda x, y: WindowInfo(app_name="Finder"),
+        **kwargs,
+    )
+    return tracker, emitted
+
+
+class TestSimplifyPath:
+    """Ramer-Douglas-Peucker 단순화 테스트"""
+
+    def test_straight_line_keeps_endpoints(self):
+        """직선 위의 중간 점은 모두 제거"""
+        points = [(i, 2 * i) for i in range(50)]
+
+        assert simplify_path(points, tolerance=0.5) == [(0, 0), (49, 98)]
+
+    def test_corner_is_kept(self):
+        """허용 오차보다 먼 꺾인 점은 유지"""
+        points = [(0, 0), (5, 0), (10, 0), (10, 5), (10, 10)]
+
+        assert simplify_path(points, tolerance=1.0) == [(0, 0), (10, 0), (10, 10)]
+
+    def test_short_paths_unchanged(self):
+        """점 2개 이하는 그대로"""
+        assert simplify_path([(1, 1), (2, 2)], tolerance=5) == [(1, 1), (2, 2)]
+
+
+class TestPointerTracker:
+    """PointerTracker 테스트"""
+
+    def test_drag_emits_decimated_path(self):
+        """누른 채 이동 후 놓으면 DRAG 이벤트 (시작 위치/누른 시각/놓은 시각)"""
+        tracker, emitted = make_tracker(min_distance=3, tolerance=1)
+        window = WindowInfo(app_name="Finder", window_title="Desktop")
+
+        tracker.press(0, 0, "left", 10.0, window)
+        for i in range(1, 101):
+            tracker.move(i, 0, 10.0 + i * 0.001)
+        for i in range(1, 101):
+            tracker.move(100, i, 10.1 + i * 0.001)
+        tracker.release(100, 100, "left", 10.3)
+
+        assert len(emitted) == 1
+        drag = emitted[0]
+        assert drag.event_type == InputEventType.DRAG
+        assert (drag.x, drag.y, drag.button) == (0, 0, "left")
+        assert drag.timestamp == 10.0
+        assert drag.end_timestamp == 10.3
+        assert drag.path == [(0, 0), (99, 0), (100, 100)]
+        assert drag.window_info is window
+        assert tracker.moves == 200
+
+    def test_small_movement_is_click(self):
+        """drag_threshold 미만 이동은 DRAG를 만들지 않음"""
+        tracker, emitted = make_tracker(drag_threshold=5)
+
+        tracker.press(10, 10, "left", 1.0)
+        tracker.move(12, 11, 1.01)
+        assert tracker.button_down
+        tracker.release(12, 11, "left", 1.05)
+
+        assert emitted == []
+        assert not tracker.has_pending
+        assert not tracker.button_down
+
+    def test_path_memory_is_bounded(self):
+        """아주 긴 드래그도 경로 점 수는 max_points 미만"""
+        tracker, emitted = make_tracker(min_distance=1, tolerance=0.5, max_points=32)
+
+        tracker.press(500, 500, "left", 0.0)
+        for i in range(20_000):
+            angle = i / 50
+            tracker.move(
+                int(500 + 400 * math.cos(angle)), int(500 + 400 * math.sin(angle)), i * 1e-3
+            )
+            assert len(tracker._stroke.points) < 32
+        tracker.release(900, 500, "left", 20.0)
+
+        assert len(emitted[0].path) < 32
+        assert tracker.points == len(emitted[0].path)
+
+    def test_moves_without_button_ignored_by_default(self):
+        """hover를 끄면 버튼 없는 이동은 기록하지 않음"""
+        tracker, emitted = make_tracker()
+
+        for i in range(100):
+            tracker.move(i * 5, 0, i * 0.01)
+        tracker.flush()
+
+        assert emitted == []
+        assert not tracker.has_pending
+
+    def test_hover_run_ends_after_gap(self):
+        """hover 구간은 hover_gap 이상 멈추면 MOUSE_MOVE 이벤트로 끝남"""
+        tracker, emitted = make_tracker(hover=True, hover_gap=0.5)
+
+        for i in range(10):
+            tracker.move(i * 10, 0, 1.0 + i * 0.01)
+        tracker.move(500, 500, 3.0)  # 정지 후 새 구간 시작
+
+        assert [e.event_type for e in emitted] == [InputEventType.MOUSE_MOVE]
+        assert emitted[0].path == [(0, 0), (90, 0)]
+        assert emitted[0].end_timestamp == 1.09
+        assert emitted[0].app_name == "Finder"
+        assert tracker.has_pending
+
+    def test_press_finishes_hover_run(self):
+        """버튼을 누르면 진행 중인 hover 구간을 먼저 발생"""
+        tracker, emitted = make_tracker(hover=True)
+
+        tracker.move(0, 0, 1.0)
+        tracker.move(50, 0, 1.1)
+        tracker.press(50, 0, "left", 1.2)
+
+        assert [e.event_type for e in emitted] == [InputEventType.MOUSE_MOVE]
@@ -0,0 +1,136 @@
+"""AdaptiveRateController 단위 테스트"""
+
+import pytest
+
+from shadow.capture.models import InputEvent, InputEventType
+from shadow.capture.rate import AdaptiveRateController
+from shadow.capture.scheduler import CaptureStats
+
+
+def click(timestamp: float) -> InputEvent:
+    """테스트용 클릭 이벤트"""
+    return InputEvent(timestamp=timestamp, event_type=InputEventType.MOUSE_CLICK, x=0, y=0)
+
+
+def idle_stats(stats: CaptureStats, frames: int = 5) -> CaptureStats:
+    """변화 없는 프레임 frames개 추가"""
+    stats.captured_frames += frames
+    stats.unchanged_frames += frames
+    return stats
+
+
+class TestAdaptiveRateController:
+    """적응형 FPS 테스트"""
+
+    def test_invalid_range_raises(self):
+        """min_fps > max_fps면 에러"""
+        with pytest.raises(ValueError):
+            AdaptiveRateController(min_fps=10, max_fps=5)
+
+    def test_starts_at_ceiling(self):
+        """처음에는 상한 FPS"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10)
+
+        assert controller.fps == 10
+
+    def test_idle_decays_to_floor(self):
+        """이벤트도 화면 변화도 없으면 점차 하한으로"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10, release_half_life=1.0)
+        stats = CaptureStats()
+
+        controller.update(idle_stats(stats), now=100.0)
+        half = controller.update(idle_stats(stats), now=101.0)
+        assert half == pytest.approx(5.0)
+
+        for t in range(102, 110):
+            fps = controller.update(idle_stats(stats), now=float(t))
+        assert fps == pytest.approx(1.0)
+
+    def test_event_burst_jumps_to_ceiling(self):
+        """이벤트가 몰리면 즉시 상한으로 복귀"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10, burst_events=4)
+        stats = CaptureStats()
+        for t in range(100, 110):
+            controller.update(idle_stats(stats), now=float(t))
+        assert controller.fps == pytest.approx(1.0)
+
+        for i in range(4):
+            controller.on_event(click(110.0 + i * 0.1))
+
+        assert controller.update(idle_stats(stats), now=110.5) == pytest.approx(10.0)
+
+    def test_old_events_leave_window(self):
+        """window 밖의 이벤트는 활동량에서 제외"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10, window=2.0, burst_events=2)
+        controller.on_event(click(100.0))
+        controller.on_event(click(100.1))
+        stats = CaptureStats()
+
+        assert controller.update(idle_stats(stats), now=100.5) == pytest.approx(10.0)
+        for t in range(103, 115):
+            fps = controller.update(idle_stats(stats), now=float(t))
+        assert fps == pytest.approx(1.0)
+
+    def test_screen_changes_keep_rate_up(self):
+        """화면이 계속 바뀌면 이벤트가 없어도 FPS 유지"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10)
+        stats = CaptureStats()
+
+        for t in range(100, 110):
+            stats.captured_frames += 10
+            stats.unchanged_frames += 5  # 절반만 변화
+            fps = controller.update(stats, now=float(t))
+
+        assert fps == pytest.approx(5.5)
+
+    def test_without_change_detection_uses_events_only(self):
+        """변화 감지가 꺼져 있으면 unchanged_frames가 0이어도 하한으로 내려감"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10, detect_changes=False)
+        stats = CaptureStats()
+
+        for t in range(100, 115):
+            stats.captured_frames += 10  # 변화 감지가 없으면 무변화 프레임이 집계되지 않음
+            fps = controller.update(stats, now=float(t))
+        assert fps == pytest.approx(1.0)
+
+        for i in range(4):
+            controller.on_event(click(115.0 + i * 0.1))
+        stats.captured_frames += 10
+        assert controller.update(stats, now=115.5) == pytest.approx(10.0)
+
+    def test_minor_changes_do_not_raise_rate(self):
+        """커서 깜박임 같은 작은 변화는 매 프레임 바뀌어도 유휴로 취급"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10)
+        stats = CaptureStats()
+
+        for t in range(100, 115):
+            frames = round(controller.fps)
+            stats.captured_frames += frames
+            stats.minor_changes += frames  # 모든 프레임이 커서만 바뀜
+            fps = controller.update(stats, now=float(t))
+
+        assert fps == pytest.approx(1.0)
+
+    def test_event_sets_wakeup_when_below_ceiling(self):
+        """낮은 FPS에서 이벤트가 오면 캡처 대기를 깨움"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10)
+        controller.on_event(click(100.0))
+        assert not controller.wakeup.is_set()  # 상한에서는 깨울 필요 없음
+
+        stats = CaptureStats()
+        for t in range(101, 110):
+            controller.update(idle_stats(stats), now=float(t))
+        controller.on_event(click(110.0))
+
+        assert controller.wakeup.is_set()
+
+    def test_reset_restores_ceiling(self):
+        """reset() 후 상한 FPS로 시작"""
+        controller = AdaptiveRateController(min_fps=1, max_fps=10)
+        stats = CaptureStats()
+        for t in range(100, 110):
+            controller.update(idle_stats(stats), now=float(t))
+
+        controller.reset()
+
+        assert controller.fps == 10
@@ -6,8 +6,10 @@ import numpy as np
 import pytest
 from pynput.mouse import Button, Controller
 
-from shadow.capture.models import InputEvent, InputEventType
+from shadow.capture.backends import SyntheticBackend
+from shadow.capture.models import InputEvent, InputEventType, MonitorGeometry
 from shadow.capture.recorder import Recorder, RecordingSession
+from shadow.preprocessing.keyframe import KeyframeExtractor
 
 
 class TestRecorder:
@@ -178,3 +180,88 @@ class TestRecorderFrameEventSynchronization:
 
         # 오차 허용 (±20%)
         assert abs(session.duration - expected_duration) < expected_duration * 0.2
+
+
+class TestMultiMonitorRecording:
+    """다중 모니터 녹화 테스트 (SyntheticBackend로 모니터 2개 흉내)"""
+
+    @staticmethod
+    def click(offset: float, x: int, y: int) -> InputEvent:
+        return InputEvent(timestamp=offset, event_type=InputEventType.MOUSE_CLICK, x=x, y=y)
+
+    def test_monitor_geometry(self):
+        """MonitorGeometry 좌표 포함 여부와 프레임 좌표 변환 (Retina 배율 포함)"""
+        geometry = MonitorGeometry(index=2, left=1920, top=0, width=1440, height=900)
+
+        assert geometry.contains(1920, 0)
+        assert not geometry.contains(1919, 10)
+        assert not geometry.contains(1920 + 1440, 10)
+        assert geometry.to_local(2020, 50) == (100, 50)
+        assert geometry.to_local(2020, 50, frame_width=2880, frame_height=1800) == (200, 100)
+
+    def test_each_monitor_captured_and_clicks_routed(self):
+        """모니터마다 프레임을 캡처하고 클릭은 해당 모니터 프레임으로 키프레임 생성"""
+        backends = {
+            1: SyntheticBackend(
+                width=40,
+                height=30,
+                events=[self.click(0.1, 10, 10), self.click(0.2, 50, 10)],
+            ),
+            2: SyntheticBackend(width=20, height=30, click_interval=None, origin=(40, 0)),
+        }
+        recorder = Recorder(fps=20, buffer_seconds=0, backend=backends)
+
+        session = recorder.record(0.5)
+        pairs = KeyframeExtractor().extract_pairs(session)
+
+        assert recorder.monitors == [1, 2]
+        assert session.frames is session.monitor_frames[1]
+        assert len(session.monitor_frames[2]) >= 3
+        assert session.monitors[2].left == 40
+        assert [pair.monitor for pair in pairs] == [1, 2]
+        assert pairs[0].before_frame.image.shape == (30, 40, 3)
+        assert pairs[1].before_frame.image.shape == (30, 20, 3)
+
+    def test_single_backend_with_multiple_monitors_raises(self):
+        """여러 모니터에 단일 백엔드를 지정하면 ValueError"""
+        with pytest.raises(ValueError):
+            Recorder(monitors=[1, 2], backend=SyntheticBackend(width=8, height=8))
+
+
+class TestRingBufferKeyframes:
+    """링 버퍼 녹화 중 키프레임 추출 테스트"""
+
+    def test_click_older_than_buffer_keeps_pair(self):
+        """버퍼 길이보다 오래된 클릭도 녹화 중 추출되어 쌍이 남고 링 슬롯은 해제됨"""
+        click = InputEvent(
+            timestamp=0.1, event_type=InputEventType.MOUSE_CLICK, x=20, y=15
+        )
+        backend = SyntheticBackend(
+            width=40, height=30, events=[click], change_interval=0, region_size=(10, 10)
+        )
+        recorder = Recorder(fps=20, buffer_seconds=0.3, backend=backend)
+
+        session = recorder.record(1.2)
+        pairs = KeyframeExtractor().extract_pairs(session)
+
+        assert len(pairs) == 1
+        pair = pairs[0]
+        oldest = min(frame.timestamp for frame in session.frames)
+        assert pair.trigger_event.timestamp < oldest
+        assert abs(pair.before_frame.timestamp - pair.trigger_event.timestamp) < 0.1
+        assert pair.before_frame.image.shape == (30, 40, 3)
+        assert session.frames.pinned_count == 0
+
+
+class TestListModeFrames:
+    """list 모드 프레임 보관 테스트"""
+
+    def test_list_mode_keeps_rgb(self):
+        """list 모드(buffer_seconds=0)로 보존된 프레임은 BGRA 대신 RGB로 보관"""
+        backend = SyntheticBackend(width=40, height=30, click_interval=None)
+        recorder = Recorder(fps=20, buffer_seconds=0, backend=backend)
+
+        session = recorder.record(0.3)
+
+        assert len(session.frames) >= 2
+        assert all(frame.is_converted for frame in session.frames)
@@ -0,0 +1,225 @@
+"""녹화 제외 앱 필터 테스트"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from shadow.api.repositories.users import ConfigRepository, load_excluded_apps
+from shadow.capture.backends import SyntheticBackend
+from shadow.capture.input_events import InputEventCollector
+from shadow.capture.models import InputEvent, InputEventType, MonitorGeometry, WindowInfo
+from shadow.capture.recorder import Recorder
+from shadow.capture.redaction import ExclusionFilter, parse_excluded_apps
+from shadow.capture.screen import ScreenCapture
+
+
+def click(offset: float, app_name: str, bundle_id: str | None = None) -> InputEvent:
+    window = WindowInfo(app_name=app_name, bundle_id=bundle_id)
+    return InputEvent(
+        timestamp=offset,
+        event_type=InputEventType.MOUSE_CLICK,
+        x=5,
+        y=5,
+        app_name=app_name,
+        window_info=window,
+    )
+
+
+def fixed_bounds(*rects):
+    """항상 같은 영역을 반환하는 window_bounds (조건 함수는 무시)"""
+    return lambda predicate: list(rects)
+
+
+class TestExclusionFilter:
+    """ExclusionFilter 테스트"""
+
+    def test_parse_excluded_apps(self):
+        """쉼표 구분 설정 해석"""
+        assert parse_excluded_apps(" Slack, com.apple.keychainaccess ,,") == [
+            "Slack",
+            "com.apple.keychainaccess",
+        ]
+        assert parse_excluded_apps("") == []
+
+    def test_matches_name_or_bundle_id(self):
+        """앱 이름 또는 bundle ID를 대소문자 구분 없이 비교"""
+        exclusion = ExclusionFilter(["slack", "com.apple.KeychainAccess"], window_bounds=None)
+
+        assert exclusion.matches("Slack")
+        assert exclusion.matches("Keychain Access", "com.apple.keychainaccess")
+        assert not exclusion.matches("Chrome", None)
+        assert not ExclusionFilter([], window_bounds=None)
+
+    def test_drops_excluded_events(self):
+        """제외 앱 이벤트만 버리고 개수 집계"""
+        exclusion = ExclusionFilter(["Secret"], window_bounds=None)
+
+        assert exclusion.drops(click(0.0, "Secret"))
+        assert not exclusion.drops(click(0.0, "Editor"))
+        assert exclusion.dropped_events == 1
+
+    def test_redact_masks_window_on_monitor(self):
+        """모니터 위치를 빼고 배율을 적용해 프레임 픽셀 영역을 지움"""
+        exclusion = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((110, 0, 130, 20)))
+        geometry = MonitorGeometry(index=2, left=100, top=0, width=40, height=40)
+        bgra = np.full((20, 20, 4), 255, dtype=np.uint8)
+
+        redacted = exclusion.redact(bgra, geometry)
+
+        assert redacted is bgra
+        assert (redacted[0:10, 5:15, :3] == 0).all()
+        assert (redacted[0:10, 5:15, 3] == 255).all()
+        assert (redacted[10:, :, :3] == 255).all()
+        assert (redacted[:, :5, :3] == 255).all()
+
+    def test_redact_copies_read_only_buffer(self):
+        """읽기 전용 버퍼는 복사 후 가림"""
+        exclusion = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((0, 0, 5, 5)))
+        bgra = np.full((10, 10, 4), 255, dtype=np.uint8)
+        bgra.flags.writeable = False
+
+        redacted = exclusion.redact(bgra, None)
+
+        assert redacted is not bgra
+        assert (redacted[:5, :5, :3] == 0).all()
+        assert (bgra == 255).all()
+
+    def test_redact_full_screen_returns_none(self):
+        """화면 전체를 덮으면 None, 다른 모니터의 윈도우는 무시"""
+        full = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((-10, -10, 50, 50)))
+        other = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((100, 0, 200, 100)))
+        bgra = np.full((20, 20, 4), 255, dtype=np.uint8)
+
+        assert full.redact(bgra, None) is None
+        assert other.redact(bgra, None) is bgra
+        assert (bgra == 255).all()
+
+    def test_regions_cached(self):
+        """refresh_interval 동안 윈도우 영역 재조회 안 함"""
+        calls = []
+
+        def bounds(predicate):
+            calls.append(predicate)
+            return [(0, 0, 1, 1)]
+
+        exclusion = ExclusionFilter(["Secret"], window_bounds=bounds, refresh_interval=60)
+        exclusion.regions()
+        exclusion.regions()
+
+        assert len(calls) == 1
+        assert calls[0](WindowInfo(app_name="Secret"))
+
+
+class TestCaptureExclusion:
+    """캡처 단계의 제외 앱 처리 테스트"""
+
+    def test_screen_capture_masks_before_conversion(self):
+        """가린 영역은 RGB 프레임에도 검게 남음"""
+        exclusion = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((0, 0, 8, 4)))
+        capture = ScreenCapture(
+            fps=30,
+            backend=SyntheticBackend(width=16, height=8, click_interval=None, change_interval=0),
+            exclusion=exclusion,
+        )
+
+        with capture.session():
+            frame = capture.capture_frame()
+
+        assert (frame.image[:4, :8] == 0).all()
+        assert frame.image[4:, 8:].any()
+
+    def test_screen_capture_skips_fully_excluded_frames(self):
+        """화면 전체가 제외 앱이면 프레임을 만들지 않음"""
+        exclusion = ExclusionFilter(["Secret"], window_bounds=fixed_bounds((0, 0, 16, 8)))
+        capture = ScreenCapture(
+            fps=30,
+            backend=SyntheticBackend(width=16, height=8, click_interval=None),
+            exclusion=exclusion,
+        )
+
+        with capture.session():
+            frame = capture.capture_frame()
+
+        assert frame is None
+        assert capture.stats.excluded_frames == 1
+
+    def test_collector_drops_excluded_events(self):
+        """제외 앱 이벤트는 로그와 콜백 모두에 전달되지 않음"""
+        backend = SyntheticBackend(
+            width=16, height=16, events=[click(0.0, "Secret"), click(0.01, "Editor")]
+        )
+        collector = InputEventCollector(
+            event_source=backend, exclusion=ExclusionFilter(["Secret"], window_bounds=None)
+        )
+        seen: list[InputEvent] = []
+        collector.add_callback(seen.append)
+
+        with collector:
+            events = collector.get_events(timeout=1.0)
+
+        assert [e.app_name for e in events + seen] == ["Editor", "Editor"]
+        assert collector.excluded_events == 1
+
+
+class FakeConfigTable:
+    """configs 테이블 흉내 (select/update + eq + execute 체인)"""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self._update: dict | None = None
+        self._matches = rows
+
+    def select(self, columns: str) -> "FakeConfigTable":
+        self._update = None
+        return self
+
+    def update(self, data: dict) -> "FakeConfigTable":
+        self._update = data
+        return self
+
+    def eq(self, column: str, value) -> "FakeConfigTable":
+        self._matches = [row for row in self.rows if row.get(column) == value]
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        if self._update is not None:
+            for row in self._matches:
+                row.update(self._update)
+        return SimpleNamespace(data=[dict(row) for row in self._matches])
+
+
+class TestUserExcludedApps:
+    """사용자 설정(configs.excluded_apps)의 제외 앱 적용 테스트"""
+
+    def make_repository(self) -> ConfigRepository:
+        table = FakeConfigTable([{"user_id": "u1", "excluded_apps": []}])
+        return ConfigRepository(db=SimpleNamespace(table=lambda name: table))
+
+    def test_load_merges_setting_and_user_config(self, monkeypatch):
+        """capture_excluded_apps 설정과 사용자 설정을 합침"""
+        from shadow.config import settings
+
+        monkeypatch.setattr(settings, "capture_excluded_apps", "Keychain")
+        repository = self.make_repository()
+        repository.add_excluded_app("u1", "Secret")
+
+        assert load_excluded_apps("u1", repository=repository) == ["Keychain", "Secret"]
+        assert load_excluded_apps("missing", repository=repository) is None
+
+    def test_added_app_dropped_during_capture(self):
+        """add_excluded_app으로 추가한 앱의 입력은 녹화 세션에 남지 않음"""
+        repository = self.make_repository()
+        repository.add_excluded_app("u1", "Secret")
+        backend = SyntheticBackend(
+            width=16, height=16, events=[click(0.05, "Secret"), click(0.1, "Editor")]
+        )
+        recorder = Recorder(
+            fps=20,
+            buffer_seconds=0,
+            backend=backend,
+            excluded_apps=load_excluded_apps("u1", repository=repository),
+        )
+
+        session = recorder.record(0.4)
+
+        assert [event.app_name for event in session.events] == ["Editor"]
@@ -0,0 +1,120 @@
+"""CaptureScheduler / CaptureStats 단위 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from shadow.capture import scheduler as scheduler_module
+from shadow.capture.scheduler import CaptureScheduler, CaptureStats
+
+
+class FakeClock:
+    """monotonic/sleep 대체용 가상 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(scheduler_module.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestCaptureScheduler:
+    """스케줄러 테스트"""
+
+    def test_first_wait_returns_immediately(self, clock):
+        """첫 wait()는 대기하지 않음"""
+        scheduler = CaptureScheduler(interval=0.1)
+
+        assert scheduler.wait() == 0
+        assert clock.now == 100.0
+
+    def test_waits_until_next_slot(self, clock):
+        """제때 캡처하면 다음 슬롯까지 대기"""
+        scheduler = CaptureScheduler(interval=0.1)
+        scheduler.wait()
+        clock.now += 0.03  # 캡처 30ms
+
+        assert scheduler.wait() == 0
+        assert clock.now == pytest.approx(100.1)
+
+    def test_overrun_skips_missed_slots_without_burst(self, clock):
+        """캡처가 늦어지면 밀린 슬롯을 건너뛰고 몰아서 캡처하지 않음"""
+        scheduler = CaptureScheduler(interval=0.1)
+        scheduler.wait()
+        clock.now += 0.35  # 100.1, 100.2 슬롯을 놓치고 100.3 슬롯에서 늦게 캡처
+
+        missed = scheduler.wait()
+        assert missed == 2
+        captured_at = clock.now
+
+        # 다음 캡처는 즉시가 아니라 다음 슬롯(100.4)까지 대기
+        clock.now += 0.01
+        assert scheduler.wait() == 0
+        assert clock.now == pytest.approx(100.4)
+        assert clock.now > captured_at
+
+    def test_reset_restarts_schedule(self, clock):
+        """reset() 후에는 즉시 캡처"""
+        scheduler = CaptureScheduler(interval=0.1)
+        scheduler.wait()
+        scheduler.reset()
+        clock.now += 5.0
+
+        assert scheduler.wait() == 0
+
+    def test_interval_change_applies_from_previous_slot(self, clock):
+        """간격 변경 시 다음 슬롯은 직전 슬롯 + 새 간격"""
+        scheduler = CaptureScheduler(interval=1.0)
+        scheduler.wait()
+        scheduler.interval = 0.1
+
+        scheduler.wait()
+        assert clock.now == pytest.approx(100.1)
+
+    def test_wake_skips_remaining_wait(self):
+        """wake 신호가 set되면 다음 슬롯까지 기다리지 않음"""
+        scheduler = CaptureScheduler(interval=10.0)
+        wake = threading.Event()
+        scheduler.wait(wake)
+        wake.set()
+
+        started = time.monotonic()
+        assert scheduler.wait(wake) == 0
+        assert time.monotonic() - started < 1.0
+        assert not wake.is_set()
+
+
+class TestCaptureStats:
+    """캡처 카운터 테스트"""
+
+    def test_averages_and_max(self):
+        """평균/최대 latency 계산"""
+        stats = CaptureStats()
+        stats.record_grab(0.010)
+        stats.record_convert(0.002)
+        stats.record_grab(0.030)
+        stats.record_convert(0.004)
+
+        assert stats.captured_frames == 2
+        assert stats.avg_grab_ms == pytest.approx(20.0)
+        assert stats.grab_ms_max == pytest.approx(30.0)
+        assert stats.avg_convert_ms == pytest.approx(3.0)
+
+    def test_empty_stats(self):
+        """프레임이 없으면 평균은 0"""
+        stats = CaptureStats()
+
+        assert stats.avg_grab_ms == 0.0
+        assert stats.to_dict()["avg_convert_ms"] == 0.0
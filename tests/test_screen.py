@@ -5,6 +5,7 @@ import time
 import numpy as np
 import pytest
 
+from shadow.capture.models import Frame
 from shadow.capture.screen import ScreenCapture
 
 
@@ -127,3 +128,51 @@ class TestScreenCaptureResolution:
 
             assert frame.width == frame.image.shape[1]
             assert frame.height == frame.image.shape[0]
+
+
+class TestFrameLazyConversion:
+    """Frame BGRA 지연 변환 테스트"""
+
+    def _bgra(self) -> np.ndarray:
+        bgra = np.zeros((4, 6, 4), dtype=np.uint8)
+        bgra[:, :, 0] = 10  # B
+        bgra[:, :, 1] = 20  # G
+        bgra[:, :, 2] = 30  # R
+        return bgra
+
+    def test_bgra_frame_converts_on_first_access(self):
+        """image 첫 접근 시 RGB로 변환"""
+        frame = Frame(timestamp=1.0, bgra=self._bgra())
+
+        assert not frame.is_converted
+        assert frame.width == 6
+        assert frame.height == 4
+        assert not frame.is_converted  # 크기 조회는 변환하지 않음
+
+        assert frame.image.shape == (4, 6, 3)
+        assert list(frame.image[0, 0]) == [30, 20, 10]
+        assert frame.is_converted
+
+    def test_convert_releases_bgra(self):
+        """convert() 후 RGB만 보관 (reference는 원본을 변환)"""
+        frame = Frame(timestamp=1.0, bgra=self._bgra())
+        ref = frame.reference(2.0)
+
+        ref.convert()
+
+        assert frame.is_converted
+        assert frame._bgra is None
+        assert frame.rgb_view().shape == (4, 6, 3)
+
+    def test_reference_shares_converted_image(self):
+        """reference 프레임은 원본과 변환 결과를 공유"""
+        frame = Frame(timestamp=1.0, bgra=self._bgra())
+        ref = frame.reference(2.0)
+
+        assert ref.timestamp == 2.0
+        assert ref.image is frame.image
+
+    def test_frame_requires_image_or_bgra(self):
+        """image와 bgra가 모두 없으면 에러"""
+        with pytest.raises(ValueError):
+            Frame(timestamp=1.0)
@@ -0,0 +1,115 @@
+"""화면 안정 시점 기반 After 프레임 선택 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.capture.models import Frame, InputEvent, InputEventType
+from shadow.capture.recorder import RecordingSession
+from shadow.preprocessing.keyframe import KeyframeExtractor, StreamingKeyframeExtractor
+from shadow.preprocessing.settle import SettleDetector, frame_difference
+
+
+def screens(values: list[int], start: float = 0.0, interval: float = 0.1) -> list[Frame]:
+    """values[i]에 따라 채운 프레임 목록 (같은 값이 이어지면 같은 화면)"""
+    return [
+        Frame(
+            timestamp=start + i * interval,
+            image=np.full((16, 16, 3), v * 10 % 250, dtype=np.uint8),
+        )
+        for i, v in enumerate(values)
+    ]
+
+
+class TestFrameDifference:
+    """frame_difference 테스트"""
+
+    def test_shared_buffer_is_unchanged(self):
+        """같은 이미지 버퍼를 참조하는 프레임은 비교 없이 0"""
+        frame = screens([5])[0]
+
+        assert frame_difference(frame, frame.reference(1.0)) == 0.0
+
+    def test_changed_fraction(self):
+        """달라진 샘플 픽셀 비율, 작은 노이즈는 무시"""
+        a, b = screens([0, 0])
+        b.image[:8] = 255
+        noisy = Frame(timestamp=0.0, image=a.image + 3)
+
+        assert frame_difference(a, b, stride=1) == pytest.approx(0.5)
+        assert frame_difference(a, noisy, stride=1) == 0.0
+
+
+class TestSettleDetector:
+    """SettleDetector 테스트"""
+
+    def test_waits_for_slow_render(self):
+        """늦게 그려지는 화면은 마지막 변화가 나타난 프레임을 선택"""
+        frames = screens([0, 0, 0, 0, 0, 0, 1, 2, 3, 3, 3, 3, 3])
+        detector = SettleDetector(settle_time=0.3, max_wait=2.0)
+
+        after = detector.select(frames[0], frames[1:], start=0.05)
+
+        assert after is frames[8]
+
+    def test_no_change_picks_first_frame(self):
+        """max_wait 동안 변화가 없으면 트리거 직후 첫 프레임"""
+        frames = screens([7] * 10)
+        detector = SettleDetector(settle_time=0.3, max_wait=0.5)
+
+        assert detector.select(frames[0], frames[1:4], start=0.05, final=False) is None
+        assert detector.select(frames[0], frames[1:], start=0.05, final=False) is frames[1]
+
+    def test_max_wait(self):
+        """계속 변하면 max_wait 안의 마지막 프레임"""
+        frames = screens(list(range(30)))
+        detector = SettleDetector(settle_time=0.3, max_wait=1.0)
+
+        assert detector.select(frames[0], frames[1:], start=0.05) is frames[10]
+
+    def test_undecided_without_final(self):
+        """final=False이면 안정 여부를 알 수 없을 때 None"""
+        frames = screens([0, 1, 1])
+        detector = SettleDetector(settle_time=0.3)
+
+        assert detector.select(frames[0], frames[1:], start=0.05, final=False) is None
+        assert detector.select(frames[0], frames[1:], start=0.05) is frames[1]
+
+
+class TestSettleKeyframes:
+    """settle 모드 키프레임 추출 테스트"""
+
+    def test_extractor_records_latency(self):
+        """settle 모드 After 프레임과 after_latency"""
+        frames = screens([0, 0, 0, 0, 0, 0, 0, 4, 4, 4, 4, 4, 4], start=100.0)
+        events = [InputEvent(timestamp=100.15, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)]
+        session = RecordingSession(frames=frames, events=events)
+
+        fixed = KeyframeExtractor(roi_size=0, after_mode="fixed").extract_pairs(session)
+        settled = KeyframeExtractor(roi_size=0, after_mode="settle").extract_pairs(session)
+
+        assert fixed[0].after_frame is frames[5]
+        assert fixed[0].after_latency == pytest.approx(0.35)
+        assert settled[0].after_frame is frames[7]
+        assert settled[0].after_latency == pytest.approx(0.55)
+
+    def test_streaming_matches_batch(self):
+        """녹화 중 추출도 화면이 안정된 뒤 같은 프레임을 선택"""
+        frames = screens([0, 0, 0, 0, 0, 0, 0, 4, 5, 5, 5, 5, 5, 5, 5], start=96.0, interval=0.125)
+        click = InputEvent(timestamp=96.15, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+        session = RecordingSession()
+        extractor = StreamingKeyframeExtractor(roi_size=0, after_mode="settle")
+
+        extractor.on_event(click)
+        for frame in frames[:11]:
+            extractor.on_frame(session, 1, frame)
+        # 97.0에 마지막 변화, 0.3초 뒤 프레임(97.375)에서 안정 판단
+        assert extractor.emitted == 0
+        extractor.on_frame(session, 1, frames[11])
+
+        pairs = extractor.pop_pairs()
+        assert [p.after_frame for p in pairs] == [frames[8]]
+
+    def test_unknown_mode(self):
+        """알 수 없는 after_mode는 ValueError"""
+        with pytest.raises(ValueError):
+            KeyframeExtractor(after_mode="later")
@@ -0,0 +1,137 @@
+"""세션 저장 (백그라운드 PNG 인코딩) 테스트"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from shadow.capture.models import Frame, InputEvent, InputEventType, KeyframePair
+from shadow.capture.recorder import RecordingSession
+from shadow.capture.storage import SessionStorage
+from shadow.capture.writer import BackgroundWriter
+
+
+def make_pairs(count: int) -> list[KeyframePair]:
+    """값이 서로 다른 화면 쌍 count개 (각 쌍의 After와 다음 쌍의 Before는 같은 버퍼)"""
+    frames = [
+        Frame(timestamp=i * 0.5, image=np.full((12, 16, 3), i * 10, dtype=np.uint8))
+        for i in range(count + 1)
+    ]
+    return [
+        KeyframePair(
+            before_frame=frames[i],
+            after_frame=frames[i + 1],
+            trigger_event=InputEvent(
+                timestamp=i * 0.5 + 0.1, event_type=InputEventType.MOUSE_CLICK, x=1, y=1
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+class TestBackgroundSave:
+    """SessionStorage 백그라운드 저장 테스트"""
+
+    def test_files_match_sync_layout(self, tmp_path):
+        """스레드 풀로 저장해도 파일 구성과 이미지 내용은 같고 임시 파일이 남지 않음"""
+        pairs = make_pairs(20)
+        storage = SessionStorage(tmp_path, workers=4, max_in_flight=3)
+
+        handle = storage.save_session_background(RecordingSession(), pairs, name="bg")
+        session_dir = handle.result(timeout=10)
+
+        assert handle.done()
+        assert session_dir == tmp_path / "bg"
+        keyframes = session_dir / "keyframes"
+        assert len(list(keyframes.glob("*.png"))) == 40
+        assert not list(session_dir.rglob("*.tmp"))
+        for i, pair in enumerate(pairs):
+            with Image.open(keyframes / f"{i + 1:03d}_after.png") as image:
+                assert np.array_equal(np.asarray(image), pair.after_frame.image)
+        assert len(storage.load_keyframe_pairs(session_dir)) == 20
+
+    def test_awaitable(self, tmp_path):
+        """asyncio 코드에서 핸들을 await"""
+        storage = SessionStorage(tmp_path, workers=2)
+
+        async def save():
+            return await storage.save_session_background(RecordingSession(), make_pairs(3))
+
+        session_dir = asyncio.run(save())
+
+        assert len(list((session_dir / "keyframes").glob("*_event.json"))) == 3
+
+    def test_await_keeps_event_loop_running(self, tmp_path):
+        """await 중에도 이벤트 루프의 다른 작업이 진행"""
+        storage = SessionStorage(tmp_path, workers=1)
+        rng = np.random.default_rng(0)
+        pairs = make_pairs(20)
+        for pair in pairs:
+            # 압축이 잘 안 되는 이미지로 인코딩 시간 확보
+            pair.before_frame = Frame(
+                timestamp=pair.before_frame.timestamp,
+                image=rng.integers(0, 256, (256, 256, 3), dtype=np.uint8),
+            )
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            handle = storage.save_deferred_background(pairs, "loop")
+            await handle
+            task.cancel()
+            return handle, ticks
+
+        handle, ticks = asyncio.run(run())
+
+        assert handle.done()
+        assert ticks > 1
+
+    def test_error_propagates(self, tmp_path):
+        """인코딩 실패는 result()에서 다시 발생하고 최종 경로에 파일을 남기지 않음"""
+        pairs = make_pairs(2)
+        pairs[1].after_frame = Frame(timestamp=2.0, image=np.zeros((4, 4, 3)))  # float64
+
+        handle = SessionStorage(tmp_path, workers=2).save_session_background(
+            RecordingSession(), pairs, name="broken"
+        )
+
+        with pytest.raises(TypeError):
+            handle.result(timeout=10)
+        keyframes = tmp_path / "broken" / "keyframes"
+        assert not (keyframes / "002_after.png").exists()
+        assert not list(keyframes.glob("*.tmp"))
+
+
+class TestBackgroundWriter:
+    """BackgroundWriter 테스트"""
+
+    def test_bounded_in_flight(self, tmp_path):
+        """진행 중인 작업이 max_in_flight개이면 submit이 블로킹"""
+        writer = BackgroundWriter(workers=2, max_in_flight=2)
+        release = threading.Event()
+
+        def blocked():
+            release.wait(5)
+            return tmp_path
+
+        writer.submit(blocked)
+        writer.submit(blocked)
+        third = threading.Thread(target=writer.submit, args=(blocked,))
+        third.start()
+        third.join(0.1)
+        assert third.is_alive()
+
+        release.set()
+        third.join(5)
+        writer.close()
+        assert not third.is_alive()
+        assert writer.completion.result(timeout=5) is None
@@ -0,0 +1,133 @@
+"""TriggeredFrameSelector 단위 테스트"""
+
+import numpy as np
+
+from shadow.capture.models import Frame, InputEvent, InputEventType
+from shadow.capture.triggered import TriggeredFrameSelector
+from shadow.config import settings
+
+
+def make_frame(timestamp: float) -> Frame:
+    return Frame(timestamp=timestamp, image=np.zeros((4, 4, 3), dtype=np.uint8))
+
+
+def click(timestamp: float) -> InputEvent:
+    return InputEvent(timestamp=timestamp, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+
+
+def run(selector: TriggeredFrameSelector, timestamps: list[float], events: dict[float, InputEvent]):
+    """프레임 타임스탬프 순서대로 선별 실행 (events: 해당 프레임 직전에 도착하는 이벤트)"""
+    kept = []
+    for ts in timestamps:
+        if ts in events:
+            selector.on_event(events[ts])
+        kept.extend(f.timestamp for f in selector.select(make_frame(ts)))
+    return kept
+
+
+class TestTriggeredFrameSelector:
+    """트리거 기반 프레임 선별 테스트"""
+
+    def test_idle_session_keeps_nothing(self):
+        """트리거가 없으면 프레임을 보존하지 않음"""
+        selector = TriggeredFrameSelector(pre_roll=0.3, post_roll=0.5, fps=10)
+
+        kept = run(selector, [i * 0.1 for i in range(100)], {})
+
+        assert kept == []
+        assert selector.kept == 0
+
+    def test_keeps_pre_roll_and_post_roll(self):
+        """트리거 전후 구간의 프레임만 보존"""
+        selector = TriggeredFrameSelector(pre_roll=0.3, post_roll=0.5, fps=10)
+        timestamps = [round(i * 0.1, 1) for i in range(30)]
+
+        # 1.05초 클릭 이벤트가 1.1초 프레임 직전에 도착
+        kept = run(selector, timestamps, {1.1: click(1.05)})
+
+        assert min(kept) <= 1.0  # Before 프레임 포함
+        assert max(kept) >= 1.5  # after_delay 이후 프레임 포함
+        assert all(0.6 <= ts <= 1.55 for ts in kept)
+        assert kept == sorted(kept)
+
+    def test_non_trigger_events_are_ignored(self):
+        """트리거 타입이 아닌 이벤트는 무시"""
+        selector = TriggeredFrameSelector(pre_roll=0.3, post_roll=0.5, fps=10)
+        key = InputEvent(timestamp=1.05, event_type=InputEventType.KEY_PRESS, key="a")
+
+        kept = run(selector, [i * 0.1 for i in range(30)], {1.1: key})
+
+        assert kept == []
+
+    def test_low_fps_still_keeps_before_frame(self):
+        """프레임 간격이 pre-roll보다 길어도 직전 프레임 1장은 보존"""
+        selector = TriggeredFrameSelector(pre_roll=0.1, post_roll=1.0, fps=1)
+
+        kept = run(selector, [0.0, 1.0, 2.0, 3.0], {2.0: click(1.6)})
+
+        assert 1.0 in kept
+        assert 2.0 in kept
+
+    def test_drag_keeps_frames_until_release(self):
+        """드래그는 놓은 시각 이후 post_roll까지 보존 (Before는 누름의 클릭이 보존)"""
+        selector = TriggeredFrameSelector(
+            pre_roll=0.2,
+            post_roll=0.3,
+            fps=10,
+            trigger_events={InputEventType.MOUSE_CLICK, InputEventType.DRAG},
+        )
+        timestamps = [round(i * 0.1, 1) for i in range(40)]
+        drag = InputEvent(
+            timestamp=1.05, event_type=InputEventType.DRAG, x=1, y=1, end_timestamp=2.55
+        )
+
+        kept = run(selector, timestamps, {1.1: click(1.05), 2.6: drag})
+
+        assert min(kept) <= 1.0
+        assert max(kept) >= 2.8
+        assert 2.0 not in kept  # 클릭 post_roll과 드래그 pre_roll 사이
+
+    def test_reset_clears_state(self):
+        """reset() 후 이전 트리거는 영향을 주지 않음"""
+        selector = TriggeredFrameSelector(pre_roll=0.3, post_roll=0.5, fps=10)
+        selector.on_event(click(0.0))
+        selector.reset()
+
+        kept = run(selector, [0.1, 0.2], {})
+
+        assert kept == []
+
+    def test_follows_keyframe_triggers_setting(self, monkeypatch):
+        """기본 트리거 타입은 keyframe_triggers 설정을 따름"""
+        monkeypatch.setattr(settings, "keyframe_triggers", "mouse_click,mouse_scroll")
+        selector = TriggeredFrameSelector(pre_roll=0.3, post_roll=0.5, fps=10)
+        scroll = InputEvent(timestamp=1.05, event_type=InputEventType.MOUSE_SCROLL, x=1, y=1)
+
+        kept = run(selector, [round(i * 0.1, 1) for i in range(30)], {1.1: scroll})
+
+        assert min(kept) <= 1.0
+        assert max(kept) >= 1.5
+
+    def test_late_text_entry_keeps_run_start(self):
+        """타이핑 중에는 묶음 시작부터 보존하여 늦게 도착한 TEXT_ENTRY의 Before가 남음"""
+        typing: list[float | None] = [None]
+        selector = TriggeredFrameSelector(
+            {InputEventType.TEXT_ENTRY},
+            pre_roll=0.3,
+            post_roll=0.5,
+            fps=10,
+            typing_since=lambda: typing[0],
+        )
+        typed = InputEvent(
+            timestamp=0.5, event_type=InputEventType.TEXT_ENTRY, text="hello", end_timestamp=4.0
+        )
+        kept = []
+        for ts in [round(i * 0.1, 1) for i in range(80)]:
+            typing[0] = 0.5 if 0.5 <= ts <= 5.0 else None
+            if ts == 5.1:
+                selector.on_event(typed)  # 마지막 입력 후 input_text_gap(1초) 뒤 도착
+            kept.extend(f.timestamp for f in selector.select(make_frame(ts)))
+
+        assert 0.4 in kept  # Before 프레임
+        assert max(kept) >= 4.3  # After 프레임
+        assert 7.0 not in kept
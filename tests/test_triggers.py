@@ -0,0 +1,272 @@
+"""입력 묶음 기반 트리거 병합 테스트"""
+
+import numpy as np
+import pytest
+
+from shadow.capture.models import Frame, InputEvent, InputEventType
+from shadow.capture.recorder import RecordingSession
+from shadow.config import settings
+from shadow.preprocessing.keyframe import KeyframeExtractor, StreamingKeyframeExtractor
+from shadow.preprocessing.triggers import TriggerGrouper, parse_trigger_events
+
+
+def scroll(timestamp: float, dy: int = -3, app: str = "Web") -> InputEvent:
+    return InputEvent(
+        timestamp=timestamp,
+        event_type=InputEventType.MOUSE_SCROLL,
+        x=50,
+        y=50,
+        dx=0,
+        dy=dy,
+        app_name=app,
+    )
+
+
+def key(timestamp: float, name: str, modifiers: list[str] | None = None) -> InputEvent:
+    return InputEvent(
+        timestamp=timestamp,
+        event_type=InputEventType.KEY_PRESS,
+        key=name,
+        modifiers=modifiers or [],
+        app_name="Editor",
+    )
+
+
+def release(timestamp: float, name: str) -> InputEvent:
+    return InputEvent(
+        timestamp=timestamp, event_type=InputEventType.KEY_RELEASE, key=name, app_name="Editor"
+    )
+
+
+def text(timestamp: float, value: str, end: float) -> InputEvent:
+    return InputEvent(
+        timestamp=timestamp,
+        event_type=InputEventType.TEXT_ENTRY,
+        text=value,
+        end_timestamp=end,
+        app_name="Editor",
+    )
+
+
+def screens(count: int, start: float = 0.0, interval: float = 0.1) -> list[Frame]:
+    """서로 다른 화면 count장"""
+    return [
+        Frame(timestamp=start + i * interval, image=np.full((8, 8, 3), i % 250, dtype=np.uint8))
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def grouper() -> TriggerGrouper:
+    return TriggerGrouper(scroll_gap=0.5, typing_gap=1.0, key_repeat_gap=0.5)
+
+
+class TestTriggerGrouper:
+    """TriggerGrouper 테스트"""
+
+    def test_scroll_gesture(self, grouper):
+        """이어진 스크롤 틱은 하나로 합치고, 간격이 벌어지면 새 제스처"""
+        events = [scroll(1.0), scroll(1.1), scroll(1.3, dy=-2), scroll(2.5)]
+
+        grouped = grouper.group(events)
+
+        assert len(grouped) == 2
+        assert grouped[0].timestamp == 1.0
+        assert grouped[0].end_timestamp == 1.3
+        assert grouped[0].dy == -8
+        assert grouped[1].timestamp == 2.5
+        assert events[0].dy == -3  # 원본 이벤트는 바꾸지 않음
+
+    def test_other_app_or_event_breaks_burst(self, grouper):
+        """다른 앱의 스크롤이나 사이에 낀 클릭은 묶음을 끊음"""
+        click = InputEvent(timestamp=1.2, event_type=InputEventType.MOUSE_CLICK, x=1, y=1)
+        events = [scroll(1.0), scroll(1.1, app="Mail"), click, scroll(1.3, app="Mail")]
+
+        assert len(grouper.group(events)) == 4
+
+    def test_typing_run(self, grouper):
+        """간격이 짧은 TEXT_ENTRY는 이어 붙임"""
+        grouped = grouper.group([text(1.0, "hello ", 1.5), text(2.0, "world", 2.4)])
+
+        assert [(e.text, e.end_timestamp) for e in grouped] == [("hello world", 2.4)]
+
+    def test_shortcut_chords(self, grouper):
+        """같은 단축키 반복은 하나, Cmd+C와 Cmd+V는 각각 트리거"""
+        events = [
+            key(1.0, "c", ["cmd"]),
+            key(1.5, "v", ["cmd"]),
+            key(3.0, "z", ["cmd"]),
+            key(3.2, "z", ["cmd"]),
+            key(3.4, "z", ["cmd"]),
+        ]
+
+        grouped = grouper.group(events)
+
+        assert [(e.key, e.timestamp, e.end_timestamp) for e in grouped] == [
+            ("c", 1.0, None),
+            ("v", 1.5, None),
+            ("z", 3.0, 3.4),
+        ]
+
+    def test_raw_key_events(self, grouper):
+        """병합 없이 녹화한 개별 키 이벤트를 TEXT_ENTRY와 단축키로 변환"""
+        events = [
+            key(1.0, "h"),
+            key(1.1, "i"),
+            key(2.0, "cmd"),
+            key(2.1, "c"),
+            release(2.2, "c"),
+            release(2.3, "cmd"),
+            key(2.5, "enter"),
+        ]
+
+        grouped = grouper.group(events)
+
+        assert [e.event_type for e in grouped] == [
+            InputEventType.TEXT_ENTRY,
+            InputEventType.KEY_PRESS,
+            InputEventType.KEY_PRESS,
+        ]
+        assert (grouped[0].text, grouped[0].end_timestamp, grouped[0].app_name) == (
+            "hi",
+            1.1,
+            "Editor",
+        )
+        assert (grouped[1].key, grouped[1].modifiers) == ("c", ["cmd"])
+        assert (grouped[2].key, grouped[2].modifiers) == ("enter", [])
+
+    def test_raw_keys_split_like_live_capture(self, monkeypatch):
+        """개별 키 이벤트는 녹화 중 수집기와 같은 input_text_gap으로 TEXT_ENTRY를 끊음"""
+        monkeypatch.setattr(settings, "input_text_gap", 0.5)
+        monkeypatch.setattr(settings, "keyframe_typing_gap", 0.1)
+        grouper = TriggerGrouper(typing_gap=0.1)
+        events = [key(1.0, "a"), key(1.3, "b"), key(2.0, "c")]
+
+        grouped = grouper.group(events)
+
+        assert [(e.text, e.timestamp, e.end_timestamp) for e in grouped] == [
+            ("ab", 1.0, 1.3),
+            ("c", 2.0, 2.0),
+        ]
+
+    def test_parse_trigger_events(self):
+        """keyframe_triggers 설정 해석"""
+        assert parse_trigger_events(" mouse_click, TEXT_ENTRY ,,") == {
+            InputEventType.MOUSE_CLICK,
+            InputEventType.TEXT_ENTRY,
+        }
+        with pytest.raises(ValueError):
+            parse_trigger_events("mouse_click,tap")
+
+
+class TestBurstKeyframes:
+    """입력 묶음 트리거 키프레임 추출 테스트"""
+
+    def test_scroll_gesture_single_pair(self):
+        """스크롤 제스처 하나에 Before(시작)/After(종료 + after_delay) 쌍 하나"""
+        frames = screens(30)
+        events = [scroll(0.55 + i * 0.1) for i in range(5)]
+        session = RecordingSession(frames=frames, events=events)
+        triggers = {InputEventType.MOUSE_SCROLL}
+
+        pairs = KeyframeExtractor(triggers, roi_size=0).extract_pairs(session)
+        ungrouped = KeyframeExtractor(triggers, roi_size=0, group_bursts=False).extract_pairs(
+            session
+        )
+
+        assert len(pairs) == 1
+        assert pairs[0].before_frame is frames[5]
+        assert pairs[0].after_frame is frames[13]
+        assert len(ungrouped) == 5
+
+    def test_keyboard_triggers(self):
+        """키보드 트리거: 타이핑 한 묶음과 단축키마다 쌍 하나"""
+        frames = screens(60)
+        events = [
+            *(key(0.5 + i * 0.1, char) for i, char in enumerate("hello")),
+            key(2.5, "cmd"),
+            key(2.6, "c"),
+            release(2.7, "cmd"),
+            key(3.5, "v", ["cmd"]),
+        ]
+        session = RecordingSession(frames=frames, events=events)
+        triggers = {InputEventType.TEXT_ENTRY, InputEventType.KEY_PRESS}
+
+        pairs = KeyframeExtractor(triggers, roi_size=0).extract_pairs(session)
+
+        assert [p.trigger_event.event_type for p in pairs] == [
+            InputEventType.TEXT_ENTRY,
+            InputEventType.KEY_PRESS,
+            InputEventType.KEY_PRESS,
+        ]
+        assert pairs[0].trigger_event.text == "hello"
+        assert [p.trigger_event.key for p in pairs[1:]] == ["c", "v"]
+
+    def test_streaming_waits_for_burst_end(self):
+        """녹화 중 추출은 스크롤 제스처가 끝난 뒤 배치 추출과 같은 쌍 하나를 발생"""
+        frames = screens(30)
+        session = RecordingSession()
+        extractor = StreamingKeyframeExtractor({InputEventType.MOUSE_SCROLL}, roi_size=0)
+        ticks = [scroll(0.55 + i * 0.1) for i in range(5)]
+
+        for frame in frames[:6]:
+            extractor.on_frame(session, 1, frame)
+        for i, tick in enumerate(ticks):
+            extractor.on_event(tick)
+            extractor.on_frame(session, 1, frames[6 + i])
+        for frame in frames[11:15]:
+            extractor.on_frame(session, 1, frame)
+        # 마지막 틱(0.95) 후 0.5초가 지나기 전에는 대기
+        assert extractor.emitted == 0
+        for frame in frames[15:]:
+            extractor.on_frame(session, 1, frame)
+
+        pairs = extractor.pop_pairs()
+        assert [(p.before_frame, p.after_frame) for p in pairs] == [(frames[5], frames[13])]
+        assert pairs[0].trigger_event.end_timestamp == pytest.approx(0.95)
+
+    def test_streaming_text_entry(self):
+        """입력이 멈춘 뒤 늦게 도착하는 TEXT_ENTRY도 배치 추출과 같은 쌍 발생"""
+        frames = screens(60)
+        typed = text(0.5, "hello", 1.0)
+        session = RecordingSession()
+        extractor = StreamingKeyframeExtractor({InputEventType.TEXT_ENTRY}, roi_size=0)
+
+        for frame in frames[:21]:
+            extractor.on_frame(session, 1, frame)
+        # input_text_gap(1초) 동안 입력이 없어 2.0초 프레임 뒤에 도착
+        extractor.on_event(typed)
+        for frame in frames[21:]:
+            extractor.on_frame(session, 1, frame)
+        extractor.flush()
+
+        batch = KeyframeExtractor({InputEventType.TEXT_ENTRY}, roi_size=0).extract_pairs(
+            RecordingSession(frames=frames, events=[typed])
+        )
+        pairs = extractor.pop_pairs()
+        assert len(batch) == 1
+        assert [(p.before_frame, p.after_frame) for p in pairs] == [
+            (batch[0].before_frame, batch[0].after_frame)
+        ]
+
+    def test_streaming_long_typing_run(self):
+        """history보다 긴 타이핑 묶음은 typing_since 시각 이후 프레임을 보관"""
+        frames = screens(100)
+        typed = text(0.5, "a long sentence", 6.0)
+        typing_start: list[float | None] = [None]
+        session = RecordingSession()
+        extractor = StreamingKeyframeExtractor(
+            {InputEventType.TEXT_ENTRY}, roi_size=0, typing_since=lambda: typing_start[0]
+        )
+
+        for frame in frames[:71]:
+            if frame.timestamp >= 0.5:
+                typing_start[0] = 0.5  # 0.5초부터 입력 중
+            extractor.on_frame(session, 1, frame)
+        typing_start[0] = None
+        extractor.on_event(typed)
+        for frame in frames[71:]:
+            extractor.on_frame(session, 1, frame)
+
+        pairs = extractor.pop_pairs()
+        assert [(p.before_frame, p.after_frame) for p in pairs] == [(frames[5], frames[63])]
@@ -1,9 +1,10 @@
 """WindowInfoCollector 단위 테스트"""
 
+import numpy as np
 import pytest
 
-from shadow.capture.models import WindowInfo
-from shadow.capture.window import WindowInfoCollector
+from shadow.capture.models import MonitorGeometry, WindowInfo
+from shadow.capture.window import WindowInfoCollector, WindowSpatialIndex, flip_quartz_y
 
 
 def test_window_collector_initialization():
@@ -50,3 +51,218 @@ def test_is_available():
     assert isinstance(is_available, bool)
     # macOS에서 테스트하므로 True여야 함
     assert is_available is True
+
+
+def make_window(pid: int, x: int, y: int, w: int, h: int, name: str = "") -> dict:
+    """Quartz window dict 형태의 테스트 윈도우"""
+    return {
+        "kCGWindowOwnerPID": pid,
+        "kCGWindowOwnerName": f"App{pid}",
+        "kCGWindowName": name or f"Window{pid}",
+        "kCGWindowLayer": 0,
+        "kCGWindowBounds": {"X": x, "Y": y, "Width": w, "Height": h},
+    }
+
+
+def linear_find(windows: list[dict], x: int, y: int) -> dict | None:
+    """기존 선형 탐색 (비교 기준)"""
+    for window in windows:
+        b = window["kCGWindowBounds"]
+        if b["X"] <= x <= b["X"] + b["Width"] and b["Y"] <= y <= b["Y"] + b["Height"]:
+            return window
+    return None
+
+
+class TestWindowSpatialIndex:
+    """WindowSpatialIndex 테스트 (플랫폼 무관)"""
+
+    def test_front_window_wins_on_overlap(self):
+        """겹치는 영역에서는 앞쪽(먼저 나온) 윈도우 반환"""
+        front = make_window(1, 100, 100, 200, 200)
+        back = make_window(2, 0, 0, 1000, 800)
+        index = WindowSpatialIndex([(w, w["kCGWindowBounds"]) for w in (front, back)])
+
+        assert index.find(150, 150) is front
+        assert index.find(50, 50) is back
+        assert index.find(2000, 50) is None
+
+    def test_edges_are_inclusive(self):
+        """경계 좌표는 윈도우에 포함 (기존 동작과 동일)"""
+        window = make_window(1, 10, 10, 100, 100)
+        index = WindowSpatialIndex([(window, window["kCGWindowBounds"])])
+
+        assert index.find(10, 10) is window
+        assert index.find(110, 110) is window
+        assert index.find(111, 50) is None
+
+    def test_matches_linear_scan(self):
+        """무작위 배치에서 선형 탐색과 같은 결과"""
+        rng = np.random.default_rng(0)
+        windows = [
+            make_window(i, *map(int, rng.integers(0, 1500, 2)), *map(int, rng.integers(1, 800, 2)))
+            for i in range(40)
+        ]
+        index = WindowSpatialIndex([(w, w["kCGWindowBounds"]) for w in windows])
+
+        for x, y in rng.integers(-50, 2400, size=(2000, 2)):
+            assert index.find(int(x), int(y)) is linear_find(windows, int(x), int(y))
+
+    def test_empty_index(self):
+        """윈도우가 없으면 항상 None"""
+        assert WindowSpatialIndex([]).find(0, 0) is None
+
+
+class FakeApp:
+    def __init__(self, pid: int):
+        self.pid = pid
+
+    def processIdentifier(self):
+        return self.pid
+
+    def localizedName(self):
+        return f"App{self.pid}"
+
+    def bundleIdentifier(self):
+        return f"com.test.app{self.pid}"
+
+
+class FakeWorkspace:
+    def __init__(self):
+        self.frontmost = FakeApp(1)
+
+    def frontmostApplication(self):
+        return self.frontmost
+
+
+@pytest.fixture
+def fake_quartz(monkeypatch):
+    """Quartz/AppKit 호출을 가짜로 대체하고 윈도우 목록 조회 횟수 기록"""
+    from types import SimpleNamespace
+
+    from shadow.capture import window as window_module
+
+    state = SimpleNamespace(
+        calls=0,
+        workspace=FakeWorkspace(),
+        windows=[make_window(1, 0, 0, 500, 500), make_window(2, 500, 0, 500, 500)],
+        displays=[(0, 0, 1000, 1000)],  # (left, top, width, height)
+    )
+
+    def copy_window_info(option, relative_to):
+        state.calls += 1
+        return list(state.windows)
+
+    monkeypatch.setattr(window_module, "HAS_APPKIT", True)
+    monkeypatch.setattr(window_module, "HAS_QUARTZ", True)
+    monkeypatch.setattr(
+        window_module,
+        "NSWorkspace",
+        SimpleNamespace(sharedWorkspace=lambda: state.workspace),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        window_module,
+        "NSRunningApplication",
+        SimpleNamespace(runningApplicationWithProcessIdentifier=FakeApp),
+        raising=False,
+    )
+    monkeypatch.setattr(window_module, "CGWindowListCopyWindowInfo", copy_window_info, raising=False)
+    def display_bounds(display_id):
+        left, top, width, height = state.displays[display_id]
+        return SimpleNamespace(
+            origin=SimpleNamespace(x=left, y=top),
+            size=SimpleNamespace(width=width, height=height),
+        )
+
+    def active_display_list(max_displays, ids, count):
+        return 0, list(range(len(state.displays))), len(state.displays)
+
+    monkeypatch.setattr(window_module, "CGDisplayBounds", display_bounds, raising=False)
+    monkeypatch.setattr(
+        window_module, "CGGetActiveDisplayList", active_display_list, raising=False
+    )
+    for name in (
+        "kCGNullWindowID",
+        "kCGWindowListExcludeDesktopElements",
+        "kCGWindowListOptionOnScreenOnly",
+    ):
+        monkeypatch.setattr(window_module, name, 0, raising=False)
+    return state
+
+
+class TestWindowSnapshotCache:
+    """윈도우 목록 스냅샷 캐시 테스트"""
+
+    def test_repeated_lookups_reuse_snapshot(self, fake_quartz):
+        """TTL 안에서는 윈도우 목록을 다시 복사하지 않음"""
+        collector = WindowInfoCollector(cache_ttl=60.0)
+
+        for _ in range(100):
+            info = collector.get_window_at_point(100, 100)
+
+        assert info.app_name == "App1"
+        assert info.bundle_id == "com.test.app1"
+        assert fake_quartz.calls == 1
+
+    def test_frontmost_change_invalidates(self, fake_quartz):
+        """활성 앱이 바뀌면 스냅샷 갱신"""
+        collector = WindowInfoCollector(cache_ttl=60.0)
+        collector.get_window_at_point(100, 100)
+
+        fake_quartz.windows = [make_window(3, 0, 0, 1000, 1000)]
+        fake_quartz.workspace.frontmost = FakeApp(3)
+
+        assert collector.get_window_at_point(100, 100).app_name == "App3"
+        assert fake_quartz.calls == 2
+
+    def test_ttl_zero_disables_cache(self, fake_quartz):
+        """cache_ttl=0이면 매번 조회"""
+        collector = WindowInfoCollector(cache_ttl=0)
+        collector.get_window_at_point(100, 100)
+        collector.get_window_at_point(100, 100)
+
+        assert fake_quartz.calls == 2
+
+    def test_invalidate(self, fake_quartz):
+        """invalidate() 후 다음 조회에서 갱신"""
+        collector = WindowInfoCollector(cache_ttl=60.0)
+        collector.get_window_at_point(100, 100)
+        collector.invalidate()
+        collector.get_window_at_point(100, 100)
+
+        assert fake_quartz.calls == 2
+
+
+class TestMultiDisplayFlip:
+    """다중 디스플레이 y 반전 테스트
+
+    주 디스플레이 1000x1000 (0, 0) 오른쪽 위에 보조 디스플레이 800x600 (1000, -200)
+    """
+
+    PRIMARY = MonitorGeometry(index=2, left=0, top=0, width=1000, height=1000)
+    SECONDARY = MonitorGeometry(index=1, left=1000, top=-200, width=800, height=600)
+
+    def test_flip_uses_primary_display(self):
+        """디스플레이 순서와 무관하게 원점에 있는 주 디스플레이 기준으로 반전"""
+        displays = [self.SECONDARY, self.PRIMARY]
+
+        assert flip_quartz_y(100, 300, displays) == 700
+        assert flip_quartz_y(1200, 1100, displays) == -100  # 보조 디스플레이 위쪽
+
+    def test_flip_outside_displays_is_none(self):
+        """반전한 점이 어느 디스플레이에도 없으면 None"""
+        assert flip_quartz_y(1200, 300, [self.SECONDARY, self.PRIMARY]) is None
+        assert flip_quartz_y(100, 300, []) is None
+
+    def test_window_on_secondary_display(self, fake_quartz):
+        """보조 디스플레이 클릭은 잘못 반전된 위치의 윈도우로 바뀌지 않음"""
+        fake_quartz.displays = [(1000, -200, 800, 600), (0, 0, 1000, 1000)]
+        fake_quartz.windows = [
+            make_window(5, 1000, -200, 800, 600),
+            make_window(1, 1100, 850, 300, 100),  # 화면 밖으로 걸친 활성 앱 윈도우
+            make_window(2, 0, 0, 1000, 1000),
+        ]
+        collector = WindowInfoCollector(cache_ttl=60.0)
+
+        assert collector.get_window_at_point(1200, 100).app_name == "App5"
+        assert collector.get_window_at_point(1200, 1100).app_name == "App5"